@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-component schema validation.
+
+Compares ``jsonschema.validate`` (meta-schema check + validator build on every
+call) against the shared compiled validator, with and without the
+type-dispatched fast path, on a synthetic project of N components.
+
+Usage:
+    uv run python scripts/benchmark-schema-validation.py
+    uv run python scripts/benchmark-schema-validation.py --components 10000 --schema-mode strict
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+from jsonschema import ValidationError, validate
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from ignition_lint.schemas import SCHEMA_FILES, schema_path_for  # noqa: E402
+from ignition_lint.validators.schema import SchemaValidator  # noqa: E402
+
+COMPONENT_TEMPLATES = [
+    {"type": "ia.container.flex", "props": {"direction": "column"}},
+    {"type": "ia.display.label", "props": {"text": "Status"}},
+    {"type": "ia.display.icon", "props": {"path": "material/home"}},
+    {"type": "ia.display.table", "props": {"data": []}},
+    {"type": "ia.input.button", "props": {"text": "Go"}},
+    {"type": "ia.input.text-field", "props": {"text": ""}},
+    {"type": "ia.chart.xy", "props": {"series": []}},
+    {"type": "ia.navigation.menutree", "props": {"items": []}},
+]
+
+
+def build_components(count: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    components = []
+    for i in range(count):
+        component = json.loads(json.dumps(rng.choice(COMPONENT_TEMPLATES)))
+        component["meta"] = {"name": f"Component{i}"}
+        component["position"] = {"basis": "auto"}
+        components.append(component)
+    return components
+
+
+def time_it(label: str, func, components: list[dict]) -> float:
+    start = time.perf_counter()
+    failures = sum(1 for component in components if not func(component))
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.3f}s  ({failures} invalid)")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--components", type=int, default=10000)
+    parser.add_argument("--schema-mode", choices=sorted(SCHEMA_FILES), default="strict")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    schema = json.loads(schema_path_for(args.schema_mode).read_text())
+    components = build_components(args.components, args.seed)
+    print(f"{args.components} components, {args.schema_mode} schema")
+
+    def per_call(component: dict) -> bool:
+        try:
+            validate(instance=component, schema=schema)
+            return True
+        except ValidationError:
+            return False
+
+    full = SchemaValidator(schema, discriminator=None)
+    fast = SchemaValidator(schema)
+
+    baseline = time_it("jsonschema.validate", per_call, components)
+    compiled = time_it("compiled", lambda c: full.first_error(c) is None, components)
+    dispatched = time_it(
+        "compiled + type dispatch", lambda c: fast.first_error(c) is None, components
+    )
+
+    print(f"  speedup (compiled):          {baseline / compiled:6.1f}x")
+    print(f"  speedup (type dispatch):     {baseline / dispatched:6.1f}x")
+    print(f"  fast-path hits: {fast.fast_path_hits}/{len(components)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,11 +12,11 @@ from .cli import (
     LintReport,
     LintSeverity,
     determine_checks,
-    format_report_text,
     lint_naming,
     lint_perspective,
     lint_scripts,
 )
+from .reporting import format_report_text
 from .suppression import build_suppression_config
 
 
@@ -0,0 +1,236 @@
+"""Persistent per-file lint result cache keyed by content hash.
+
+Each file's issues are stored under a key derived from the file's content
+digest and a fingerprint of everything else that can change the result:
+package version, schema files, and the active lint options.  Unchanged
+files are then served from disk instead of being re-linted.  An entry may
+also carry a small JSON "extra" produced by the same lint, such as a
+view's cross-view references, so project-wide passes stay incremental.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+from .reporting import NO_METADATA, LintIssue, LintSeverity
+
+DEFAULT_CACHE_DIR = ".ignition-lint-cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Bump when the on-disk entry layout changes.
+_CACHE_FORMAT = 4
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: str | Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _issue_to_dict(issue: LintIssue) -> dict[str, Any]:
+    # file_path is re-stamped on load so identical files share one entry
+    return {
+        "severity": issue.severity.value,
+        "code": issue.code,
+        "message": issue.message,
+        "component_path": issue.component_path,
+        "component_type": issue.component_type,
+        "line_number": issue.line_number,
+        "column": issue.column,
+        "suggestion": issue.suggestion,
+        "metadata": dict(issue.metadata),
+    }
+
+
+def _issue_from_dict(data: dict[str, Any], file_path: str) -> LintIssue:
+    return LintIssue(
+        severity=LintSeverity(data["severity"]),
+        code=data["code"],
+        message=data["message"],
+        file_path=file_path,
+        component_path=data.get("component_path"),
+        component_type=data.get("component_type"),
+        line_number=data.get("line_number"),
+        column=data.get("column"),
+        suggestion=data.get("suggestion"),
+        metadata=data.get("metadata") or NO_METADATA,
+    )
+
+
+class LintCache:
+    """On-disk cache of per-file lint results with size-bounded LRU eviction."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        options: Mapping[str, Any],
+        dependencies: Iterable[str | Path] = (),
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._pending: dict[str, str] = {}
+        self._keys: dict[str, str | None] = {}
+        self.fingerprint = self._fingerprint(options, dependencies)
+
+    @staticmethod
+    def _fingerprint(
+        options: Mapping[str, Any], dependencies: Iterable[str | Path]
+    ) -> str:
+        deps: dict[str, str | None] = {}
+        for dep in dependencies:
+            try:
+                deps[Path(dep).name] = file_digest(dep)
+            except OSError:
+                deps[Path(dep).name] = None
+        payload = {
+            "format": _CACHE_FORMAT,
+            "version": __version__,
+            "options": dict(options),
+            "dependencies": deps,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _key_for(self, file_path: str) -> str | None:
+        if file_path in self._keys:
+            return self._keys.pop(file_path)
+        try:
+            content = file_digest(file_path)
+        except OSError:
+            return None
+        return hashlib.sha256(f"{self.fingerprint}:{content}".encode()).hexdigest()
+
+    def contains(self, file_path: str | Path) -> bool:
+        """Whether *file_path* has a cache entry, without loading it.
+
+        On a hit the file's key is kept for the following :meth:`get`, so
+        checking first does not hash the file twice.  Otherwise the file
+        counts as a miss and its result can be :meth:`put` straight away.
+        """
+        file_path = str(file_path)
+        key = self._key_for(file_path)
+        if key is not None and self._entry_path(key).is_file():
+            self._keys[file_path] = key
+            return True
+        self.misses += 1
+        if key is not None:
+            self._pending[file_path] = key
+        return False
+
+    def get(
+        self, file_path: str | Path, extras: dict[str, Any] | None = None
+    ) -> list[LintIssue] | None:
+        """Return cached issues for *file_path*, or None on a miss.
+
+        On a hit, the entry's extra (if any) is stored in *extras* under
+        the file path.
+        """
+        file_path = str(file_path)
+        key = self._key_for(file_path)
+        if key is None:
+            self.misses += 1
+            return None
+
+        entry = self._entry_path(key)
+        try:
+            with open(entry, encoding="utf-8") as handle:
+                data = json.load(handle)
+            issues = [_issue_from_dict(item, file_path) for item in data["issues"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            self._pending[file_path] = key
+            return None
+
+        # Touch the entry so eviction treats it as recently used
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        self.hits += 1
+        if extras is not None and data.get("extra") is not None:
+            extras[file_path] = data["extra"]
+        return issues
+
+    def put(
+        self,
+        file_path: str | Path,
+        issues: Iterable[LintIssue],
+        extra: Any = None,
+    ) -> None:
+        """Store the issues (and JSON *extra*) for a file that missed in :meth:`get`."""
+        key = self._pending.pop(str(file_path), None)
+        if key is None:
+            return
+
+        entry = self._entry_path(key)
+        payload: dict[str, Any] = {
+            "issues": [_issue_to_dict(issue) for issue in issues]
+        }
+        if extra is not None:
+            payload["extra"] = extra
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent runs never see partial entries
+            fd, tmp_name = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(tmp_name, entry)
+        except OSError:
+            pass
+
+    def prune(self) -> int:
+        """Evict least recently used entries until the cache fits ``max_bytes``.
+
+        Returns the number of entries removed.
+        """
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        try:
+            buckets = list(os.scandir(self.cache_dir))
+        except OSError:
+            return 0
+        for bucket in buckets:
+            if not bucket.is_dir():
+                continue
+            for item in os.scandir(bucket.path):
+                if not item.name.endswith(".json"):
+                    continue
+                try:
+                    stat = item.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, Path(item.path)))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        entries.sort()
+        for _mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
@@ -4,26 +4,39 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
+from typing import Any
 
+from .cache import DEFAULT_CACHE_DIR, LintCache
 from .json_linter import JsonLinter
 from .json_linter import ValidationError as NamingError
-from .perspective.linter import IgnitionPerspectiveLinter
-from .reporting import LintIssue, LintReport, LintSeverity, format_report_text
-from .schemas import SCHEMA_FILES, schema_path_for
-from .scripts.linter import IgnitionScriptLinter, ScriptLintIssue
+from .parallel import lint_script_files, lint_view_files, resolve_jobs
+from .perspective.linter import find_view_files
+from .perspective.view_graph import CROSS_VIEW_CODES, ViewGraph, ViewRefs
+from .report_writers import REPORT_WRITERS
+from .reporting import LintIssue, LintReport, LintSeverity, format_memo_stats
+from .schemas import (
+    SCHEMA_FILES,
+    component_props_path,
+    schema_path_for,
+    tag_schema_path_for,
+)
 from .scripts.linter import LintSeverity as ScriptSeverity
+from .scripts.linter import ScriptLintIssue
+from .scripts.symbols import CALL_CODES, ScriptLibrary, check_script_files
 from .suppression import build_suppression_config
+from .tags import IgnitionTagLinter
+from .tags.udt import UDT_CODES, check_tag_udts
 
 PROFILE_CHECKS = {
-    "default": {"perspective", "naming", "scripts"},
+    "default": {"perspective", "naming", "scripts", "tags"},
     "perspective-only": {"perspective", "naming"},
     "scripts-only": {"scripts"},
     "naming-only": {"naming"},
-    "full": {"perspective", "naming", "scripts"},
+    "tags-only": {"tags"},
+    "full": {"perspective", "naming", "scripts", "tags"},
 }
 
 
@@ -75,40 +88,289 @@ def convert_naming_errors(errors: Sequence[NamingError]) -> Iterable[LintIssue]:
         )
 
 
+def _lint_with_cache(
+    files: Sequence[Path],
+    lint_batch: Callable[[Sequence[Path]], Iterable[list[LintIssue]]],
+    cache: LintCache | None,
+    report: LintReport,
+    extras: dict[str, Any] | None = None,
+) -> None:
+    """Serve unchanged files from *cache*, lint the rest, and fill *report*.
+
+    Issues reach *report* file by file in input order, cached or not.
+    *extras* is per-file side output keyed by ``str(path)``: *lint_batch*
+    fills it for the files it lints, and cache hits restore it.
+    """
+    if cache is None:
+        for file_issues in lint_batch(files):
+            report.extend(file_issues)
+        return
+
+    # Hits are decided once, here, and their entries loaded as their turn
+    # comes, so cached results are not all held at once.  Misses are not
+    # looked up again: a file whose content matches an earlier miss must
+    # still take its own result from the batch.
+    cached = [cache.contains(f) for f in files]
+    fresh = iter(
+        lint_batch([f for f, hit in zip(files, cached, strict=True) if not hit])
+    )
+    for file_path, hit in zip(files, cached, strict=True):
+        file_issues = cache.get(file_path, extras) if hit else None
+        if file_issues is None:
+            if hit:
+                # The entry was unreadable after all; lint the file on its own
+                (file_issues,) = lint_batch([file_path])
+            else:
+                file_issues = next(fresh)
+            extra = extras.get(str(file_path)) if extras is not None else None
+            cache.put(file_path, file_issues, extra)
+        report.extend(file_issues)
+    cache.prune()
+
+    report.cache_hits += cache.hits
+    report.cache_misses += cache.misses
+
+
+def _split_ignored(
+    files: Sequence[Path], report: LintReport
+) -> tuple[list[Path], list[Path]]:
+    """Split *files* into those to lint and those the ignore file blanket-ignores.
+
+    Ignored files are never opened; everything they would report is
+    suppressed anyway.
+    """
+    suppression = report.suppression
+    if suppression is None:
+        return list(files), []
+    kept: list[Path] = []
+    ignored: list[Path] = []
+    for file_path in files:
+        blanket = suppression.for_path(str(file_path)).blanket
+        (ignored if blanket else kept).append(file_path)
+    if ignored:
+        print(f"🔇 Skipping {len(ignored)} ignored files", file=sys.stderr)
+    return kept, ignored
+
+
+def _ignored_codes(report: LintReport) -> frozenset[str]:
+    """Codes suppressed everywhere, whose checks need not run at all."""
+    if report.suppression is None:
+        return frozenset()
+    return frozenset(report.suppression.ignore_codes)
+
+
+def _perspective_cache(
+    cache_dir: Path | None,
+    schema_path: Path,
+    component_type: str | None,
+    ignore_codes: frozenset[str] = frozenset(),
+) -> LintCache | None:
+    if cache_dir is None:
+        return None
+    # Skipped checks change what is cached, so ignored codes are an option
+    return LintCache(
+        cache_dir,
+        options={
+            "check": "perspective",
+            "component_type": component_type,
+            "ignore_codes": sorted(ignore_codes),
+        },
+        dependencies=[schema_path, component_props_path()],
+    )
+
+
 def lint_perspective(
     target: Path,
     schema_mode: str,
     component_type: str | None,
     verbose: bool,
+    jobs: int = 1,
+    cache_dir: Path | None = None,
+    report: LintReport | None = None,
 ) -> LintReport:
-    report = LintReport()
-    schema_path = schema_path_for(schema_mode)
-    linter = IgnitionPerspectiveLinter(str(schema_path))
-    linter.lint_project(str(target), target_component_type=component_type)
-    report.extend(linter.issues)
-    return report
+    view_files = [Path(f) for f in find_view_files(target)]
+    if not view_files:
+        print("❌ No view.json files found in target directory", file=sys.stderr)
+        return report if report is not None else LintReport()
+    print(f"📁 Found {len(view_files)} view files", file=sys.stderr)
+    return lint_perspective_files(
+        view_files,
+        schema_mode,
+        component_type,
+        jobs=jobs,
+        cache_dir=cache_dir,
+        scanned_root=target,
+        report=report,
+    )
 
 
 def lint_perspective_files(
     view_files: list[Path],
     schema_mode: str,
     component_type: str | None,
+    jobs: int = 1,
+    cache_dir: Path | None = None,
+    scanned_root: Path | None = None,
+    report: LintReport | None = None,
 ) -> LintReport:
-    """Lint an explicit list of view.json files."""
-    report = LintReport()
+    """Lint an explicit list of view.json files.
+
+    Cross-view checks run afterwards over the references gathered while
+    linting; those needing the whole project are limited to projects whose
+    views directory lies under *scanned_root*.  Calls from inline scripts
+    into the project's script library are checked against its modules.
+    Issues are added to *report* when given, else to a new report; files
+    its suppression blanket-ignores are skipped, as are checks for codes it
+    ignores everywhere.
+    """
+    if report is None:
+        report = LintReport()
     schema_path = schema_path_for(schema_mode)
-    linter = IgnitionPerspectiveLinter(str(schema_path))
-    for vf in view_files:
-        linter.lint_file(str(vf), target_component_type=component_type)
-    report.extend(linter.issues)
+    ignore_codes = _ignored_codes(report)
+    view_files, ignored = _split_ignored(view_files, report)
+    view_refs: dict[str, Any] = {}
+    _lint_with_cache(
+        view_files,
+        lambda files: lint_view_files(
+            files,
+            schema_path,
+            component_type,
+            jobs,
+            view_refs,
+            report.memo_stats,
+            ignore_codes,
+        ),
+        _perspective_cache(cache_dir, schema_path, component_type, ignore_codes),
+        report,
+        view_refs,
+    )
+
+    graph = ViewGraph()
+    for file_path in view_files:
+        refs = view_refs.get(str(file_path))
+        if refs is not None:
+            graph.add(file_path, ViewRefs.from_json(refs))
+    for file_path in ignored:
+        graph.add_unread(file_path)
+    if scanned_root is not None and not CROSS_VIEW_CODES <= ignore_codes:
+        report.extend(graph.analyze(scanned_root))
+    if not set(CALL_CODES) <= ignore_codes:
+        report.extend(
+            graph.check_script_calls(lambda root: ScriptLibrary.load(root, cache_dir))
+        )
     return report
 
 
-def lint_scripts(target: Path, verbose: bool) -> LintReport:
-    report = LintReport()
-    linter = IgnitionScriptLinter()
-    linter.lint_directory(str(target))
-    report.extend(convert_script_issues(linter.issues))
+def lint_scripts(
+    target: Path,
+    verbose: bool,
+    jobs: int = 1,
+    cache_dir: Path | None = None,
+    report: LintReport | None = None,
+) -> LintReport:
+    if report is None:
+        report = LintReport()
+    py_files = sorted(target.rglob("*.py"))
+    print(f"🔍 Found {len(py_files)} Python script files", file=sys.stderr)
+    py_files, ignored = _split_ignored(py_files, report)
+    cache = (
+        LintCache(cache_dir, options={"check": "scripts"})
+        if cache_dir is not None
+        else None
+    )
+    symbols: dict[str, Any] = {}
+    _lint_with_cache(
+        py_files,
+        lambda files: (
+            list(convert_script_issues(file_issues))
+            for file_issues in lint_script_files(files, jobs, symbols)
+        ),
+        cache,
+        report,
+        symbols,
+    )
+    if not set(CALL_CODES) <= _ignored_codes(report):
+        report.extend(check_script_files(symbols, ignored))
+    return report
+
+
+def find_tag_files(paths: Iterable[str | Path]) -> list[Path]:
+    """Expand tag export paths: directories contribute every ``*.json`` below them."""
+    tag_files: list[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            tag_files.extend(sorted(path.rglob("*.json")))
+        elif path.exists():
+            tag_files.append(path)
+        else:
+            print(f"❌ Tag export not found: {path}", file=sys.stderr)
+    return tag_files
+
+
+def lint_tags(
+    paths: Iterable[str | Path],
+    cache_dir: Path | None = None,
+    report: LintReport | None = None,
+    rollup_scripts: bool = False,
+    library_root: Path | None = None,
+) -> LintReport:
+    """Lint tag exports (files, or directories of ``*.json`` files).
+
+    Each export is read incrementally, so gateway exports of any size are
+    linted in bounded memory.  UDT instances are then resolved against the
+    definitions found across all of the exports.  With *rollup_scripts*,
+    issues in an event script shared by many tags of an export are
+    reported once, with the number of tags.  Calls from event scripts are
+    checked against the script library at *library_root*, if it exists.
+    """
+    if report is None:
+        report = LintReport()
+    tag_files = find_tag_files(paths)
+    print(f"🏷️  Found {len(tag_files)} tag export files", file=sys.stderr)
+    tag_files, ignored = _split_ignored(tag_files, report)
+    library = None
+    if (
+        library_root is not None
+        and library_root.is_dir()
+        and not set(CALL_CODES) <= _ignored_codes(report)
+    ):
+        library = ScriptLibrary.load(library_root, cache_dir) or None
+    cache = (
+        LintCache(
+            cache_dir,
+            # Call checks run with the tags, so their results depend on the
+            # library's symbols too
+            options={
+                "check": "tags",
+                "rollup_scripts": rollup_scripts,
+                "script_library": None if library is None else library.fingerprint(),
+            },
+            dependencies=[tag_schema_path_for("robust")],
+        )
+        if cache_dir is not None
+        else None
+    )
+    linter = IgnitionTagLinter(
+        script_library=library, rollup_event_scripts=rollup_scripts
+    )
+    udt_summaries: dict[str, Any] = {}
+    linter.udt_summaries = udt_summaries
+
+    def lint_batch(files: Sequence[Path]) -> Iterable[list[LintIssue]]:
+        for file_path in files:
+            linter.issues = []
+            linter.lint_file(str(file_path))
+            yield linter.issues
+
+    _lint_with_cache(tag_files, lint_batch, cache, report, udt_summaries)
+    if not set(UDT_CODES) <= _ignored_codes(report):
+        # Types defined in ignored exports still resolve instances, so those
+        # exports are read for their definitions; their issues are dropped
+        unread: dict[str, Any] = {}
+        if ignored:
+            linter.udt_summaries = unread
+            _lint_with_cache(ignored, lint_batch, cache, LintReport(), unread)
+        report.extend(check_tag_udts(udt_summaries, unread))
     return report
 
 
@@ -122,12 +384,16 @@ def lint_target_directory(
     component_style_rgx: str | None,
     parameter_style_rgx: str | None,
     allow_acronyms: bool,
+    jobs: int = 1,
+    cache_dir: Path | None = None,
+    report: LintReport | None = None,
 ) -> LintReport:
     """Lint an arbitrary directory recursively, auto-discovering view.json and .py files."""
-    report = LintReport()
+    if report is None:
+        report = LintReport()
 
-    view_files = list(target.rglob("view.json"))
-    py_files = list(target.rglob("*.py"))
+    view_files = sorted(target.rglob("view.json"))
+    py_files = sorted(target.rglob("*.py"))
 
     if not view_files and not py_files:
         print(f"ℹ️  No view.json or .py files found under {target}", file=sys.stderr)
@@ -136,25 +402,34 @@ def lint_target_directory(
     # Perspective checks on any view.json found
     if "perspective" in checks and view_files:
         print(f"📁 Found {len(view_files)} view.json files", file=sys.stderr)
-        report.merge(lint_perspective_files(view_files, schema_mode, component_type))
+        lint_perspective_files(
+            view_files,
+            schema_mode,
+            component_type,
+            jobs,
+            cache_dir,
+            scanned_root=target,
+            report=report,
+        )
 
     # Naming checks on any view.json found
     if "naming" in checks and view_files:
         pattern = str(target / "**/view.json")
-        report.merge(
-            lint_naming(
-                [pattern],
-                component_style,
-                parameter_style,
-                component_style_rgx,
-                parameter_style_rgx,
-                allow_acronyms,
-            )
+        lint_naming(
+            [pattern],
+            component_style,
+            parameter_style,
+            component_style_rgx,
+            parameter_style_rgx,
+            allow_acronyms,
+            report=report,
         )
 
     # Script checks on any .py files found
     if "scripts" in checks and py_files:
-        report.merge(lint_scripts(target, verbose=False))
+        lint_scripts(
+            target, verbose=False, jobs=jobs, cache_dir=cache_dir, report=report
+        )
 
     return report
 
@@ -166,6 +441,7 @@ def lint_naming(
     component_style_rgx: str | None,
     parameter_style_rgx: str | None,
     allow_acronyms: bool,
+    report: LintReport | None = None,
 ) -> LintReport:
     linter = JsonLinter(
         component_style=component_style,
@@ -175,7 +451,8 @@ def lint_naming(
         allow_acronyms=allow_acronyms,
     )
     errors = linter.lint_files(list(patterns))
-    report = LintReport()
+    if report is None:
+        report = LintReport()
     report.extend(convert_naming_errors(errors))
     return report
 
@@ -206,6 +483,15 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--files", help="Comma-separated list of file patterns for naming linting"
     )
+    parser.add_argument(
+        "--tags",
+        help="Comma-separated tag export JSON files or directories for the tags check",
+    )
+    parser.add_argument(
+        "--rollup-tag-scripts",
+        action="store_true",
+        help="Report issues in event scripts shared by many tags once per export, with a count",
+    )
     parser.add_argument(
         "--component", "-c", help="Filter Perspective linting to component type prefix"
     )
@@ -226,7 +512,7 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--checks",
-        help="Comma-separated list of checks to run (perspective,naming,scripts)",
+        help="Comma-separated list of checks to run (perspective,naming,scripts,tags)",
     )
     parser.add_argument(
         "--naming-only", action="store_true", help="Only run naming validation"
@@ -248,9 +534,9 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--report-format",
-        choices=["text", "json"],
+        choices=list(REPORT_WRITERS),
         default="text",
-        help="Output format",
+        help="Output format; issues are written as they are found",
     )
     parser.add_argument(
         "--fail-on",
@@ -263,6 +549,22 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Verify schema assets are available and exit",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes for Perspective and script linting (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the incremental result cache",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help=f"Result cache directory (default: {{project}}/{DEFAULT_CACHE_DIR})",
+    )
     parser.add_argument(
         "--ignore-codes", help="Comma-separated rule codes to suppress globally"
     )
@@ -287,22 +589,29 @@ def main() -> int:
         project_root=project_root or target_root,
         ignore_file=ignore_file,
     )
-    report = LintReport(suppression=suppression)
+    writer = REPORT_WRITERS[args.report_format](sys.stdout)
+    report = LintReport(suppression=suppression, sink=writer.write)
     fail_threshold = LintSeverity.from_string(args.fail_on)
+    jobs = resolve_jobs(args.jobs)
+    cache_root = project_root or target_root
+    cache_dir: Path | None = None
+    if not args.no_cache and (args.cache_dir or cache_root):
+        cache_dir = (
+            Path(args.cache_dir) if args.cache_dir else cache_root / DEFAULT_CACHE_DIR
+        )
 
     if args.files:
         patterns = [
             pattern.strip() for pattern in args.files.split(",") if pattern.strip()
         ]
-        report.merge(
-            lint_naming(
-                patterns,
-                args.component_style,
-                args.parameter_style,
-                args.component_style_rgx,
-                args.parameter_style_rgx,
-                args.allow_acronyms,
-            )
+        lint_naming(
+            patterns,
+            args.component_style,
+            args.parameter_style,
+            args.component_style_rgx,
+            args.parameter_style_rgx,
+            args.allow_acronyms,
+            report=report,
         )
     elif target_root:
         # --target: scan any directory recursively for view.json and .py
@@ -314,18 +623,19 @@ def main() -> int:
             return 1
 
         checks = determine_checks(args.profile, args.checks, args.naming_only)
-        report.merge(
-            lint_target_directory(
-                target_root,
-                args.schema_mode,
-                args.component,
-                checks,
-                args.component_style,
-                args.parameter_style,
-                args.component_style_rgx,
-                args.parameter_style_rgx,
-                args.allow_acronyms,
-            )
+        lint_target_directory(
+            target_root,
+            args.schema_mode,
+            args.component,
+            checks,
+            args.component_style,
+            args.parameter_style,
+            args.component_style_rgx,
+            args.parameter_style_rgx,
+            args.allow_acronyms,
+            jobs=jobs,
+            cache_dir=cache_dir,
+            report=report,
         )
     elif args.project:
         project_path = Path(args.project).resolve()
@@ -340,13 +650,14 @@ def main() -> int:
                 project_path / "com.inductiveautomation.perspective" / "views"
             )
             if perspective_path.exists():
-                report.merge(
-                    lint_perspective(
-                        perspective_path,
-                        args.schema_mode,
-                        args.component,
-                        args.verbose,
-                    )
+                lint_perspective(
+                    perspective_path,
+                    args.schema_mode,
+                    args.component,
+                    args.verbose,
+                    jobs=jobs,
+                    cache_dir=cache_dir,
+                    report=report,
                 )
             else:
                 print(
@@ -360,15 +671,14 @@ def main() -> int:
             )
             if perspective_path.exists():
                 pattern = str(perspective_path / "**/view.json")
-                report.merge(
-                    lint_naming(
-                        [pattern],
-                        args.component_style,
-                        args.parameter_style,
-                        args.component_style_rgx,
-                        args.parameter_style_rgx,
-                        args.allow_acronyms,
-                    )
+                lint_naming(
+                    [pattern],
+                    args.component_style,
+                    args.parameter_style,
+                    args.component_style_rgx,
+                    args.parameter_style_rgx,
+                    args.allow_acronyms,
+                    report=report,
                 )
             else:
                 print(
@@ -379,38 +689,45 @@ def main() -> int:
         if "scripts" in checks:
             scripts_path = project_path / "ignition" / "script-python"
             if scripts_path.exists():
-                report.merge(lint_scripts(scripts_path, args.verbose))
+                lint_scripts(
+                    scripts_path,
+                    args.verbose,
+                    jobs=jobs,
+                    cache_dir=cache_dir,
+                    report=report,
+                )
             else:
                 print(
                     f"ℹ️  No script-python directory found at {scripts_path}",
                     file=sys.stderr,
                 )
-    else:
-        print("❌ One of --project, --target, or --files is required", file=sys.stderr)
+    elif not args.tags:
+        print(
+            "❌ One of --project, --target, --files or --tags is required",
+            file=sys.stderr,
+        )
         return 1
 
-    if args.report_format == "json":
-        output = {
-            "issues": [
-                {
-                    "severity": issue.severity.value,
-                    "code": issue.code,
-                    "message": issue.message,
-                    "file_path": issue.file_path,
-                    "component_path": issue.component_path,
-                    "component_type": issue.component_type,
-                    "line_number": issue.line_number,
-                    "column": issue.column,
-                    "suggestion": issue.suggestion,
-                }
-                for issue in report.issues
-            ],
-            "summary": report.summary,
-        }
-        print(json.dumps(output, indent=2))
-    else:
-        print(format_report_text(report))
+    if args.tags and "tags" in determine_checks(
+        args.profile, args.checks, args.naming_only
+    ):
+        tag_paths = [path.strip() for path in args.tags.split(",") if path.strip()]
+        project_dir = project_root or target_root
+        lint_tags(
+            tag_paths,
+            cache_dir=cache_dir,
+            report=report,
+            rollup_scripts=args.rollup_tag_scripts,
+            library_root=(
+                project_dir / "ignition" / "script-python" if project_dir else None
+            ),
+        )
+
+    if args.verbose:
+        for line in format_memo_stats(report):
+            print(line, file=sys.stderr)
 
+    writer.close(report)
     return 1 if report.has_failures(fail_threshold) else 0
 
 
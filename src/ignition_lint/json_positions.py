@@ -0,0 +1,324 @@
+"""Position-tracking JSON loading.
+
+``json.loads`` discards where each value came from, so issues could only be
+placed by scanning the raw text for names afterwards.
+:func:`load_json_with_positions` parses the document itself and, while it
+does, records the offset of every object, array and object key under its
+JSON path: a tuple of keys and array indexes such as
+``("root", "children", 0, "propConfig", "props.text")``.
+:class:`JsonPositions` turns those offsets into 1-based line and column
+numbers and resolves the dotted paths linters report back to JSON paths.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from collections.abc import Iterable
+from json import JSONDecodeError
+from json.decoder import scanstring
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .reporting import LintIssue
+
+JsonPath = tuple[str | int, ...]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER = re.compile(r"(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?")
+_INDEXES = re.compile(r"((?:\[\d+\])+)$")
+_SPACE = frozenset(" \t\n\r")
+_CONSTANTS = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "NaN": float("nan"),
+    "Infinity": float("inf"),
+    "-Infinity": float("-inf"),
+}
+
+
+class JsonPositions:
+    """Offsets of the containers and keys of one parsed JSON document."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.containers: dict[JsonPath, int] = {}
+        self.keys: dict[JsonPath, int] = {}
+        self._line_starts: list[int] | None = None
+
+    def __contains__(self, path: JsonPath) -> bool:
+        return path in self.keys or path in self.containers
+
+    def offset(self, path: JsonPath) -> int | None:
+        """Offset of *path*'s key when it is an object member, else of its value."""
+        offset = self.keys.get(path)
+        if offset is None:
+            offset = self.containers.get(path)
+        return offset
+
+    def line_col(self, offset: int) -> tuple[int, int]:
+        """Convert a character offset to a 1-based (line, column) pair."""
+        if self._line_starts is None:
+            self._line_starts = [0]
+            self._line_starts.extend(m.end() for m in re.finditer("\n", self.text))
+        line = bisect_right(self._line_starts, offset)
+        return line, offset - self._line_starts[line - 1] + 1
+
+    def position(self, path: JsonPath) -> tuple[int, int] | None:
+        """Line and column of *path*, or of its nearest recorded ancestor."""
+        for end in range(len(path), -1, -1):
+            offset = self.offset(path[:end])
+            if offset is not None:
+                return self.line_col(offset)
+        return None
+
+    def resolve(self, base: JsonPath, dotted: str) -> tuple[JsonPath, bool]:
+        """Follow a dotted suffix such as ``propConfig.props.text.transforms[0]``.
+
+        Object keys may themselves contain dots (propConfig keys do), so at
+        each step the longest run of segments naming an existing key wins.
+        Returns the deepest path reached and whether all of *dotted* was
+        consumed.
+        """
+        path = base
+        segments = dotted.split(".") if dotted else []
+        i = 0
+        while i < len(segments):
+            for j in range(len(segments), i, -1):
+                key = ".".join(segments[i:j])
+                indexes: list[int] = []
+                m = _INDEXES.search(key)
+                if m and key[: m.start()]:
+                    indexes = [int(n) for n in m.group(1)[1:-1].split("][")]
+                    key = key[: m.start()]
+                candidate = path + (key,)
+                if candidate in self:
+                    path = candidate
+                    for index in indexes:
+                        if path + (index,) not in self.containers:
+                            return path, False
+                        path = path + (index,)
+                    i = j
+                    break
+            else:
+                return path, False
+        return path, True
+
+    def locate(
+        self, anchors: dict[str, list[JsonPath]], reported: str
+    ) -> JsonPath | None:
+        """Map a path as reported in an issue back to a JSON path.
+
+        *anchors* maps the path strings a linter assigns to objects (a
+        component's ``root.root.children[0]``, a tag's ``Folder/Motor``) to
+        their JSON paths; more than one object may share a string.  The
+        longest anchor that prefixes *reported* at a ``.`` boundary is
+        taken and the rest is followed with :meth:`resolve`.  Reports with
+        no anchor are resolved from the document root.
+        """
+        end = len(reported)
+        while end > 0:
+            bases = anchors.get(reported[:end])
+            if bases:
+                suffix = reported[end + 1 :]
+                best = bases[0]
+                for base in bases:
+                    path, complete = self.resolve(base, suffix)
+                    if complete:
+                        return path
+                    if len(path) > len(best):
+                        best = path
+                return best
+            end = reported.rfind(".", 0, end)
+
+        path, complete = self.resolve((), reported)
+        return path if path or complete else None
+
+
+def locate_issues(
+    issues: Iterable[LintIssue],
+    positions: JsonPositions,
+    anchors: dict[str, list[JsonPath]],
+) -> None:
+    """Fill in line_number and column for issues that lack them.
+
+    Each issue's component_path is mapped back to the JSON path it was
+    reported from with :meth:`JsonPositions.locate`.  A quoted
+    ``search_key`` in the issue metadata (``'"valueSource"'``) narrows the
+    position to that key of the located object when it is present.  Issues
+    that already carry a line are left alone, as are columns set relative
+    to an expression; embedded scripts are validated without lines, so
+    their issues are placed at the script.
+    """
+    for issue in issues:
+        if issue.line_number is not None:
+            continue
+        path = positions.locate(anchors, issue.component_path)
+        if path is None:
+            continue
+        search_key = issue.metadata.get("search_key")
+        if isinstance(search_key, str):
+            keyed = (*path, search_key.strip('"'))
+            if keyed in positions:
+                path = keyed
+        location = positions.position(path)
+        if location is None:
+            continue
+        issue.line_number = location[0]
+        if issue.column is None:
+            issue.column = location[1]
+
+
+def load_json_with_positions(text: str) -> tuple[Any, JsonPositions]:
+    """Parse *text* like ``json.loads`` and record where each node starts.
+
+    Raises :class:`json.JSONDecodeError` on malformed input.
+    """
+    positions = JsonPositions(text)
+    parser = _Parser(text, positions)
+    value, end = parser.value(_skip(text, 0), ())
+    end = _skip(text, end)
+    if end != len(text):
+        raise JSONDecodeError("Extra data", text, end)
+    return value, positions
+
+
+def scan_json_value(
+    text: str, pos: int, positions: JsonPositions, path: JsonPath = ()
+) -> tuple[Any, int]:
+    """Parse the JSON value starting at *pos* in *text*.
+
+    Offsets of the containers and keys inside it are recorded in
+    *positions* under *path*.  Returns the value and the offset just past
+    it; raises :class:`json.JSONDecodeError` on malformed input.
+    """
+    return _Parser(text, positions).value(pos, path)
+
+
+class _Parser:
+    # Mirrors the pure-Python scanner in the standard library's json module,
+    # including its fast paths for the single spaces of pretty-printed
+    # output, with offsets recorded as containers and keys are entered.
+
+    def __init__(self, text: str, positions: JsonPositions):
+        self.text = text
+        self.containers = positions.containers
+        self.keys = positions.keys
+
+    def value(self, pos: int, path: JsonPath) -> tuple[Any, int]:
+        text = self.text
+        try:
+            char = text[pos]
+        except IndexError:
+            raise JSONDecodeError("Expecting value", text, pos) from None
+
+        if char == '"':
+            return scanstring(text, pos + 1)
+        if char == "{":
+            return self.object(pos, path)
+        if char == "[":
+            return self.array(pos, path)
+
+        m = _NUMBER.match(text, pos)
+        if m is not None:
+            integer, fraction, exponent = m.groups()
+            if fraction or exponent:
+                return float(integer + (fraction or "") + (exponent or "")), m.end()
+            return int(integer), m.end()
+
+        for literal, constant in _CONSTANTS.items():
+            if text.startswith(literal, pos):
+                return constant, pos + len(literal)
+        raise JSONDecodeError("Expecting value", text, pos)
+
+    def object(self, pos: int, path: JsonPath) -> tuple[dict, int]:
+        text = self.text
+        ws = _WHITESPACE.match
+        keys = self.keys
+        value = self.value
+        self.containers[path] = pos
+        result: dict[str, Any] = {}
+
+        pos += 1
+        char = text[pos : pos + 1]
+        if char in _SPACE:
+            pos = ws(text, pos).end()
+            char = text[pos : pos + 1]
+        if char == "}":
+            return result, pos + 1
+
+        while True:
+            if char != '"':
+                raise JSONDecodeError(
+                    "Expecting property name enclosed in double quotes", text, pos
+                )
+            key, end = scanstring(text, pos + 1)
+            child = path + (key,)
+            keys[child] = pos
+            pos = end
+
+            if text[pos : pos + 1] != ":":
+                pos = ws(text, pos).end()
+                if text[pos : pos + 1] != ":":
+                    raise JSONDecodeError("Expecting ':' delimiter", text, pos)
+            pos += 1
+            if text[pos : pos + 1] in _SPACE:
+                pos = ws(text, pos + 1).end()
+
+            char = text[pos : pos + 1]
+            if char == '"':
+                result[key], pos = scanstring(text, pos + 1)
+            else:
+                result[key], pos = value(pos, child)
+
+            char = text[pos : pos + 1]
+            if char in _SPACE:
+                pos = ws(text, pos + 1).end()
+                char = text[pos : pos + 1]
+            if char == "}":
+                return result, pos + 1
+            if char != ",":
+                raise JSONDecodeError("Expecting ',' delimiter", text, pos)
+            pos += 1
+            char = text[pos : pos + 1]
+            if char in _SPACE:
+                pos = ws(text, pos + 1).end()
+                char = text[pos : pos + 1]
+
+    def array(self, pos: int, path: JsonPath) -> tuple[list, int]:
+        text = self.text
+        ws = _WHITESPACE.match
+        value = self.value
+        self.containers[path] = pos
+        result: list[Any] = []
+
+        pos += 1
+        char = text[pos : pos + 1]
+        if char in _SPACE:
+            pos = ws(text, pos).end()
+            char = text[pos : pos + 1]
+        if char == "]":
+            return result, pos + 1
+
+        index = 0
+        while True:
+            item, pos = value(pos, path + (index,))
+            result.append(item)
+            index += 1
+
+            char = text[pos : pos + 1]
+            if char in _SPACE:
+                pos = ws(text, pos + 1).end()
+                char = text[pos : pos + 1]
+            if char == "]":
+                return result, pos + 1
+            if char != ",":
+                raise JSONDecodeError("Expecting ',' delimiter", text, pos)
+            pos += 1
+            if text[pos : pos + 1] in _SPACE:
+                pos = ws(text, pos + 1).end()
+
+
+def _skip(text: str, pos: int) -> int:
+    return _WHITESPACE.match(text, pos).end()
@@ -0,0 +1,156 @@
+"""Process-pool execution for linting large projects.
+
+Files are sharded across worker processes that each hold their own
+pre-loaded linter (schema, validators).  Results are yielded as one issue
+list per file in input order as soon as each file is done, so the merged
+output is identical to a serial run over the same file list and can be
+written out while later files are still being linted.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TypeVar
+
+from .perspective.linter import IgnitionPerspectiveLinter
+from .reporting import LintIssue
+from .scripts.linter import IgnitionScriptLinter, ScriptLintIssue
+from .validators.memo import MemoStats
+
+T = TypeVar("T")
+
+# Per-process linter state, populated once by the pool initializer (or
+# lazily for in-process serial runs).
+_perspective_linter: IgnitionPerspectiveLinter | None = None
+_component_type: str | None = None
+_script_linter: IgnitionScriptLinter | None = None
+
+
+def resolve_jobs(jobs: int | None) -> int:
+    """Normalize a ``--jobs`` value; 0 or negative means one worker per CPU."""
+    if jobs is None:
+        return 1
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _chunksize(total: int, jobs: int) -> int:
+    """Batch several files per task to amortize IPC without starving workers."""
+    return max(1, total // (jobs * 8))
+
+
+def _init_perspective_worker(
+    schema_path: str, component_type: str | None, ignore_codes: tuple[str, ...] = ()
+) -> None:
+    global _perspective_linter, _component_type
+    _perspective_linter = IgnitionPerspectiveLinter(schema_path, ignore_codes)
+    _component_type = component_type
+
+
+def _lint_view_file(
+    file_path: str,
+) -> tuple[list[LintIssue], list | None, dict[str, MemoStats]]:
+    linter = _perspective_linter
+    assert linter is not None, "perspective worker not initialized"
+    linter.issues = []
+    linter.lint_file(file_path, target_component_type=_component_type)
+    refs = linter.view_refs.pop(file_path, None)
+    return (
+        linter.issues,
+        None if refs is None else refs.to_json(),
+        linter.take_memo_stats(),
+    )
+
+
+def _init_script_worker() -> None:
+    global _script_linter
+    _script_linter = IgnitionScriptLinter()
+
+
+def _lint_script_file(file_path: str) -> tuple[list[ScriptLintIssue], list | None]:
+    linter = _script_linter
+    assert linter is not None, "script worker not initialized"
+    linter.issues = []
+    linter._lint_file(Path(file_path))
+    symbols = linter.symbols.pop(file_path, None)
+    return linter.issues, None if symbols is None else symbols.to_json()
+
+
+def _run(
+    func: Callable[[str], T],
+    files: Sequence[str],
+    jobs: int,
+    initializer: Callable[..., None],
+    initargs: tuple = (),
+) -> Iterator[T]:
+    """Apply *func* to every file, yielding results in input order."""
+    if not files:
+        return
+    if jobs <= 1 or len(files) < 2:
+        initializer(*initargs)
+        for file_path in files:
+            yield func(file_path)
+        return
+
+    workers = min(jobs, len(files))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as pool:
+        yield from pool.map(func, files, chunksize=_chunksize(len(files), workers))
+
+
+def lint_view_files(
+    view_files: Sequence[str | Path],
+    schema_path: str | Path,
+    component_type: str | None = None,
+    jobs: int = 1,
+    view_refs: dict[str, list] | None = None,
+    memo_stats: dict[str, MemoStats] | None = None,
+    ignore_codes: Iterable[str] = (),
+) -> Iterator[list[LintIssue]]:
+    """Lint view.json files across *jobs* processes; one issue list per file.
+
+    When *view_refs* is given it receives each file's cross-view
+    references (:meth:`ViewRefs.to_json` form), keyed by file path.  When
+    *memo_stats* is given the workers' expression and script memo stats
+    are added to it.  Both are complete once the iterator is exhausted.
+    Checks that can only report *ignore_codes* are not run.
+    """
+    files = [str(f) for f in view_files]
+    results = _run(
+        _lint_view_file,
+        files,
+        jobs,
+        _init_perspective_worker,
+        (str(schema_path), component_type, tuple(sorted(ignore_codes))),
+    )
+    for file_path, (file_issues, refs, file_stats) in zip(files, results, strict=True):
+        if view_refs is not None and refs is not None:
+            view_refs[file_path] = refs
+        if memo_stats is not None:
+            for name, stats in file_stats.items():
+                memo_stats.setdefault(name, MemoStats()).add(stats)
+        yield file_issues
+
+
+def lint_script_files(
+    py_files: Sequence[str | Path],
+    jobs: int = 1,
+    symbols: dict[str, list] | None = None,
+) -> Iterator[list[ScriptLintIssue]]:
+    """Lint standalone .py files across *jobs* processes; one issue list per file.
+
+    When *symbols* is given it receives each parsed file's script library
+    symbols and calls (:meth:`ScriptSymbols.to_json` form), keyed by file
+    path, as each file is yielded.
+    """
+    files = [str(f) for f in py_files]
+    results = _run(_lint_script_file, files, jobs, _init_script_worker)
+    for file_path, (file_issues, file_symbols) in zip(files, results, strict=True):
+        if symbols is not None and file_symbols is not None:
+            symbols[file_path] = file_symbols
+        yield file_issues
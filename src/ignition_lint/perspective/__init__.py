@@ -1,5 +1,5 @@
 """Perspective linting utilities."""
 
-from .linter import IgnitionPerspectiveLinter
+from .linter import IgnitionPerspectiveLinter, find_view_files
 
-__all__ = ["IgnitionPerspectiveLinter"]
+__all__ = ["IgnitionPerspectiveLinter", "find_view_files"]
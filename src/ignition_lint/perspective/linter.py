@@ -19,6 +19,8 @@ import json
 import os
 import re
 import sys
+from collections.abc import Iterable
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -36,15 +38,157 @@ except ImportError:  # pragma: no cover - optional dependency
         pass
 
 
+from ..json_positions import JsonPath, load_json_with_positions, locate_issues
 from ..reporting import LintIssue, LintSeverity
+from ..schemas import component_props_path as _component_props_path
 from ..schemas import schema_path_for as _schema_path_for
+from ..scripts.symbols import InlineCallCollector
 from ..validators.expression import ExpressionValidator
 from ..validators.jython import JythonValidator
+from ..validators.memo import MemoStats
+from ..validators.schema import get_schema_validator
+from .traversal import FunctionRule, Node, NodeKind, Rule, ViewTraversal
+from .view_graph import ViewRefs, ViewRefsRule
+from .view_model import ExpressionNode, ScriptNode, ViewModel, ViewModelBuilder
+
+# view.custom.X / view.params.X (also self.view.…, and ["X"] subscripts)
+_VIEW_PROP_REF_RE = re.compile(
+    r"(?<!\w)view\.(custom|params)"
+    r"(?:\.(\w[\w-]*)|\[\s*['\"]([^'\"]+)['\"]\s*\])"
+)
+
+# Codes each separately run check can report.  A check whose codes are all
+# in the linter's ignore_codes is skipped rather than run and filtered.
+RULE_CODES: dict[str, frozenset[str]] = {
+    "schema": frozenset({"SCHEMA_VALIDATION", "SCHEMA_VALIDATION_SKIPPED"}),
+    "best_practices": frozenset(
+        {
+            "UNKNOWN_PROP",
+            "MISSING_META_PROPERTY",
+            "EMPTY_COMPONENT_NAME",
+            "GENERIC_COMPONENT_NAME",
+            "PERFORMANCE_CONSIDERATION",
+            "MISSING_CHILD_POSITION",
+            "SINGLE_CHILD_FLEX",
+            "MISSING_FLEX_DIRECTION",
+            "EVENT_WRONG_CATEGORY",
+            "MISSING_LABEL_TEXT",
+            "MISSING_ICON_PATH",
+        }
+    ),
+    "accessibility": frozenset({"ACCESSIBILITY_LABELING"}),
+    "bindable_target": frozenset({"BINDING_NON_BINDABLE_PROPERTY"}),
+    "bindings": frozenset(
+        {
+            "INVALID_BINDING_TYPE",
+            "MISSING_TAG_PATH",
+            "MISSING_TAG_FALLBACK",
+            "MISSING_EXPRESSION",
+            "MISSING_PROPERTY_PATH",
+            "BINDING_ROOT_DOT_PATH",
+            "BINDING_BARE_ROOT_PATH",
+            "BINDING_INVALID_SCOPE",
+            "INVALID_TRANSFORM_TYPE",
+            "MISSING_SCRIPT_CODE",
+            "MISSING_TRANSFORM_EXPRESSION",
+            "MISSING_MAP_MAPPINGS",
+            "MISSING_MAP_FALLBACK",
+        }
+    ),
+    "unused_properties": frozenset({"UNUSED_CUSTOM_PROPERTY", "UNUSED_PARAM_PROPERTY"}),
+    "param_directions": frozenset({"MISSING_PARAM_DIRECTION"}),
+    "binding_paths": frozenset(
+        {
+            "BINDING_COMPONENT_NOT_FOUND",
+            "BINDING_VIEW_PROP_NOT_FOUND",
+            "EXPR_VIEW_PROP_NOT_FOUND",
+        }
+    ),
+}
+
+
+class _ViewReferenceRule(Rule):
+    """Index the view custom/param properties referenced anywhere in a view.
+
+    Every string value (expressions, scripts, binding configs) is tokenized
+    once for ``view.custom.*`` / ``view.params.*`` references, and a
+    propConfig key such as ``custom.X`` counts as a reference to ``X``.
+    """
+
+    kinds = frozenset({NodeKind.STRING, NodeKind.PROP_CONFIG})
+
+    def __init__(self):
+        self.refs: dict[str, set[str]] = {"custom": set(), "params": set()}
+
+    def visit(self, node: Node) -> None:
+        refs = self.refs
+        if node.kind is NodeKind.STRING:
+            for text in node.value:
+                if "view" in text:
+                    for m in _VIEW_PROP_REF_RE.finditer(text):
+                        name = m.group(2)
+                        if name is None:
+                            refs[m.group(1)].add(m.group(3))
+                        else:
+                            # Hyphenated names are legal, but in a script
+                            # "a-1" is also a subtraction: index both readings
+                            refs[m.group(1)].update((name, name.split("-")[0]))
+        elif node.scope.is_view:
+            kind, _, name = node.prop_name.partition(".")
+            if kind in refs and name:
+                refs[kind].add(name.partition(".")[0])
+
+
+class _ScopeAnchorRule(Rule):
+    """Map both path styles of every scope to its JSON path in the document."""
+
+    kinds = frozenset({NodeKind.VIEW, NodeKind.COMPONENT})
+
+    def __init__(self):
+        self.anchors: dict[str, list[JsonPath]] = {}
+
+    def visit(self, node: Node) -> None:
+        scope = node.scope
+        self.anchors.setdefault(scope.path, []).append(scope.pointer)
+        self.anchors.setdefault(scope.resolution_path, []).append(scope.pointer)
+
+
+def find_view_files(target_path: str | Path) -> list[str]:
+    """Find all view.json files in the target directory.
+
+    A project's ``com.inductiveautomation.perspective/views`` directory is
+    searched when present, otherwise the whole target.
+    """
+    view_files = []
+    target = Path(target_path)
+
+    if not target.exists():
+        print(f"ERROR: Target path does not exist: {target_path}", file=sys.stderr)
+        return []
+
+    # Look for perspective views structure
+    perspective_path = target / "com.inductiveautomation.perspective" / "views"
+    if perspective_path.exists():
+        search_path = perspective_path
+    else:
+        search_path = target
+
+    for root, _dirs, files in os.walk(search_path):
+        for file in files:
+            if file == "view.json":
+                view_files.append(os.path.join(root, file))
+
+    # Sorted so results are deterministic across filesystems and runs
+    return sorted(view_files)
 
 
 class IgnitionPerspectiveLinter:
-    def __init__(self, schema_path: str = None):
-        """Initialize the linter with the component schema."""
+    def __init__(self, schema_path: str = None, ignore_codes: Iterable[str] = ()):
+        """Initialize the linter with the component schema.
+
+        Checks (see ``RULE_CODES``) that can only report codes in
+        *ignore_codes* are not run.
+        """
         if schema_path is None:
             schema_path = _schema_path_for("robust")
         else:
@@ -53,7 +197,16 @@ class IgnitionPerspectiveLinter:
         self.schema_path = schema_path
         self.jsonschema_available = JSONSCHEMA_AVAILABLE and validate is not None
         self.schema = self._load_schema(schema_path)
+        self.schema_validator = (
+            get_schema_validator(schema_path, self.schema)
+            if self.jsonschema_available
+            else None
+        )
         self.issues: list[LintIssue] = []
+        ignored = frozenset(ignore_codes)
+        self.skipped_rules = frozenset(
+            rule for rule, codes in RULE_CODES.items() if codes <= ignored
+        )
         self.component_stats = {
             "total_files": 0,
             "total_components": 0,
@@ -62,7 +215,10 @@ class IgnitionPerspectiveLinter:
             "component_types": set(),
         }
         self._missing_schema_files: set[str] = set()
+        # Per-file cross-view references, joined project-wide by ViewGraph
+        self.view_refs: dict[str, ViewRefs] = {}
         self.jython_validator = JythonValidator()
+        self.call_collector = InlineCallCollector()
         self.expression_validator = ExpressionValidator()
         self.known_prop_names = self._extract_known_props()
         self._component_props = self._load_component_props()
@@ -160,11 +316,8 @@ class IgnitionPerspectiveLinter:
     @staticmethod
     def _load_component_props() -> dict[str, frozenset[str]]:
         """Load per-component property map from component-props.json."""
-        comp_props_path = (
-            Path(__file__).parent.parent / "schemas" / "component-props.json"
-        )
         try:
-            with open(comp_props_path) as f:
+            with open(_component_props_path()) as f:
                 raw = json.load(f)
             return {k: frozenset(v) for k, v in raw.items()}
         except (FileNotFoundError, json.JSONDecodeError):
@@ -179,59 +332,36 @@ class IgnitionPerspectiveLinter:
         type_specific = self._component_props.get(comp_type, frozenset())
         return self.known_prop_names | type_specific
 
+    def take_memo_stats(self) -> dict[str, MemoStats]:
+        """Expression and script memo stats since the last call, then reset."""
+        return {
+            "expression": self.expression_validator.memo.take_stats(),
+            "jython": self.jython_validator.memo.take_stats(),
+            "script call": self.call_collector.memo.take_stats(),
+        }
+
     def find_view_files(self, target_path: str) -> list[str]:
         """Find all view.json files in the target directory."""
-        view_files = []
-        target = Path(target_path)
-
-        if not target.exists():
-            print(f"ERROR: Target path does not exist: {target_path}", file=sys.stderr)
-            return []
-
-        # Look for perspective views structure
-        perspective_path = target / "com.inductiveautomation.perspective" / "views"
-        if perspective_path.exists():
-            search_path = perspective_path
-        else:
-            search_path = target
-
-        for root, _dirs, files in os.walk(search_path):
-            for file in files:
-                if file == "view.json":
-                    view_files.append(os.path.join(root, file))
-
-        return view_files
+        return find_view_files(target_path)
 
     def extract_components_with_context(
         self, view_data: dict, file_path: str
     ) -> list[tuple[dict, str, str]]:
         """Extract all ia.* components with their context path."""
-        components = []
+        components: list[tuple[dict, str, str]] = []
 
-        def extract_recursive(obj, path="root"):
-            if isinstance(obj, dict):
-                if (
-                    "type" in obj
-                    and isinstance(obj["type"], str)
-                    and obj["type"].startswith("ia.")
-                ):
-                    components.append((obj, file_path, path))
-
-                if "children" in obj and isinstance(obj["children"], list):
-                    for i, child in enumerate(obj["children"]):
-                        extract_recursive(child, f"{path}.children[{i}]")
+        def collect(node: Node) -> None:
+            if node.scope.is_component:
+                components.append((node.value, file_path, node.scope.path))
 
-                if "root" in obj:
-                    extract_recursive(obj["root"], f"{path}.root")
-
-        extract_recursive(view_data)
+        ViewTraversal([FunctionRule({NodeKind.COMPONENT}, collect)]).walk(view_data)
         return components
 
     def validate_component_schema(
         self, component: dict, file_path: str, component_path: str
     ) -> bool:
         """Validate a component against the schema."""
-        if not self.jsonschema_available or validate is None:
+        if self.schema_validator is None:
             if file_path not in self._missing_schema_files:
                 self._missing_schema_files.add(file_path)
                 self.issues.append(
@@ -247,24 +377,24 @@ class IgnitionPerspectiveLinter:
                 )
             return True
 
-        try:
-            validate(instance=component, schema=self.schema)
+        e = self.schema_validator.first_error(component)
+        if e is None:
             return True
-        except ValidationError as e:
-            self.issues.append(
-                LintIssue(
-                    severity=LintSeverity.ERROR,
-                    code="SCHEMA_VALIDATION",
-                    message=f"Schema validation failed: {e.message}",
-                    file_path=file_path,
-                    component_path=component_path,
-                    component_type=component.get("type", "unknown"),
-                    suggestion=f"Path: {'.'.join(map(str, e.absolute_path))}"
-                    if e.absolute_path
-                    else None,
-                )
+
+        self.issues.append(
+            LintIssue(
+                severity=LintSeverity.ERROR,
+                code="SCHEMA_VALIDATION",
+                message=f"Schema validation failed: {e.message}",
+                file_path=file_path,
+                component_path=component_path,
+                component_type=component.get("type", "unknown"),
+                suggestion=f"Path: {'.'.join(map(str, e.absolute_path))}"
+                if e.absolute_path
+                else None,
             )
-            return False
+        )
+        return False
 
     def check_component_best_practices(
         self, component: dict, file_path: str, component_path: str
@@ -400,12 +530,6 @@ class IgnitionPerspectiveLinter:
                 and not has_bound_direction
                 and len(children) > 1
             ):
-                comp_name = component.get("meta", {}).get("name", "")
-                metadata = {
-                    "search_key": '"justify"' if "justify" in props else '"props"'
-                }
-                if comp_name:
-                    metadata["component_name"] = comp_name
                 self.issues.append(
                     LintIssue(
                         severity=LintSeverity.INFO,
@@ -418,17 +542,8 @@ class IgnitionPerspectiveLinter:
                     )
                 )
 
-        # Validate bindings
-        self._validate_bindings(component, file_path, component_path)
-
-        # Validate event handler Jython scripts
-        self._validate_event_scripts(component, file_path, component_path)
-
-        # Validate onChange scripts in propConfig
-        self._validate_onchange_scripts(component, file_path, component_path)
-
-        # Validate expression bindings and transforms
-        self._validate_expressions(component, file_path, component_path)
+        # Check event handlers are registered under the right category
+        self._check_event_categories(component, file_path, component_path)
 
         # Check for missing text in labels
         if comp_type == "ia.display.label":
@@ -558,82 +673,83 @@ class IgnitionPerspectiveLinter:
         "onBlur": "focus",
     }
 
-    def _validate_bindings(self, component: dict, file_path: str, component_path: str):
-        """Validate bindings based on empirical analysis patterns."""
-        prop_config = component.get("propConfig", {})
-        comp_type = component.get("type", "unknown")
-
-        # Check for non-bindable structural properties in propConfig
-        for prop_name in prop_config:
-            if not prop_name.startswith(self._VALID_BINDING_SCOPES):
-                self.issues.append(
-                    LintIssue(
-                        severity=LintSeverity.ERROR,
-                        code="BINDING_NON_BINDABLE_PROPERTY",
-                        message=f"propConfig targets non-bindable structural property '{prop_name}'",
-                        file_path=file_path,
-                        component_path=f"{component_path}.propConfig.{prop_name}",
-                        component_type=comp_type,
-                        suggestion=(
-                            f"'{prop_name}' is a structural key with no binding scope. "
-                            "Only props.*, position.*, custom.*, meta.*, and params.* "
-                            "are bindable. This will cause an IllegalArgumentException "
-                            "in Ignition Designer."
-                        ),
-                    )
-                )
-
-        # Validate each property binding
-        for prop_name, config in prop_config.items():
-            if "binding" not in config:
-                continue
+    def _check_bindable_target(
+        self, prop_name: str, file_path: str, component_path: str, comp_type: str
+    ):
+        """Flag propConfig keys that have no binding scope."""
+        if prop_name.startswith(self._VALID_BINDING_SCOPES):
+            return
+        self.issues.append(
+            LintIssue(
+                severity=LintSeverity.ERROR,
+                code="BINDING_NON_BINDABLE_PROPERTY",
+                message=f"propConfig targets non-bindable structural property '{prop_name}'",
+                file_path=file_path,
+                component_path=f"{component_path}.propConfig.{prop_name}",
+                component_type=comp_type,
+                suggestion=(
+                    f"'{prop_name}' is a structural key with no binding scope. "
+                    "Only props.*, position.*, custom.*, meta.*, and params.* "
+                    "are bindable. This will cause an IllegalArgumentException "
+                    "in Ignition Designer."
+                ),
+            )
+        )
 
-            binding = config["binding"]
-            binding_type = binding.get("type")
-            binding_config = binding.get("config", {})
-            transforms = binding.get("transforms", [])
-
-            # Validate binding type
-            valid_binding_types = [
-                "property",
-                "expr",
-                "tag",
-                "expr-struct",
-                "query",
-                "tag-history",
-            ]
-            if binding_type not in valid_binding_types:
-                self.issues.append(
-                    LintIssue(
-                        severity=LintSeverity.ERROR,
-                        code="INVALID_BINDING_TYPE",
-                        message=f"Invalid binding type '{binding_type}' for {prop_name}",
-                        file_path=file_path,
-                        component_path=f"{component_path}.propConfig.{prop_name}",
-                        component_type=comp_type,
-                        suggestion=f"Use one of: {', '.join(valid_binding_types)}",
-                    )
+    def _validate_binding(
+        self,
+        binding: dict,
+        prop_name: str,
+        file_path: str,
+        component_path: str,
+        comp_type: str,
+    ):
+        """Validate a component binding based on empirical analysis patterns."""
+        binding_type = binding.get("type")
+        binding_config = binding.get("config", {})
+        transforms = binding.get("transforms", [])
+
+        # Validate binding type
+        valid_binding_types = [
+            "property",
+            "expr",
+            "tag",
+            "expr-struct",
+            "query",
+            "tag-history",
+        ]
+        if binding_type not in valid_binding_types:
+            self.issues.append(
+                LintIssue(
+                    severity=LintSeverity.ERROR,
+                    code="INVALID_BINDING_TYPE",
+                    message=f"Invalid binding type '{binding_type}' for {prop_name}",
+                    file_path=file_path,
+                    component_path=f"{component_path}.propConfig.{prop_name}",
+                    component_type=comp_type,
+                    suggestion=f"Use one of: {', '.join(valid_binding_types)}",
                 )
+            )
 
-            # Validate type-specific configurations
-            if binding_type == "tag":
-                self._validate_tag_binding(
-                    binding_config, prop_name, file_path, component_path, comp_type
-                )
-            elif binding_type == "expr":
-                self._validate_expr_binding(
-                    binding_config, prop_name, file_path, component_path, comp_type
-                )
-            elif binding_type == "property":
-                self._validate_property_binding(
-                    binding_config, prop_name, file_path, component_path, comp_type
-                )
+        # Validate type-specific configurations
+        if binding_type == "tag":
+            self._validate_tag_binding(
+                binding_config, prop_name, file_path, component_path, comp_type
+            )
+        elif binding_type == "expr":
+            self._validate_expr_binding(
+                binding_config, prop_name, file_path, component_path, comp_type
+            )
+        elif binding_type == "property":
+            self._validate_property_binding(
+                binding_config, prop_name, file_path, component_path, comp_type
+            )
 
-            # Validate transforms
-            for i, transform in enumerate(transforms):
-                self._validate_transform(
-                    transform, prop_name, i, file_path, component_path, comp_type
-                )
+        # Validate transforms
+        for i, transform in enumerate(transforms):
+            self._validate_transform(
+                transform, prop_name, i, file_path, component_path, comp_type
+            )
 
     def _validate_tag_binding(
         self,
@@ -825,32 +941,20 @@ class IgnitionPerspectiveLinter:
                 )
             )
 
-        # Validate type-specific requirements
-        if transform_type == "script":
-            if "code" not in transform:
-                self.issues.append(
-                    LintIssue(
-                        severity=LintSeverity.ERROR,
-                        code="MISSING_SCRIPT_CODE",
-                        message=f"Script transform for {prop_name} missing 'code' property",
-                        file_path=file_path,
-                        component_path=f"{component_path}.propConfig.{prop_name}.transforms[{index}]",
-                        component_type=comp_type,
-                        suggestion="Add 'code' property with Jython script",
-                    )
-                )
-            else:
-                # Validate the Jython script content
-                script_code = transform["code"]
-                context = f"transform[{index}]"
-                self._validate_jython_script(
-                    script_code,
-                    prop_name,
-                    context,
-                    file_path,
-                    component_path,
-                    comp_type,
+        # Validate type-specific requirements (script bodies are validated
+        # from SCRIPT nodes during traversal)
+        if transform_type == "script" and "code" not in transform:
+            self.issues.append(
+                LintIssue(
+                    severity=LintSeverity.ERROR,
+                    code="MISSING_SCRIPT_CODE",
+                    message=f"Script transform for {prop_name} missing 'code' property",
+                    file_path=file_path,
+                    component_path=f"{component_path}.propConfig.{prop_name}.transforms[{index}]",
+                    component_type=comp_type,
+                    suggestion="Add 'code' property with Jython script",
                 )
+            )
 
         if transform_type == "expression" and "expression" not in transform:
             self.issues.append(
@@ -893,336 +997,163 @@ class IgnitionPerspectiveLinter:
                     )
                 )
 
-    def _validate_jython_script(
-        self,
-        script_content: str,
-        prop_name: str,
-        context: str,
-        file_path: str,
-        component_path: str,
-        comp_type: str,
-    ):
-        """Validate inline Jython scripts using the shared validator."""
-        if not script_content or not script_content.strip():
-            return
-
-        validator_issues = self.jython_validator.validate_script(
-            script_content, context=context
-        )
-        for issue in validator_issues:
-            issue.file_path = file_path
-            issue.component_path = f"{component_path}.{prop_name}"
-            issue.component_type = comp_type
-            self.issues.append(issue)
-
-    def _validate_event_scripts(
+    def _check_event_categories(
         self, component: dict, file_path: str, component_path: str
     ):
-        """Validate Jython scripts in event handlers."""
+        """Check that each event handler is registered under its category."""
         events = component.get("events", {})
         comp_type = component.get("type", "unknown")
+        if not isinstance(events, dict):
+            return
 
         for event_category, handlers in events.items():
-            if isinstance(handlers, dict):
-                for event_name, handler_config in handlers.items():
-                    # Check that event is under the correct category
-                    expected_category = self._EVENT_CATEGORY_MAP.get(event_name)
-                    if (
-                        expected_category is not None
-                        and event_category != expected_category
-                    ):
-                        self.issues.append(
-                            LintIssue(
-                                severity=LintSeverity.ERROR,
-                                code="EVENT_WRONG_CATEGORY",
-                                message=(
-                                    f"Event '{event_name}' is a {expected_category} "
-                                    f"event but was found under '{event_category}'"
-                                ),
-                                file_path=file_path,
-                                component_path=component_path,
-                                component_type=comp_type,
-                                suggestion=f"Move to events.{expected_category}.{event_name}",
-                            )
-                        )
-
-                    # Handle both single handler and array of handlers
-                    handlers_list = (
-                        handler_config
-                        if isinstance(handler_config, list)
-                        else [handler_config]
-                    )
-
-                    for j, handler in enumerate(handlers_list):
-                        if (
-                            isinstance(handler, dict)
-                            and handler.get("type") == "script"
-                        ):
-                            script_code = handler.get("config", {}).get("script", "")
-                            if script_code:
-                                context = f"event.{event_category}.{event_name}[{j}]"
-                                prop_name = f"events.{event_category}.{event_name}"
-                                self._validate_jython_script(
-                                    script_code,
-                                    prop_name,
-                                    context,
-                                    file_path,
-                                    component_path,
-                                    comp_type,
-                                )
-
-    def _validate_expressions(
-        self, component: dict, file_path: str, component_path: str
-    ):
-        """Validate expression bindings and expression transforms in a component."""
-        prop_config = component.get("propConfig", {})
-        comp_type = component.get("type", "unknown")
-
-        for prop_name, config in prop_config.items():
-            if not isinstance(config, dict):
-                continue
-
-            binding = config.get("binding")
-            if not isinstance(binding, dict):
+            if not isinstance(handlers, dict):
                 continue
-
-            binding_type = binding.get("type")
-            binding_config = binding.get("config", {})
-
-            # expr bindings
-            if binding_type == "expr" and isinstance(binding_config, dict):
-                expression = binding_config.get("expression", "")
-                if expression:
-                    self.issues.extend(
-                        self.expression_validator.validate_expression(
-                            expression,
-                            f"expr({prop_name})",
-                            file_path,
-                            f"{component_path}.propConfig.{prop_name}",
-                            comp_type,
-                        )
-                    )
-
-            # expr-struct bindings - each member has its own expression
-            if binding_type == "expr-struct" and isinstance(binding_config, dict):
-                struct = binding_config.get("struct", {})
-                if isinstance(struct, dict):
-                    for member_name, member_expr in struct.items():
-                        if isinstance(member_expr, str) and member_expr.strip():
-                            self.issues.extend(
-                                self.expression_validator.validate_expression(
-                                    member_expr,
-                                    f"expr-struct({prop_name}.{member_name})",
-                                    file_path,
-                                    f"{component_path}.propConfig.{prop_name}.{member_name}",
-                                    comp_type,
-                                )
-                            )
-
-            # Expression transforms
-            transforms = binding.get("transforms", [])
-            for i, transform in enumerate(transforms):
+            for event_name in handlers:
+                expected_category = self._EVENT_CATEGORY_MAP.get(event_name)
                 if (
-                    isinstance(transform, dict)
-                    and transform.get("type") == "expression"
+                    expected_category is not None
+                    and event_category != expected_category
                 ):
-                    expr_text = transform.get("expression", "")
-                    if expr_text:
-                        self.issues.extend(
-                            self.expression_validator.validate_expression(
-                                expr_text,
-                                f"transform[{i}]({prop_name})",
-                                file_path,
-                                f"{component_path}.propConfig.{prop_name}.transforms[{i}]",
-                                comp_type,
-                            )
+                    self.issues.append(
+                        LintIssue(
+                            severity=LintSeverity.ERROR,
+                            code="EVENT_WRONG_CATEGORY",
+                            message=(
+                                f"Event '{event_name}' is a {expected_category} "
+                                f"event but was found under '{event_category}'"
+                            ),
+                            file_path=file_path,
+                            component_path=component_path,
+                            component_type=comp_type,
+                            suggestion=f"Move to events.{expected_category}.{event_name}",
                         )
+                    )
 
-    def _validate_propconfig_expressions(
-        self, prop_config: dict, file_path: str, context_prefix: str
-    ):
-        """Validate expression bindings in a propConfig dict (for view-level usage)."""
-        for prop_name, config in prop_config.items():
-            if not isinstance(config, dict):
-                continue
+    # --- Traversal handlers ---
 
-            binding = config.get("binding")
-            if not isinstance(binding, dict):
-                continue
+    def _visit_component(self, node: Node, file_path: str) -> None:
+        """Schema, best-practice and accessibility checks for one component."""
+        scope = node.scope
+        if not scope.is_component or not scope.selected:
+            return
 
-            binding_type = binding.get("type")
-            binding_config = binding.get("config", {})
-
-            if binding_type == "expr" and isinstance(binding_config, dict):
-                expression = binding_config.get("expression", "")
-                if expression:
-                    self.issues.extend(
-                        self.expression_validator.validate_expression(
-                            expression,
-                            f"view.expr({prop_name})",
-                            file_path,
-                            f"{context_prefix}.propConfig.{prop_name}",
-                            "view",
-                        )
-                    )
+        component = node.value
+        self.component_stats["component_types"].add(scope.component_type)
+        self.component_stats["total_components"] += 1
 
-            if binding_type == "expr-struct" and isinstance(binding_config, dict):
-                struct = binding_config.get("struct", {})
-                if isinstance(struct, dict):
-                    for member_name, member_expr in struct.items():
-                        if isinstance(member_expr, str) and member_expr.strip():
-                            self.issues.extend(
-                                self.expression_validator.validate_expression(
-                                    member_expr,
-                                    f"view.expr-struct({prop_name}.{member_name})",
-                                    file_path,
-                                    f"{context_prefix}.propConfig.{prop_name}.{member_name}",
-                                    "view",
-                                )
-                            )
-
-            transforms = binding.get("transforms", [])
-            for i, transform in enumerate(transforms):
-                if (
-                    isinstance(transform, dict)
-                    and transform.get("type") == "expression"
-                ):
-                    expr_text = transform.get("expression", "")
-                    if expr_text:
-                        self.issues.extend(
-                            self.expression_validator.validate_expression(
-                                expr_text,
-                                f"view.transform[{i}]({prop_name})",
-                                file_path,
-                                f"{context_prefix}.propConfig.{prop_name}.transforms[{i}]",
-                                "view",
-                            )
-                        )
+        if "schema" in self.skipped_rules or self.validate_component_schema(
+            component, file_path, scope.path
+        ):
+            self.component_stats["valid_components"] += 1
+        else:
+            self.component_stats["invalid_components"] += 1
+            self._file_valid = False
+
+        if "best_practices" not in self.skipped_rules:
+            self.check_component_best_practices(component, file_path, scope.path)
+        if "accessibility" not in self.skipped_rules:
+            self.check_component_accessibility(component, file_path, scope.path)
+
+    def _visit_prop_config(self, node: Node, file_path: str) -> None:
+        scope = node.scope
+        if scope.linted:
+            self._check_bindable_target(
+                node.prop_name, file_path, scope.path, scope.component_type
+            )
 
-    def _validate_onchange_scripts(
-        self, component: dict, file_path: str, component_path: str
-    ):
-        """Validate onChange scripts within a component's propConfig."""
-        prop_config = component.get("propConfig", {})
-        comp_type = component.get("type", "unknown")
+    def _visit_binding(self, node: Node, file_path: str) -> None:
+        scope = node.scope
+        if scope.linted and not scope.is_view:
+            self._validate_binding(
+                node.value, node.prop_name, file_path, scope.path, scope.component_type
+            )
+
+    # --- View model consumers ---
 
-        for prop_name, config in prop_config.items():
-            on_change = config.get("onChange") if isinstance(config, dict) else None
-            if not isinstance(on_change, dict):
+    def _check_scripts(self, scripts: list[ScriptNode], file_path: str) -> None:
+        """Validate a view's event, onChange and transform scripts as one batch."""
+        batch = []
+        for script in scripts:
+            scope = script.scope
+            if scope is None or not scope.linted:
                 continue
-            script_code = on_change.get("script", "")
-            if script_code:
+
+            prop_name = script.prop_name
+            if script.script_type == "event":
+                context = f"event.{script.event}[{script.index}]"
+                target = f"events.{script.event}"
+            elif script.script_type == "onChange":
                 context = f"onChange({prop_name})"
-                self._validate_jython_script(
-                    script_code,
-                    f"propConfig.{prop_name}.onChange",
-                    context,
-                    file_path,
-                    component_path,
-                    comp_type,
-                )
+                target = f"propConfig.{prop_name}.onChange"
+            elif scope.is_view:
+                context = f"binding.transform[{script.index}]"
+                target = f"propConfig.{prop_name}.binding.transforms[{script.index}]"
+            else:
+                context = f"transform[{script.index}]"
+                target = prop_name
 
-    def _validate_propconfig_scripts(
-        self, prop_config: dict, file_path: str, context_prefix: str
-    ):
-        """Validate onChange and transform scripts in a propConfig dict (view-level or component-level)."""
-        for prop_name, config in prop_config.items():
-            if not isinstance(config, dict):
-                continue
+            if scope.is_view:
+                context = f"view.{context}"
+            batch.append((script, target, context))
 
-            # onChange scripts
-            on_change = config.get("onChange")
-            if isinstance(on_change, dict):
-                script_code = on_change.get("script", "")
-                if script_code:
-                    context = f"{context_prefix}.onChange({prop_name})"
-                    self._validate_jython_script(
-                        script_code,
-                        f"propConfig.{prop_name}.onChange",
-                        context,
-                        file_path,
-                        context_prefix,
-                        "view",
-                    )
+        results = self.jython_validator.validate_many(
+            ((script.content, context) for script, _, context in batch),
+            embedded=True,
+        )
+        for (script, target, _), issues in zip(batch, results, strict=True):
+            for issue in issues:
+                issue.file_path = file_path
+                issue.component_path = f"{script.component_path}.{target}"
+                issue.component_type = script.component_type
+                self.issues.append(issue)
+
+    def _check_expression(self, expression: ExpressionNode, file_path: str) -> None:
+        """Validate an expression binding, expr-struct member or transform."""
+        scope = expression.scope
+        if scope is None or not scope.linted:
+            return
 
-            # Transform scripts on bindings
-            binding = config.get("binding")
-            if isinstance(binding, dict):
-                transforms = binding.get("transforms", [])
-                for i, transform in enumerate(transforms):
-                    if (
-                        isinstance(transform, dict)
-                        and transform.get("type") == "script"
-                    ):
-                        script_code = transform.get("code", "")
-                        if script_code:
-                            context = f"{context_prefix}.binding.transform[{i}]"
-                            self._validate_jython_script(
-                                script_code,
-                                f"propConfig.{prop_name}.binding.transforms[{i}]",
-                                context,
-                                file_path,
-                                context_prefix,
-                                "view",
-                            )
+        prop_name = expression.prop_name
+        location = f"{expression.component_path}.propConfig.{prop_name}"
+        if expression.source == "expr":
+            context = f"expr({prop_name})"
+        elif expression.source == "expr-struct":
+            context = f"expr-struct({prop_name}.{expression.member})"
+            location = f"{location}.{expression.member}"
+        else:
+            context = f"transform[{expression.index}]({prop_name})"
+            location = f"{location}.transforms[{expression.index}]"
+
+        if scope.is_view:
+            context = f"view.{context}"
+        self.issues.extend(
+            self.expression_validator.validate_expression(
+                expression.content,
+                context,
+                file_path,
+                location,
+                expression.component_type,
+            )
+        )
 
-    @staticmethod
-    def _collect_all_strings(obj: Any) -> list[str]:
-        """Recursively collect all string values from a JSON structure."""
-        strings: list[str] = []
-        if isinstance(obj, str):
-            strings.append(obj)
-        elif isinstance(obj, dict):
-            for v in obj.values():
-                strings.extend(IgnitionPerspectiveLinter._collect_all_strings(v))
-        elif isinstance(obj, list):
-            for item in obj:
-                strings.extend(IgnitionPerspectiveLinter._collect_all_strings(item))
-        return strings
+    def _check_unused_properties(self, model: ViewModel, refs: dict[str, set[str]]):
+        """Check for custom and param properties that appear unreferenced within the view.
 
-    @staticmethod
-    def _collect_propconfig_keys(obj: Any, prefix: str = "") -> set[str]:
-        """Recursively collect all propConfig key paths from a JSON structure."""
-        keys: set[str] = set()
-        if isinstance(obj, dict):
-            prop_config = obj.get("propConfig", {})
-            if isinstance(prop_config, dict):
-                for k in prop_config:
-                    keys.add(k)
-            for v in obj.values():
-                keys.update(IgnitionPerspectiveLinter._collect_propconfig_keys(v))
-        elif isinstance(obj, list):
-            for item in obj:
-                keys.update(IgnitionPerspectiveLinter._collect_propconfig_keys(item))
-        return keys
-
-    def _check_unused_properties(self, view_data: dict, file_path: str):
-        """Check for custom and param properties that appear unreferenced within the view."""
-        custom_props = view_data.get("custom", {})
-        params_props = view_data.get("params", {})
-
-        if not custom_props and not params_props:
+        *refs* maps ``"custom"`` and ``"params"`` to the property names
+        referenced anywhere in the view, as indexed during traversal.
+        """
+        if not model.properties:
             return
 
-        # Collect all strings and propConfig keys from the entire view
-        all_strings = self._collect_all_strings(view_data)
-        all_text = "\n".join(all_strings)
-        propconfig_keys = self._collect_propconfig_keys(view_data)
-
-        # Check custom properties
-        if isinstance(custom_props, dict):
-            for prop_name in custom_props:
-                # Search for references in expressions, scripts, and propConfig keys
-                expr_ref = f"view.custom.{prop_name}"
-                script_ref = f"self.view.custom.{prop_name}"
-                binding_target = f"custom.{prop_name}"
-
-                found = (
-                    expr_ref in all_text
-                    or script_ref in all_text
-                    or binding_target in propconfig_keys
-                )
-                if not found:
+        file_path = model.file_path
+        unused_custom = model.custom_property_names - refs["custom"]
+        unused_params = model.param_property_names - refs["params"]
+
+        for prop in model.properties:
+            prop_name = prop.name
+            if prop.kind == "custom":
+                if prop_name in unused_custom:
                     self.issues.append(
                         LintIssue(
                             severity=LintSeverity.WARNING,
@@ -1234,31 +1165,18 @@ class IgnitionPerspectiveLinter:
                             suggestion="Remove if unused, or verify it's referenced by an embedding view",
                         )
                     )
-
-        # Check param properties
-        if isinstance(params_props, dict):
-            for prop_name in params_props:
-                expr_ref = f"view.params.{prop_name}"
-                script_ref = f"self.view.params.{prop_name}"
-                binding_target = f"params.{prop_name}"
-
-                found = (
-                    expr_ref in all_text
-                    or script_ref in all_text
-                    or binding_target in propconfig_keys
-                )
-                if not found:
-                    self.issues.append(
-                        LintIssue(
-                            severity=LintSeverity.INFO,
-                            code="UNUSED_PARAM_PROPERTY",
-                            message=f"Param property '{prop_name}' appears unreferenced in this view",
-                            file_path=file_path,
-                            component_path=f"params.{prop_name}",
-                            component_type="view",
-                            suggestion="Params may be set by embedding views; verify before removing",
-                        )
+            elif prop_name in unused_params:
+                self.issues.append(
+                    LintIssue(
+                        severity=LintSeverity.INFO,
+                        code="UNUSED_PARAM_PROPERTY",
+                        message=f"Param property '{prop_name}' appears unreferenced in this view",
+                        file_path=file_path,
+                        component_path=f"params.{prop_name}",
+                        component_type="view",
+                        suggestion="Params may be set by embedding views; verify before removing",
                     )
+                )
 
     def _check_param_directions(self, view_data: dict, file_path: str):
         """Check that view params have explicit paramDirection in propConfig.
@@ -1324,27 +1242,6 @@ class IgnitionPerspectiveLinter:
 
     _PROPERTY_BOUNDARY_RE = re.compile(r"\.(props|custom|position|meta)\.")
 
-    @staticmethod
-    def _build_component_name_tree(node: dict) -> dict:
-        """Build a nested dict from the component tree keyed by meta.name.
-
-        Returns a dict like:
-        {"Header": {"_type": "ia.container.flex", "_children": {"Label": {...}}}, ...}
-        """
-        tree: dict = {}
-        for child in node.get("children", []):
-            name = child.get("meta", {}).get("name", "")
-            if not name:
-                continue
-            entry: dict = {
-                "_type": child.get("type", "unknown"),
-                "_children": IgnitionPerspectiveLinter._build_component_name_tree(
-                    child
-                ),
-            }
-            tree[name] = entry
-        return tree
-
     def _resolve_component_path(
         self,
         path: str,
@@ -1390,23 +1287,56 @@ class IgnitionPerspectiveLinter:
                 return
             current = current[segment].get("_children", {})
 
-    def _validate_binding_paths(self, view_data: dict, file_path: str):
-        """View-level pass: resolve view property refs and component paths in bindings."""
-        custom_keys = set()
-        params_keys = set()
-        custom = view_data.get("custom", {})
-        params = view_data.get("params", {})
-        if isinstance(custom, dict):
-            custom_keys = set(custom.keys())
-        if isinstance(params, dict):
-            params_keys = set(params.keys())
+    def _validate_binding_paths(self, model: ViewModel):
+        """Resolve view property refs and /root/ component paths in bindings."""
+        custom_keys = model.custom_property_names
+        params_keys = model.param_property_names
+        file_path = model.file_path
 
-        name_tree = self._build_component_name_tree(view_data.get("root", {}))
+        for binding in model.bindings:
+            path = binding.property_path
+            if binding.binding_type != "property" or not isinstance(path, str):
+                continue
+            component_path = (
+                f"{binding.scope.resolution_path}.propConfig.{binding.prop_path}"
+            )
+            # Tier 2: Resolve view.custom.X / view.params.X in property bindings
+            self._check_view_prop_ref(
+                path,
+                custom_keys,
+                params_keys,
+                file_path,
+                component_path,
+                binding.component_type,
+                code="BINDING_VIEW_PROP_NOT_FOUND",
+            )
+            # Tier 3: Resolve /root/A/B component paths in property bindings
+            if path.startswith("/root/"):
+                self._resolve_component_path(
+                    path[len("/root/") :],
+                    model.name_tree,
+                    file_path,
+                    component_path,
+                    binding.component_type,
+                )
 
-        # Walk the entire view collecting property binding paths and expression refs
-        self._walk_bindings_for_resolution(
-            view_data, file_path, custom_keys, params_keys, name_tree
-        )
+        # Tier 2: Check expression refs {view.custom.X} / {view.params.X}
+        for expression in model.expressions:
+            component_path = (
+                f"{expression.scope.resolution_path}.propConfig.{expression.prop_name}"
+            )
+            if expression.source == "expr-struct":
+                component_path = f"{component_path}.{expression.member}"
+            elif expression.source == "transform":
+                component_path = f"{component_path}.transforms[{expression.index}]"
+            self._check_expr_view_refs(
+                expression.content,
+                custom_keys,
+                params_keys,
+                file_path,
+                component_path,
+                expression.component_type,
+            )
 
     @staticmethod
     def _extract_top_level_key(dotted_suffix: str) -> str | None:
@@ -1424,140 +1354,11 @@ class IgnitionPerspectiveLinter:
             first = first[:bracket]
         return first if first else None
 
-    def _walk_bindings_for_resolution(
-        self,
-        obj: Any,
-        file_path: str,
-        custom_keys: set[str],
-        params_keys: set[str],
-        name_tree: dict,
-        path_prefix: str = "root",
-    ):
-        """Recursively walk view data to find bindings and expression refs for resolution."""
-        if isinstance(obj, dict):
-            prop_config = obj.get("propConfig", {})
-            comp_type = obj.get("type", "view")
-
-            if isinstance(prop_config, dict):
-                for prop_name, config in prop_config.items():
-                    if not isinstance(config, dict):
-                        continue
-                    binding = config.get("binding")
-                    if not isinstance(binding, dict):
-                        continue
-
-                    binding_type = binding.get("type")
-                    binding_config = binding.get("config", {})
-                    component_path = f"{path_prefix}.propConfig.{prop_name}"
-
-                    # Tier 2: Resolve view.custom.X / view.params.X in property bindings
-                    if binding_type == "property" and isinstance(binding_config, dict):
-                        bp = binding_config.get("path", "")
-                        if isinstance(bp, str):
-                            self._check_view_prop_ref(
-                                bp,
-                                custom_keys,
-                                params_keys,
-                                file_path,
-                                component_path,
-                                comp_type,
-                                code="BINDING_VIEW_PROP_NOT_FOUND",
-                            )
-
-                    # Tier 3: Resolve /root/A/B component paths in property bindings
-                    if binding_type == "property" and isinstance(binding_config, dict):
-                        bp = binding_config.get("path", "")
-                        if isinstance(bp, str) and bp.startswith("/root/"):
-                            after_root = bp[len("/root/") :]
-                            self._resolve_component_path(
-                                after_root,
-                                name_tree,
-                                file_path,
-                                component_path,
-                                comp_type,
-                            )
-
-                    # Tier 2: Check expression refs {view.custom.X} / {view.params.X}
-                    if binding_type == "expr" and isinstance(binding_config, dict):
-                        expr = binding_config.get("expression", "")
-                        if isinstance(expr, str):
-                            self._check_expr_view_refs(
-                                expr,
-                                custom_keys,
-                                params_keys,
-                                file_path,
-                                component_path,
-                                comp_type,
-                            )
-                    if binding_type == "expr-struct" and isinstance(
-                        binding_config, dict
-                    ):
-                        struct = binding_config.get("struct", {})
-                        if isinstance(struct, dict):
-                            for member_name, member_expr in struct.items():
-                                if isinstance(member_expr, str):
-                                    self._check_expr_view_refs(
-                                        member_expr,
-                                        custom_keys,
-                                        params_keys,
-                                        file_path,
-                                        f"{component_path}.{member_name}",
-                                        comp_type,
-                                    )
-
-                    # Also check expression transforms
-                    transforms = binding.get("transforms", [])
-                    if isinstance(transforms, list):
-                        for i, transform in enumerate(transforms):
-                            if (
-                                isinstance(transform, dict)
-                                and transform.get("type") == "expression"
-                            ):
-                                expr = transform.get("expression", "")
-                                if isinstance(expr, str):
-                                    self._check_expr_view_refs(
-                                        expr,
-                                        custom_keys,
-                                        params_keys,
-                                        file_path,
-                                        f"{component_path}.transforms[{i}]",
-                                        comp_type,
-                                    )
-
-            # Recurse into children
-            children = obj.get("children", [])
-            if isinstance(children, list):
-                for i, child in enumerate(children):
-                    child_name = (
-                        child.get("meta", {}).get("name", f"[{i}]")
-                        if isinstance(child, dict)
-                        else f"[{i}]"
-                    )
-                    self._walk_bindings_for_resolution(
-                        child,
-                        file_path,
-                        custom_keys,
-                        params_keys,
-                        name_tree,
-                        f"{path_prefix}/{child_name}",
-                    )
-
-            # Recurse into root (for top-level view_data)
-            if "root" in obj and path_prefix == "root":
-                self._walk_bindings_for_resolution(
-                    obj["root"],
-                    file_path,
-                    custom_keys,
-                    params_keys,
-                    name_tree,
-                    "root",
-                )
-
     def _check_view_prop_ref(
         self,
         path: str,
-        custom_keys: set[str],
-        params_keys: set[str],
+        custom_keys: frozenset[str],
+        params_keys: frozenset[str],
         file_path: str,
         component_path: str,
         comp_type: str,
@@ -1600,8 +1401,8 @@ class IgnitionPerspectiveLinter:
     def _check_expr_view_refs(
         self,
         expression: str,
-        custom_keys: set[str],
-        params_keys: set[str],
+        custom_keys: frozenset[str],
+        params_keys: frozenset[str],
         file_path: str,
         component_path: str,
         comp_type: str,
@@ -1619,86 +1420,6 @@ class IgnitionPerspectiveLinter:
                 code="EXPR_VIEW_PROP_NOT_FOUND",
             )
 
-    @staticmethod
-    def _build_component_line_map(raw_text: str) -> dict[str, int]:
-        """Map component names and types to 1-based line numbers in the raw JSON text.
-
-        Creates a mapping for quick line number lookups during issue enrichment.
-        Prioritizes component names (meta.name) and falls back to types.
-        """
-        line_map: dict[str, int] = {}
-        name_pattern = re.compile(r'"name"\s*:\s*"([^"]*)"')
-        type_pattern = re.compile(r'"type"\s*:\s*"(ia\.[^"]*)"')
-
-        for lineno, line in enumerate(raw_text.splitlines(), start=1):
-            # Map component names (meta.name)
-            m = name_pattern.search(line)
-            if m:
-                component_name = m.group(1)
-                # Store only the first occurrence of each name
-                if component_name and component_name not in line_map:
-                    line_map[component_name] = lineno
-
-            # Also map component types for fallback
-            m = type_pattern.search(line)
-            if m:
-                comp_type = m.group(1)
-                # Use a prefixed key to avoid collision with names
-                type_key = f"__type__{comp_type}__{lineno}"
-                line_map[type_key] = lineno
-
-        return line_map
-
-    def _enrich_issue_line_numbers(
-        self,
-        issues: list[LintIssue],
-        line_map: dict[str, int],
-        start_idx: int,
-        raw_text: str = "",
-    ) -> None:
-        """Fill in line_number for issues that lack one.
-
-        Uses multiple strategies to locate the correct line:
-        1. metadata.search_key - direct text search near component
-        2. metadata.component_name - lookup in line_map
-        3. component_type - fallback to any instance of that type
-        """
-        raw_lines = raw_text.splitlines() if raw_text else []
-
-        for issue in issues[start_idx:]:
-            if issue.line_number is not None:
-                continue
-
-            search_key = issue.metadata.get("search_key")
-            component_name = issue.metadata.get("component_name")
-
-            # Strategy 1: Direct text search using search_key
-            if search_key and raw_lines:
-                start_line = 0
-                # If we know the component name, start searching from its line
-                if component_name and component_name in line_map:
-                    start_line = line_map[component_name] - 1  # 0-indexed
-
-                for i, line in enumerate(raw_lines[start_line:], start_line + 1):
-                    if search_key in line:
-                        issue.line_number = i
-                        break
-
-                if issue.line_number is not None:
-                    continue
-
-            # Strategy 2: Component name lookup
-            if component_name and component_name in line_map:
-                issue.line_number = line_map[component_name]
-                continue
-
-            # Strategy 3: Component type fallback
-            if issue.component_type:
-                for key, lineno in line_map.items():
-                    if key.startswith(f"__type__{issue.component_type}__"):
-                        issue.line_number = lineno
-                        break
-
     def lint_file(
         self, file_path: str, target_component_type: str | None = None
     ) -> bool:
@@ -1709,7 +1430,7 @@ class IgnitionPerspectiveLinter:
         try:
             with open(file_path, encoding="utf-8") as f:
                 raw_text = f.read()
-            view_data = json.loads(raw_text)
+            view_data, positions = load_json_with_positions(raw_text)
         except json.JSONDecodeError as e:
             self.issues.append(
                 LintIssue(
@@ -1736,34 +1457,47 @@ class IgnitionPerspectiveLinter:
             )
             return False
 
-        # Validate view-level propConfig (onChange scripts, transform scripts, expressions)
-        view_prop_config = view_data.get("propConfig", {})
-        if isinstance(view_prop_config, dict):
-            for prop_name in view_prop_config:
-                if not prop_name.startswith(self._VALID_BINDING_SCOPES):
-                    self.issues.append(
-                        LintIssue(
-                            severity=LintSeverity.ERROR,
-                            code="BINDING_NON_BINDABLE_PROPERTY",
-                            message=f"propConfig targets non-bindable structural property '{prop_name}'",
-                            file_path=file_path,
-                            component_path=f"view.propConfig.{prop_name}",
-                            component_type="view",
-                            suggestion=(
-                                f"'{prop_name}' is a structural key with no binding scope. "
-                                "Only props.*, position.*, custom.*, meta.*, and params.* "
-                                "are bindable. This will cause an IllegalArgumentException "
-                                "in Ignition Designer."
-                            ),
-                        )
-                    )
-            self._validate_propconfig_scripts(view_prop_config, file_path, "view")
-            self._validate_propconfig_expressions(view_prop_config, file_path, "view")
-
-        # Extract components
-        components = self.extract_components_with_context(view_data, file_path)
-
-        if not components:
+        # One walk over the view runs the per-component checks and builds the
+        # ViewModel that the script, expression and view-wide checks consume.
+        self._file_valid = True
+        builder = ViewModelBuilder(file_path)
+        references = _ViewReferenceRule()
+        anchors = _ScopeAnchorRule()
+        view_refs = ViewRefsRule(self.call_collector)
+        rules: list[Rule] = [
+            FunctionRule(
+                {NodeKind.COMPONENT},
+                partial(self._visit_component, file_path=file_path),
+            )
+        ]
+        if "bindable_target" not in self.skipped_rules:
+            rules.append(
+                FunctionRule(
+                    {NodeKind.PROP_CONFIG},
+                    partial(self._visit_prop_config, file_path=file_path),
+                )
+            )
+        if "bindings" not in self.skipped_rules:
+            rules.append(
+                FunctionRule(
+                    {NodeKind.BINDING},
+                    partial(self._visit_binding, file_path=file_path),
+                )
+            )
+        rules.extend([builder, references, anchors, view_refs])
+        traversal = ViewTraversal(rules, component_type=target_component_type)
+        traversal.walk(view_data)
+        traversal.finish()
+        model = builder.model
+        view_refs.locate(positions)
+        self.view_refs[file_path] = view_refs.refs
+
+        # Validate Jython scripts and expressions
+        self._check_scripts(model.scripts, file_path)
+        for expression in model.expressions:
+            self._check_expression(expression, file_path)
+
+        if not model.components:
             self.issues.append(
                 LintIssue(
                     severity=LintSeverity.INFO,
@@ -1776,52 +1510,22 @@ class IgnitionPerspectiveLinter:
             )
             return True
 
-        # Filter by component type if specified
-        if target_component_type:
-            components = [
-                (comp, fp, path)
-                for comp, fp, path in components
-                if comp.get("type", "").startswith(target_component_type)
-            ]
-
-        file_valid = True
-        for component, _, component_path in components:
-            comp_type = component.get("type", "unknown")
-            self.component_stats["component_types"].add(comp_type)
-            self.component_stats["total_components"] += 1
-
-            # Schema validation
-            is_valid = self.validate_component_schema(
-                component, file_path, component_path
-            )
-            if is_valid:
-                self.component_stats["valid_components"] += 1
-            else:
-                self.component_stats["invalid_components"] += 1
-                file_valid = False
-
-            # Best practices checks
-            self.check_component_best_practices(component, file_path, component_path)
-
-            # Accessibility checks
-            self.check_component_accessibility(component, file_path, component_path)
-
         # Check for unused custom/param properties (per-view)
-        self._check_unused_properties(view_data, file_path)
+        if "unused_properties" not in self.skipped_rules:
+            self._check_unused_properties(model, references.refs)
 
         # Check that params have explicit paramDirection in propConfig
-        self._check_param_directions(view_data, file_path)
+        if "param_directions" not in self.skipped_rules:
+            self._check_param_directions(view_data, file_path)
 
         # Validate binding paths against view structure (Tier 2 & 3)
-        self._validate_binding_paths(view_data, file_path)
+        if "binding_paths" not in self.skipped_rules:
+            self._validate_binding_paths(model)
 
-        # Enrich line numbers for all issues generated during this lint
-        line_map = self._build_component_line_map(raw_text)
-        self._enrich_issue_line_numbers(
-            self.issues, line_map, issues_start_idx, raw_text
-        )
+        # Locate every issue generated during this lint in the source text
+        locate_issues(self.issues[issues_start_idx:], positions, anchors.anchors)
 
-        return file_valid
+        return self._file_valid
 
     def lint_project(
         self, target_path: str, target_component_type: str | None = None
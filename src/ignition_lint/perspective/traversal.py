@@ -0,0 +1,358 @@
+"""Single-pass traversal of Perspective views.
+
+A view is walked exactly once.  Each structural element found along the
+way is wrapped in a :class:`Node` and dispatched to the rules that declared
+interest in its :class:`NodeKind`.  Rules that need the whole view before
+they can decide anything (unused properties, component path resolution)
+collect what they need while visiting and report from :meth:`Rule.finish`.
+
+Walk order for every scope (the view itself, then each component slot in
+pre-order): ``COMPONENT``, then for each propConfig entry ``PROP_CONFIG``,
+``BINDING``, ``SCRIPT`` (onChange, transforms) and ``EXPRESSION`` nodes,
+then event ``SCRIPT`` nodes, then one ``STRING`` node listing every string
+value owned by the scope, and finally the scope's children.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+
+class NodeKind(Enum):
+    """Kinds of nodes a rule can subscribe to."""
+
+    VIEW = "view"
+    COMPONENT = "component"
+    PROP_CONFIG = "propConfig"
+    BINDING = "binding"
+    SCRIPT = "script"
+    EXPRESSION = "expression"
+    STRING = "string"
+
+
+@dataclass(eq=False, slots=True)
+class Scope:
+    """The view, or a component slot, that owns propConfig, events and children.
+
+    Two path styles are carried because existing issue codes report them:
+    ``path`` is the dotted form (``root.root.children[0]``; ``view`` for the
+    view itself) and ``resolution_path`` is the name-based form used by
+    binding resolution (``root/Header/Label``).  ``pointer`` is the JSON
+    path of the scope's object in the view document (``("root", "children",
+    0)``; empty for the view).
+    """
+
+    node: dict
+    path: str
+    resolution_path: str
+    component_type: str
+    pointer: tuple = ()
+    parent: Scope | None = None
+    name: Any = ""
+    depth: int = 0
+    is_view: bool = False
+    is_component: bool = False
+    selected: bool = True
+
+    @property
+    def linted(self) -> bool:
+        """Whether per-component checks apply (the view, or a selected ia.* component)."""
+        return self.is_view or (self.is_component and self.selected)
+
+
+@dataclass(eq=False, slots=True)
+class Node:
+    """A single dispatched element of a view.
+
+    ``value`` holds the component dict, propConfig entry, binding dict, or the
+    script/expression text depending on ``kind``; for ``STRING`` it is the
+    list of all string values owned by the scope.  ``origin`` records
+    where a script (``event``/``onChange``/``transform``) or expression
+    (``expr``/``expr-struct``/``transform``) came from.
+    """
+
+    kind: NodeKind
+    scope: Scope
+    value: Any = None
+    prop_name: str = ""
+    origin: str = ""
+    index: int | None = None
+    member: str = ""
+
+
+class Rule:
+    """Base class for traversal rules.
+
+    Subclasses set ``kinds`` to the node kinds they consume and override
+    :meth:`visit`; :meth:`finish` runs once after the walk completes.
+    """
+
+    kinds: frozenset[NodeKind] = frozenset()
+
+    def visit(self, node: Node) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
+
+
+class FunctionRule(Rule):
+    """Adapt plain callables (typically bound linter methods) into a rule."""
+
+    def __init__(
+        self,
+        kinds: Iterable[NodeKind] = (),
+        visit: Callable[[Node], None] | None = None,
+        finish: Callable[[], None] | None = None,
+    ):
+        self.kinds = frozenset(kinds)
+        if visit is not None:
+            self.visit = visit  # type: ignore[method-assign]
+        if finish is not None:
+            self.finish = finish  # type: ignore[method-assign]
+
+
+class ViewTraversal:
+    """Walk a view once, dispatching nodes to the registered rules."""
+
+    def __init__(self, rules: Iterable[Rule], component_type: str | None = None):
+        self.rules = list(rules)
+        self.component_type = component_type
+        self.component_count = 0
+        self._dispatch: dict[NodeKind, list[Callable[[Node], None]]] = {
+            kind: [] for kind in NodeKind
+        }
+        for rule in self.rules:
+            for kind in rule.kinds:
+                self._dispatch[kind].append(rule.visit)
+        self._want_strings = bool(self._dispatch[NodeKind.STRING])
+
+    def _emit(self, node: Node) -> None:
+        for visit in self._dispatch[node.kind]:
+            visit(node)
+
+    def walk(self, view_data: dict) -> None:
+        """Visit every node of *view_data*; call :meth:`finish` afterwards."""
+        view = Scope(
+            node=view_data,
+            path="view",
+            resolution_path="root",
+            component_type="view",
+            is_view=True,
+        )
+        self._emit(Node(NodeKind.VIEW, view, view_data))
+        self._visit_scope(view, skip_key="root")
+
+        root = view_data.get("root")
+        if isinstance(root, dict):
+            self._visit_slot(root, view, "root.root", "root", ("root",), 0)
+
+    def finish(self) -> None:
+        """Let every rule report its deferred findings, in registration order."""
+        for rule in self.rules:
+            rule.finish()
+
+    # ------------------------------------------------------------------
+    # Structure
+    # ------------------------------------------------------------------
+
+    def _visit_slot(
+        self,
+        obj: dict,
+        parent: Scope,
+        path: str,
+        resolution_path: str,
+        pointer: tuple,
+        depth: int,
+    ) -> None:
+        comp_type = obj.get("type", "view")
+        is_component = isinstance(comp_type, str) and comp_type.startswith("ia.")
+        meta = obj.get("meta")
+        name = meta.get("name", "") if isinstance(meta, dict) else ""
+        scope = Scope(
+            node=obj,
+            path=path,
+            resolution_path=resolution_path,
+            component_type=comp_type,
+            pointer=pointer,
+            parent=parent,
+            name=name,
+            depth=depth,
+            is_component=is_component,
+            selected=(
+                not self.component_type
+                or (is_component and comp_type.startswith(self.component_type))
+            ),
+        )
+        if is_component:
+            self.component_count += 1
+        self._emit(Node(NodeKind.COMPONENT, scope, obj))
+        self._visit_scope(scope, skip_key="children")
+
+        children = obj.get("children")
+        if isinstance(children, list):
+            for i, child in enumerate(children):
+                if not isinstance(child, dict):
+                    if self._want_strings:
+                        strings: list[str] = []
+                        _collect_strings(child, strings)
+                        self._emit(Node(NodeKind.STRING, scope, strings))
+                    continue
+                child_meta = child.get("meta", {})
+                child_name = (
+                    child_meta.get("name", f"[{i}]")
+                    if isinstance(child_meta, dict)
+                    else f"[{i}]"
+                )
+                self._visit_slot(
+                    child,
+                    scope,
+                    f"{path}.children[{i}]",
+                    f"{resolution_path}/{child_name}",
+                    (*pointer, "children", i),
+                    depth + 1,
+                )
+
+    def _visit_scope(self, scope: Scope, skip_key: str) -> None:
+        obj = scope.node
+        prop_config = obj.get("propConfig")
+        if isinstance(prop_config, dict):
+            for prop_name, config in prop_config.items():
+                self._visit_prop_config(scope, prop_name, config)
+
+        if not scope.is_view:
+            events = obj.get("events")
+            if isinstance(events, dict):
+                self._visit_events(scope, events)
+
+        if self._want_strings:
+            strings: list[str] = []
+            for key, value in obj.items():
+                if key != skip_key:
+                    _collect_strings(value, strings)
+            self._emit(Node(NodeKind.STRING, scope, strings))
+
+    def _visit_prop_config(self, scope: Scope, prop_name: str, config: Any) -> None:
+        self._emit(Node(NodeKind.PROP_CONFIG, scope, config, prop_name))
+        if not isinstance(config, dict):
+            return
+
+        binding = config.get("binding")
+        if isinstance(binding, dict):
+            self._emit(Node(NodeKind.BINDING, scope, binding, prop_name))
+
+        on_change = config.get("onChange")
+        if isinstance(on_change, dict):
+            script = on_change.get("script", "")
+            if isinstance(script, str) and script:
+                self._emit(
+                    Node(NodeKind.SCRIPT, scope, script, prop_name, origin="onChange")
+                )
+
+        if not isinstance(binding, dict):
+            return
+
+        transforms = binding.get("transforms", [])
+        if isinstance(transforms, list):
+            for i, transform in enumerate(transforms):
+                if not isinstance(transform, dict):
+                    continue
+                if transform.get("type") == "script":
+                    code = transform.get("code", "")
+                    if isinstance(code, str) and code:
+                        self._emit(
+                            Node(
+                                NodeKind.SCRIPT,
+                                scope,
+                                code,
+                                prop_name,
+                                origin="transform",
+                                index=i,
+                            )
+                        )
+
+        binding_type = binding.get("type")
+        binding_config = binding.get("config", {})
+        if binding_type == "expr" and isinstance(binding_config, dict):
+            expression = binding_config.get("expression", "")
+            if isinstance(expression, str) and expression:
+                self._emit(
+                    Node(NodeKind.EXPRESSION, scope, expression, prop_name, "expr")
+                )
+        elif binding_type == "expr-struct" and isinstance(binding_config, dict):
+            struct = binding_config.get("struct", {})
+            if isinstance(struct, dict):
+                for member, expression in struct.items():
+                    if isinstance(expression, str) and expression.strip():
+                        self._emit(
+                            Node(
+                                NodeKind.EXPRESSION,
+                                scope,
+                                expression,
+                                prop_name,
+                                origin="expr-struct",
+                                member=member,
+                            )
+                        )
+
+        if isinstance(transforms, list):
+            for i, transform in enumerate(transforms):
+                if (
+                    isinstance(transform, dict)
+                    and transform.get("type") == "expression"
+                ):
+                    expression = transform.get("expression", "")
+                    if isinstance(expression, str) and expression:
+                        self._emit(
+                            Node(
+                                NodeKind.EXPRESSION,
+                                scope,
+                                expression,
+                                prop_name,
+                                origin="transform",
+                                index=i,
+                            )
+                        )
+
+    def _visit_events(self, scope: Scope, events: dict) -> None:
+        for category, handlers in events.items():
+            if not isinstance(handlers, dict):
+                continue
+            for event_name, handler_config in handlers.items():
+                handlers_list = (
+                    handler_config
+                    if isinstance(handler_config, list)
+                    else [handler_config]
+                )
+                for j, handler in enumerate(handlers_list):
+                    if not isinstance(handler, dict) or handler.get("type") != "script":
+                        continue
+                    config = handler.get("config", {})
+                    script = (
+                        config.get("script", "") if isinstance(config, dict) else ""
+                    )
+                    if isinstance(script, str) and script:
+                        self._emit(
+                            Node(
+                                NodeKind.SCRIPT,
+                                scope,
+                                script,
+                                origin="event",
+                                index=j,
+                                member=f"{category}.{event_name}",
+                            )
+                        )
+
+
+def _collect_strings(value: Any, out: list[str]) -> None:
+    if isinstance(value, str):
+        out.append(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect_strings(item, out)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_strings(item, out)
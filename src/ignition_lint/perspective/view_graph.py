@@ -0,0 +1,556 @@
+"""Cross-view reference graph for Perspective projects.
+
+Linting a view in isolation cannot tell whether its params are ever set,
+whether the views it embeds exist, or whether anything uses it at all.
+:class:`ViewRefsRule` summarizes, during the lint walk, the params a view
+declares and the views it references: ``ia.display.view`` embeds, flex
+repeaters, popup actions and ``system.perspective.openPopup`` calls, plus
+the script library calls its inline scripts make.  The summaries
+(:class:`ViewRefs`) are small enough to cache with each file's issues, and
+:class:`ViewGraph` joins them across a project to report what no single
+view can see.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..json_positions import JsonPath, JsonPositions
+from ..reporting import LintIssue, LintSeverity
+from ..scripts.symbols import (
+    SCRIPT_LIBRARY_DIR,
+    InlineCallCollector,
+    LibraryCall,
+    ScriptLibrary,
+    check_library_calls,
+)
+from .traversal import Node, NodeKind, Rule
+
+VIEWS_DIR = "views"
+
+# Component type -> embed kind
+EMBED_COMPONENT_TYPES = {
+    "ia.display.view": "view",
+    "ia.display.flex-repeater": "flex-repeater",
+}
+
+# Flex repeater instance keys that configure the instance, not view params
+_REPEATER_INSTANCE_KEYS = frozenset({"instanceStyle", "instancePosition"})
+
+_OPEN_POPUP_RE = re.compile(
+    r"openPopup\s*\(\s*[^,()]+,\s*(?:view\s*=\s*)?(['\"])([^'\"]+)\1"
+)
+
+
+@dataclass(slots=True)
+class ViewParam:
+    """A param declared by a view, with its propConfig paramDirection."""
+
+    direction: str  # "input", "output", "inout", or "" when unset
+    line_number: int | None = None
+    column: int | None = None
+
+
+@dataclass(slots=True)
+class ViewEmbed:
+    """A reference from a view to another view."""
+
+    target: str | None  # view path; None when the path is bound
+    kind: str  # "view", "flex-repeater", "popup"
+    params: frozenset[str] | None  # None when bound or not statically known
+    component_path: str
+    component_type: str
+    line_number: int | None = None
+    column: int | None = None
+    pointer: JsonPath = field(default=(), repr=False, compare=False)
+
+
+@dataclass(slots=True)
+class ScriptCalls:
+    """Script library calls made by one inline script of a view."""
+
+    calls: list[LibraryCall]
+    component_path: str
+    component_type: str
+    line_number: int | None = None
+    column: int | None = None
+    pointer: JsonPath = field(default=(), repr=False, compare=False)
+
+
+@dataclass(slots=True)
+class ViewRefs:
+    """The params one view declares and the views and scripts it references."""
+
+    params: dict[str, ViewParam] = field(default_factory=dict)
+    embeds: list[ViewEmbed] = field(default_factory=list)
+    script_calls: list[ScriptCalls] = field(default_factory=list)
+
+    def to_json(self) -> list:
+        """Compact JSON form, as cached alongside the view's issues."""
+        return [
+            {
+                name: [p.direction, p.line_number, p.column]
+                for name, p in self.params.items()
+            },
+            [
+                [
+                    e.target,
+                    e.kind,
+                    None if e.params is None else sorted(e.params),
+                    e.component_path,
+                    e.component_type,
+                    e.line_number,
+                    e.column,
+                ]
+                for e in self.embeds
+            ],
+            [
+                [
+                    [call.to_json() for call in site.calls],
+                    site.component_path,
+                    site.component_type,
+                    site.line_number,
+                    site.column,
+                ]
+                for site in self.script_calls
+            ],
+        ]
+
+    @classmethod
+    def from_json(cls, data: list) -> ViewRefs:
+        params, embeds, script_calls = data
+        return cls(
+            params={name: ViewParam(*value) for name, value in params.items()},
+            embeds=[
+                ViewEmbed(
+                    target, kind, None if names is None else frozenset(names), *rest
+                )
+                for target, kind, names, *rest in embeds
+            ],
+            script_calls=[
+                ScriptCalls([LibraryCall.from_json(call) for call in calls], *rest)
+                for calls, *rest in script_calls
+            ],
+        )
+
+
+class ViewRefsRule(Rule):
+    """Traversal rule that collects a view's :class:`ViewRefs`."""
+
+    kinds = frozenset({NodeKind.VIEW, NodeKind.COMPONENT, NodeKind.SCRIPT})
+
+    def __init__(self, call_collector: InlineCallCollector | None = None):
+        self.refs = ViewRefs()
+        self.call_collector = call_collector
+
+    def visit(self, node: Node) -> None:
+        if node.kind is NodeKind.VIEW:
+            self._add_params(node.value)
+        elif node.kind is NodeKind.COMPONENT:
+            if node.scope.is_component:
+                self._add_component(node)
+        else:
+            if self.call_collector is not None and node.scope.linted:
+                self._add_script_calls(node)
+            for m in _OPEN_POPUP_RE.finditer(node.value):
+                self.refs.embeds.append(
+                    ViewEmbed(
+                        target=normalize_view_path(m.group(2)),
+                        kind="popup",
+                        params=None,
+                        component_path=node.scope.path,
+                        component_type=node.scope.component_type,
+                        pointer=node.scope.pointer,
+                    )
+                )
+
+    def locate(self, positions: JsonPositions) -> None:
+        """Record the line and column of every param and embed."""
+        for name, param in self.refs.params.items():
+            location = positions.position(("params", name))
+            if location is not None:
+                param.line_number, param.column = location
+        for embed in self.refs.embeds:
+            location = positions.position(embed.pointer)
+            if location is not None:
+                embed.line_number, embed.column = location
+        for site in self.refs.script_calls:
+            location = positions.position(site.pointer)
+            if location is not None:
+                site.line_number, site.column = location
+
+    def _add_params(self, view_data: dict) -> None:
+        params = view_data.get("params")
+        if not isinstance(params, dict):
+            return
+        prop_config = view_data.get("propConfig")
+        if not isinstance(prop_config, dict):
+            prop_config = {}
+        for name in params:
+            entry = prop_config.get(f"params.{name}")
+            direction = (
+                entry.get("paramDirection", "") if isinstance(entry, dict) else ""
+            )
+            self.refs.params[name] = ViewParam(
+                direction if isinstance(direction, str) else ""
+            )
+
+    def _add_component(self, node: Node) -> None:
+        scope = node.scope
+        component = node.value
+        kind = EMBED_COMPONENT_TYPES.get(scope.component_type)
+        if kind is not None:
+            self._add_embed(
+                component, kind, scope.path, scope.component_type, scope.pointer
+            )
+
+        events = component.get("events")
+        if not isinstance(events, dict):
+            return
+        for category, handlers in events.items():
+            if not isinstance(handlers, dict):
+                continue
+            for event_name, handler_config in handlers.items():
+                handler_list = (
+                    handler_config
+                    if isinstance(handler_config, list)
+                    else [handler_config]
+                )
+                for j, handler in enumerate(handler_list):
+                    if not isinstance(handler, dict) or handler.get("type") != "popup":
+                        continue
+                    config = handler.get("config")
+                    if not isinstance(config, dict):
+                        continue
+                    view_path = config.get("viewPath")
+                    if not isinstance(view_path, str) or not view_path:
+                        continue
+                    view_params = config.get("viewParams")
+                    pointer = (*scope.pointer, "events", category, event_name)
+                    if isinstance(handler_config, list):
+                        pointer = (*pointer, j)
+                    self.refs.embeds.append(
+                        ViewEmbed(
+                            target=normalize_view_path(view_path),
+                            kind="popup",
+                            params=(
+                                frozenset(view_params)
+                                if isinstance(view_params, dict)
+                                else frozenset()
+                            ),
+                            component_path=scope.path,
+                            component_type=scope.component_type,
+                            pointer=pointer,
+                        )
+                    )
+
+    def _add_script_calls(self, node: Node) -> None:
+        assert self.call_collector is not None
+        calls = self.call_collector.collect(node.value)
+        if not calls:
+            return
+        scope = node.scope
+        if node.origin == "event":
+            category, _, event_name = node.member.partition(".")
+            target = f"events.{node.member}"
+            pointer = (*scope.pointer, "events", category, event_name)
+            handlers = scope.node.get("events", {}).get(category, {}).get(event_name)
+            if isinstance(handlers, list):
+                pointer = (*pointer, node.index)
+            pointer = (*pointer, "config", "script")
+        elif node.origin == "onChange":
+            target = f"propConfig.{node.prop_name}.onChange"
+            pointer = (
+                *scope.pointer,
+                "propConfig",
+                node.prop_name,
+                "onChange",
+                "script",
+            )
+        else:
+            target = f"propConfig.{node.prop_name}.binding.transforms[{node.index}]"
+            pointer = (
+                *scope.pointer,
+                "propConfig",
+                node.prop_name,
+                "binding",
+                "transforms",
+                node.index,
+                "code",
+            )
+        self.refs.script_calls.append(
+            ScriptCalls(
+                calls=list(calls),
+                component_path=f"{scope.path}.{target}",
+                component_type=scope.component_type,
+                pointer=pointer,
+            )
+        )
+
+    def _add_embed(
+        self,
+        component: dict,
+        kind: str,
+        component_path: str,
+        component_type: str,
+        pointer: JsonPath,
+    ) -> None:
+        props = component.get("props")
+        if not isinstance(props, dict):
+            props = {}
+        prop_config = component.get("propConfig")
+        if not isinstance(prop_config, dict):
+            prop_config = {}
+
+        path = props.get("path")
+        target: str | None = None
+        if "props.path" not in prop_config:
+            if not isinstance(path, str) or not path:
+                return
+            target = normalize_view_path(path)
+
+        params: set[str] | None = set()
+        if kind == "view":
+            if "props.params" in prop_config:
+                params = None
+            else:
+                if isinstance(props.get("params"), dict):
+                    params.update(props["params"])
+                for key in prop_config:
+                    if key.startswith("props.params."):
+                        params.add(key[len("props.params.") :].split(".")[0])
+        elif any(key.startswith("props.instances") for key in prop_config):
+            params = None
+        else:
+            instances = props.get("instances")
+            if isinstance(instances, list):
+                for instance in instances:
+                    if isinstance(instance, dict):
+                        params.update(instance)
+            params -= _REPEATER_INSTANCE_KEYS
+
+        self.refs.embeds.append(
+            ViewEmbed(
+                target=target,
+                kind=kind,
+                params=None if params is None else frozenset(params),
+                component_path=component_path,
+                component_type=component_type,
+                pointer=pointer,
+            )
+        )
+
+
+def normalize_view_path(path: str) -> str:
+    return path.strip().strip("/")
+
+
+def library_root_for_views(views_root: Path) -> Path:
+    """The ``script-python`` directory of the project owning *views_root*."""
+    return views_root.parent.parent / "ignition" / SCRIPT_LIBRARY_DIR
+
+
+def views_root_for(file_path: str | Path) -> tuple[Path, str] | None:
+    """Return ``(views directory, view path)`` for a view.json, or None.
+
+    The view path is the folder path below the project's ``views``
+    directory, as used by ``props.path`` and ``viewPath`` references.
+    """
+    folder = Path(file_path).resolve().parent
+    parts = folder.parts
+    for i in range(len(parts) - 1, -1, -1):
+        if parts[i] == VIEWS_DIR:
+            return Path(*parts[: i + 1]), "/".join(parts[i + 1 :])
+    return None
+
+
+def page_config_views(views_root: Path) -> set[str] | None:
+    """View paths that pages and docks in the project's page config open.
+
+    None when the project has no readable page config.
+    """
+    config_path = views_root.parent / "page-config" / "config.json"
+    try:
+        with open(config_path, encoding="utf-8") as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    found: set[str] = set()
+    stack: list[Any] = [config]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            view_path = value.get("viewPath")
+            if isinstance(view_path, str) and view_path:
+                found.add(normalize_view_path(view_path))
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return found
+
+
+CROSS_VIEW_CODES = frozenset(
+    {"EMBEDDED_VIEW_NOT_FOUND", "VIEW_PARAM_NEVER_SET", "ORPHAN_VIEW"}
+)
+
+
+class ViewGraph:
+    """Views of one or more projects joined by their references."""
+
+    def __init__(self):
+        # views root -> view path -> (file path, refs)
+        self._projects: dict[Path, dict[str, tuple[str, ViewRefs]]] = {}
+        # views roots with views that were not linted (ignored files)
+        self._partial: set[Path] = set()
+
+    def add(self, file_path: str | Path, refs: ViewRefs) -> None:
+        located = views_root_for(file_path)
+        if located is None:
+            return
+        views_root, view_path = located
+        self._projects.setdefault(views_root, {})[view_path] = (str(file_path), refs)
+
+    def add_unread(self, file_path: str | Path) -> None:
+        """Note a view that exists but was not linted, so its refs are unknown."""
+        located = views_root_for(file_path)
+        if located is not None:
+            self._partial.add(located[0])
+
+    def analyze(self, scanned_root: str | Path) -> list[LintIssue]:
+        """Report cross-view issues.
+
+        Missing embed targets are checked on disk, so they are reliable for
+        any subset of views.  Orphan views and params that are never set
+        need every view of the project, so they are only reported for
+        projects whose whole views directory lies under *scanned_root* and
+        that have no unread views.  Orphan views also need the project's
+        page config, which names the views opened directly.
+        """
+        scanned_root = Path(scanned_root).resolve()
+        issues: list[LintIssue] = []
+        for views_root, views in self._projects.items():
+            incoming: dict[str, list[ViewEmbed]] = {}
+            for file_path, refs in views.values():
+                for embed in refs.embeds:
+                    if embed.target is None:
+                        continue
+                    incoming.setdefault(embed.target, []).append(embed)
+                    if (
+                        embed.target not in views
+                        and not (views_root / embed.target / "view.json").is_file()
+                    ):
+                        issues.append(self._missing_target(file_path, embed))
+
+            if scanned_root != views_root and scanned_root not in views_root.parents:
+                continue
+            if views_root in self._partial:
+                continue
+            # Without a page config the entry points are unknown, and every
+            # view not embedded elsewhere would be reported
+            entry_points = page_config_views(views_root)
+            for view_path, (file_path, refs) in views.items():
+                if entry_points is not None and view_path in entry_points:
+                    continue
+                embedders = incoming.get(view_path)
+                if not embedders:
+                    if entry_points is None:
+                        continue
+                    issues.append(
+                        LintIssue(
+                            severity=LintSeverity.INFO,
+                            code="ORPHAN_VIEW",
+                            message=(
+                                f"View '{view_path}' is not opened by any page, "
+                                "popup or embedding view"
+                            ),
+                            file_path=file_path,
+                            component_path="view",
+                            component_type="view",
+                            line_number=1,
+                            column=1,
+                            suggestion=(
+                                "Remove the view if unused; views reached only "
+                                "through bound view paths are not followed"
+                            ),
+                        )
+                    )
+                    continue
+                if any(embed.params is None for embed in embedders):
+                    continue
+                set_params = frozenset().union(*(e.params for e in embedders))
+                for name, param in refs.params.items():
+                    if param.direction == "output" or name in set_params:
+                        continue
+                    issues.append(
+                        LintIssue(
+                            severity=LintSeverity.INFO,
+                            code="VIEW_PARAM_NEVER_SET",
+                            message=(
+                                f"Param '{name}' is not set by any of the "
+                                f"{len(embedders)} view(s) embedding "
+                                f"'{view_path}'"
+                            ),
+                            file_path=file_path,
+                            component_path=f"params.{name}",
+                            component_type="view",
+                            line_number=param.line_number,
+                            column=param.column,
+                            suggestion=(
+                                "Remove the param, or pass it from the embedding "
+                                "views if the default is not intended"
+                            ),
+                        )
+                    )
+        return issues
+
+    def check_script_calls(
+        self, load_library: Callable[[Path], ScriptLibrary]
+    ) -> list[LintIssue]:
+        """Check inline script calls against each project's script library.
+
+        *load_library* is called once per project that has both script
+        calls and a ``script-python`` directory.
+        """
+        issues: list[LintIssue] = []
+        for views_root, views in self._projects.items():
+            if not any(refs.script_calls for _file, refs in views.values()):
+                continue
+            library_root = library_root_for_views(views_root)
+            if not library_root.is_dir():
+                continue
+            library = load_library(library_root)
+            if not library.modules:
+                continue
+            for file_path, refs in views.values():
+                for site in refs.script_calls:
+                    issues.extend(
+                        check_library_calls(
+                            library,
+                            site.calls,
+                            file_path,
+                            site.component_path,
+                            site.component_type,
+                            (site.line_number, site.column),
+                        )
+                    )
+        return issues
+
+    @staticmethod
+    def _missing_target(file_path: str, embed: ViewEmbed) -> LintIssue:
+        return LintIssue(
+            severity=LintSeverity.WARNING,
+            code="EMBEDDED_VIEW_NOT_FOUND",
+            message=f"Referenced view '{embed.target}' does not exist",
+            file_path=file_path,
+            component_path=embed.component_path,
+            component_type=embed.component_type,
+            line_number=embed.line_number,
+            column=embed.column,
+            suggestion=f"Check the {embed.kind} path",
+        )
@@ -1,12 +1,18 @@
-"""Flattened view model for structured analysis of Perspective views."""
+"""Flattened view model for structured analysis of Perspective views.
+
+The model is produced by :class:`ViewModelBuilder`, a traversal rule, so the
+linter can build it in the same single walk that drives its other checks.
+"""
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 from typing import Any
 
+from .traversal import Node, NodeKind, Rule, Scope, ViewTraversal
+
 
-@dataclass
+@dataclass(slots=True)
 class PropertyDef:
     """A custom or param property defined on a view."""
 
@@ -15,7 +21,7 @@ class PropertyDef:
     default_value: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BindingNode:
     """A binding extracted from a view's propConfig tree."""
 
@@ -28,28 +34,41 @@ class BindingNode:
     tag_path: str | None = None
     transforms: list[dict[str, Any]] = field(default_factory=list)
     component_path: str = ""
+    component_type: str = ""
+    scope: Scope | None = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptNode:
     """A script extracted from a view (event handler, onChange, or transform)."""
 
     content: str
-    location: str  # descriptive path e.g. "root.events.onClick[0]"
+    location: str  # descriptive path e.g. "root.root.events.dom.onClick[0]"
     script_type: str  # "event", "onChange", "transform"
     component_path: str = ""
+    component_type: str = ""
+    prop_name: str = ""  # propConfig key (onChange, transform)
+    event: str = ""  # "category.eventName" (event)
+    index: int | None = None  # handler or transform index
+    scope: Scope | None = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionNode:
     """An expression extracted from a binding or transform."""
 
     content: str
     location: str  # descriptive path
     component_path: str = ""
+    component_type: str = ""
+    prop_name: str = ""
+    source: str = ""  # "expr", "expr-struct", "transform"
+    member: str = ""  # expr-struct member name
+    index: int | None = None  # transform index
+    scope: Scope | None = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ViewModel:
     """Flattened representation of an Ignition Perspective view."""
 
@@ -59,14 +78,31 @@ class ViewModel:
     scripts: list[ScriptNode] = field(default_factory=list)
     expressions: list[ExpressionNode] = field(default_factory=list)
     components: list[dict[str, Any]] = field(default_factory=list)
+    # Named children of the root component, nested by meta.name:
+    # {"Header": {"_type": "ia.container.flex", "_children": {...}}, ...}
+    name_tree: dict[str, Any] = field(default_factory=dict)
+    _custom_names: frozenset[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _param_names: frozenset[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
-    def custom_property_names(self) -> set[str]:
-        return {p.name for p in self.properties if p.kind == "custom"}
+    def custom_property_names(self) -> frozenset[str]:
+        if self._custom_names is None:
+            self._custom_names = frozenset(
+                p.name for p in self.properties if p.kind == "custom"
+            )
+        return self._custom_names
 
     @property
-    def param_property_names(self) -> set[str]:
-        return {p.name for p in self.properties if p.kind == "param"}
+    def param_property_names(self) -> frozenset[str]:
+        if self._param_names is None:
+            self._param_names = frozenset(
+                p.name for p in self.properties if p.kind == "param"
+            )
+        return self._param_names
 
     @property
     def all_expression_text(self) -> list[str]:
@@ -77,215 +113,135 @@ class ViewModel:
         return [s.content for s in self.scripts]
 
 
-def _extract_from_propconfig(
-    prop_config: dict[str, Any],
-    component_path: str,
-    bindings: list[BindingNode],
-    scripts: list[ScriptNode],
-    expressions: list[ExpressionNode],
-) -> None:
-    """Extract bindings, scripts, and expressions from a propConfig dict."""
-    for prop_name, config in prop_config.items():
-        if not isinstance(config, dict):
-            continue
-
-        # onChange scripts
-        on_change = config.get("onChange")
-        if isinstance(on_change, dict):
-            script_code = on_change.get("script", "")
-            if script_code:
-                scripts.append(
-                    ScriptNode(
-                        content=script_code,
-                        location=f"{component_path}.propConfig.{prop_name}.onChange",
-                        script_type="onChange",
-                        component_path=component_path,
-                    )
-                )
+class ViewModelBuilder(Rule):
+    """Traversal rule that fills a :class:`ViewModel` as the view is walked."""
 
-        # Bindings
-        binding = config.get("binding")
-        if not isinstance(binding, dict):
-            continue
+    kinds = frozenset(
+        {
+            NodeKind.VIEW,
+            NodeKind.COMPONENT,
+            NodeKind.BINDING,
+            NodeKind.SCRIPT,
+            NodeKind.EXPRESSION,
+        }
+    )
+
+    def __init__(self, file_path: str):
+        self.model = ViewModel(file_path=file_path)
+        self._subtrees: dict[int, dict[str, Any]] = {}
+
+    def visit(self, node: Node) -> None:
+        kind = node.kind
+        if kind is NodeKind.VIEW:
+            self._add_properties(node.value)
+        elif kind is NodeKind.COMPONENT:
+            self._add_component(node.scope)
+        elif kind is NodeKind.BINDING:
+            self._add_binding(node)
+        elif kind is NodeKind.SCRIPT:
+            self._add_script(node)
+        else:
+            self._add_expression(node)
+
+    def _add_properties(self, view_data: dict[str, Any]) -> None:
+        properties = self.model.properties
+        for key, kind in (("custom", "custom"), ("params", "param")):
+            values = view_data.get(key, {})
+            if isinstance(values, dict):
+                for name, value in values.items():
+                    properties.append(
+                        PropertyDef(name=name, kind=kind, default_value=value)
+                    )
 
+    def _add_component(self, scope: Scope) -> None:
+        if scope.is_component:
+            self.model.components.append(scope.node)
+
+        if scope.depth == 0:
+            self._subtrees[id(scope)] = self.model.name_tree
+            return
+        parent_tree = self._subtrees.get(id(scope.parent))
+        if parent_tree is None or not scope.name:
+            return
+        entry: dict[str, Any] = {
+            "_type": scope.node.get("type", "unknown"),
+            "_children": {},
+        }
+        parent_tree[scope.name] = entry
+        self._subtrees[id(scope)] = entry["_children"]
+
+    def _add_binding(self, node: Node) -> None:
+        binding = node.value
         binding_type = binding.get("type", "")
         binding_config = binding.get("config", {})
-
-        node = BindingNode(
-            prop_path=prop_name,
+        entry = BindingNode(
+            prop_path=node.prop_name,
             binding_type=binding_type,
             transforms=binding.get("transforms", []),
-            component_path=component_path,
+            component_path=node.scope.path,
+            component_type=node.scope.component_type,
+            scope=node.scope,
         )
-
-        if binding_type == "expr" and isinstance(binding_config, dict):
-            expr = binding_config.get("expression", "")
-            node.expression = expr
-            if expr:
-                expressions.append(
-                    ExpressionNode(
-                        content=expr,
-                        location=f"{component_path}.propConfig.{prop_name}.binding.expr",
-                        component_path=component_path,
-                    )
-                )
-
-        if binding_type == "expr-struct" and isinstance(binding_config, dict):
-            struct = binding_config.get("struct", {})
-            if isinstance(struct, dict):
-                for member, expr in struct.items():
-                    if isinstance(expr, str) and expr.strip():
-                        expressions.append(
-                            ExpressionNode(
-                                content=expr,
-                                location=f"{component_path}.propConfig.{prop_name}.binding.struct.{member}",
-                                component_path=component_path,
-                            )
-                        )
-
-        if binding_type == "property" and isinstance(binding_config, dict):
-            node.property_path = binding_config.get("path")
-
-        if binding_type == "tag" and isinstance(binding_config, dict):
-            node.tag_path = binding_config.get("tagPath")
-
-        bindings.append(node)
-
-        # Transform scripts and expressions
-        for i, transform in enumerate(binding.get("transforms", [])):
-            if not isinstance(transform, dict):
-                continue
-            t_type = transform.get("type")
-            if t_type == "script":
-                code = transform.get("code", "")
-                if code:
-                    scripts.append(
-                        ScriptNode(
-                            content=code,
-                            location=f"{component_path}.propConfig.{prop_name}.transforms[{i}]",
-                            script_type="transform",
-                            component_path=component_path,
-                        )
-                    )
-            if t_type == "expression":
-                expr = transform.get("expression", "")
-                if expr:
-                    expressions.append(
-                        ExpressionNode(
-                            content=expr,
-                            location=f"{component_path}.propConfig.{prop_name}.transforms[{i}]",
-                            component_path=component_path,
-                        )
-                    )
-
-
-def _extract_from_tree(
-    obj: Any,
-    path: str,
-    components: list[dict[str, Any]],
-    bindings: list[BindingNode],
-    scripts: list[ScriptNode],
-    expressions: list[ExpressionNode],
-) -> None:
-    """Walk the component tree extracting events and propConfig."""
-    if not isinstance(obj, dict):
-        return
-
-    if (
-        "type" in obj
-        and isinstance(obj.get("type"), str)
-        and obj["type"].startswith("ia.")
-    ):
-        components.append(obj)
-
-    # propConfig
-    prop_config = obj.get("propConfig", {})
-    if isinstance(prop_config, dict):
-        _extract_from_propconfig(prop_config, path, bindings, scripts, expressions)
-
-    # Event scripts
-    events = obj.get("events", {})
-    if isinstance(events, dict):
-        for category, handlers in events.items():
-            if not isinstance(handlers, dict):
-                continue
-            for event_name, handler_config in handlers.items():
-                handlers_list = (
-                    handler_config
-                    if isinstance(handler_config, list)
-                    else [handler_config]
-                )
-                for j, handler in enumerate(handlers_list):
-                    if isinstance(handler, dict) and handler.get("type") == "script":
-                        code = handler.get("config", {}).get("script", "")
-                        if code:
-                            scripts.append(
-                                ScriptNode(
-                                    content=code,
-                                    location=f"{path}.events.{category}.{event_name}[{j}]",
-                                    script_type="event",
-                                    component_path=path,
-                                )
-                            )
-
-    # Recurse into children
-    children = obj.get("children", [])
-    if isinstance(children, list):
-        for i, child in enumerate(children):
-            _extract_from_tree(
-                child,
-                f"{path}.children[{i}]",
-                components,
-                bindings,
-                scripts,
-                expressions,
+        if isinstance(binding_config, dict):
+            if binding_type == "expr":
+                entry.expression = binding_config.get("expression", "")
+            elif binding_type == "property":
+                entry.property_path = binding_config.get("path")
+            elif binding_type == "tag":
+                entry.tag_path = binding_config.get("tagPath")
+        self.model.bindings.append(entry)
+
+    def _add_script(self, node: Node) -> None:
+        scope = node.scope
+        prop_name = node.prop_name
+        if node.origin == "event":
+            location = f"{scope.path}.events.{node.member}[{node.index}]"
+        elif node.origin == "onChange":
+            location = f"{scope.path}.propConfig.{prop_name}.onChange"
+        else:
+            location = f"{scope.path}.propConfig.{prop_name}.transforms[{node.index}]"
+        self.model.scripts.append(
+            ScriptNode(
+                content=node.value,
+                location=location,
+                script_type=node.origin,
+                component_path=scope.path,
+                component_type=scope.component_type,
+                prop_name=prop_name,
+                event=node.member,
+                index=node.index,
+                scope=scope,
             )
-
-    # Recurse into root
-    if "root" in obj:
-        _extract_from_tree(
-            obj["root"], f"{path}.root", components, bindings, scripts, expressions
         )
 
-
-def build_view_model(view_data: dict[str, Any], file_path: str) -> ViewModel:
-    """Build a flattened ViewModel from raw view.json data."""
-    model = ViewModel(file_path=file_path)
-
-    # Extract custom properties
-    custom = view_data.get("custom", {})
-    if isinstance(custom, dict):
-        for name, value in custom.items():
-            model.properties.append(
-                PropertyDef(name=name, kind="custom", default_value=value)
+    def _add_expression(self, node: Node) -> None:
+        scope = node.scope
+        location = f"{scope.path}.propConfig.{node.prop_name}"
+        if node.origin == "expr":
+            location = f"{location}.binding.expr"
+        elif node.origin == "expr-struct":
+            location = f"{location}.binding.struct.{node.member}"
+        else:
+            location = f"{location}.transforms[{node.index}]"
+        self.model.expressions.append(
+            ExpressionNode(
+                content=node.value,
+                location=location,
+                component_path=scope.path,
+                component_type=scope.component_type,
+                prop_name=node.prop_name,
+                source=node.origin,
+                member=node.member,
+                index=node.index,
+                scope=scope,
             )
-
-    # Extract param properties
-    params = view_data.get("params", {})
-    if isinstance(params, dict):
-        for name, value in params.items():
-            model.properties.append(
-                PropertyDef(name=name, kind="param", default_value=value)
-            )
-
-    # Walk view-level propConfig
-    view_prop_config = view_data.get("propConfig", {})
-    if isinstance(view_prop_config, dict):
-        _extract_from_propconfig(
-            view_prop_config, "view", model.bindings, model.scripts, model.expressions
         )
 
-    # Walk the component tree (start from root, not view_data, to avoid
-    # double-processing the view-level propConfig)
-    root = view_data.get("root")
-    if isinstance(root, dict):
-        _extract_from_tree(
-            root,
-            "root",
-            model.components,
-            model.bindings,
-            model.scripts,
-            model.expressions,
-        )
 
-    return model
+def build_view_model(view_data: dict[str, Any], file_path: str) -> ViewModel:
+    """Build a flattened ViewModel from raw view.json data."""
+    builder = ViewModelBuilder(file_path)
+    traversal = ViewTraversal([builder])
+    traversal.walk(view_data)
+    traversal.finish()
+    return builder.model
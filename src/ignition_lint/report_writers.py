@@ -0,0 +1,243 @@
+"""Streaming report output for the CLI.
+
+A writer receives each issue as soon as the linters report it (it is the
+``sink`` of a :class:`LintReport`) and writes it straight to its stream,
+so output starts with the first finding and memory does not grow with
+the number of issues.  ``close`` writes whatever depends on the totals.
+"""
+
+from __future__ import annotations
+
+import abc
+import json
+from pathlib import Path
+from typing import Any, TextIO
+from urllib.parse import quote
+
+from . import __version__
+from .reporting import (
+    LintIssue,
+    LintReport,
+    LintSeverity,
+    format_empty_report,
+    format_issue_lines,
+    format_report_footer,
+    format_report_header,
+    format_severity_counts,
+    issue_to_dict,
+)
+
+
+class ReportWriter(abc.ABC):
+    """Base class: counts issues and writes a preamble before the first."""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.count = 0
+
+    def write(self, issue: LintIssue) -> None:
+        if not self.count:
+            self._start()
+            # Let the first finding show up while the rest are linted
+            self.stream.flush()
+        self.count += 1
+        self._write_issue(issue)
+
+    def close(self, report: LintReport) -> None:
+        if not self.count:
+            self._start()
+        self._finish(report)
+        self.stream.flush()
+
+    def _start(self) -> None:  # noqa: B027 - optional hook
+        """Write the preamble, if the format has one."""
+
+    @abc.abstractmethod
+    def _write_issue(self, issue: LintIssue) -> None:
+        """Write one issue to the stream."""
+
+    def _finish(self, report: LintReport) -> None:  # noqa: B027 - optional hook
+        """Write whatever depends on the totals."""
+
+
+class TextReportWriter(ReportWriter):
+    """Human-readable output; severity totals follow the issues."""
+
+    def _start(self) -> None:
+        self.stream.write("\n".join(format_report_header()) + "\n")
+
+    def _write_issue(self, issue: LintIssue) -> None:
+        self.stream.write("\n".join(format_issue_lines(issue)) + "\n")
+
+    def _finish(self, report: LintReport) -> None:
+        if self.count:
+            lines = format_severity_counts(report) + format_report_footer(report)
+        else:
+            lines = format_empty_report(report)
+        self.stream.write("\n".join(lines).rstrip() + "\n")
+
+
+def _report_totals(report: LintReport) -> dict[str, Any]:
+    totals: dict[str, Any] = {"summary": report.summary}
+    if report.cache_hits or report.cache_misses:
+        totals["cache"] = {"hits": report.cache_hits, "misses": report.cache_misses}
+    return totals
+
+
+class JsonReportWriter(ReportWriter):
+    """A single JSON document, written one issue at a time.
+
+    The output is the same as ``json.dumps(..., indent=2)`` of the whole
+    report: ``{"issues": [...], "summary": {...}, "cache": {...}}``.
+    """
+
+    def _start(self) -> None:
+        self.stream.write('{\n  "issues": [')
+
+    def _write_issue(self, issue: LintIssue) -> None:
+        encoded = json.dumps(issue_to_dict(issue), indent=2)
+        separator = "\n" if self.count == 1 else ",\n"
+        self.stream.write(separator + "    " + encoded.replace("\n", "\n    "))
+
+    def _finish(self, report: LintReport) -> None:
+        parts = ["\n  ]" if self.count else "]"]
+        for key, value in _report_totals(report).items():
+            encoded = json.dumps(value, indent=2).replace("\n", "\n  ")
+            parts.append(f",\n  {json.dumps(key)}: {encoded}")
+        parts.append("\n}\n")
+        self.stream.write("".join(parts))
+
+
+class JsonLinesReportWriter(ReportWriter):
+    """One JSON object per line per issue, then a final totals line.
+
+    The totals line is the only one with a ``summary`` key.
+    """
+
+    def _write_issue(self, issue: LintIssue) -> None:
+        self.stream.write(json.dumps(issue_to_dict(issue)) + "\n")
+
+    def _finish(self, report: LintReport) -> None:
+        self.stream.write(json.dumps(_report_totals(report)) + "\n")
+
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+_SARIF_LEVELS = {
+    LintSeverity.ERROR: "error",
+    LintSeverity.WARNING: "warning",
+    LintSeverity.INFO: "note",
+    LintSeverity.STYLE: "note",
+}
+_SRCROOT = "%SRCROOT%"
+
+
+class SarifReportWriter(ReportWriter):
+    """SARIF 2.1.0 log with one run, results written as they arrive.
+
+    Rules and artifacts are interned as results are written and referenced
+    by index (``ruleIndex``, ``artifactLocation.index``); their tables only
+    need to be complete at the end, so they follow ``results`` in the run
+    object.  Relative and in-tree file paths are made relative to
+    *source_root* (default: the working directory) as ``%SRCROOT%`` URIs.
+    """
+
+    def __init__(self, stream: TextIO, source_root: str | Path | None = None):
+        super().__init__(stream)
+        self.source_root = Path(source_root or Path.cwd()).resolve()
+        self._rules: dict[str, int] = {}
+        self._rule_table: list[dict[str, Any]] = []
+        self._artifacts: dict[str, int] = {}
+        self._artifact_table: list[dict[str, Any]] = []
+
+    def _start(self) -> None:
+        self.stream.write(
+            f'{{"$schema":{json.dumps(SARIF_SCHEMA)},"version":"2.1.0",'
+            '"runs":[{"results":['
+        )
+
+    def _rule_index(self, issue: LintIssue) -> int:
+        index = self._rules.get(issue.code)
+        if index is None:
+            index = self._rules[issue.code] = len(self._rule_table)
+            self._rule_table.append(
+                {
+                    "id": issue.code,
+                    # Each result keeps its own level and message
+                    "defaultConfiguration": {"level": _SARIF_LEVELS[issue.severity]},
+                }
+            )
+        return index
+
+    def _artifact_location(self, file_path: str) -> dict[str, Any]:
+        index = self._artifacts.get(file_path)
+        if index is None:
+            index = self._artifacts[file_path] = len(self._artifact_table)
+            self._artifact_table.append({"location": self._uri(file_path)})
+        return {**self._artifact_table[index]["location"], "index": index}
+
+    def _uri(self, file_path: str) -> dict[str, str]:
+        path = Path(file_path)
+        if path.is_absolute():
+            try:
+                path = path.relative_to(self.source_root)
+            except ValueError:
+                return {"uri": path.as_uri()}
+        return {"uri": quote(path.as_posix()), "uriBaseId": _SRCROOT}
+
+    def _write_issue(self, issue: LintIssue) -> None:
+        physical: dict[str, Any] = {
+            "artifactLocation": self._artifact_location(issue.file_path)
+        }
+        if issue.line_number:
+            region = {"startLine": issue.line_number}
+            if issue.column:
+                region["startColumn"] = issue.column
+            physical["region"] = region
+        location: dict[str, Any] = {"physicalLocation": physical}
+        if issue.component_path:
+            location["logicalLocations"] = [
+                {"fullyQualifiedName": issue.component_path, "kind": "element"}
+            ]
+        result: dict[str, Any] = {
+            "ruleId": issue.code,
+            "ruleIndex": self._rule_index(issue),
+            "level": _SARIF_LEVELS[issue.severity],
+            "message": {"text": issue.message},
+            "locations": [location],
+        }
+        properties = {
+            key: value
+            for key, value in (
+                ("suggestion", issue.suggestion),
+                ("componentType", issue.component_type),
+            )
+            if value
+        }
+        if properties:
+            result["properties"] = properties
+        separator = "" if self.count == 1 else ","
+        self.stream.write(separator + json.dumps(result, separators=(",", ":")))
+
+    def _finish(self, report: LintReport) -> None:
+        tool = {
+            "driver": {
+                "name": "ignition-lint",
+                "version": __version__,
+                "informationUri": "https://github.com/TheThoughtagen/ignition-lint",
+                "rules": self._rule_table,
+            }
+        }
+        run = {
+            "tool": tool,
+            "originalUriBaseIds": {_SRCROOT: {"uri": self.source_root.as_uri() + "/"}},
+            "artifacts": self._artifact_table,
+        }
+        self.stream.write("]," + json.dumps(run, separators=(",", ":"))[1:] + "]}\n")
+
+
+REPORT_WRITERS: dict[str, type[ReportWriter]] = {
+    "text": TextReportWriter,
+    "json": JsonReportWriter,
+    "jsonl": JsonLinesReportWriter,
+    "sarif": SarifReportWriter,
+}
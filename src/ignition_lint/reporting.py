@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
-from dataclasses import dataclass, field
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, overload
 
 if TYPE_CHECKING:
     from .suppression import SuppressionConfig
+    from .validators.memo import MemoStats
 
 
 class LintSeverity(str, Enum):
@@ -38,7 +40,37 @@ class LintSeverity(str, Enum):
         return order.index(self) <= order.index(threshold)
 
 
-@dataclass
+class _NoMetadata(Mapping[str, str]):
+    """Shared, read-only empty metadata so most issues allocate no dict.
+
+    Not a ``dict``, so dataclasses accept it as a plain field default.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> str:
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+    def __hash__(self) -> int:
+        return hash(frozenset())
+
+    def __repr__(self) -> str:
+        return "{}"
+
+    def __reduce__(self) -> str:
+        return "NO_METADATA"
+
+
+NO_METADATA: Mapping[str, str] = _NoMetadata()
+
+
+@dataclass(slots=True)
 class LintIssue:
     """Normalized lint issue structure."""
 
@@ -51,17 +83,147 @@ class LintIssue:
     line_number: int | None = None
     column: int | None = None
     suggestion: str | None = None
-    metadata: dict[str, str] = field(default_factory=dict)
+    metadata: Mapping[str, str] = NO_METADATA
+
+
+_SEVERITIES = tuple(LintSeverity)
+_SEVERITY_INDEX = {level: index for index, level in enumerate(_SEVERITIES)}
+# Line numbers and columns are 1-based, so 0 stands in for None
+_NO_POSITION = 0
+
+
+class _StringPool:
+    """Interns strings into small integer ids; id 0 is None."""
+
+    __slots__ = ("_ids", "values")
+
+    def __init__(self) -> None:
+        self._ids: dict[str | None, int] = {None: 0}
+        self.values: list[str | None] = [None]
+
+    def intern(self, value: str | None) -> int:
+        ids = self._ids
+        index = ids.get(value)
+        if index is None:
+            index = ids[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+class IssueTable(Sequence[LintIssue]):
+    """Columnar, append-only issue storage behind ``LintReport.issues``.
+
+    Each issue costs one row across typed arrays; strings are stored once
+    in a shared pool and referenced by id, and metadata is kept only for the
+    rows that have any. Reading a row builds a fresh ``LintIssue``, so
+    mutating an issue obtained from the table does not change the table.
+    """
+
+    __slots__ = (
+        "_strings",
+        "_severity",
+        "_code",
+        "_message",
+        "_file_path",
+        "_component_path",
+        "_component_type",
+        "_line_number",
+        "_column",
+        "_suggestion",
+        "_metadata",
+    )
+
+    def __init__(self, issues: Iterable[LintIssue] = ()) -> None:
+        self._strings = _StringPool()
+        self._severity = array("B")
+        self._code = array("I")
+        self._message = array("I")
+        self._file_path = array("I")
+        self._component_path = array("I")
+        self._component_type = array("I")
+        self._line_number = array("I")
+        self._column = array("I")
+        self._suggestion = array("I")
+        self._metadata: dict[int, Mapping[str, str]] = {}
+        for issue in issues:
+            self.append(issue)
+
+    def append(self, issue: LintIssue) -> None:
+        intern = self._strings.intern
+        if issue.metadata:
+            self._metadata[len(self._severity)] = dict(issue.metadata)
+        self._severity.append(_SEVERITY_INDEX[issue.severity])
+        self._code.append(intern(issue.code))
+        self._message.append(intern(issue.message))
+        self._file_path.append(intern(issue.file_path))
+        self._component_path.append(intern(issue.component_path))
+        self._component_type.append(intern(issue.component_type))
+        self._line_number.append(issue.line_number or _NO_POSITION)
+        self._column.append(issue.column or _NO_POSITION)
+        self._suggestion.append(intern(issue.suggestion))
+
+    def _row(self, index: int) -> LintIssue:
+        strings = self._strings.values
+        return LintIssue(
+            severity=_SEVERITIES[self._severity[index]],
+            code=strings[self._code[index]],
+            message=strings[self._message[index]],
+            file_path=strings[self._file_path[index]],
+            component_path=strings[self._component_path[index]],
+            component_type=strings[self._component_type[index]],
+            line_number=self._line_number[index] or None,
+            column=self._column[index] or None,
+            suggestion=strings[self._suggestion[index]],
+            metadata=self._metadata.get(index, NO_METADATA),
+        )
+
+    def __len__(self) -> int:
+        return len(self._severity)
+
+    @overload
+    def __getitem__(self, index: int) -> LintIssue: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[LintIssue]: ...
+
+    def __getitem__(self, index: int | slice) -> LintIssue | list[LintIssue]:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("issue index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[LintIssue]:
+        return map(self._row, range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IssueTable | list | tuple):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other, strict=True)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"IssueTable({list(self)!r})"
 
 
 @dataclass
 class LintReport:
     """Aggregate linting results used across modules."""
 
-    issues: list[LintIssue] = field(default_factory=list)
+    issues: IssueTable = field(default_factory=IssueTable)
     summary: dict[str, int] = field(default_factory=dict)
     suppression: SuppressionConfig | None = None
     suppressed_count: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    # Validator memo stats by memo name ("expression", "jython")
+    memo_stats: dict[str, MemoStats] = field(default_factory=dict)
+    # When set, kept issues go to the sink (e.g. a ReportWriter) as they
+    # arrive instead of into ``issues``; ``summary`` is still counted.
+    sink: Callable[[LintIssue], None] | None = None
 
     def add_issue(self, issue: LintIssue) -> None:
         if self.suppression and self.suppression.should_suppress(
@@ -69,7 +231,10 @@ class LintReport:
         ):
             self.suppressed_count += 1
             return
-        self.issues.append(issue)
+        if self.sink is not None:
+            self.sink(issue)
+        else:
+            self.issues.append(issue)
         self.summary[issue.severity.value] = (
             self.summary.get(issue.severity.value, 0) + 1
         )
@@ -79,61 +244,125 @@ class LintReport:
             self.add_issue(issue)
 
     def has_failures(self, threshold: LintSeverity) -> bool:
-        return any(issue.severity.fails_threshold(threshold) for issue in self.issues)
+        return any(
+            count and LintSeverity(level).fails_threshold(threshold)
+            for level, count in self.summary.items()
+        )
 
     def merge(self, other: LintReport) -> None:
         self.extend(other.issues)
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        self.add_memo_stats(other.memo_stats)
 
+    def add_memo_stats(self, memo_stats: Mapping[str, MemoStats]) -> None:
+        for name, stats in memo_stats.items():
+            if name in self.memo_stats:
+                self.memo_stats[name].add(stats)
+            else:
+                self.memo_stats[name] = replace(stats)
 
-def format_report_text(report: LintReport) -> str:
-    """Pretty-print a lint report."""
-    lines: list[str] = []
-    lines.append("=" * 60)
-    lines.append("📊 LINT RESULTS")
-    lines.append("=" * 60)
 
-    if not report.issues:
-        lines.append("✅ No issues found")
-        if report.suppressed_count:
-            lines.append(f"🔇 {report.suppressed_count} issues suppressed")
-        return "\n".join(lines)
+SEVERITY_ICONS = {
+    LintSeverity.ERROR: "❌",
+    LintSeverity.WARNING: "⚠️",
+    LintSeverity.INFO: "ℹ️",
+    LintSeverity.STYLE: "💡",
+}
+
+
+def issue_to_dict(issue: LintIssue) -> dict[str, Any]:
+    """JSON form of an issue used by the JSON report formats."""
+    return {
+        "severity": issue.severity.value,
+        "code": issue.code,
+        "message": issue.message,
+        "file_path": issue.file_path,
+        "component_path": issue.component_path,
+        "component_type": issue.component_type,
+        "line_number": issue.line_number,
+        "column": issue.column,
+        "suggestion": issue.suggestion,
+    }
+
 
-    severity_order = LintSeverity.ordered_levels()
-    lines.append("📋 Issues by severity:")
-    for level in severity_order:
+def format_issue_lines(issue: LintIssue) -> list[str]:
+    """Text block for one issue, followed by a blank separator line."""
+    line_info = f":{issue.line_number}" if issue.line_number else ""
+    lines = [
+        f"{SEVERITY_ICONS[issue.severity]} [{issue.code}] {issue.message}",
+        f"   File: {issue.file_path}{line_info}",
+    ]
+    if issue.component_path:
+        lines.append(f"   Component: {issue.component_path}")
+    if issue.suggestion:
+        lines.append(f"   Suggestion: {issue.suggestion}")
+    for key, value in issue.metadata.items():
+        lines.append(f"   {key}: {value}")
+    lines.append("")
+    return lines
+
+
+def format_severity_counts(report: LintReport) -> list[str]:
+    """The "Issues by severity" block from the report summary."""
+    lines = ["📋 Issues by severity:"]
+    for level in LintSeverity.ordered_levels():
         count = report.summary.get(level.value, 0)
         if count:
-            icon = {
-                LintSeverity.ERROR: "❌",
-                LintSeverity.WARNING: "⚠️",
-                LintSeverity.INFO: "ℹ️",
-                LintSeverity.STYLE: "💡",
-            }[level]
-            lines.append(f"  {icon} {level.value.title()}: {count}")
+            lines.append(f"  {SEVERITY_ICONS[level]} {level.value.title()}: {count}")
+    return lines
+
+
+def format_report_header() -> list[str]:
+    return ["=" * 60, "📊 LINT RESULTS", "=" * 60]
 
-    lines.append("")
-    for issue in report.issues:
-        icon = {
-            LintSeverity.ERROR: "❌",
-            LintSeverity.WARNING: "⚠️",
-            LintSeverity.INFO: "ℹ️",
-            LintSeverity.STYLE: "💡",
-        }[issue.severity]
-        location = issue.component_path or ""
-        line_info = f":{issue.line_number}" if issue.line_number else ""
-        lines.append(f"{icon} [{issue.code}] {issue.message}")
-        lines.append(f"   File: {issue.file_path}{line_info}")
-        if location:
-            lines.append(f"   Component: {location}")
-        if issue.suggestion:
-            lines.append(f"   Suggestion: {issue.suggestion}")
-        if issue.metadata:
-            for key, value in issue.metadata.items():
-                lines.append(f"   {key}: {value}")
-        lines.append("")
 
+def format_report_footer(report: LintReport) -> list[str]:
+    """Suppressed and cache counts closing a report with issues."""
+    lines: list[str] = []
     if report.suppressed_count:
         lines.append(f"🔇 {report.suppressed_count} issues suppressed")
         lines.append("")
+    if report.cache_hits or report.cache_misses:
+        lines.append(_format_cache_line(report))
+        lines.append("")
+    return lines
+
+
+def format_empty_report(report: LintReport) -> list[str]:
+    """Body of a report that kept no issues."""
+    lines = ["✅ No issues found"]
+    if report.suppressed_count:
+        lines.append(f"🔇 {report.suppressed_count} issues suppressed")
+    if report.cache_hits or report.cache_misses:
+        lines.append(_format_cache_line(report))
+    return lines
+
+
+def format_report_text(report: LintReport) -> str:
+    """Pretty-print a lint report."""
+    lines = format_report_header()
+    if not report.issues:
+        lines.extend(format_empty_report(report))
+        return "\n".join(lines)
 
+    lines.extend(format_severity_counts(report))
+    lines.append("")
+    for issue in report.issues:
+        lines.extend(format_issue_lines(issue))
+    lines.extend(format_report_footer(report))
     return "\n".join(lines).rstrip()
+
+
+def format_memo_stats(report: LintReport) -> list[str]:
+    """One line per validator memo that was consulted, for verbose output."""
+    return [
+        f"🧠 {name.title()} memo: {stats.hits}/{stats.lookups} hits "
+        f"({stats.hit_rate:.0%})"
+        for name, stats in sorted(report.memo_stats.items())
+        if stats.lookups
+    ]
+
+
+def _format_cache_line(report: LintReport) -> str:
+    return f"🗄️  Cache: {report.cache_hits} hits, {report.cache_misses} misses"
@@ -14,6 +14,8 @@ TAG_SCHEMA_FILES = {
     "robust": "tag-schema-robust.json",
 }
 
+COMPONENT_PROPS_FILE = "component-props.json"
+
 _SCHEMA_DIR = Path(__file__).parent
 
 
@@ -35,3 +37,8 @@ def tag_schema_path_for(mode: str) -> Path:
             f"Unknown tag schema mode '{mode}'. Options: {', '.join(TAG_SCHEMA_FILES)}"
         )
     return _SCHEMA_DIR / TAG_SCHEMA_FILES[normalized]
+
+
+def component_props_path() -> Path:
+    """Return the absolute path to the per-component property map."""
+    return _SCHEMA_DIR / COMPONENT_PROPS_FILE
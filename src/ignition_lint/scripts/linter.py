@@ -15,16 +15,27 @@ Usage:
     uv run python ignition-script-linter.py --target /path/to/ignition/script-python --output results.json
 """
 
+from __future__ import annotations
+
 import argparse
 import ast
 import json
 import re
 import sys
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from ..validators.jython import _preprocess_py2
+from .symbols import (
+    CALL_CODES,
+    ScriptSymbols,
+    collect_library_calls,
+    collect_module_symbols,
+)
+
 
 class LintSeverity(Enum):
     ERROR = "ERROR"
@@ -53,6 +64,181 @@ _INLINE_DISABLE_NEXT = re.compile(r"#\s*ignition-lint:\s*disable-next\s*=\s*(.+)
 _INLINE_DISABLE_LINE = re.compile(r"#\s*ignition-lint:\s*disable-line\s*=\s*(.+)")
 _INLINE_DISABLE = re.compile(r"#\s*ignition-lint:\s*disable\s*=\s*(.+)")
 
+# One pass over a script's text finds every line rule.  Anchors consume only
+# their leading keyword (the rest of each rule is a lookahead) so that no
+# match can hide another rule starting later on the same line; ``print``
+# carries both print rules as optional lookaheads because they start at
+# the same position.  ``[^\S\n]`` keeps whitespace from crossing lines.
+# The leading guard lets the engine skip positions where no rule can start.
+_LINE_RULES_RE = re.compile(
+    r"""
+    (?:^|(?=[spDxbul1.]))
+    (?:
+      (?P<LONG_LINE>^(?=.{121}))
+    | (?P<IGNITION_SYSTEM_OVERRIDE>^[^\S\n]*system(?=[^\S\n]*=))
+    | (?P<GLOBAL_VARIABLE_USAGE>^[^\S\n]*global(?=[^\S\n]+\w))
+    | (?P<java_import>^from(?=[^\S\n]+(?:java|com|org)\.\w))
+    | (?P<system_call>(?=(?P<call>system\.\w+(?:\.\w+)*))system\.)
+    | (?P<print>\bprint
+        (?=(?P<JYTHON_PRINT_STATEMENT>[^\S\n]+[^(\n]))?
+        (?=(?P<IGNITION_DEBUG_PRINT>[^\S\n]*\(.*debug))?)
+    | (?P<debug_call>DEBUG(?=.*\)))
+    | (?P<JYTHON_XRANGE_USAGE>\bxrange\b)
+    | (?P<JYTHON_DEPRECATED_ITERITEMS>\.iteritems\(\))
+    | (?P<JYTHON_STRING_TYPES>\bbasestring\b|\bunicode\b)
+    | (?P<IGNITION_HARDCODED_GATEWAY>localhost:8088|127\.0\.0\.1:8088)
+    )
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+# Line rule code -> (severity, message, suggestion)
+_LINE_RULES: dict[str, tuple[LintSeverity, str, str]] = {
+    "JYTHON_PRINT_STATEMENT": (
+        LintSeverity.WARNING,
+        "Print statement found - use print() function for Jython compatibility",
+        "Change 'print x' to 'print(x)'",
+    ),
+    "JYTHON_XRANGE_USAGE": (
+        LintSeverity.INFO,
+        "xrange() found - consider using range() for consistency",
+        "xrange() works in Jython but range() is more compatible",
+    ),
+    "JYTHON_DEPRECATED_ITERITEMS": (
+        LintSeverity.WARNING,
+        "dict.iteritems() is deprecated - use dict.items()",
+        "Replace .iteritems() with .items()",
+    ),
+    "JYTHON_STRING_TYPES": (
+        LintSeverity.WARNING,
+        "basestring/unicode types found - may cause compatibility issues",
+        "Use str type checking for better compatibility",
+    ),
+    "IGNITION_SYSTEM_OVERRIDE": (
+        LintSeverity.ERROR,
+        "Overriding 'system' variable breaks Ignition functionality",
+        "Rename variable to avoid conflict with system module",
+    ),
+    "IGNITION_HARDCODED_GATEWAY": (
+        LintSeverity.WARNING,
+        "Hardcoded gateway URL found - use system properties instead",
+        "Use system.util.getSystemProps() for gateway URL",
+    ),
+    "IGNITION_DEBUG_PRINT": (
+        LintSeverity.INFO,
+        "Debug print statement found - consider using logger instead",
+        "Use system.util.getLogger() for proper logging",
+    ),
+    "GLOBAL_VARIABLE_USAGE": (
+        LintSeverity.WARNING,
+        "Global variable usage detected - consider alternatives",
+        "Use function parameters or class attributes instead",
+    ),
+}
+
+
+# Nodes whose list fields hold statements
+_STATEMENT_PARENTS = (ast.mod, ast.stmt, ast.excepthandler, ast.match_case)
+
+
+def _walk_statements(tree: ast.AST):
+    """Like :func:`ast.walk`, in the same order, but only yielding statements.
+
+    Function definitions only occur in statement lists, so skipping
+    expressions finds them without visiting most of the tree.
+    """
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        for name in node._fields:
+            value = getattr(node, name, None)
+            if (
+                isinstance(value, list)
+                and value
+                and isinstance(value[0], _STATEMENT_PARENTS)
+            ):
+                todo.extend(value)
+        yield node
+
+
+@dataclass
+class ScriptContext:
+    """One script file, parsed and scanned once for every check.
+
+    ``tree`` is parsed after :func:`_preprocess_py2`, so Jython 2 syntax
+    such as print statements does not count as an error.  ``rule_lines``
+    maps each line rule code to the lines it matched, ``system_calls``
+    holds the distinct ``system.*`` call paths in order of appearance and
+    ``java_imports`` counts ``from java./com./org.`` imports.
+    """
+
+    file_path: str
+    content: str
+    lines: list[str]
+    tree: ast.Module | None = None
+    syntax_error: SyntaxError | None = None
+    parse_error: Exception | None = None
+    rule_lines: dict[str, list[int]] = field(default_factory=dict)
+    system_calls: dict[str, None] = field(default_factory=dict)
+    java_imports: int = 0
+
+    @classmethod
+    def analyze(cls, file_path: str, content: str) -> ScriptContext:
+        context = cls(file_path, content, content.split("\n"))
+        try:
+            context.tree = ast.parse(_preprocess_py2(content))
+        except SyntaxError as e:
+            context.syntax_error = e
+        except Exception as e:
+            context.parse_error = e
+        context._scan()
+        return context
+
+    def _scan(self) -> None:
+        content = self.content
+        rule_lines = self.rule_lines
+        line_number = 1
+        line_start = 0  # offset up to which newlines have been counted
+        call_end = 0
+
+        def hit(code: str) -> None:
+            found = rule_lines.setdefault(code, [])
+            if not found or found[-1] != line_number:
+                found.append(line_number)
+
+        for m in _LINE_RULES_RE.finditer(content):
+            start = m.start()
+            line_number += content.count("\n", line_start, start)
+            line_start = start
+            kind = m.lastgroup
+            if kind == "system_call":
+                # Calls do not overlap, like re.findall over the line
+                if start >= call_end:
+                    call_end = m.end("call")
+                    self.system_calls[m.group("call")] = None
+            elif kind == "print":
+                if m.group("JYTHON_PRINT_STATEMENT") is not None:
+                    hit("JYTHON_PRINT_STATEMENT")
+                if m.group("IGNITION_DEBUG_PRINT") is not None:
+                    hit("IGNITION_DEBUG_PRINT")
+            elif kind == "debug_call":
+                hit("IGNITION_DEBUG_PRINT")
+            elif kind == "java_import":
+                self.java_imports += 1
+            else:
+                hit(kind)
+
+    def rule_hits(self, *codes: str) -> list[tuple[int, str]]:
+        """``(line, code)`` for the given line rules, by line then code order."""
+        order = {code: i for i, code in enumerate(codes)}
+        hits = [
+            (line_number, code)
+            for code in codes
+            for line_number in self.rule_lines.get(code, ())
+        ]
+        hits.sort(key=lambda h: (h[0], order[h[1]]))
+        return hits
+
 
 class IgnitionScriptLinter:
     def __init__(self):
@@ -60,6 +246,8 @@ class IgnitionScriptLinter:
         self.files_processed = 0
         self.total_lines_analyzed = 0
         self._current_suppressions: dict[str, Any] | None = None
+        # File path -> library symbols and calls, joined project-wide later
+        self.symbols: dict[str, ScriptSymbols] = {}
 
         # Ignition system modules and functions (8.1 + 8.3)
         self.ignition_system_modules = {
@@ -105,38 +293,6 @@ class IgnitionScriptLinter:
             "system.webdev",
         }
 
-        # Python 2.7 vs 3.x compatibility issues
-        self.python2_patterns = {
-            "print_statement": re.compile(r"\bprint\s+[^(]"),
-            "string_types": re.compile(r"\bbasestring\b|\bunicode\b"),
-            "xrange": re.compile(r"\bxrange\b"),
-            "iteritems": re.compile(r"\.iteritems\(\)"),
-            "iterkeys": re.compile(r"\.iterkeys\(\)"),
-            "itervalues": re.compile(r"\.itervalues\(\)"),
-            "has_key": re.compile(r"\.has_key\("),
-            "execfile": re.compile(r"\bexecfile\b"),
-            "raw_input": re.compile(r"\braw_input\b"),
-            "reduce": re.compile(r"\breduce\("),
-            "reload": re.compile(r"\breload\("),
-        }
-
-        # Common Java integration patterns in Ignition
-        self.java_patterns = {
-            "java_import": re.compile(r"^from\s+(java\.|com\.|org\.)\w+"),
-            "java_class": re.compile(r"\b[A-Z]\w*\.[A-Z]\w*"),
-            "java_method": re.compile(r"\.get[A-Z]\w*\(|\.set[A-Z]\w*\("),
-        }
-
-        # Common Ignition anti-patterns
-        self.antipatterns = {
-            "system_override": re.compile(r"^\s*system\s*="),
-            "hardcoded_gateway": re.compile(r"localhost:8088|127\.0\.0\.1:8088"),
-            "hardcoded_db": re.compile(r"localhost:5432|127\.0\.0\.1:5432"),
-            "print_debug": re.compile(r"\bprint\s*\(.*debug|DEBUG.*\)"),
-            "sleep_in_loop": re.compile(r"time\.sleep\(.+\)\s*$"),
-            "global_vars": re.compile(r"^\s*global\s+\w+"),
-        }
-
     @staticmethod
     def _parse_inline_suppressions(lines: list[str]) -> dict[str, Any]:
         """Scan lines for ignition-lint inline suppression comments."""
@@ -144,6 +300,8 @@ class IgnitionScriptLinter:
         line_codes: dict[int, set[str]] = {}
 
         for i, line in enumerate(lines):
+            if "ignition-lint" not in line:
+                continue
             line_num = i + 1
 
             # disable-file — only recognised in the first 10 lines
@@ -205,9 +363,9 @@ class IgnitionScriptLinter:
 
         # Find all Python files
         if recursive:
-            python_files = list(target.rglob("*.py"))
+            python_files = sorted(target.rglob("*.py"))
         else:
-            python_files = list(target.glob("*.py"))
+            python_files = sorted(target.glob("*.py"))
 
         print(f"🔍 Found {len(python_files)} Python script files", file=sys.stderr)
 
@@ -225,18 +383,20 @@ class IgnitionScriptLinter:
         try:
             with open(file_path, encoding="utf-8") as f:
                 content = f.read()
-                lines = content.split("\n")
 
-            self._current_suppressions = self._parse_inline_suppressions(lines)
+            context = ScriptContext.analyze(str(file_path), content)
+            self._current_suppressions = self._parse_inline_suppressions(context.lines)
             self.files_processed += 1
-            self.total_lines_analyzed += len(lines)
+            self.total_lines_analyzed += len(context.lines)
 
             # Perform various checks
-            self._check_syntax(file_path, content)
-            self._check_jython_compatibility(file_path, content, lines)
-            self._check_ignition_patterns(file_path, content, lines)
-            self._check_code_quality(file_path, content, lines)
-            self._check_java_integration(file_path, content, lines)
+            self._check_syntax(context)
+            self._check_jython_compatibility(context)
+            self._check_ignition_patterns(context)
+            self._check_code_quality(context)
+            self._check_java_integration(context)
+            if context.tree is not None:
+                self.symbols[str(file_path)] = self._collect_symbols(context.tree)
 
         except Exception as e:
             self.issues.append(
@@ -250,150 +410,82 @@ class IgnitionScriptLinter:
         finally:
             self._current_suppressions = None
 
-    def _check_syntax(self, file_path: Path, content: str):
+    def _collect_symbols(self, tree: ast.Module) -> ScriptSymbols:
+        calls = collect_library_calls(tree)
+        for call in calls:
+            call.suppressed = tuple(
+                code
+                for code in CALL_CODES
+                if self._is_suppressed(code, call.line_number)
+            )
+        # Collected whatever the file's name: cache entries are shared by
+        # files with the same content, and only library modules get indexed
+        return ScriptSymbols(collect_module_symbols(tree), calls)
+
+    def _add_line_issues(self, context: ScriptContext, *codes: str) -> None:
+        for line_number, code in context.rule_hits(*codes):
+            severity, message, suggestion = _LINE_RULES[code]
+            self._add_issue(
+                ScriptLintIssue(
+                    severity=severity,
+                    code=code,
+                    message=message,
+                    file_path=context.file_path,
+                    line_number=line_number,
+                    suggestion=suggestion,
+                )
+            )
+
+    def _check_syntax(self, context: ScriptContext):
         """Check basic Python syntax."""
-        try:
-            # Try to parse with Python AST
-            ast.parse(content)
-        except SyntaxError as e:
+        e = context.syntax_error
+        if e is not None:
+            # Preprocessing keeps lines intact; quote the original source
+            text = e.text
+            if e.lineno and e.lineno <= len(context.lines):
+                text = context.lines[e.lineno - 1]
             self._add_issue(
                 ScriptLintIssue(
                     severity=LintSeverity.ERROR,
                     code="SYNTAX_ERROR",
                     message=f"Python syntax error: {e.msg}",
-                    file_path=str(file_path),
+                    file_path=context.file_path,
                     line_number=e.lineno,
                     column=e.offset,
-                    suggestion=f"Fix syntax error: {e.text.strip() if e.text else 'check code structure'}",
+                    suggestion=f"Fix syntax error: {text.strip() if text else 'check code structure'}",
                 )
             )
-        except Exception as e:
+        elif context.parse_error is not None:
             self._add_issue(
                 ScriptLintIssue(
                     severity=LintSeverity.WARNING,
                     code="PARSE_WARNING",
-                    message=f"Could not fully parse file: {str(e)}",
-                    file_path=str(file_path),
+                    message=f"Could not fully parse file: {str(context.parse_error)}",
+                    file_path=context.file_path,
                 )
             )
 
-    def _check_jython_compatibility(
-        self, file_path: Path, content: str, lines: list[str]
-    ):
+    def _check_jython_compatibility(self, context: ScriptContext):
         """Check for Jython/Python 2.7 compatibility issues."""
-
-        # Check for Python 2 vs 3 incompatibilities
-        for line_num, line in enumerate(lines, 1):
-            # Check for print statements (should be print functions in Jython)
-            if self.python2_patterns["print_statement"].search(line):
-                self._add_issue(
-                    ScriptLintIssue(
-                        severity=LintSeverity.WARNING,
-                        code="JYTHON_PRINT_STATEMENT",
-                        message="Print statement found - use print() function for Jython compatibility",
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        suggestion="Change 'print x' to 'print(x)'",
-                    )
-                )
-
-            # Check for xrange (Python 2) vs range (Python 3)
-            if self.python2_patterns["xrange"].search(line):
-                self._add_issue(
-                    ScriptLintIssue(
-                        severity=LintSeverity.INFO,
-                        code="JYTHON_XRANGE_USAGE",
-                        message="xrange() found - consider using range() for consistency",
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        suggestion="xrange() works in Jython but range() is more compatible",
-                    )
-                )
-
-            # Check for deprecated dictionary methods
-            if self.python2_patterns["iteritems"].search(line):
-                self._add_issue(
-                    ScriptLintIssue(
-                        severity=LintSeverity.WARNING,
-                        code="JYTHON_DEPRECATED_ITERITEMS",
-                        message="dict.iteritems() is deprecated - use dict.items()",
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        suggestion="Replace .iteritems() with .items()",
-                    )
-                )
-
-            # Check for string type issues
-            if self.python2_patterns["string_types"].search(line):
-                self._add_issue(
-                    ScriptLintIssue(
-                        severity=LintSeverity.WARNING,
-                        code="JYTHON_STRING_TYPES",
-                        message="basestring/unicode types found - may cause compatibility issues",
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        suggestion="Use str type checking for better compatibility",
-                    )
-                )
-
-    def _check_ignition_patterns(self, file_path: Path, content: str, lines: list[str]):
+        self._add_line_issues(
+            context,
+            "JYTHON_PRINT_STATEMENT",
+            "JYTHON_XRANGE_USAGE",
+            "JYTHON_DEPRECATED_ITERITEMS",
+            "JYTHON_STRING_TYPES",
+        )
+
+    def _check_ignition_patterns(self, context: ScriptContext):
         """Check for Ignition-specific patterns and best practices."""
-
-        # Check for proper system module usage
-        system_imports = set()
-        system_calls = set()
-
-        for line_num, line in enumerate(lines, 1):
-            # Track system module imports
-            if "import system" in line or "from system" in line:
-                system_imports.add(line.strip())
-
-            # Track system function calls
-            if "system." in line:
-                matches = re.findall(r"system\.\w+(?:\.\w+)*", line)
-                system_calls.update(matches)
-
-            # Check for anti-patterns
-            if self.antipatterns["system_override"].search(line):
-                self._add_issue(
-                    ScriptLintIssue(
-                        severity=LintSeverity.ERROR,
-                        code="IGNITION_SYSTEM_OVERRIDE",
-                        message="Overriding 'system' variable breaks Ignition functionality",
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        suggestion="Rename variable to avoid conflict with system module",
-                    )
-                )
-
-            # Check for hardcoded URLs
-            if self.antipatterns["hardcoded_gateway"].search(line):
-                self._add_issue(
-                    ScriptLintIssue(
-                        severity=LintSeverity.WARNING,
-                        code="IGNITION_HARDCODED_GATEWAY",
-                        message="Hardcoded gateway URL found - use system properties instead",
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        suggestion="Use system.util.getSystemProps() for gateway URL",
-                    )
-                )
-
-            # Check for debugging print statements
-            if self.antipatterns["print_debug"].search(line):
-                self._add_issue(
-                    ScriptLintIssue(
-                        severity=LintSeverity.INFO,
-                        code="IGNITION_DEBUG_PRINT",
-                        message="Debug print statement found - consider using logger instead",
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        suggestion="Use system.util.getLogger() for proper logging",
-                    )
-                )
+        self._add_line_issues(
+            context,
+            "IGNITION_SYSTEM_OVERRIDE",
+            "IGNITION_HARDCODED_GATEWAY",
+            "IGNITION_DEBUG_PRINT",
+        )
 
         # Validate system function calls
-        for call in system_calls:
+        for call in context.system_calls:
             if not any(
                 call.startswith(module) for module in self.ignition_system_modules
             ):
@@ -407,59 +499,45 @@ class IgnitionScriptLinter:
                                 severity=LintSeverity.WARNING,
                                 code="IGNITION_UNKNOWN_SYSTEM_CALL",
                                 message=f"Unknown system function call: {call}",
-                                file_path=str(file_path),
+                                file_path=context.file_path,
                                 suggestion="Verify function exists in Ignition documentation",
                             )
                         )
 
-    def _check_java_integration(self, file_path: Path, content: str, lines: list[str]):
+    def _check_java_integration(self, context: ScriptContext):
         """Check for Java integration patterns."""
-
-        java_imports_found = []
-        java_usage_found = []
-
-        for line_num, line in enumerate(lines, 1):
-            # Check for Java imports
-            if self.java_patterns["java_import"].search(line):
-                java_imports_found.append((line_num, line.strip()))
-
-            # Check for Java-style method calls
-            if self.java_patterns["java_method"].search(line):
-                java_usage_found.append((line_num, line.strip()))
-
         # Report Java integration patterns (informational)
-        if java_imports_found:
+        if context.java_imports:
             self._add_issue(
                 ScriptLintIssue(
                     severity=LintSeverity.INFO,
                     code="JAVA_INTEGRATION_DETECTED",
-                    message=f"Java imports detected ({len(java_imports_found)} imports)",
-                    file_path=str(file_path),
+                    message=f"Java imports detected ({context.java_imports} imports)",
+                    file_path=context.file_path,
                     suggestion="Ensure Java classes are available in Ignition classpath",
                 )
             )
 
-    def _check_code_quality(self, file_path: Path, content: str, lines: list[str]):
+    def _check_code_quality(self, context: ScriptContext):
         """Check for general code quality issues."""
 
         # Check for long lines
-        for line_num, line in enumerate(lines, 1):
-            if len(line) > 120:
-                self._add_issue(
-                    ScriptLintIssue(
-                        severity=LintSeverity.STYLE,
-                        code="LONG_LINE",
-                        message=f"Line too long ({len(line)} characters, recommend < 120)",
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        suggestion="Break long lines for better readability",
-                    )
+        for line_number in context.rule_lines.get("LONG_LINE", ()):
+            length = len(context.lines[line_number - 1])
+            self._add_issue(
+                ScriptLintIssue(
+                    severity=LintSeverity.STYLE,
+                    code="LONG_LINE",
+                    message=f"Line too long ({length} characters, recommend < 120)",
+                    file_path=context.file_path,
+                    line_number=line_number,
+                    suggestion="Break long lines for better readability",
                 )
+            )
 
         # Check for missing docstrings in functions
-        try:
-            tree = ast.parse(content)
-            for node in ast.walk(tree):
+        if context.tree is not None:
+            for node in _walk_statements(context.tree):
                 if isinstance(node, ast.FunctionDef):
                     # Skip dunder methods and private functions
                     if node.name.startswith("_"):
@@ -470,27 +548,14 @@ class IgnitionScriptLinter:
                                 severity=LintSeverity.STYLE,
                                 code="MISSING_DOCSTRING",
                                 message=f"Function '{node.name}' missing docstring",
-                                file_path=str(file_path),
+                                file_path=context.file_path,
                                 line_number=node.lineno,
                                 suggestion="Add docstring describing function purpose and parameters",
                             )
                         )
-        except Exception:
-            pass  # Skip if AST parsing fails
 
         # Check for global variable usage
-        for line_num, line in enumerate(lines, 1):
-            if self.antipatterns["global_vars"].search(line):
-                self._add_issue(
-                    ScriptLintIssue(
-                        severity=LintSeverity.WARNING,
-                        code="GLOBAL_VARIABLE_USAGE",
-                        message="Global variable usage detected - consider alternatives",
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        suggestion="Use function parameters or class attributes instead",
-                    )
-                )
+        self._add_line_issues(context, "GLOBAL_VARIABLE_USAGE")
 
     def _generate_report(self) -> dict[str, Any]:
         """Generate comprehensive linting report."""
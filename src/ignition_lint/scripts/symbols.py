@@ -0,0 +1,716 @@
+"""Symbol index of a project's ``script-python`` library.
+
+Ignition exposes every ``code.py`` under ``ignition/script-python`` as a
+module named by its folder path (``ignition/script-python/util/db/code.py``
+is ``util.db``), callable from other modules and from inline view and tag
+scripts, optionally behind the legacy ``project.``/``shared.`` prefixes.
+:func:`collect_module_symbols` summarizes what a module defines at top
+level and :func:`collect_library_calls` the dotted calls a script makes.
+Both summaries are small JSON values, so they are cached per file with
+the lint results; :class:`ScriptLibrary` joins them across a project to
+report calls to modules or functions that do not exist, or that pass the
+wrong arguments.  Modules are added and removed one file at a time, so a
+long-running session only re-parses the files that change.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import textwrap
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..cache import LintCache
+from ..reporting import LintIssue, LintSeverity
+from ..validators.jython import _preprocess_py2
+from ..validators.memo import DEFAULT_MEMO_SIZE, ResultMemo
+
+SCRIPT_LIBRARY_DIR = "script-python"
+MODULE_FILE = "code.py"
+
+# Legacy prefixes for project and shared (global project) library calls
+_LIBRARY_PREFIXES = frozenset({"project", "shared"})
+
+# Parameters Ignition passes to inline event, onChange and transform scripts
+_INLINE_SCRIPT_PARAMS = frozenset(
+    {
+        "self",
+        "event",
+        "value",
+        "quality",
+        "timestamp",
+        "previousValue",
+        "currentValue",
+        "origin",
+        "missedEvents",
+        "initialChange",
+        "tag",
+        "tagPath",
+        "executionCount",
+    }
+)
+
+CALL_CODES = ("UNRESOLVED_SCRIPT_CALL", "SCRIPT_CALL_ARITY")
+
+
+@dataclass(frozen=True, slots=True)
+class Signature:
+    """Positional parameters of a library function or class constructor."""
+
+    params: tuple[str, ...]
+    required: int
+    varargs: bool = False
+    varkw: bool = False
+
+    @classmethod
+    def from_arguments(cls, args: ast.arguments, skip: int = 0) -> Signature:
+        params = tuple(a.arg for a in (*args.posonlyargs, *args.args))[skip:]
+        return cls(
+            params=params,
+            required=max(0, len(params) - len(args.defaults)),
+            varargs=args.vararg is not None,
+            # Keyword-only parameters are not Jython 2 syntax; accept any keyword
+            varkw=args.kwarg is not None or bool(args.kwonlyargs),
+        )
+
+    def problem(self, call: LibraryCall) -> str | None:
+        """Describe why *call* does not match this signature, or None."""
+        if call.unpacked:
+            return None
+        if call.positional > len(self.params) and not self.varargs:
+            return (
+                f"takes at most {len(self.params)} positional argument(s) "
+                f"({call.positional} given)"
+            )
+        for keyword in call.keywords:
+            if keyword in self.params[: call.positional]:
+                return f"got multiple values for argument '{keyword}'"
+            if keyword not in self.params and not self.varkw:
+                return f"got an unexpected keyword argument '{keyword}'"
+        missing = [
+            name
+            for name in self.params[call.positional : self.required]
+            if name not in call.keywords
+        ]
+        if missing:
+            names = ", ".join(f"'{name}'" for name in missing)
+            return f"is missing required argument(s) {names}"
+        return None
+
+    def to_json(self) -> list:
+        return [list(self.params), self.required, self.varargs, self.varkw]
+
+    @classmethod
+    def from_json(cls, data: list) -> Signature:
+        params, required, varargs, varkw = data
+        return cls(tuple(params), required, varargs, varkw)
+
+
+@dataclass(slots=True)
+class ModuleSymbols:
+    """Top-level names a library module defines.
+
+    Functions and classes map to their :class:`Signature`, or None when it
+    cannot be known statically (decorated, or a class without its own
+    ``__init__``).  ``names`` holds every other top-level binding; ``open``
+    is set when a star import or ``globals()`` may add names.
+    """
+
+    functions: dict[str, Signature | None] = field(default_factory=dict)
+    classes: dict[str, Signature | None] = field(default_factory=dict)
+    names: frozenset[str] = frozenset()
+    open: bool = False
+
+    def defines(self, name: str) -> bool:
+        return (
+            self.open
+            or name in self.functions
+            or name in self.classes
+            or name in self.names
+        )
+
+    def to_json(self) -> list:
+        return [
+            {n: None if s is None else s.to_json() for n, s in self.functions.items()},
+            {n: None if s is None else s.to_json() for n, s in self.classes.items()},
+            sorted(self.names),
+            self.open,
+        ]
+
+    @classmethod
+    def from_json(cls, data: list) -> ModuleSymbols:
+        functions, classes, names, is_open = data
+        return cls(
+            functions={
+                n: None if s is None else Signature.from_json(s)
+                for n, s in functions.items()
+            },
+            classes={
+                n: None if s is None else Signature.from_json(s)
+                for n, s in classes.items()
+            },
+            names=frozenset(names),
+            open=is_open,
+        )
+
+
+@dataclass(slots=True)
+class LibraryCall:
+    """A call through a dotted name that may target the script library."""
+
+    target: str  # dotted name with import aliases expanded
+    positional: int
+    keywords: tuple[str, ...] = ()
+    unpacked: bool = False  # *args or **kwargs at the call site
+    line_number: int | None = None
+    column: int | None = None
+    suppressed: tuple[str, ...] = ()  # codes disabled inline for this line
+
+    def to_json(self) -> list:
+        return [
+            self.target,
+            self.positional,
+            list(self.keywords),
+            self.unpacked,
+            self.line_number,
+            self.column,
+            list(self.suppressed),
+        ]
+
+    @classmethod
+    def from_json(cls, data: list) -> LibraryCall:
+        target, positional, keywords, unpacked, line, column, suppressed = data
+        return cls(
+            target,
+            positional,
+            tuple(keywords),
+            unpacked,
+            line,
+            column,
+            tuple(suppressed),
+        )
+
+
+@dataclass(slots=True)
+class ScriptSymbols:
+    """What one ``.py`` file defines at top level and calls.
+
+    The definitions are only indexed if the file is a library module.
+    """
+
+    module: ModuleSymbols | None = None
+    calls: list[LibraryCall] = field(default_factory=list)
+
+    def to_json(self) -> list:
+        return [
+            None if self.module is None else self.module.to_json(),
+            [call.to_json() for call in self.calls],
+        ]
+
+    @classmethod
+    def from_json(cls, data: list) -> ScriptSymbols:
+        module, calls = data
+        return cls(
+            None if module is None else ModuleSymbols.from_json(module),
+            [LibraryCall.from_json(call) for call in calls],
+        )
+
+
+def library_root_for(file_path: str | Path) -> tuple[Path, str] | None:
+    """Return ``(script-python directory, module path)`` for a ``code.py``.
+
+    The module path is the dotted folder path below ``script-python``;
+    None is returned for files that are not library modules.
+    """
+    path = Path(file_path).resolve()
+    if path.name != MODULE_FILE:
+        return None
+    parts = path.parent.parts
+    for i in range(len(parts) - 1, -1, -1):
+        if parts[i] == SCRIPT_LIBRARY_DIR:
+            if i == len(parts) - 1:
+                return None
+            return Path(*parts[: i + 1]), ".".join(parts[i + 1 :])
+    return None
+
+
+def _bound_names(target: ast.AST, out: set[str]) -> None:
+    for node in ast.walk(target):
+        if isinstance(node, ast.Name):
+            out.add(node.id)
+
+
+def collect_module_symbols(tree: ast.Module) -> ModuleSymbols:
+    """Summarize the top-level definitions of a parsed library module.
+
+    Bodies of top-level ``if``/``try``/``for``/``while``/``with`` blocks run
+    at import time too, so their definitions count.  A function or class
+    defined twice with different signatures keeps no signature.
+    """
+    symbols = ModuleSymbols()
+    names: set[str] = set()
+
+    def define(table: dict[str, Signature | None], name: str, signature) -> None:
+        if name in table and table[name] != signature:
+            signature = None
+        table[name] = signature
+
+    def visit(body: list[ast.stmt]) -> None:
+        for node in body:
+            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+                define(
+                    symbols.functions,
+                    node.name,
+                    None
+                    if node.decorator_list
+                    else Signature.from_arguments(node.args),
+                )
+            elif isinstance(node, ast.ClassDef):
+                define(symbols.classes, node.name, _constructor_signature(node))
+            elif isinstance(node, ast.Import | ast.ImportFrom):
+                for alias in node.names:
+                    if alias.name == "*":
+                        symbols.open = True
+                    else:
+                        names.add(alias.asname or alias.name.split(".")[0])
+            elif isinstance(node, ast.Assign):
+                for target in node.targets:
+                    _bound_names(target, names)
+            elif isinstance(node, ast.AnnAssign | ast.AugAssign):
+                _bound_names(node.target, names)
+            elif isinstance(node, ast.For | ast.AsyncFor):
+                _bound_names(node.target, names)
+                visit(node.body)
+                visit(node.orelse)
+            elif isinstance(node, ast.With | ast.AsyncWith):
+                for item in node.items:
+                    if item.optional_vars is not None:
+                        _bound_names(item.optional_vars, names)
+                visit(node.body)
+            elif isinstance(node, ast.If | ast.While):
+                visit(node.body)
+                visit(node.orelse)
+            elif isinstance(node, ast.Try):
+                visit(node.body)
+                for handler in node.handlers:
+                    if handler.name:
+                        names.add(handler.name)
+                    visit(handler.body)
+                visit(node.orelse)
+                visit(node.finalbody)
+            elif (
+                isinstance(node, ast.Expr)
+                and isinstance(node.value, ast.Call)
+                and isinstance(node.value.func, ast.Name)
+                and node.value.func.id in ("globals", "exec", "execfile")
+            ):
+                symbols.open = True
+
+    visit(tree.body)
+
+    # A name bound more than one way has no single signature
+    ambiguous = (names | symbols.classes.keys()) & symbols.functions.keys()
+    ambiguous |= names & symbols.classes.keys()
+    for name in ambiguous:
+        symbols.functions.pop(name, None)
+        symbols.classes.pop(name, None)
+    symbols.names = frozenset(names | ambiguous)
+    return symbols
+
+
+def read_module_symbols(file_path: str | Path) -> ModuleSymbols | None:
+    """Symbols of the module file at *file_path*; None if unreadable or invalid."""
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            tree = ast.parse(_preprocess_py2(f.read()))
+    except (OSError, UnicodeDecodeError, SyntaxError, ValueError, RecursionError):
+        return None
+    return collect_module_symbols(tree)
+
+
+def _constructor_signature(node: ast.ClassDef) -> Signature | None:
+    if node.decorator_list:
+        return None
+    for item in node.body:
+        if isinstance(item, ast.FunctionDef) and item.name == "__init__":
+            if item.decorator_list:
+                return None
+            return Signature.from_arguments(item.args, skip=1)
+    return None  # inherited constructor
+
+
+def _dotted_name(node: ast.expr) -> str | None:
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+def collect_library_calls(
+    tree: ast.AST, bound: Iterable[str] = ()
+) -> list[LibraryCall]:
+    """Return the calls in *tree* that may target the script library.
+
+    These are calls through a dotted name whose root is not bound in the
+    script, plus calls through names bound by ``import`` statements, with
+    the import expanded (``from util import db; db.run()`` calls
+    ``util.db.run``).  Names bound any other way, or listed in *bound*,
+    are local objects.
+    """
+    bound = set(bound)
+    aliases: dict[str, str] = {}
+    calls: list[ast.Call] = []
+    # A plain stack walk visits the same nodes as ast.walk at about half
+    # the cost; calls are put back in source order below.
+    stack: list[ast.AST] = [tree]
+    while stack:
+        node = stack.pop()
+        for name in node._fields:
+            value = getattr(node, name, None)
+            if isinstance(value, ast.AST):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(item for item in value if isinstance(item, ast.AST))
+
+        kind = type(node)
+        if kind is ast.Name:
+            if type(node.ctx) is not ast.Load:
+                bound.add(node.id)
+        elif kind is ast.Call:
+            calls.append(node)
+        elif kind is ast.arg:
+            bound.add(node.arg)
+        elif kind in (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef):
+            bound.add(node.name)
+        elif kind is ast.ExceptHandler:
+            if node.name:
+                bound.add(node.name)
+        elif kind is ast.Import:
+            for alias in node.names:
+                if alias.asname:
+                    aliases[alias.asname] = alias.name
+                else:
+                    root = alias.name.split(".")[0]
+                    aliases[root] = root
+        elif kind is ast.ImportFrom:
+            if node.module and not node.level:
+                for alias in node.names:
+                    if alias.name != "*":
+                        aliases[alias.asname or alias.name] = (
+                            f"{node.module}.{alias.name}"
+                        )
+    calls.sort(key=lambda call: (call.lineno, call.col_offset))
+
+    found: list[LibraryCall] = []
+    for call in calls:
+        target = _dotted_name(call.func)
+        if target is None:
+            continue
+        root, dot, rest = target.partition(".")
+        if root in bound:
+            continue
+        if root in aliases:
+            target = aliases[root] + dot + rest
+        elif not dot:
+            continue
+        if target.partition(".")[0] == "system":
+            continue
+        found.append(
+            LibraryCall(
+                target=target,
+                positional=sum(not isinstance(arg, ast.Starred) for arg in call.args),
+                keywords=tuple(k.arg for k in call.keywords if k.arg is not None),
+                unpacked=any(isinstance(arg, ast.Starred) for arg in call.args)
+                or any(k.arg is None for k in call.keywords),
+                line_number=call.lineno,
+                column=call.col_offset + 1,
+            )
+        )
+    return found
+
+
+class InlineCallCollector:
+    """Collect library calls from inline (view or tag) scripts.
+
+    Inline scripts are function bodies, so they are dedented before
+    parsing; scripts that do not parse contribute no calls.  Results are
+    memoized by script text like the validators' (see :class:`ResultMemo`).
+    """
+
+    def __init__(self, memo_size: int = DEFAULT_MEMO_SIZE):
+        self.memo: ResultMemo[str, tuple[LibraryCall, ...]] = ResultMemo(memo_size)
+
+    def collect(self, script: str) -> tuple[LibraryCall, ...]:
+        return self.memo.lookup(script, lambda: self._collect(script))
+
+    @staticmethod
+    def _collect(script: str) -> tuple[LibraryCall, ...]:
+        try:
+            tree = ast.parse(_preprocess_py2(textwrap.dedent(script)))
+        except (SyntaxError, ValueError, RecursionError):
+            return ()
+        return tuple(collect_library_calls(tree, _INLINE_SCRIPT_PARAMS))
+
+
+class ScriptLibrary:
+    """The library modules of one ``script-python`` directory."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.modules: dict[str, ModuleSymbols] = {}
+        # module path -> file path, for incremental updates by file
+        self._files: dict[str, str] = {}
+        self._packages: set[str] | None = None
+
+    def __len__(self) -> int:
+        return len(self.modules)
+
+    @classmethod
+    def load(cls, root: str | Path, cache_dir: Path | None = None) -> ScriptLibrary:
+        """Index every module under *root*.
+
+        With a *cache_dir*, module symbols are kept in the lint cache keyed
+        by file content, so only new or changed modules are parsed.
+        """
+        library = cls(root)
+        cache = (
+            LintCache(cache_dir, options={"check": "script-symbols"})
+            if cache_dir is not None
+            else None
+        )
+        extras: dict[str, list] = {}
+        for file_path in sorted(Path(root).rglob(MODULE_FILE)):
+            name = str(file_path)
+            if cache is not None and cache.get(name, extras) is not None:
+                # Modules that did not parse were cached without symbols
+                if name in extras:
+                    library.add(name, ModuleSymbols.from_json(extras[name]))
+                continue
+            symbols = library.update(name)
+            if cache is not None:
+                cache.put(name, [], None if symbols is None else symbols.to_json())
+        if cache is not None:
+            cache.prune()
+        return library
+
+    def add(self, file_path: str | Path, symbols: ModuleSymbols) -> None:
+        """Add or replace the module defined by *file_path*."""
+        located = library_root_for(file_path)
+        if located is None:
+            return
+        _root, module_path = located
+        self.modules[module_path] = symbols
+        self._files[str(file_path)] = module_path
+        self._packages = None
+
+    def update(self, file_path: str | Path) -> ModuleSymbols | None:
+        """Re-read one module after it changed on disk; returns its symbols.
+
+        A module that no longer exists or does not parse is removed.
+        """
+        symbols = read_module_symbols(file_path)
+        if symbols is None:
+            self.remove(file_path)
+        else:
+            self.add(file_path, symbols)
+        return symbols
+
+    def remove(self, file_path: str | Path) -> None:
+        module_path = self._files.pop(str(file_path), None)
+        if module_path is not None:
+            self.modules.pop(module_path, None)
+            self._packages = None
+
+    @property
+    def packages(self) -> set[str]:
+        """Every module path and the package paths above it."""
+        if self._packages is None:
+            packages: set[str] = set()
+            for module_path in self.modules:
+                parts = module_path.split(".")
+                packages.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+            self._packages = packages
+        return self._packages
+
+    def fingerprint(self) -> str:
+        """Digest of the module symbols that calls are checked against.
+
+        Results holding call checks can be cached under it; edits inside
+        function bodies leave it unchanged.
+        """
+        payload = json.dumps(
+            sorted((path, symbols.to_json()) for path, symbols in self.modules.items()),
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def check(self, call: LibraryCall) -> tuple[str, str] | None:
+        """Return ``(code, message)`` when *call* cannot work, else None.
+
+        Only calls under one of the library's top-level packages are
+        checked; anything else may be a Java package, a Python module or
+        a library this project inherits.
+        """
+        parts = call.target.split(".")
+        packages = self.packages
+        if parts[0] not in packages:
+            if parts[0] not in _LIBRARY_PREFIXES or len(parts) < 2:
+                return None
+            parts = parts[1:]
+            if parts[0] not in packages:
+                return None
+
+        for end in range(len(parts), 0, -1):
+            module_path = ".".join(parts[:end])
+            if module_path in self.modules:
+                break
+        else:
+            end = 0
+        if end == len(parts) or (
+            end < len(parts) and ".".join(parts[: end + 1]) in packages
+        ):
+            # The call stops at, or goes through, a package with no such module
+            known = end
+            while known < len(parts) and ".".join(parts[: known + 1]) in packages:
+                known += 1
+            if known == len(parts):
+                path = ".".join(parts)
+                return (
+                    "UNRESOLVED_SCRIPT_CALL",
+                    f"'{path}' is a script package or module, not a function",
+                )
+            missing = ".".join(parts[: known + 1])
+            return (
+                "UNRESOLVED_SCRIPT_CALL",
+                f"Script module '{missing}' does not exist",
+            )
+
+        symbols = self.modules[module_path]
+        name = parts[end]
+        if not symbols.defines(name):
+            return (
+                "UNRESOLVED_SCRIPT_CALL",
+                f"Script module '{module_path}' has no attribute '{name}'",
+            )
+        if end + 1 < len(parts):
+            return None  # attribute of a module-level object
+        if name in symbols.functions:
+            kind, signature = "Function", symbols.functions[name]
+        elif name in symbols.classes:
+            kind, signature = "Class", symbols.classes[name]
+        else:
+            return None
+        problem = None if signature is None else signature.problem(call)
+        if problem is None:
+            return None
+        return "SCRIPT_CALL_ARITY", f"{kind} '{module_path}.{name}' {problem}"
+
+
+class LibraryIndex:
+    """Script libraries of one or more projects, keyed by ``script-python`` root."""
+
+    def __init__(self):
+        self.libraries: dict[Path, ScriptLibrary] = {}
+
+    def add(self, file_path: str | Path, symbols: ModuleSymbols) -> None:
+        located = library_root_for(file_path)
+        if located is not None:
+            root = located[0]
+            library = self.libraries.get(root)
+            if library is None:
+                library = self.libraries[root] = ScriptLibrary(root)
+            library.add(file_path, symbols)
+
+    def library_for(self, file_path: str | Path) -> ScriptLibrary | None:
+        """The library of the ``script-python`` directory containing *file_path*."""
+        path = Path(file_path).resolve()
+        for parent in path.parents:
+            if parent.name == SCRIPT_LIBRARY_DIR:
+                return self.libraries.get(parent)
+        return None
+
+
+def check_library_calls(
+    library: ScriptLibrary,
+    calls: Iterable[LibraryCall],
+    file_path: str,
+    component_path: str | None = None,
+    component_type: str | None = None,
+    script_location: tuple[int | None, int | None] | None = None,
+) -> list[LintIssue]:
+    """Lint *calls* against *library*.
+
+    Calls from a ``.py`` file are located by their own line and column.
+    Calls from an inline script pass the ``(line, column)`` of the script
+    in its view or tag file as *script_location*, and the line within the
+    script is added to the message.
+    """
+    issues: list[LintIssue] = []
+    for call in calls:
+        result = library.check(call)
+        if result is None:
+            continue
+        code, message = result
+        if code in call.suppressed:
+            continue
+        line_number, column = call.line_number, call.column
+        if script_location is not None:
+            message = f"{message} (script line {call.line_number})"
+            line_number, column = script_location
+        issues.append(
+            LintIssue(
+                severity=LintSeverity.WARNING,
+                code=code,
+                message=message,
+                file_path=file_path,
+                component_path=component_path,
+                component_type=component_type,
+                line_number=line_number,
+                column=column,
+                suggestion=(
+                    "Check the module path and function name in the project library"
+                    if code == "UNRESOLVED_SCRIPT_CALL"
+                    else "Match the call's arguments to the function's parameters"
+                ),
+            )
+        )
+    return issues
+
+
+def check_script_files(
+    symbols: Mapping[str, list], unread: Iterable[str | Path] = ()
+) -> list[LintIssue]:
+    """Lint the library calls of linted ``.py`` files.
+
+    *symbols* maps file paths to :meth:`ScriptSymbols.to_json` values; the
+    library modules among them form the index the calls are checked
+    against, by their paths.  Modules in *unread* (files that were not linted) are indexed
+    from disk so calls into them still resolve.
+    """
+    summaries = {path: ScriptSymbols.from_json(data) for path, data in symbols.items()}
+    index = LibraryIndex()
+    for file_path, summary in summaries.items():
+        if summary.module is not None:
+            index.add(file_path, summary.module)
+    for file_path in unread:
+        if Path(file_path).name == MODULE_FILE:
+            module = read_module_symbols(file_path)
+            if module is not None:
+                index.add(file_path, module)
+
+    issues: list[LintIssue] = []
+    for file_path, summary in summaries.items():
+        if not summary.calls:
+            continue
+        library = index.library_for(file_path)
+        if library is not None:
+            issues.extend(check_library_calls(library, summary.calls, file_path))
+    return issues
@@ -15,11 +15,12 @@ except ImportError:  # pragma: no cover - optional dependency
 from .cli import (
     LintReport,
     check_linter_availability,
-    format_report_text,
     lint_naming,
     lint_perspective,
     lint_scripts,
+    lint_tags,
 )
+from .reporting import format_report_text, issue_to_dict
 from .schemas import schema_path_for
 from .suppression import build_suppression_config
 
@@ -33,20 +34,7 @@ mcp = FastMCP("Ignition Linter")
 
 def _report_to_dict(report: LintReport) -> dict[str, Any]:
     return {
-        "issues": [
-            {
-                "severity": issue.severity.value,
-                "code": issue.code,
-                "message": issue.message,
-                "file_path": issue.file_path,
-                "component_path": issue.component_path,
-                "component_type": issue.component_type,
-                "line_number": issue.line_number,
-                "column": issue.column,
-                "suggestion": issue.suggestion,
-            }
-            for issue in report.issues
-        ],
+        "issues": [issue_to_dict(issue) for issue in report.issues],
         "summary": report.summary,
     }
 
@@ -77,6 +65,7 @@ Available Tools:
 - lint_perspective_components(project_path, component_type=None)
 - lint_jython_scripts(project_path)
 - lint_ignition_project(project_path)
+- lint_tag_exports(tags_path)
 - validate_component_json(component, context?) – coming soon
 - validate_script_content(script_content, context?) – coming soon
     """.strip()
@@ -142,6 +131,25 @@ def lint_jython_scripts(
     return format_report_text(report)
 
 
+@mcp.tool()
+def lint_tag_exports(
+    tags_path: str,
+    ignore_codes: str | None = None,
+) -> str:
+    """Lint tag/UDT JSON exports (a file, or a directory of exports)."""
+    path = Path(tags_path)
+    if not path.exists():
+        return f"ℹ️  No tag export found at {path}"
+
+    suppression = build_suppression_config(
+        ignore_codes=ignore_codes,
+        project_root=path if path.is_dir() else path.parent,
+    )
+    report = LintReport(suppression=suppression)
+    report.merge(lint_tags([path]))
+    return format_report_text(report)
+
+
 @mcp.tool()
 def lint_ignition_project(
     project_path: str,
@@ -8,9 +8,27 @@ from pathlib import Path
 import pathspec
 
 
+@dataclass(frozen=True)
+class PathSuppression:
+    """What the ignore file suppresses for one file."""
+
+    blanket: bool = False
+    codes: frozenset[str] = frozenset()
+
+    def suppresses(self, code: str) -> bool:
+        return self.blanket or code in self.codes
+
+
+_NOT_SUPPRESSED = PathSuppression()
+
+
 @dataclass
 class SuppressionConfig:
-    """Holds all suppression rules: CLI ignore codes + ignore-file patterns."""
+    """Holds all suppression rules: CLI ignore codes + ignore-file patterns.
+
+    Each file is resolved and matched against the ignore file once; the
+    outcome is memoized by path, since a file usually reports many issues.
+    """
 
     ignore_codes: set[str] = field(default_factory=set)
     blanket_path_spec: pathspec.PathSpec | None = None
@@ -18,30 +36,63 @@ class SuppressionConfig:
         default_factory=list
     )
     project_root: Path | None = None
+    _code_specs: dict[str, pathspec.PathSpec] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _paths: dict[str, PathSuppression] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def should_suppress(self, code: str, file_path: str) -> bool:
         """Return True if this issue should be suppressed."""
         if code in self.ignore_codes:
             return True
+        return self.for_path(file_path).suppresses(code)
+
+    def for_path(self, file_path: str) -> PathSuppression:
+        """Ignore-file suppression for *file_path* (CLI codes not included)."""
+        cached = self._paths.get(file_path)
+        if cached is None:
+            cached = self._paths[file_path] = self._match_path(file_path)
+        return cached
 
+    def _match_path(self, file_path: str) -> PathSuppression:
         if self.project_root is None:
-            return False
+            return _NOT_SUPPRESSED
 
         try:
             rel_path = (
                 Path(file_path).resolve().relative_to(self.project_root).as_posix()
             )
         except ValueError:
-            return False
+            return _NOT_SUPPRESSED
 
         if self.blanket_path_spec and self.blanket_path_spec.match_file(rel_path):
-            return True
-
-        for spec, codes in self.rule_path_specs:
-            if code in codes and spec.match_file(rel_path):
-                return True
-
-        return False
+            return PathSuppression(blanket=True)
+
+        codes = frozenset(
+            code
+            for code, spec in self._specs_by_code().items()
+            if spec.match_file(rel_path)
+        )
+        return PathSuppression(codes=codes) if codes else _NOT_SUPPRESSED
+
+    def _specs_by_code(self) -> dict[str, pathspec.PathSpec]:
+        """Merge the per-rule patterns into one spec per rule code."""
+        if self._code_specs is None:
+            patterns: dict[str, list] = {}
+            for spec, codes in self.rule_path_specs:
+                # A lone exclusion pattern matched nothing in its own spec;
+                # merged, it would un-match other lines for the same code
+                included = [p for p in spec.patterns if p.include]
+                for code in codes:
+                    patterns.setdefault(code, []).extend(included)
+            self._code_specs = {
+                code: pathspec.PathSpec(code_patterns)
+                for code, code_patterns in patterns.items()
+                if code_patterns
+            }
+        return self._code_specs
 
 
 def load_ignition_lintignore(
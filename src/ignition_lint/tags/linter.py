@@ -5,9 +5,13 @@ best-practice violations such as missing dataType, missing typeId on
 UDT instances, misconfigured value sources, and unknown property names.
 """
 
+from __future__ import annotations
+
+import hashlib
 import json
-import re
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import Any
 
 try:
     from jsonschema import ValidationError, validate
@@ -25,7 +29,18 @@ except ImportError:  # pragma: no cover - optional dependency
 
 from ..reporting import LintIssue, LintSeverity
 from ..schemas import tag_schema_path_for as _tag_schema_path_for
+from ..scripts.symbols import InlineCallCollector, ScriptLibrary, check_library_calls
 from ..validators.jython import JythonValidator
+from ..validators.schema import get_schema_validator
+from .stream import CHILDREN, StreamedTag, TagStream
+from .udt import (
+    TYPES_FOLDER,
+    TagUdts,
+    UdtDefinition,
+    UdtInstance,
+    UdtMember,
+    UdtParameter,
+)
 
 # Keys that are present on every tagType (shared base)
 _SHARED_TAG_KEYS = frozenset(
@@ -44,7 +59,12 @@ _SHARED_TAG_KEYS = frozenset(
 class IgnitionTagLinter:
     """Lint Ignition tag/UDT JSON files for structural and best-practice issues."""
 
-    def __init__(self, schema_path: str | None = None):
+    def __init__(
+        self,
+        schema_path: str | None = None,
+        script_library: ScriptLibrary | None = None,
+        rollup_event_scripts: bool = False,
+    ):
         if schema_path is None:
             schema_path = _tag_schema_path_for("robust")
         else:
@@ -53,6 +73,11 @@ class IgnitionTagLinter:
         self.schema_path = schema_path
         self.jsonschema_available = JSONSCHEMA_AVAILABLE and validate is not None
         self.schema = self._load_schema(schema_path)
+        self.schema_validator = (
+            get_schema_validator(schema_path, self.schema, discriminator="tagType")
+            if self.jsonschema_available
+            else None
+        )
         self.issues: list[LintIssue] = []
         self.tag_stats = {
             "total_files": 0,
@@ -62,6 +87,17 @@ class IgnitionTagLinter:
             "tag_types": set(),
         }
         self.jython_validator = JythonValidator()
+        # Event script calls into the gateway scripting project's library
+        self.script_library = script_library
+        self.call_collector = InlineCallCollector()
+        # Report each distinct event script's issues once per file, at its
+        # first tag, with the number of tags sharing it
+        self.rollup_event_scripts = rollup_event_scripts
+        # Lint results of the current file's event scripts, by content digest
+        self._event_scripts: dict[bytes, _EventScript] = {}
+        # UDT definitions and instances of each linted file, by file path
+        # (TagUdts.to_json values), for check_tag_udts
+        self.udt_summaries: dict[str, list] = {}
         self.known_atomic_props = self._extract_known_atomic_props()
 
     # ------------------------------------------------------------------
@@ -111,14 +147,23 @@ class IgnitionTagLinter:
     # ------------------------------------------------------------------
 
     def lint_file(self, file_path: str) -> bool:
-        """Lint a single tag JSON file. Returns True if the file is valid."""
+        """Lint a single tag JSON file. Returns True if the file is valid.
+
+        The file is read incrementally (see :class:`TagStream`), so exports
+        of any size are linted in bounded memory.  Its UDT definitions and
+        instances are summarized in :attr:`udt_summaries`.
+        """
         self.tag_stats["total_files"] += 1
+        issues_start = len(self.issues)
+        udts = TagUdts()
+        self._event_scripts = {}
 
         try:
             with open(file_path, encoding="utf-8") as f:
-                raw_text = f.read()
-            data = json.loads(raw_text)
+                file_valid = self._lint_stream(TagStream(f), file_path, udts)
         except json.JSONDecodeError as e:
+            # Report the file as a whole, as if it had not been read at all
+            del self.issues[issues_start:]
             self.issues.append(
                 LintIssue(
                     severity=LintSeverity.ERROR,
@@ -131,7 +176,8 @@ class IgnitionTagLinter:
                 )
             )
             return False
-        except Exception as e:
+        except (OSError, UnicodeError) as e:
+            del self.issues[issues_start:]
             self.issues.append(
                 LintIssue(
                     severity=LintSeverity.ERROR,
@@ -144,462 +190,646 @@ class IgnitionTagLinter:
             )
             return False
 
-        line_map = self._build_tag_line_map(raw_text)
-        issues_start = len(self.issues)
+        if self.rollup_event_scripts:
+            self._roll_up_event_scripts()
+        self._event_scripts = {}
+        if udts:
+            self.udt_summaries[file_path] = udts.to_json()
+        return file_valid
 
-        # Walk the tag tree
-        if isinstance(data, list):
-            # Handle top-level arrays (common in tag exports)
-            file_valid = True
-            for i, entry in enumerate(data):
-                if not self._validate_tag_node(entry, file_path, f"[{i}]"):
-                    file_valid = False
-        else:
-            # Single tag node
-            file_valid = self._validate_tag_node(data, file_path, "")
+    def _lint_stream(self, stream: TagStream, file_path: str, udts: TagUdts) -> bool:
+        """Validate each node of *stream* as it is read.
+
+        A parent is only complete after its children, so its issues are
+        moved ahead of theirs once it has been checked, keeping the report
+        in tree order.
+        """
+        file_valid = True
+        # Nodes whose children are being read, by id of their StreamedTag
+        open_frames: dict[int, _TagFrame] = {}
+
+        for event, tag in stream:
+            if event == CHILDREN:
+                parent = open_frames.get(id(tag.parent)) if tag.parent else None
+                frame = self._open_frame(tag, parent, file_path, udts)
+                frame.children_start = len(self.issues)
+                open_frames[id(tag)] = frame
+                continue
 
-        # Enrich issues with line numbers
-        self._enrich_issue_line_numbers(self.issues, line_map, issues_start, raw_text)
+            if tag.has_children:
+                frame = open_frames.pop(id(tag))
+            else:
+                parent = open_frames.get(id(tag.parent)) if tag.parent else None
+                frame = self._open_frame(tag, parent, file_path, udts)
+
+            issues_start = len(self.issues)
+            if not self._visit_tag(frame, file_path):
+                file_valid = False
+            if tag.has_children and len(self.issues) > issues_start:
+                node_issues = self.issues[issues_start:]
+                del self.issues[issues_start:]
+                start = frame.children_start
+                self.issues[start:start] = node_issues
 
         return file_valid
 
     # ------------------------------------------------------------------
-    # Recursive tag walker
+    # Tag nodes
     # ------------------------------------------------------------------
 
-    def _validate_tag_node(
+    def _open_frame(
         self,
-        node: dict,
+        tag: StreamedTag,
+        parent: _TagFrame | None,
         file_path: str,
-        tag_path: str,
-        inside_udt_instance: bool = False,
-    ) -> bool:
-        """Validate a single tag node and recurse into children."""
+        udts: TagUdts,
+    ) -> _TagFrame:
+        """Place *tag* in the tree and record it if it belongs to a UDT.
+
+        Called once a node's own members are read, before its children.
+        """
+        frame = _TagFrame(tag, parent)
+        node = tag.value
+        if not isinstance(node, dict):
+            return frame
+        tag_type = node.get("tagType")
+
+        # Members of a definition, or overrides of an instance's members
+        if parent is not None and parent.members is not None:
+            name = node.get("name")
+            if isinstance(name, str) and name and name not in parent.members:
+                type_id = node.get("typeId")
+                member = UdtMember(
+                    tag_type,
+                    type_id if isinstance(type_id, str) else None,
+                    path=frame.path,
+                )
+                member.line_number, member.column = _tag_location(tag)
+                parent.members[name] = member
+                frame.members = member.members
+
+        if tag_type == "UdtType":
+            path, in_types_folder = _definition_path(frame)
+            parent_id = node.get("typeId")
+            definition = UdtDefinition(
+                path,
+                parent_id if isinstance(parent_id, str) else None,
+                _udt_parameters(tag),
+                component_path=frame.path,
+                in_types_folder=in_types_folder,
+            )
+            definition.line_number, definition.column = _tag_location(tag, "typeId")
+            udts.definitions.append(definition)
+            frame.members = definition.members
+        elif tag_type == "UdtInstance" and not frame.inside_udt_instance:
+            # Members of an instance inherit their type from the definition
+            type_id = node.get("typeId")
+            if isinstance(type_id, str) and type_id:
+                if frame.members is None:
+                    frame.members = {}
+                instance = UdtInstance(
+                    type_id,
+                    frame.path,
+                    parameters=_udt_parameters(tag),
+                    members=frame.members,
+                )
+                instance.line_number, instance.column = _tag_location(tag, "typeId")
+                udts.instances.append(instance)
+        elif tag_type == "Folder" and node.get("name") == TYPES_FOLDER:
+            udts.types_folder = True
+        return frame
+
+    def _visit_tag(self, frame: _TagFrame, file_path: str) -> bool:
+        """Run every node-level rule on one tag, without its children.
+
+        Returns True if the tag matches the schema.
+        """
+        node = frame.tag.value
         if not isinstance(node, dict):
             # Report error for malformed tag entries
             node_type = type(node).__name__
             node_repr = repr(node) if len(repr(node)) < 50 else repr(node)[:47] + "..."
+            line_number, column = _tag_location(frame.tag)
             self.issues.append(
                 LintIssue(
                     severity=LintSeverity.ERROR,
                     code="INVALID_TAG_NODE",
                     message=f"Tag node must be a dict/object, got {node_type}: {node_repr}",
                     file_path=file_path,
-                    component_path=tag_path or "root",
+                    component_path=frame.path,
                     component_type="invalid",
+                    line_number=line_number,
+                    column=column,
                     suggestion="Each tag must be a JSON object with 'name', 'tagType', etc.",
                 )
             )
             self.tag_stats["invalid_tags"] += 1
             return False
 
-        tag_name = node.get("name", "")
-        current_path = f"{tag_path}/{tag_name}" if tag_path else tag_name
         tag_type = node.get("tagType", "")
-
         self.tag_stats["total_tags"] += 1
         if tag_type:
             self.tag_stats["tag_types"].add(tag_type)
 
-        # Schema validation
-        schema_valid = self._validate_tag_schema(node, file_path, current_path)
-
-        # Best practices checks
-        self._check_tag_best_practices(
-            node, file_path, current_path, inside_udt_instance
-        )
-
-        # Event script validation
-        self._validate_event_scripts(node, file_path, current_path)
+        schema_valid = self._validate_tag_schema(node, file_path, frame)
+        self._check_tag_best_practices(node, tag_type, file_path, frame)
+        event_scripts = node.get("eventScripts")
+        if event_scripts:
+            self._validate_event_scripts(
+                event_scripts, node.get("tagType", "unknown"), file_path, frame
+            )
 
         if schema_valid:
             self.tag_stats["valid_tags"] += 1
         else:
             self.tag_stats["invalid_tags"] += 1
+        return schema_valid
 
-        # Recurse into child tags
-        tags = node.get("tags")
-        node_valid = schema_valid
-        if isinstance(tags, list):
-            child_inside_udt = inside_udt_instance or tag_type == "UdtInstance"
-            for i, child in enumerate(tags):
-                child_path = f"{current_path}/tags[{i}]"
-                child_valid = self._validate_tag_node(
-                    child, file_path, child_path, child_inside_udt
-                )
-                if not child_valid:
-                    node_valid = False
-
-        return node_valid
+    def _tag_issue(
+        self,
+        frame: _TagFrame,
+        file_path: str,
+        severity: LintSeverity,
+        code: str,
+        message: str,
+        suggestion: str | None = None,
+        search_key: str | None = None,
+    ) -> None:
+        """Report an issue on the tag *frame*, located at *search_key* if given."""
+        node = frame.tag.value
+        if search_key is None:
+            line_number, column = _tag_location(frame.tag)
+        else:
+            line_number, column = _tag_location(frame.tag, search_key)
+        metadata: dict[str, str] = {}
+        tag_name = node.get("name", "")
+        if tag_name:
+            metadata["tag_name"] = tag_name
+        if search_key is not None:
+            metadata["search_key"] = f'"{search_key}"'
+        self.issues.append(
+            LintIssue(
+                severity=severity,
+                code=code,
+                message=message,
+                file_path=file_path,
+                component_path=frame.path,
+                component_type=node.get("tagType") or "unknown",
+                line_number=line_number,
+                column=column,
+                suggestion=suggestion,
+                metadata=metadata,
+            )
+        )
 
     # ------------------------------------------------------------------
     # Schema validation
     # ------------------------------------------------------------------
 
-    def _validate_tag_schema(self, node: dict, file_path: str, tag_path: str) -> bool:
+    def _validate_tag_schema(
+        self, node: dict, file_path: str, frame: _TagFrame
+    ) -> bool:
         """Validate a tag node against the JSON schema."""
-        if not self.jsonschema_available or validate is None:
+        if self.schema_validator is None:
             return True
 
-        try:
-            validate(instance=node, schema=self.schema)
+        e = self.schema_validator.first_error(node)
+        if e is None:
             return True
-        except ValidationError as e:
-            metadata: dict[str, str] = {}
-            if e.absolute_path:
-                path_parts = list(e.absolute_path)
-                search_prop = None
-                for part in reversed(path_parts):
-                    if isinstance(part, str):
-                        search_prop = part
-                        break
-                if search_prop:
-                    metadata["search_key"] = f'"{search_prop}"'
-
-            tag_name = node.get("name", "")
-            if tag_name:
-                metadata["tag_name"] = tag_name
 
-            self.issues.append(
-                LintIssue(
-                    severity=LintSeverity.ERROR,
-                    code="SCHEMA_VALIDATION",
-                    message=f"Schema validation failed: {e.message}",
-                    file_path=file_path,
-                    component_path=tag_path,
-                    component_type=node.get("tagType", "unknown"),
-                    suggestion=(
-                        f"Path: {'.'.join(map(str, e.absolute_path))}"
-                        if e.absolute_path
-                        else None
-                    ),
-                    metadata=metadata,
-                )
+        metadata: dict[str, str] = {}
+        search_prop = None
+        if e.absolute_path:
+            path_parts = list(e.absolute_path)
+            for part in reversed(path_parts):
+                if isinstance(part, str):
+                    search_prop = part
+                    break
+            if search_prop:
+                metadata["search_key"] = f'"{search_prop}"'
+        if search_prop:
+            line_number, column = _tag_location(frame.tag, search_prop)
+        else:
+            line_number, column = _tag_location(frame.tag)
+
+        tag_name = node.get("name", "")
+        if tag_name:
+            metadata["tag_name"] = tag_name
+
+        self.issues.append(
+            LintIssue(
+                severity=LintSeverity.ERROR,
+                code="SCHEMA_VALIDATION",
+                message=f"Schema validation failed: {e.message}",
+                file_path=file_path,
+                component_path=frame.path,
+                component_type=node.get("tagType", "unknown"),
+                line_number=line_number,
+                column=column,
+                suggestion=(
+                    f"Path: {'.'.join(map(str, e.absolute_path))}"
+                    if e.absolute_path
+                    else None
+                ),
+                metadata=metadata,
             )
-            return False
+        )
+        return False
 
     # ------------------------------------------------------------------
     # Best practices
     # ------------------------------------------------------------------
 
     def _check_tag_best_practices(
-        self,
-        node: dict,
-        file_path: str,
-        tag_path: str,
-        inside_udt_instance: bool = False,
+        self, node: dict, tag_type: str, file_path: str, frame: _TagFrame
     ) -> None:
         """Run programmatic best-practice checks on a tag node."""
-        tag_type = node.get("tagType", "")
-        tag_name = node.get("name", "")
-        base_metadata: dict[str, str] = {}
-        if tag_name:
-            base_metadata["tag_name"] = tag_name
-
         # MISSING_TAG_NAME — INFO level because the git module stores
         # one tag per file, with the name derived from the filename.
         if "name" not in node:
-            self.issues.append(
-                LintIssue(
-                    severity=LintSeverity.INFO,
-                    code="MISSING_TAG_NAME",
-                    message="Tag has no 'name' property (may be derived from filename)",
-                    file_path=file_path,
-                    component_path=tag_path,
-                    component_type=tag_type or "unknown",
-                    suggestion="Name may come from the filename in file-per-tag format",
-                    metadata={**base_metadata, "search_key": '"tagType"'},
-                )
+            self._tag_issue(
+                frame,
+                file_path,
+                LintSeverity.INFO,
+                "MISSING_TAG_NAME",
+                "Tag has no 'name' property (may be derived from filename)",
+                suggestion="Name may come from the filename in file-per-tag format",
+                search_key="tagType",
             )
 
-        # INVALID_TAG_TYPE
-        valid_tag_types = {"AtomicTag", "UdtType", "UdtInstance", "Folder", "Provider"}
-        if tag_type and tag_type not in valid_tag_types:
-            self.issues.append(
-                LintIssue(
-                    severity=LintSeverity.ERROR,
-                    code="INVALID_TAG_TYPE",
-                    message=f"Invalid tagType: '{tag_type}'",
-                    file_path=file_path,
-                    component_path=tag_path,
-                    component_type=tag_type,
-                    suggestion=f"Valid values: {', '.join(sorted(valid_tag_types))}",
-                    metadata={**base_metadata, "search_key": '"tagType"'},
-                )
+        rules = _TAG_TYPE_RULES.get(tag_type)
+        if rules is not None:
+            rules(self, node, file_path, frame)
+        elif tag_type:
+            self._tag_issue(
+                frame,
+                file_path,
+                LintSeverity.ERROR,
+                "INVALID_TAG_TYPE",
+                f"Invalid tagType: '{tag_type}'",
+                suggestion=f"Valid values: {', '.join(sorted(VALID_TAG_TYPES))}",
+                search_key="tagType",
             )
 
-        # AtomicTag-specific checks
-        if tag_type == "AtomicTag":
-            # MISSING_DATA_TYPE — skip inside UdtInstance (inherited from definition)
-            if "dataType" not in node and not inside_udt_instance:
-                self.issues.append(
-                    LintIssue(
-                        severity=LintSeverity.WARNING,
-                        code="MISSING_DATA_TYPE",
-                        message="AtomicTag is missing 'dataType'",
-                        file_path=file_path,
-                        component_path=tag_path,
-                        component_type=tag_type,
-                        suggestion="Add 'dataType' (e.g., Int4, Float8, Boolean, String)",
-                        metadata=base_metadata,
-                    )
+    def _check_atomic_tag(self, node: dict, file_path: str, frame: _TagFrame) -> None:
+        # MISSING_DATA_TYPE / MISSING_VALUE_SOURCE — skip inside UdtInstance
+        # (inherited from the definition)
+        if not frame.inside_udt_instance:
+            if "dataType" not in node:
+                self._tag_issue(
+                    frame,
+                    file_path,
+                    LintSeverity.WARNING,
+                    "MISSING_DATA_TYPE",
+                    "AtomicTag is missing 'dataType'",
+                    suggestion="Add 'dataType' (e.g., Int4, Float8, Boolean, String)",
+                )
+            if "valueSource" not in node:
+                self._tag_issue(
+                    frame,
+                    file_path,
+                    LintSeverity.INFO,
+                    "MISSING_VALUE_SOURCE",
+                    "AtomicTag has no explicit 'valueSource' (defaults to memory)",
                 )
 
-            # MISSING_VALUE_SOURCE — skip inside UdtInstance (inherited from definition)
-            if "valueSource" not in node and not inside_udt_instance:
-                self.issues.append(
-                    LintIssue(
-                        severity=LintSeverity.INFO,
-                        code="MISSING_VALUE_SOURCE",
-                        message="AtomicTag has no explicit 'valueSource' (defaults to memory)",
-                        file_path=file_path,
-                        component_path=tag_path,
-                        component_type=tag_type,
-                        metadata=base_metadata,
-                    )
+        value_source = node.get("valueSource", "")
+
+        # OPC_MISSING_CONFIG
+        if value_source == "opc":
+            missing_fields = [
+                f"'{field}'"
+                for field in ("opcServer", "opcItemPath")
+                if field not in node
+            ]
+            if missing_fields:
+                self._tag_issue(
+                    frame,
+                    file_path,
+                    LintSeverity.WARNING,
+                    "OPC_MISSING_CONFIG",
+                    f"OPC tag is missing {' and '.join(missing_fields)}",
+                    suggestion="Add 'opcServer' and 'opcItemPath' properties",
+                    search_key="valueSource",
                 )
 
-            value_source = node.get("valueSource", "")
-
-            # OPC_MISSING_CONFIG
-            if value_source == "opc":
-                if "opcServer" not in node or "opcItemPath" not in node:
-                    missing_fields = []
-                    if "opcServer" not in node:
-                        missing_fields.append("'opcServer'")
-                    if "opcItemPath" not in node:
-                        missing_fields.append("'opcItemPath'")
-
-                    self.issues.append(
-                        LintIssue(
-                            severity=LintSeverity.WARNING,
-                            code="OPC_MISSING_CONFIG",
-                            message=f"OPC tag is missing {' and '.join(missing_fields)}",
-                            file_path=file_path,
-                            component_path=tag_path,
-                            component_type=tag_type,
-                            suggestion="Add 'opcServer' and 'opcItemPath' properties",
-                            metadata={**base_metadata, "search_key": '"valueSource"'},
-                        )
-                    )
+        # EXPR_MISSING_EXPRESSION
+        elif value_source == "expr":
+            if "expression" not in node:
+                self._tag_issue(
+                    frame,
+                    file_path,
+                    LintSeverity.ERROR,
+                    "EXPR_MISSING_EXPRESSION",
+                    "Expression tag is missing 'expression' property",
+                    suggestion="Add an 'expression' property",
+                    search_key="valueSource",
+                )
 
-            # EXPR_MISSING_EXPRESSION
-            if value_source == "expr":
-                if "expression" not in node:
-                    self.issues.append(
-                        LintIssue(
-                            severity=LintSeverity.ERROR,
-                            code="EXPR_MISSING_EXPRESSION",
-                            message="Expression tag is missing 'expression' property",
-                            file_path=file_path,
-                            component_path=tag_path,
-                            component_type=tag_type,
-                            suggestion="Add an 'expression' property",
-                            metadata={**base_metadata, "search_key": '"valueSource"'},
-                        )
-                    )
+        # DB_MISSING_QUERY
+        elif value_source == "db":
+            if "query" not in node:
+                self._tag_issue(
+                    frame,
+                    file_path,
+                    LintSeverity.WARNING,
+                    "DB_MISSING_QUERY",
+                    "Database tag is missing 'query' property",
+                    suggestion="Add a 'query' property",
+                    search_key="valueSource",
+                )
 
-            # DB_MISSING_QUERY
-            if value_source == "db":
-                if "query" not in node:
-                    self.issues.append(
-                        LintIssue(
-                            severity=LintSeverity.WARNING,
-                            code="DB_MISSING_QUERY",
-                            message="Database tag is missing 'query' property",
-                            file_path=file_path,
-                            component_path=tag_path,
-                            component_type=tag_type,
-                            suggestion="Add a 'query' property",
-                            metadata={**base_metadata, "search_key": '"valueSource"'},
-                        )
-                    )
+        # HISTORY_NO_PROVIDER
+        if node.get("historyEnabled") is True and "historyProvider" not in node:
+            self._tag_issue(
+                frame,
+                file_path,
+                LintSeverity.INFO,
+                "HISTORY_NO_PROVIDER",
+                "History is enabled but no 'historyProvider' is specified",
+                suggestion="Add 'historyProvider' to ensure history goes to the correct provider",
+                search_key="historyEnabled",
+            )
 
-            # HISTORY_NO_PROVIDER
-            if node.get("historyEnabled") is True and "historyProvider" not in node:
-                self.issues.append(
-                    LintIssue(
-                        severity=LintSeverity.INFO,
-                        code="HISTORY_NO_PROVIDER",
-                        message="History is enabled but no 'historyProvider' is specified",
-                        file_path=file_path,
-                        component_path=tag_path,
-                        component_type=tag_type,
-                        suggestion="Add 'historyProvider' to ensure history goes to the correct provider",
-                        metadata={**base_metadata, "search_key": '"historyEnabled"'},
-                    )
-                )
+        # UNKNOWN_TAG_PROP — only for AtomicTag
+        known = self.known_atomic_props
+        for key, val in node.items():
+            if key in known:
+                continue
+            # Skip binding objects (dict with bindType key)
+            if isinstance(val, dict) and "bindType" in val:
+                continue
+            self._tag_issue(
+                frame,
+                file_path,
+                LintSeverity.STYLE,
+                "UNKNOWN_TAG_PROP",
+                f"Unknown property '{key}' on AtomicTag",
+                suggestion="Check for typos or remove if unneeded",
+                search_key=key,
+            )
 
-            # UNKNOWN_TAG_PROP — only for AtomicTag
-            for key in node:
-                if key in self.known_atomic_props:
-                    continue
-                # Skip binding objects (dict with bindType key)
-                val = node[key]
-                if isinstance(val, dict) and "bindType" in val:
-                    continue
-                self.issues.append(
-                    LintIssue(
-                        severity=LintSeverity.STYLE,
-                        code="UNKNOWN_TAG_PROP",
-                        message=f"Unknown property '{key}' on AtomicTag",
-                        file_path=file_path,
-                        component_path=tag_path,
-                        component_type=tag_type,
-                        suggestion="Check for typos or remove if unneeded",
-                        metadata={**base_metadata, "search_key": f'"{key}"'},
-                    )
-                )
+    def _check_udt_instance(self, node: dict, file_path: str, frame: _TagFrame) -> None:
+        # Skip the typeId check inside a UdtInstance (nested UdtInstance
+        # members inherit typeId from the UDT definition)
+        if "typeId" not in node and not frame.inside_udt_instance:
+            self._tag_issue(
+                frame,
+                file_path,
+                LintSeverity.ERROR,
+                "MISSING_TYPE_ID",
+                "UdtInstance is missing 'typeId'",
+                suggestion="Add 'typeId' pointing to the UDT definition",
+            )
 
-        # UdtInstance-specific checks — skip typeId check inside UdtInstance
-        # (nested UdtInstance members inherit typeId from the UDT definition)
-        if tag_type == "UdtInstance":
-            if "typeId" not in node and not inside_udt_instance:
-                self.issues.append(
-                    LintIssue(
-                        severity=LintSeverity.ERROR,
-                        code="MISSING_TYPE_ID",
-                        message="UdtInstance is missing 'typeId'",
-                        file_path=file_path,
-                        component_path=tag_path,
-                        component_type=tag_type,
-                        suggestion="Add 'typeId' pointing to the UDT definition",
-                        metadata=base_metadata,
-                    )
-                )
+    def _check_container_tag(
+        self, node: dict, file_path: str, frame: _TagFrame
+    ) -> None:
+        pass
 
     # ------------------------------------------------------------------
     # Event script validation
     # ------------------------------------------------------------------
 
     def _validate_event_scripts(
-        self, node: dict, file_path: str, tag_path: str
+        self, event_scripts: Any, tag_type: str, file_path: str, frame: _TagFrame
     ) -> None:
         """Validate embedded event scripts using JythonValidator."""
-        event_scripts = node.get("eventScripts")
-        if not event_scripts:
-            return
-
         # Dict format: {"valueChanged": {"eventScript": "...", "enabled": true}}
         if isinstance(event_scripts, dict):
             for event_name, event_data in event_scripts.items():
-                if not isinstance(event_data, dict):
-                    continue
-                script = event_data.get("eventScript", "")
-                if not script or not script.strip():
-                    continue
-
-                context = f"{tag_path}.eventScripts.{event_name}"
-                self._validate_jython_script(
-                    script,
-                    event_name,
-                    context,
-                    file_path,
-                    tag_path,
-                    node.get("tagType", "unknown"),
-                )
+                if isinstance(event_data, dict):
+                    self._validate_jython_script(
+                        event_data.get("eventScript", ""),
+                        event_name,
+                        ("eventScripts", event_name),
+                        file_path,
+                        frame,
+                        tag_type,
+                    )
 
         # Array format: [{"eventid": "...", "script": "...", "enabled": true}]
         elif isinstance(event_scripts, list):
             for i, entry in enumerate(event_scripts):
-                if not isinstance(entry, dict):
-                    continue
-                script = entry.get("script", "")
-                event_id = entry.get("eventid", f"event[{i}]")
-                if not script or not script.strip():
-                    continue
-
-                context = f"{tag_path}.eventScripts[{i}]"
-                self._validate_jython_script(
-                    script,
-                    event_id,
-                    context,
-                    file_path,
-                    tag_path,
-                    node.get("tagType", "unknown"),
-                )
+                if isinstance(entry, dict):
+                    self._validate_jython_script(
+                        entry.get("script", ""),
+                        entry.get("eventid", f"event[{i}]"),
+                        ("eventScripts", i),
+                        file_path,
+                        frame,
+                        tag_type,
+                    )
 
     def _validate_jython_script(
         self,
-        script_content: str,
+        script_content: Any,
         prop_name: str,
-        context: str,
+        script_path: tuple[str | int, ...],
         file_path: str,
-        tag_path: str,
+        frame: _TagFrame,
         tag_type: str,
     ) -> None:
-        """Validate a Jython script and append issues."""
+        """Validate a Jython script and append issues.
+
+        Each distinct script is linted once per file and its issues are
+        copied to every tag that uses it, placed at the script's entry
+        (*script_path*) in the tag; lines within the script are named in
+        the messages.
+        """
         if not script_content or not script_content.strip():
             return
 
-        validator_issues = self.jython_validator.validate_script(
-            script_content, context=context
+        digest = hashlib.blake2b(
+            script_content.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        entry = self._event_scripts.get(digest)
+        if entry is None:
+            entry = self._event_scripts[digest] = self._lint_event_script(
+                script_content, file_path
+            )
+        entry.occurrences += 1
+        if not entry.script_issues and not entry.call_issues:
+            return
+        if self.rollup_event_scripts and entry.occurrences > 1:
+            return
+
+        component_path = f"{frame.path}.{prop_name}"
+        line_number, column = _tag_location(frame.tag, *script_path)
+        issues = [
+            replace(
+                template,
+                component_path=component_path,
+                component_type=tag_type,
+                line_number=line_number,
+                column=column,
+            )
+            for template in (*entry.script_issues, *entry.call_issues)
+        ]
+        self.issues.extend(issues)
+        if self.rollup_event_scripts:
+            entry.reported = issues
+
+    def _lint_event_script(self, script_content: str, file_path: str) -> _EventScript:
+        """Lint one event script, without reference to the tags using it."""
+        script_issues = self.jython_validator.validate_script(
+            script_content, context=_EVENT_SCRIPT_CONTEXT, embedded=True
         )
-        for issue in validator_issues:
+        for issue in script_issues:
             issue.file_path = file_path
-            issue.component_path = f"{tag_path}.{prop_name}"
-            issue.component_type = tag_type
-            self.issues.append(issue)
-
-    # ------------------------------------------------------------------
-    # Line number mapping and enrichment
-    # ------------------------------------------------------------------
-
-    @staticmethod
-    def _build_tag_line_map(raw_text: str) -> dict[str, int]:
-        """Map tag names to 1-based line numbers in the raw JSON text."""
-        line_map: dict[str, int] = {}
-        name_pattern = re.compile(r'"name"\s*:\s*"([^"]*)"')
-        tag_type_pattern = re.compile(r'"tagType"\s*:\s*"([^"]*)"')
-
-        for lineno, line in enumerate(raw_text.splitlines(), start=1):
-            m = name_pattern.search(line)
-            if m:
-                line_map[m.group(1)] = lineno
-            else:
-                m = tag_type_pattern.search(line)
-                if m:
-                    line_map.setdefault(f"__tagType__{m.group(1)}__{lineno}", lineno)
+        call_issues: list[LintIssue] = []
+        if self.script_library is not None:
+            calls = self.call_collector.collect(script_content)
+            if calls:
+                call_issues = check_library_calls(
+                    self.script_library, calls, file_path, script_location=(None, None)
+                )
+        return _EventScript(tuple(script_issues), tuple(call_issues))
 
-        return line_map
+    def _roll_up_event_scripts(self) -> None:
+        for entry in self._event_scripts.values():
+            if entry.occurrences < 2:
+                continue
+            for issue in entry.reported:
+                issue.message = f"{issue.message} ({entry.occurrences} occurrences)"
+                issue.metadata = {
+                    **issue.metadata,
+                    "occurrences": str(entry.occurrences),
+                }
 
-    def _enrich_issue_line_numbers(
-        self,
-        issues: list[LintIssue],
-        line_map: dict[str, int],
-        start_idx: int,
-        raw_text: str = "",
-    ) -> None:
-        """Fill in line_number for issues that lack one."""
-        raw_lines = raw_text.splitlines() if raw_text else []
 
-        for issue in issues[start_idx:]:
-            if issue.line_number is not None:
-                continue
+# Jython checks only distinguish transforms and standalone .py files by
+# context, so tag event scripts share one (issues get the tag's path)
+_EVENT_SCRIPT_CONTEXT = "tag.eventScripts"
 
-            search_key = issue.metadata.get("search_key")
-            tag_name = issue.metadata.get("tag_name")
-
-            # Try search_key — direct text search
-            if search_key and raw_lines:
-                start_line = 0
-                if tag_name and tag_name in line_map:
-                    start_line = line_map[tag_name] - 1  # 0-indexed
-                for i, line in enumerate(raw_lines[start_line:], start_line + 1):
-                    if search_key in line:
-                        issue.line_number = i
-                        break
-                if issue.line_number is not None:
-                    continue
-
-            # Try tag name from line_map
-            if tag_name and tag_name in line_map:
-                issue.line_number = line_map[tag_name]
-                continue
+VALID_TAG_TYPES = frozenset(
+    {"AtomicTag", "UdtType", "UdtInstance", "Folder", "Provider"}
+)
 
-            # Try tagType fallback
-            if issue.component_type:
-                for key, lineno in line_map.items():
-                    if key.startswith(f"__tagType__{issue.component_type}__"):
-                        issue.line_number = lineno
-                        break
+# Rules specific to each tagType, run once per node by _check_tag_best_practices
+_TAG_TYPE_RULES = {
+    "AtomicTag": IgnitionTagLinter._check_atomic_tag,
+    "UdtInstance": IgnitionTagLinter._check_udt_instance,
+    "UdtType": IgnitionTagLinter._check_container_tag,
+    "Folder": IgnitionTagLinter._check_container_tag,
+    "Provider": IgnitionTagLinter._check_container_tag,
+}
+
+
+@dataclass(slots=True)
+class _EventScript:
+    """Lint results of one distinct event script body in a file.
+
+    The issues are templates, copied for each tag using the script.
+    """
+
+    script_issues: tuple[LintIssue, ...]
+    call_issues: tuple[LintIssue, ...]
+    occurrences: int = 0
+    # The copies reported at its first tag, when rolling up
+    reported: list[LintIssue] = field(default_factory=list)
+
+
+class _TagFrame:
+    """A tag node being linted and where it sits in the tree.
+
+    The tag path (``Folder/tags[0]/Motor``) is only built when an issue
+    needs it, then kept for the node's children.
+    """
+
+    __slots__ = (
+        "tag",
+        "parent",
+        "inside_udt_instance",
+        "children_start",
+        "members",
+        "_path",
+    )
+
+    def __init__(self, tag: StreamedTag, parent: _TagFrame | None):
+        self.tag = tag
+        self.parent = parent
+        # Members of a UdtInstance inherit from the UDT definition
+        self.inside_udt_instance = parent is not None and (
+            parent.inside_udt_instance
+            or parent.tag.value.get("tagType") == "UdtInstance"
+        )
+        self.children_start = 0
+        # Where the node's children are recorded, when it is part of a UDT
+        self.members: dict[str, UdtMember] | None = None
+        self._path: str | None = None
+
+    @property
+    def path(self) -> str:
+        if self._path is None:
+            # Build any missing ancestor paths first, without recursing
+            pending = []
+            frame: _TagFrame | None = self
+            while frame is not None and frame._path is None:
+                pending.append(frame)
+                frame = frame.parent
+            for frame in reversed(pending):
+                frame._path = frame._own_path()
+        return self._path
+
+    def _own_path(self) -> str:
+        pointer = self.tag.pointer
+        if self.parent is not None:
+            tag_path = f"{self.parent._path}/tags[{pointer[-1]}]"
+        else:
+            # Entries of a top-level array are numbered; a root tag is not
+            tag_path = f"[{pointer[0]}]" if pointer else ""
+        node = self.tag.value
+        if not isinstance(node, dict):
+            return tag_path or "root"
+        tag_name = node.get("name", "")
+        return f"{tag_path}/{tag_name}" if tag_path else tag_name
+
+
+def _tag_location(tag: StreamedTag, *path: str | int) -> tuple[int | None, int | None]:
+    """Line and column of *path* within *tag*, else of the tag itself.
+
+    Positions are recorded as the tag is read, so this is a lookup.
+    """
+    positions = tag.positions
+    offset = positions.offset(path) if path else None
+    if offset is None:
+        offset = positions.containers.get(())
+    if offset is None:
+        return None, None
+    return positions.line_col(offset)
+
+
+def _udt_parameters(tag: StreamedTag) -> dict[str, UdtParameter]:
+    parameters = tag.value.get("parameters")
+    if not isinstance(parameters, dict):
+        return {}
+    keys = tag.positions.keys
+    result: dict[str, UdtParameter] = {}
+    for name, value in parameters.items():
+        data_type = value.get("dataType") if isinstance(value, dict) else None
+        param = UdtParameter(data_type if isinstance(data_type, str) else None)
+        offset = keys.get(("parameters", name))
+        if offset is not None:
+            param.line_number, param.column = tag.positions.line_col(offset)
+        result[name] = param
+    return result
+
+
+def _definition_path(frame: _TagFrame) -> tuple[str, bool]:
+    """Path of the UdtType at *frame* below its ``_types_`` folder.
+
+    The flag is False when the export holds no such folder: the path is
+    then relative to the export, and empty for a nameless definition
+    named by its file (see :meth:`UdtDefinition.place`).
+    """
+    names: list[str] = []
+    current: _TagFrame | None = frame
+    while current is not None:
+        name = current.tag.value.get("name")
+        if name == TYPES_FOLDER:
+            return "/".join(reversed(names)), True
+        if isinstance(name, str) and name:
+            names.append(name)
+        current = current.parent
+    return "/".join(reversed(names)), False
@@ -0,0 +1,307 @@
+"""Incremental reading of tag exports.
+
+Gateway tag exports are single JSON documents that can run to hundreds of
+megabytes.  :class:`TagStream` reads one in chunks and yields each tag node
+as soon as its own members have been read.  The ``tags`` arrays holding a
+node's children are walked in place rather than loaded, so memory is
+bounded by the largest single tag and the nesting depth, not by the file.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from json import JSONDecodeError
+from json.decoder import scanstring
+from typing import Any, TextIO, TypeVar
+
+from ..json_positions import JsonPath, JsonPositions, scan_json_value
+
+_T = TypeVar("_T")
+
+CHUNK_SIZE = 1024 * 1024
+
+# Events yielded by TagStream
+CHILDREN = "children"
+NODE = "node"
+
+# A value or error this close to the end of the buffer may only mean that
+# a literal, number or escape continues in the next chunk
+_LOOKAHEAD = 16
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Stands in for the value of a ``tags`` array that is walked, not loaded
+_CHILDREN = object()
+
+
+class TagPositions(JsonPositions):
+    """Positions of one tag node, resolved to lines and columns as it is read.
+
+    Paths are relative to the node; offsets are offsets in the file.
+    """
+
+    def __init__(self) -> None:
+        super().__init__("")
+        self.line_cols: dict[int, tuple[int, int]] = {}
+
+    def line_col(self, offset: int) -> tuple[int, int]:
+        return self.line_cols[offset]
+
+
+@dataclass(slots=True, eq=False)
+class StreamedTag:
+    """A tag node read from a :class:`TagStream`.
+
+    *value* holds the node's members without its ``tags`` array, or the
+    entry itself when it is not a JSON object.  *pointer* is the node's
+    JSON path in the file and *parent* the node whose ``tags`` array holds
+    it, if any.
+    """
+
+    value: Any
+    pointer: JsonPath
+    parent: StreamedTag | None
+    positions: TagPositions = field(default_factory=TagPositions)
+    has_children: bool = False
+
+
+@dataclass(slots=True)
+class _ObjectFrame:
+    tag: StreamedTag
+    members: int = 0
+
+
+@dataclass(slots=True)
+class _ArrayFrame:
+    parent: StreamedTag | None
+    pointer: JsonPath
+    index: int = 0
+
+
+class TagStream:
+    """Iterate over the tag nodes of an export read from *fp*.
+
+    Yields ``(CHILDREN, tag)`` when a node's ``tags`` array starts, with
+    the members read so far (Ignition writes ``tags`` last), and
+    ``(NODE, tag)`` once the node is complete, so a parent's ``NODE``
+    event follows those of its children.  A document that is an array is
+    a list of top-level tags.  Malformed input raises
+    :class:`json.JSONDecodeError` with the file's line and column, after
+    the nodes before the error have been yielded.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int = CHUNK_SIZE):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._base = 0  # file offset of _buf[0]
+        self._eof = False
+        # Where the last _scan started in _buf, after any refills
+        self._start = 0
+        # Line of file offset _cursor, and the offset that line starts at
+        self._cursor = 0
+        self._line = 1
+        self._line_start = 0
+        self._scratch = JsonPositions("")
+
+    def __iter__(self) -> Iterator[tuple[str, StreamedTag]]:
+        stack: list[_ObjectFrame | _ArrayFrame] = []
+        char = self._peek()
+        if char == "[":
+            self._pos += 1
+            stack.append(_ArrayFrame(None, ()))
+        elif char == "{":
+            stack.append(_ObjectFrame(self._open_tag((), None)))
+        else:
+            yield NODE, self._scalar_tag((), None)
+
+        while stack:
+            frame = stack[-1]
+            char = self._peek()
+
+            if isinstance(frame, _ArrayFrame):
+                if char == "]":
+                    self._pos += 1
+                    stack.pop()
+                    continue
+                if frame.index:
+                    if char != ",":
+                        raise self._error("Expecting ',' delimiter")
+                    self._pos += 1
+                    char = self._peek()
+                pointer = (*frame.pointer, frame.index)
+                frame.index += 1
+                if char == "{":
+                    stack.append(_ObjectFrame(self._open_tag(pointer, frame.parent)))
+                else:
+                    yield NODE, self._scalar_tag(pointer, frame.parent)
+                continue
+
+            tag = frame.tag
+            if char == "}":
+                self._pos += 1
+                stack.pop()
+                yield NODE, tag
+                continue
+            if frame.members:
+                if char != ",":
+                    raise self._error("Expecting ',' delimiter")
+                self._pos += 1
+                char = self._peek()
+            if char != '"':
+                raise self._error("Expecting property name enclosed in double quotes")
+            frame.members += 1
+            key, value = self._member(tag)
+            if value is _CHILDREN:
+                tag.has_children = True
+                yield CHILDREN, tag
+                stack.append(_ArrayFrame(tag, (*tag.pointer, "tags")))
+            else:
+                tag.value[key] = value
+
+        if self._peek():
+            raise self._error("Extra data")
+
+    # ------------------------------------------------------------------
+    # Nodes and members
+    # ------------------------------------------------------------------
+
+    def _open_tag(self, pointer: JsonPath, parent: StreamedTag | None) -> StreamedTag:
+        tag = StreamedTag({}, pointer, parent)
+        self._record(tag.positions.containers, tag.positions, (), self._pos)
+        self._pos += 1
+        return tag
+
+    def _scalar_tag(self, pointer: JsonPath, parent: StreamedTag | None) -> StreamedTag:
+        value = self._scan(
+            lambda text, pos: scan_json_value(text, pos, self._scratch, ())
+        )
+        tag = StreamedTag(value, pointer, parent)
+        self._record(tag.positions.containers, tag.positions, (), self._start)
+        return tag
+
+    def _member(self, tag: StreamedTag) -> tuple[str, Any]:
+        """Read one ``"key": value`` member of *tag*.
+
+        The value of a ``tags`` array is ``_CHILDREN``; the array is left
+        for the caller to walk, with the stream positioned inside it.
+        """
+
+        def parse(text: str, pos: int) -> tuple[tuple[str, int, Any], int]:
+            key, pos = scanstring(text, pos + 1)
+            if text[pos : pos + 1] != ":":
+                pos = _WHITESPACE.match(text, pos).end()
+                if text[pos : pos + 1] != ":":
+                    raise JSONDecodeError("Expecting ':' delimiter", text, pos)
+            pos = _WHITESPACE.match(text, pos + 1).end()
+            if key == "tags" and text[pos : pos + 1] == "[":
+                return (key, pos, _CHILDREN), pos + 1
+            value, end = scan_json_value(text, pos, self._scratch, (key,))
+            return (key, pos, value), end
+
+        key, value_pos, value = self._scan(parse)
+        positions = tag.positions
+        found = [(positions.keys, (key,), self._start)]
+        if value is _CHILDREN:
+            found.append((positions.containers, (key,), value_pos))
+        else:
+            scratch = self._scratch
+            found.extend((positions.keys, *item) for item in scratch.keys.items())
+            found.extend(
+                (positions.containers, *item) for item in scratch.containers.items()
+            )
+            found.sort(key=lambda item: item[2])
+        for table, path, pos in found:
+            self._record(table, positions, path, pos)
+        return key, value
+
+    def _record(
+        self,
+        table: dict[JsonPath, int],
+        positions: TagPositions,
+        path: JsonPath,
+        pos: int,
+    ) -> None:
+        # Offsets must be recorded in file order: lines are counted forwards
+        offset = self._base + pos
+        table[path] = offset
+        positions.line_cols[offset] = self._line_col(offset)
+
+    # ------------------------------------------------------------------
+    # Buffering
+    # ------------------------------------------------------------------
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end."""
+        while True:
+            pos = _WHITESPACE.match(self._buf, self._pos).end()
+            self._pos = pos
+            if pos < len(self._buf):
+                return self._buf[pos]
+            if not self._refill(pos):
+                return ""
+
+    def _scan(self, parse: Callable[[str, int], tuple[_T, int]]) -> _T:
+        """Apply *parse* at the current position, reading on as needed.
+
+        *parse* takes the buffer and a start index and returns a result
+        and the index after it.  A value that may continue past the end of
+        the buffer is parsed again once more of the file has been read.
+        """
+        start = self._base + self._pos
+        while True:
+            pos = start - self._base
+            self._scratch.keys.clear()
+            self._scratch.containers.clear()
+            try:
+                result, end = parse(self._buf, pos)
+            except JSONDecodeError as e:
+                truncated = e.msg.startswith("Unterminated string") or (
+                    e.pos >= len(self._buf) - _LOOKAHEAD
+                )
+                if truncated and self._refill(pos):
+                    continue
+                raise self._error(e.msg, e.pos) from None
+            if end >= len(self._buf) - _LOOKAHEAD and self._refill(pos):
+                continue
+            self._start = start - self._base
+            self._pos = end
+            return result
+
+    def _refill(self, keep: int) -> bool:
+        """Drop the buffer before index *keep* and read more; False at the end."""
+        if self._eof:
+            return False
+        self._line_col(self._base + keep)
+        # Read at least as much as is kept, so re-parsing stays linear
+        chunk = self._fp.read(max(self._chunk_size, len(self._buf) - keep))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[keep:] + chunk
+        self._base += keep
+        self._pos -= keep
+        return True
+
+    def _line_col(self, offset: int) -> tuple[int, int]:
+        """1-based line and column of a file offset at or after the last one."""
+        if offset > self._cursor:
+            start = self._cursor - self._base
+            end = offset - self._base
+            newlines = self._buf.count("\n", start, end)
+            if newlines:
+                self._line += newlines
+                self._line_start = self._base + self._buf.rfind("\n", start, end) + 1
+            self._cursor = offset
+        return self._line, offset - self._line_start + 1
+
+    def _error(self, msg: str, pos: int | None = None) -> JSONDecodeError:
+        if pos is None:
+            pos = self._pos
+        offset = self._base + pos
+        line, column = self._line_col(offset)
+        error = JSONDecodeError(msg, self._buf, pos)
+        error.pos, error.lineno, error.colno = offset, line, column
+        error.args = (f"{msg}: line {line} column {column} (char {offset})",)
+        return error
@@ -0,0 +1,481 @@
+"""UDT definitions and the instances that use them.
+
+A ``UdtInstance`` names its definition by ``typeId``: the path of a
+``UdtType`` below the provider's ``_types_`` folder (``Pumps/Motor``).  A
+definition may itself extend a parent type through its own ``typeId``,
+inheriting the parent's members and parameters.  Instances list only the
+members they override, so each override must name a member of the type,
+and the parameters they set must be ones the type declares.
+
+While a tag export is linted, :class:`TagUdts` summarizes the definitions
+and instances it holds as a small JSON value, cached per file with the
+lint results.  :func:`check_tag_udts` joins the summaries of a run into a
+:class:`UdtIndex` and resolves every instance against it.  Definitions are
+indexed by path and their inherited members and parameters are flattened
+once per type, so each instance is checked with dictionary lookups however
+many share a type.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..reporting import LintIssue, LintSeverity
+
+TYPES_FOLDER = "_types_"
+
+UDT_CODES = ("UDT_UNKNOWN_TYPE", "UDT_UNKNOWN_MEMBER", "UDT_PARAMETER_MISMATCH")
+
+
+def type_key(type_id: str) -> str:
+    """Normalize a ``typeId`` to a path below ``_types_``.
+
+    Fully qualified ids (``[default]_types_/Pumps/Motor``) name the same
+    definition as relative ones (``Pumps/Motor``).
+    """
+    if type_id.startswith("["):
+        end = type_id.find("]")
+        if end != -1:
+            type_id = type_id[end + 1 :]
+    type_id = type_id.strip("/")
+    if type_id.startswith(TYPES_FOLDER + "/"):
+        type_id = type_id[len(TYPES_FOLDER) + 1 :]
+    return type_id
+
+
+@dataclass(slots=True)
+class UdtMember:
+    """A member tag of a definition, or a member an instance overrides.
+
+    *path*, *line_number* and *column* locate the member's tag in its export.
+    """
+
+    tag_type: str | None
+    type_id: str | None = None
+    members: dict[str, UdtMember] = field(default_factory=dict)
+    path: str | None = None
+    line_number: int | None = None
+    column: int | None = None
+
+    def to_json(self) -> list:
+        return [
+            self.tag_type,
+            self.type_id,
+            {name: member.to_json() for name, member in self.members.items()},
+            self.path,
+            self.line_number,
+            self.column,
+        ]
+
+    @classmethod
+    def from_json(cls, data: list) -> UdtMember:
+        tag_type, type_id, members, path, line_number, column = data
+        return cls(
+            tag_type,
+            type_id,
+            {name: cls.from_json(member) for name, member in members.items()},
+            path,
+            line_number,
+            column,
+        )
+
+
+@dataclass(slots=True)
+class UdtParameter:
+    """A parameter a definition declares or an instance sets."""
+
+    data_type: str | None = None
+    line_number: int | None = None
+    column: int | None = None
+
+    def to_json(self) -> list:
+        return [self.data_type, self.line_number, self.column]
+
+    @classmethod
+    def from_json(cls, data: list) -> UdtParameter:
+        return cls(*data)
+
+
+@dataclass(slots=True)
+class UdtDefinition:
+    """A ``UdtType``, by its path below ``_types_``.
+
+    *parent_id* is the ``typeId`` of the type it extends, if any; the
+    location is that of the ``typeId`` key, or of the tag without one.
+    A definition exported outside a ``_types_`` folder (file-per-tag
+    layouts) has *in_types_folder* unset and a path relative to its
+    export until :meth:`place` completes it from the file path.
+    """
+
+    path: str
+    parent_id: str | None = None
+    parameters: dict[str, UdtParameter] = field(default_factory=dict)
+    members: dict[str, UdtMember] = field(default_factory=dict)
+    component_path: str | None = None
+    line_number: int | None = None
+    column: int | None = None
+    in_types_folder: bool = True
+
+    def place(self, file_path: str) -> None:
+        """Complete the path from the export's *file_path* where it needs it.
+
+        Summaries are cached by content, so this is done when they are
+        loaded: a definition named by its file sits in a ``_types_``
+        directory, and its path continues below that directory.
+        """
+        if not self.in_types_folder:
+            path = Path(file_path)
+            parts = path.parent.parts
+            names = [self.path or path.stem]
+            if TYPES_FOLDER in parts:
+                start = len(parts) - parts[::-1].index(TYPES_FOLDER)
+                names[:0] = parts[start:]
+            self.path = "/".join(names)
+            self.in_types_folder = True
+        # A typeId naming the type itself is not a parent
+        if self.parent_id is not None and type_key(self.parent_id) in ("", self.path):
+            self.parent_id = None
+
+    def to_json(self) -> list:
+        return [
+            self.path,
+            self.parent_id,
+            {name: param.to_json() for name, param in self.parameters.items()},
+            {name: member.to_json() for name, member in self.members.items()},
+            self.component_path,
+            self.line_number,
+            self.column,
+            self.in_types_folder,
+        ]
+
+    @classmethod
+    def from_json(cls, data: list) -> UdtDefinition:
+        (
+            path,
+            parent_id,
+            parameters,
+            members,
+            component_path,
+            line,
+            column,
+            in_types_folder,
+        ) = data
+        return cls(
+            path,
+            parent_id,
+            {name: UdtParameter.from_json(p) for name, p in parameters.items()},
+            {name: UdtMember.from_json(m) for name, m in members.items()},
+            component_path,
+            line,
+            column,
+            in_types_folder,
+        )
+
+
+@dataclass(slots=True)
+class UdtInstance:
+    """A ``UdtInstance`` with a ``typeId``, located at that key.
+
+    *members* holds the members it overrides, by name.
+    """
+
+    type_id: str
+    component_path: str
+    line_number: int | None = None
+    column: int | None = None
+    parameters: dict[str, UdtParameter] = field(default_factory=dict)
+    members: dict[str, UdtMember] = field(default_factory=dict)
+
+    def to_json(self) -> list:
+        return [
+            self.type_id,
+            self.component_path,
+            self.line_number,
+            self.column,
+            {name: param.to_json() for name, param in self.parameters.items()},
+            {name: member.to_json() for name, member in self.members.items()},
+        ]
+
+    @classmethod
+    def from_json(cls, data: list) -> UdtInstance:
+        type_id, component_path, line, column, parameters, members = data
+        return cls(
+            type_id,
+            component_path,
+            line,
+            column,
+            {name: UdtParameter.from_json(p) for name, p in parameters.items()},
+            {name: UdtMember.from_json(m) for name, m in members.items()},
+        )
+
+
+@dataclass(slots=True)
+class TagUdts:
+    """The UDT definitions and instances of one tag export.
+
+    *types_folder* is set when the export holds a ``_types_`` folder, so
+    instances are resolved even if it defines nothing.
+    """
+
+    definitions: list[UdtDefinition] = field(default_factory=list)
+    instances: list[UdtInstance] = field(default_factory=list)
+    types_folder: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.definitions or self.instances or self.types_folder)
+
+    def to_json(self) -> list:
+        return [
+            [definition.to_json() for definition in self.definitions],
+            [instance.to_json() for instance in self.instances],
+            self.types_folder,
+        ]
+
+    @classmethod
+    def from_json(cls, data: list) -> TagUdts:
+        definitions, instances, types_folder = data
+        return cls(
+            [UdtDefinition.from_json(d) for d in definitions],
+            [UdtInstance.from_json(i) for i in instances],
+            types_folder,
+        )
+
+
+def _merge_members(
+    inherited: dict[str, UdtMember], own: dict[str, UdtMember]
+) -> dict[str, UdtMember]:
+    """Members of a type that extends one with *inherited* members."""
+    merged = dict(inherited)
+    for name, member in own.items():
+        base = merged.get(name)
+        if base is not None and base.members and member.members:
+            member = UdtMember(
+                member.tag_type,
+                member.type_id,
+                _merge_members(base.members, member.members),
+            )
+        merged[name] = member
+    return merged
+
+
+class UdtIndex:
+    """UDT definitions of a run, by path below ``_types_``."""
+
+    def __init__(self):
+        self.definitions: dict[str, UdtDefinition] = {}
+        # Members and parameters of each type including inherited ones,
+        # or None when its parent chain is broken
+        self._members: dict[str, dict[str, UdtMember] | None] = {}
+        self._parameters: dict[str, dict[str, UdtParameter] | None] = {}
+        # Members below each nested instance member, by id of the member
+        self._nested: dict[int, dict[str, UdtMember] | None] = {}
+
+    def __len__(self) -> int:
+        return len(self.definitions)
+
+    def add(self, definition: UdtDefinition) -> None:
+        # The first definition of a path wins, as it would on import
+        self.definitions.setdefault(definition.path, definition)
+
+    def resolve(self, type_id: str) -> UdtDefinition | None:
+        return self.definitions.get(type_key(type_id))
+
+    def members(self, type_id: str) -> dict[str, UdtMember] | None:
+        """Members of *type_id* including inherited ones, or None if unknown."""
+        key = type_key(type_id)
+        if key not in self._members:
+            self._flatten(key)
+        return self._members.get(key)
+
+    def parameters(self, type_id: str) -> dict[str, UdtParameter] | None:
+        """Parameters of *type_id* including inherited ones, or None if unknown."""
+        key = type_key(type_id)
+        if key not in self._parameters:
+            self._flatten(key)
+        return self._parameters.get(key)
+
+    def _flatten(self, key: str) -> None:
+        # Walk up to the first ancestor already flattened (or the root of
+        # the chain), then fill in the types below it on the way down
+        chain: list[UdtDefinition] = []
+        seen: set[str] = set()
+        members: dict[str, UdtMember] | None = {}
+        parameters: dict[str, UdtParameter] | None = {}
+        while key is not None:
+            if key in self._members:
+                members, parameters = self._members[key], self._parameters[key]
+                break
+            definition = self.definitions.get(key)
+            if definition is None or key in seen:
+                members = parameters = None
+                break
+            seen.add(key)
+            chain.append(definition)
+            parent = definition.parent_id
+            key = type_key(parent) if parent else None
+
+        for definition in reversed(chain):
+            if members is not None and parameters is not None:
+                members = _merge_members(members, definition.members)
+                parameters = {**parameters, **definition.parameters}
+            self._members[definition.path] = members
+            self._parameters[definition.path] = parameters
+
+    def _member_types(self, member: UdtMember) -> dict[str, UdtMember] | None:
+        """Members below *member*: its own, plus its type's for a nested instance."""
+        if member.tag_type != "UdtInstance" or not member.type_id:
+            return member.members
+        key = id(member)
+        if key not in self._nested:
+            inherited = self.members(member.type_id)
+            self._nested[key] = (
+                None if inherited is None else _merge_members(inherited, member.members)
+            )
+        return self._nested[key]
+
+    def check_definition(
+        self, definition: UdtDefinition, file_path: str
+    ) -> list[LintIssue]:
+        """Lint the parent type a definition extends."""
+        parent = definition.parent_id
+        if not parent or self.resolve(parent) is not None:
+            return []
+        return [
+            LintIssue(
+                severity=LintSeverity.ERROR,
+                code="UDT_UNKNOWN_TYPE",
+                message=(
+                    f"UDT '{definition.path}' extends '{parent}', "
+                    "which is not defined in the linted tag exports"
+                ),
+                file_path=file_path,
+                component_path=definition.component_path,
+                component_type="UdtType",
+                line_number=definition.line_number,
+                column=definition.column,
+                suggestion="Check the parent typeId against the UDT definitions",
+            )
+        ]
+
+    def check_instance(self, instance: UdtInstance, file_path: str) -> list[LintIssue]:
+        """Lint an instance's typeId, overrides and parameters."""
+        type_id = instance.type_id
+        members = self.members(type_id)
+        parameters = self.parameters(type_id)
+        if members is None or parameters is None:
+            if self.resolve(type_id) is not None:
+                # Defined, but extends a missing type: reported on the definition
+                return []
+            return [
+                LintIssue(
+                    severity=LintSeverity.ERROR,
+                    code="UDT_UNKNOWN_TYPE",
+                    message=(
+                        f"UDT type '{type_id}' is not defined in the linted tag exports"
+                    ),
+                    file_path=file_path,
+                    component_path=instance.component_path,
+                    component_type="UdtInstance",
+                    line_number=instance.line_number,
+                    column=instance.column,
+                    suggestion=f"Check the typeId against the UDT definitions under {TYPES_FOLDER}",
+                )
+            ]
+
+        issues: list[LintIssue] = []
+        for name, param in instance.parameters.items():
+            declared = parameters.get(name)
+            if declared is None:
+                message = f"Parameter '{name}' is not declared by UDT '{type_id}'"
+            elif (
+                param.data_type
+                and declared.data_type
+                and param.data_type != declared.data_type
+            ):
+                message = (
+                    f"Parameter '{name}' is {param.data_type} but UDT "
+                    f"'{type_id}' declares it as {declared.data_type}"
+                )
+            else:
+                continue
+            issues.append(
+                LintIssue(
+                    severity=LintSeverity.WARNING,
+                    code="UDT_PARAMETER_MISMATCH",
+                    message=message,
+                    file_path=file_path,
+                    component_path=instance.component_path,
+                    component_type="UdtInstance",
+                    line_number=param.line_number,
+                    column=param.column,
+                    suggestion="Match the instance's parameters to the UDT definition",
+                )
+            )
+
+        # Overrides are matched level by level against the type's members
+        pending = deque([(instance.members, members)])
+        while pending:
+            overrides, declared_members = pending.popleft()
+            for name, override in overrides.items():
+                member = declared_members.get(name)
+                if member is None:
+                    issues.append(
+                        LintIssue(
+                            severity=LintSeverity.WARNING,
+                            code="UDT_UNKNOWN_MEMBER",
+                            message=(
+                                f"'{name}' overrides no member of UDT '{type_id}'"
+                            ),
+                            file_path=file_path,
+                            component_path=override.path,
+                            component_type=override.tag_type or "unknown",
+                            line_number=override.line_number,
+                            column=override.column,
+                            suggestion=(
+                                "Rename the tag to match a member of the UDT, "
+                                "or remove the stale override"
+                            ),
+                        )
+                    )
+                elif override.members:
+                    below = self._member_types(member)
+                    if below is not None:
+                        pending.append((override.members, below))
+        return issues
+
+
+def check_tag_udts(
+    summaries: Mapping[str, list], unread: Mapping[str, list] | None = None
+) -> list[LintIssue]:
+    """Resolve the UDT instances of linted tag exports against their definitions.
+
+    *summaries* maps file paths to :meth:`TagUdts.to_json` values.  The
+    definitions in *unread* (summaries of exports whose issues are not
+    reported) are indexed too, but nothing in those exports is checked.
+    Runs that include no definitions and no ``_types_`` folder (instance
+    exports linted on their own) have nothing to resolve against, so they
+    are not checked.
+    """
+    udts = {path: TagUdts.from_json(data) for path, data in summaries.items()}
+    others = {path: TagUdts.from_json(data) for path, data in (unread or {}).items()}
+    index = UdtIndex()
+    for group in (udts, others):
+        for file_path, summary in group.items():
+            for definition in summary.definitions:
+                definition.place(file_path)
+                index.add(definition)
+    if not index and not any(
+        summary.types_folder for group in (udts, others) for summary in group.values()
+    ):
+        return []
+
+    issues: list[LintIssue] = []
+    for file_path, summary in udts.items():
+        for definition in summary.definitions:
+            issues.extend(index.check_definition(definition, file_path))
+        for instance in summary.instances:
+            issues.extend(index.check_instance(instance, file_path))
+    return issues
@@ -2,5 +2,11 @@
 
 from .expression import ExpressionValidator
 from .jython import JythonValidator
+from .schema import SchemaValidator, get_schema_validator
 
-__all__ = ["ExpressionValidator", "JythonValidator"]
+__all__ = [
+    "ExpressionValidator",
+    "JythonValidator",
+    "SchemaValidator",
+    "get_schema_validator",
+]
@@ -0,0 +1,505 @@
+"""Lexer and parser for the Ignition expression language.
+
+:func:`parse_expression` tokenizes an expression once and builds an AST
+from the tokens.  The parser never raises: malformed input still yields a
+tree for the parts that parse, together with the syntax problems found on
+the way (unbalanced brackets, an unclosed string, values written back to
+back with no operator).  Offsets are 0-based positions in the expression
+text.
+
+Grammar notes:
+
+* ``{...}`` is a property or tag reference; its contents are kept verbatim,
+  so tag paths such as ``{[default]Pump (1)/Speed}`` may contain any
+  character.  Nested braces are matched.
+* Strings are delimited by ``'`` or ``"`` and have no escapes.
+* ``//`` starts a comment that runs to the end of the line.
+* ``like`` and ``xor`` are operators when they follow a value.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+
+
+class TokenKind(Enum):
+    NUMBER = "number"
+    STRING = "string"
+    PROPERTY = "property"
+    NAME = "name"
+    OPERATOR = "operator"
+    LPAREN = "("
+    RPAREN = ")"
+    LBRACKET = "["
+    RBRACKET = "]"
+    COMMA = ","
+    DOT = "."
+    UNKNOWN = "unknown"
+    EOF = "eof"
+
+
+@dataclass(slots=True)
+class Token:
+    kind: TokenKind
+    text: str  # STRING and PROPERTY: the contents, without delimiters
+    start: int
+
+
+# One token per match.  References containing nested braces, unclosed
+# strings and stray characters do not match and are handled by the
+# tokenizer loop.
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<space>\s+|//[^\n]*)
+    | (?P<number>0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    | (?P<name>[^\W\d]\w*)
+    | \{(?P<property>[^{}]*)\}
+    | '(?P<single>[^']*)'
+    | "(?P<double>[^"]*)"
+    | (?P<operator>&&|\|\||==|!=|<>|<=|>=|<<|>>|[-+*/%^<>=!&|~])
+    | (?P<punctuation>[()\[\],.])
+    """,
+    re.VERBOSE,
+)
+_BRACE_RE = re.compile(r"[{}]")
+
+_PUNCTUATION = {
+    "(": TokenKind.LPAREN,
+    ")": TokenKind.RPAREN,
+    "[": TokenKind.LBRACKET,
+    "]": TokenKind.RBRACKET,
+    ",": TokenKind.COMMA,
+    ".": TokenKind.DOT,
+}
+
+# Binary operator -> precedence (higher binds tighter)
+_BINARY_PRECEDENCE = {
+    "||": 1,
+    "&&": 2,
+    "|": 3,
+    "xor": 3,
+    "&": 4,
+    "=": 5,
+    "==": 5,
+    "!=": 5,
+    "<>": 5,
+    "like": 5,
+    "<": 6,
+    "<=": 6,
+    ">": 6,
+    ">=": 6,
+    "<<": 7,
+    ">>": 7,
+    "+": 8,
+    "-": 8,
+    "*": 9,
+    "/": 9,
+    "%": 9,
+    "^": 10,
+}
+_RIGHT_ASSOCIATIVE = frozenset({"^"})
+_WORD_OPERATORS = frozenset({"like", "xor"})
+_UNARY_OPERATORS = frozenset({"-", "+", "!", "~"})
+# Characters that are not part of the language are treated as an operator of
+# the lowest precedence, so that the values around them are not reported as
+# adjacent.
+_UNKNOWN_PRECEDENCE = 0
+
+_VALUE_KINDS = frozenset(
+    {TokenKind.NUMBER, TokenKind.STRING, TokenKind.PROPERTY, TokenKind.NAME}
+)
+
+
+class Expr:
+    """Base class of expression AST nodes."""
+
+    __slots__ = ()
+    start: int
+
+    def children(self) -> Iterator[Expr]:
+        return iter(())
+
+
+@dataclass(slots=True)
+class Number(Expr):
+    text: str
+    start: int
+
+
+@dataclass(slots=True)
+class String(Expr):
+    value: str
+    start: int
+
+
+@dataclass(slots=True)
+class PropertyRef(Expr):
+    """A ``{...}`` reference; *path* is the text between the braces."""
+
+    path: str
+    start: int
+
+
+@dataclass(slots=True)
+class Name(Expr):
+    name: str
+    start: int
+
+
+@dataclass(slots=True)
+class Call(Expr):
+    callee: Expr
+    args: list[Expr | None]
+    start: int
+
+    @property
+    def name(self) -> str | None:
+        """The called function's name, or None for a computed callee."""
+        if isinstance(self.callee, Name):
+            return self.callee.name
+        if isinstance(self.callee, Member):
+            return self.callee.name
+        return None
+
+    def children(self) -> Iterator[Expr]:
+        yield self.callee
+        yield from (arg for arg in self.args if arg is not None)
+
+
+@dataclass(slots=True)
+class Index(Expr):
+    target: Expr
+    index: Expr | None
+    start: int
+
+    def children(self) -> Iterator[Expr]:
+        yield self.target
+        if self.index is not None:
+            yield self.index
+
+
+@dataclass(slots=True)
+class Member(Expr):
+    target: Expr
+    name: str
+    start: int
+
+    def children(self) -> Iterator[Expr]:
+        yield self.target
+
+
+@dataclass(slots=True)
+class Unary(Expr):
+    op: str
+    operand: Expr | None
+    start: int
+
+    def children(self) -> Iterator[Expr]:
+        if self.operand is not None:
+            yield self.operand
+
+
+@dataclass(slots=True)
+class Binary(Expr):
+    op: str
+    left: Expr
+    right: Expr | None
+    start: int
+
+    def children(self) -> Iterator[Expr]:
+        yield self.left
+        if self.right is not None:
+            yield self.right
+
+
+@dataclass(slots=True)
+class Sequence(Expr):
+    """Values written back to back with no operator between them."""
+
+    items: list[Expr]
+    start: int
+
+    def children(self) -> Iterator[Expr]:
+        yield from self.items
+
+
+@dataclass(slots=True)
+class ParsedExpression:
+    """The AST of an expression and the syntax problems found parsing it."""
+
+    root: Expr | None = None
+    unclosed_parens: list[int] = field(default_factory=list)
+    extra_parens: list[int] = field(default_factory=list)
+    unclosed_braces: list[int] = field(default_factory=list)
+    extra_braces: list[int] = field(default_factory=list)
+    # (offset, quote character) of a string literal that is never closed
+    unclosed_string: tuple[int, str] | None = None
+    # Value tokens that directly follow another value
+    adjacent: list[Token] = field(default_factory=list)
+
+
+class ExpressionVisitor:
+    """Walks an expression AST, calling ``visit_<NodeClass>`` for each node.
+
+    Like :class:`ast.NodeVisitor`: a ``visit_*`` method that wants the
+    node's children visited calls :meth:`generic_visit`.
+    """
+
+    def visit(self, node: Expr) -> None:
+        getattr(self, "visit_" + type(node).__name__, self.generic_visit)(node)
+
+    def generic_visit(self, node: Expr) -> None:
+        for child in node.children():
+            self.visit(child)
+
+
+def tokenize(expression: str, parsed: ParsedExpression) -> list[Token]:
+    """Split *expression* into tokens, ending with an EOF token.
+
+    Comments and whitespace are dropped.  Unbalanced braces and parentheses
+    and an unclosed string are recorded on *parsed*.
+    """
+    tokens: list[Token] = []
+    append = tokens.append
+    open_parens: list[int] = []
+    match = _TOKEN_RE.match
+    length = len(expression)
+    i = 0
+    while i < length:
+        m = match(expression, i)
+        if m is None:
+            ch = expression[i]
+            if ch == "{":
+                i = _scan_braces(expression, i, parsed, tokens)
+            elif ch == "}":
+                parsed.extra_braces.append(i)
+                i += 1
+            elif ch == "'" or ch == '"':
+                parsed.unclosed_string = (i, ch)
+                append(Token(TokenKind.STRING, expression[i + 1 :], i))
+                i = length
+            else:
+                append(Token(TokenKind.UNKNOWN, ch, i))
+                i += 1
+            continue
+
+        group = m.lastgroup
+        if group == "space":
+            pass
+        elif group == "name":
+            append(Token(TokenKind.NAME, m.group(), i))
+        elif group == "punctuation":
+            kind = _PUNCTUATION[m.group()]
+            if kind is TokenKind.LPAREN:
+                open_parens.append(i)
+            elif kind is TokenKind.RPAREN:
+                if open_parens:
+                    open_parens.pop()
+                else:
+                    parsed.extra_parens.append(i)
+            append(Token(kind, m.group(), i))
+        elif group == "operator":
+            append(Token(TokenKind.OPERATOR, m.group(), i))
+        elif group == "number":
+            append(Token(TokenKind.NUMBER, m.group(), i))
+        elif group == "property":
+            append(Token(TokenKind.PROPERTY, m.group(group), i))
+        else:
+            append(Token(TokenKind.STRING, m.group(group), i))
+        i = m.end()
+
+    parsed.unclosed_parens = open_parens
+    append(Token(TokenKind.EOF, "", length))
+    return tokens
+
+
+def _scan_braces(
+    expression: str, start: int, parsed: ParsedExpression, tokens: list[Token]
+) -> int:
+    """Append the PROPERTY token opening at *start*; return the offset after it."""
+    open_braces = [start]
+    for m in _BRACE_RE.finditer(expression, start + 1):
+        if m.group() == "{":
+            open_braces.append(m.start())
+            continue
+        open_braces.pop()
+        if not open_braces:
+            end = m.start()
+            tokens.append(Token(TokenKind.PROPERTY, expression[start + 1 : end], start))
+            return end + 1
+    parsed.unclosed_braces.extend(open_braces)
+    tokens.append(Token(TokenKind.PROPERTY, expression[start + 1 :], start))
+    return len(expression)
+
+
+class _Parser:
+    def __init__(self, tokens: list[Token], parsed: ParsedExpression):
+        self.tokens = tokens
+        self.pos = 0
+        self.parsed = parsed
+
+    def peek(self) -> Token:
+        return self.tokens[self.pos]
+
+    def advance(self) -> Token:
+        token = self.tokens[self.pos]
+        if token.kind is not TokenKind.EOF:
+            self.pos += 1
+        return token
+
+    def parse(self) -> Expr | None:
+        return self.sequence(top=True)
+
+    def sequence(self, top: bool = False) -> Expr | None:
+        """Parse one expression, plus any values that follow it with no operator.
+
+        At the top level, tokens that cannot start or continue an expression
+        (closing brackets with nothing to close, commas, stray dots) are
+        skipped; the tokenizer has already recorded unbalanced brackets.
+        """
+        items: list[Expr] = []
+        after_value = False
+        while True:
+            token = self.peek()
+            if token.kind is TokenKind.EOF:
+                break
+            if after_value and token.kind in _VALUE_KINDS:
+                self.parsed.adjacent.append(token)
+            pos = self.pos
+            item = self.binary(0)
+            if item is not None:
+                items.append(item)
+                after_value = True
+            if self.pos == pos:
+                if not top:
+                    break
+                self.advance()
+                if token.kind not in (TokenKind.RPAREN, TokenKind.RBRACKET):
+                    after_value = False
+            elif not top and self.peek().kind not in _VALUE_KINDS:
+                break
+        if not items:
+            return None
+        if len(items) == 1:
+            return items[0]
+        return Sequence(items, items[0].start)
+
+    def binary(self, min_precedence: int) -> Expr | None:
+        left = self.unary()
+        while True:
+            token = self.peek()
+            op = self._binary_operator(token, left)
+            if op is None:
+                return left
+            precedence = _BINARY_PRECEDENCE.get(op, _UNKNOWN_PRECEDENCE)
+            if precedence < min_precedence:
+                return left
+            self.advance()
+            next_min = precedence if op in _RIGHT_ASSOCIATIVE else precedence + 1
+            right = self.binary(next_min)
+            if left is None:
+                # Operator with no left operand: keep what follows
+                left = right
+            else:
+                left = Binary(op, left, right, left.start)
+
+    @staticmethod
+    def _binary_operator(token: Token, left: Expr | None) -> str | None:
+        if token.kind is TokenKind.OPERATOR:
+            return token.text
+        if token.kind is TokenKind.UNKNOWN:
+            return token.text
+        if (
+            token.kind is TokenKind.NAME
+            and left is not None
+            and token.text.lower() in _WORD_OPERATORS
+        ):
+            return token.text.lower()
+        return None
+
+    def unary(self) -> Expr | None:
+        token = self.peek()
+        if token.kind is TokenKind.OPERATOR and token.text in _UNARY_OPERATORS:
+            self.advance()
+            return Unary(token.text, self.unary(), token.start)
+        return self.postfix(self.operand())
+
+    def operand(self) -> Expr | None:
+        token = self.peek()
+        kind = token.kind
+        if kind is TokenKind.NUMBER:
+            self.advance()
+            return Number(token.text, token.start)
+        if kind is TokenKind.STRING:
+            self.advance()
+            return String(token.text, token.start)
+        if kind is TokenKind.PROPERTY:
+            self.advance()
+            return PropertyRef(token.text, token.start)
+        if kind is TokenKind.NAME:
+            self.advance()
+            return Name(token.text, token.start)
+        if kind is TokenKind.LPAREN:
+            self.advance()
+            inner = self.sequence()
+            self._expect(TokenKind.RPAREN)
+            return inner
+        return None
+
+    def postfix(self, node: Expr | None) -> Expr | None:
+        if node is None:
+            return None
+        while True:
+            token = self.peek()
+            if token.kind is TokenKind.LPAREN:
+                self.advance()
+                node = Call(node, self._arguments(), node.start)
+            elif token.kind is TokenKind.LBRACKET:
+                self.advance()
+                index = self.sequence()
+                self._expect(TokenKind.RBRACKET)
+                node = Index(node, index, node.start)
+            elif token.kind is TokenKind.DOT:
+                self.advance()
+                name = ""
+                if self.peek().kind is TokenKind.NAME:
+                    name = self.advance().text
+                node = Member(node, name, node.start)
+            else:
+                return node
+
+    def _arguments(self) -> list[Expr | None]:
+        args: list[Expr | None] = []
+        if self._expect(TokenKind.RPAREN):
+            return args
+        while True:
+            args.append(self.sequence())
+            if self._expect(TokenKind.COMMA):
+                continue
+            self._expect(TokenKind.RPAREN)
+            return args
+
+    def _expect(self, kind: TokenKind) -> bool:
+        if self.peek().kind is kind:
+            self.advance()
+            return True
+        return False
+
+
+def parse_expression(expression: str) -> ParsedExpression:
+    """Tokenize and parse *expression* in one pass.
+
+    Input nested too deeply to parse recursively yields no tree
+    (``root`` is None); the bracket and string findings are still recorded.
+    """
+    parsed = ParsedExpression()
+    tokens = tokenize(expression, parsed)
+    try:
+        parsed.root = _Parser(tokens, parsed).parse()
+    except RecursionError:
+        # Pathologically nested input: keep the tokenizer's findings only
+        parsed.root = None
+    return parsed
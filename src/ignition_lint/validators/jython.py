@@ -5,9 +5,14 @@ from __future__ import annotations
 import ast
 import re
 import textwrap
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
+from typing import Any
 
 from ..reporting import LintIssue, LintSeverity
+from .memo import DEFAULT_MEMO_SIZE, ResultMemo
 
 # Known Java packages available in Ignition's Jython runtime.
 # This is a lightweight subset — just enough to distinguish real packages from typos.
@@ -85,51 +90,159 @@ KNOWN_JAVA_PACKAGES: frozenset[str] = frozenset(
 )
 
 
-def _preprocess_py2(source: str) -> str:
-    """Transform common Python 2 constructs to Python 3 so ast.parse() succeeds.
-
-    Jython in Ignition uses Python 2 syntax.  This avoids spurious
-    JYTHON_SYNTAX_ERROR reports for valid Jython code while still letting
-    ast.parse() catch genuine errors.
-    """
+# Python 2 rewrites applied by _preprocess_py2, in order.  Every pattern is
+# confined to a single line, so they give the same result on one script or
+# on several scripts joined by _BATCH_SEPARATOR.
+_PY2_REWRITES: tuple[tuple[re.Pattern[str], str], ...] = (
     # print >>stream, args  →  print(args, file=stream)
-    source = re.sub(
-        r"^(\s*)print[ \t]*>>[ \t]*(\S+)[ \t]*,[ \t]*(.+)$",
+    (
+        re.compile(r"^(\s*)print[ \t]*>>[ \t]*(\S+)[ \t]*,[ \t]*(.+)$", re.MULTILINE),
         r"\1print(\3, file=\2)",
-        source,
-        flags=re.MULTILINE,
-    )
+    ),
     # print >>stream  (no args)  →  print(file=stream)
-    source = re.sub(
-        r"^(\s*)print[ \t]*>>[ \t]*(\S+)[ \t]*$",
+    (
+        re.compile(r"^(\s*)print[ \t]*>>[ \t]*(\S+)[ \t]*$", re.MULTILINE),
         r"\1print(file=\2)",
-        source,
-        flags=re.MULTILINE,
-    )
+    ),
     # print args  →  print(args)  (skip lines already handled: function calls and >> redirects)
-    source = re.sub(
-        r"^(\s*)print\b[ \t]+(?!>>)(?!\()(.+)$",
+    (
+        re.compile(r"^(\s*)print\b[ \t]+(?!>>)(?!\()(.+)$", re.MULTILINE),
         r"\1print(\2)",
-        source,
-        flags=re.MULTILINE,
-    )
+    ),
     # except Type, var:  →  except Type as var:
-    source = re.sub(
-        r"^(\s*except[ \t]+[\w.]+)[ \t]*,[ \t]*(\w+)[ \t]*:",
+    (
+        re.compile(r"^(\s*except[ \t]+[\w.]+)[ \t]*,[ \t]*(\w+)[ \t]*:", re.MULTILINE),
         r"\1 as \2:",
-        source,
-        flags=re.MULTILINE,
-    )
+    ),
     # raise Type, value  →  raise Type(value)
-    source = re.sub(
-        r"^(\s*raise[ \t]+[\w.]+)[ \t]*,[ \t]*(.+)$",
+    (
+        re.compile(r"^(\s*raise[ \t]+[\w.]+)[ \t]*,[ \t]*(.+)$", re.MULTILINE),
         r"\1(\2)",
-        source,
-        flags=re.MULTILINE,
-    )
+    ),
+)
+
+# Fewer new scripts than this are analyzed in-process even when a batch
+# asks for worker processes; spawning the pool would cost more.
+_MIN_POOL_BATCH = 256
+
+# A line no rewrite can match or extend across (NUL is not whitespace).
+_BATCH_SEPARATOR = "\n\0\n"
+
+
+def _preprocess_py2(source: str) -> str:
+    """Transform common Python 2 constructs to Python 3 so ast.parse() succeeds.
+
+    Jython in Ignition uses Python 2 syntax.  This avoids spurious
+    JYTHON_SYNTAX_ERROR reports for valid Jython code while still letting
+    ast.parse() catch genuine errors.
+    """
+    for pattern, replacement in _PY2_REWRITES:
+        source = pattern.sub(replacement, source)
     return source
 
 
+def _preprocess_py2_many(sources: list[str]) -> list[str]:
+    """Apply :func:`_preprocess_py2` to a batch of sources in one pass."""
+    if len(sources) < 2 or any("\0" in source for source in sources):
+        return [_preprocess_py2(source) for source in sources]
+    return _preprocess_py2(_BATCH_SEPARATOR.join(sources)).split(_BATCH_SEPARATOR)
+
+
+# Tokens that decide where statements start, for lines the fast path in
+# _logical_line_starts cannot handle.  Strings are matched from their
+# opening quote, so prefixes do not matter.
+_STATEMENT_TOKENS_RE = re.compile(
+    r"""
+    (?P<string>
+        \"\"\"(?:[^"\\]|\\.|"(?!""))*(?:\"\"\"|\Z)
+      | '''(?:[^'\\]|\\.|'(?!''))*(?:'''|\Z)
+      | "(?:[^"\\\n]|\\.)*"?
+      | '(?:[^'\\\n]|\\.)*'?
+    )
+    | (?P<comment>\#[^\n]*)
+    | (?P<open>[(\[{])
+    | (?P<close>[)\]}])
+    | (?P<continuation>\\\r?\n)
+    | (?P<newline>\n)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# One-line strings without escapes whose quotes are not part of a longer
+# run of quotes (so never the start of a triple-quoted string).  Blanking
+# these leaves most lines free of quotes, and their brackets and comments
+# can then be read with plain string methods.
+_PLAIN_STRING_RE = re.compile(
+    r"""'(?<!'')(?!'')[^'\\\n]*'(?!')|"(?<!"")(?!"")[^"\\\n]*"(?!")"""
+)
+_BLANK_LINE_STARTS = frozenset({"", "#", "\r", "\f"})
+
+
+def _logical_line_starts(script: str) -> Iterator[tuple[int, str, int]]:
+    """Yield ``(line_number, line, indent_width)`` for each statement line.
+
+    Strings, comments, brackets and backslash continuations are tracked,
+    so lines inside multi-line strings, bracketed or backslash
+    continuations, and blank or comment-only lines are skipped.  Lines
+    that still hold a quote or backslash once plain strings are blanked
+    are followed with :data:`_STATEMENT_TOKENS_RE`.  An unterminated
+    triple-quoted string runs to the end of the script; the syntax check
+    reports it.  Yielded lines have their plain strings blanked; their
+    indentation is unchanged.
+    """
+    lines = _PLAIN_STRING_RE.sub("_", script).split("\n")
+    line_count = len(lines)
+    index = 0
+    depth = 0
+    # Offset of line *offset_index* in *script*, advanced only on demand
+    offset = offset_index = 0
+    while index < line_count:
+        line = lines[index]
+        if not depth:
+            width = len(line) - len(line.lstrip(" \t"))
+            if line[width : width + 1] not in _BLANK_LINE_STARTS:
+                yield index + 1, line, width
+
+        if "#" in line:
+            line = line[: line.index("#")]
+        if "'" not in line and '"' not in line and "\\" not in line:
+            depth += (
+                line.count("(")
+                + line.count("[")
+                + line.count("{")
+                - line.count(")")
+                - line.count("]")
+                - line.count("}")
+            )
+            if depth < 0:
+                depth = 0
+            index += 1
+            continue
+
+        # Follow the statement token by token to the end of its last line
+        while offset_index < index:
+            offset = script.index("\n", offset) + 1
+            offset_index += 1
+        for token in _STATEMENT_TOKENS_RE.finditer(script, offset):
+            kind = token.lastgroup
+            if kind == "string":
+                index += token.group().count("\n")
+            elif kind == "open":
+                depth += 1
+            elif kind == "close":
+                depth = max(0, depth - 1)
+            elif kind == "continuation":
+                index += 1
+            elif kind == "newline":
+                index += 1
+                if not depth:
+                    offset = token.end()
+                    offset_index = index
+                    break
+        else:
+            return
+
+
 @dataclass
 class JythonIssue:
     """Internal representation used before conversion to lint issue."""
@@ -139,53 +252,403 @@ class JythonIssue:
     message: str
     suggestion: str | None = None
     line_number: int | None = None
+    column: int | None = None
+
+
+# Calls that should sit inside a try block with an except handler.
+_ERROR_HANDLING_FUNCS = ("getChild", "getSibling", "sendMessage", "closePopup")
+# Calls that walk the component tree instead of using properties or messages.
+_COMPONENT_TRAVERSAL_FUNCS = ("getSibling", "getParent", "getChild", "getComponent")
+# Legacy system.net functions that perform a request.
+_HTTP_FUNCTIONS = frozenset({"httpGet", "httpPost"})
+# JythonHttpClient methods that perform a request.
+_HTTP_CLIENT_METHODS = frozenset(
+    {
+        f"{method}{suffix}"
+        for method in (
+            "get",
+            "post",
+            "put",
+            "delete",
+            "patch",
+            "head",
+            "options",
+            "trace",
+            "request",
+        )
+        for suffix in ("", "Async")
+    }
+)
+_PRINT_STATEMENT_RE = re.compile(r"\s*print\b(?!\s*\()")
+
+
+def _call_name(func: ast.expr) -> str | None:
+    """Return the called function's own name: ``c`` for ``a.b.c(...)``."""
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    if isinstance(func, ast.Name):
+        return func.id
+    return None
+
+
+def _leaf(visitor: ast.NodeVisitor, node: ast.AST) -> None:
+    """Dispatch entry for nodes with nothing to visit below them."""
+
+
+class _PatternVisitor(ast.NodeVisitor):
+    """Collect the first line of each Ignition pattern finding in a script.
+
+    ``found`` maps a finding key to its first line in *script*; tree lines
+    are shifted by *line_offset*.  Calls count as handled only inside the
+    body of a ``try`` with an ``except`` clause in the same function.
+    """
+
+    def __init__(self, script: str, line_offset: int = 0) -> None:
+        self.found: dict[str, int] = {}
+        self._script = script
+        self._lines: list[str] | None = None
+        self._line_offset = line_offset
+        self._handled = 0
+        self._http_clients: set[str] = set()
+
+    # NodeVisitor.visit looks each handler up by name and generic_visit
+    # builds a generator per node; this visitor runs on every inline
+    # script, so dispatch is a type-keyed table and leaves are not entered.
+    def visit(self, node: ast.AST) -> None:
+        handler = self._dispatch.get(node.__class__)
+        if handler is None:
+            self.generic_visit(node)
+        elif handler is not _leaf:
+            handler(self, node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        visit = self.visit
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        visit(item)
+            elif isinstance(value, ast.AST):
+                visit(value)
+
+    def _add(self, key: str, node: ast.AST) -> None:
+        line = node.lineno + self._line_offset
+        if line < self.found.get(key, line + 1):
+            self.found[key] = line
+
+    def _is_print_statement(self, node: ast.Call) -> bool:
+        # print x and print(x) both parse as calls once the Python 2
+        # rewrites ran; the statement form has no parenthesis after print
+        # on the original line.
+        if self._lines is None:
+            self._lines = self._script.split("\n")
+        index = node.lineno + self._line_offset - 1
+        return 0 <= index < len(self._lines) and bool(
+            _PRINT_STATEMENT_RE.match(self._lines[index])
+        )
+
+    def visit_Try(self, node: ast.Try) -> None:
+        if node.handlers:
+            self._handled += 1
+        for child in node.body:
+            self.visit(child)
+        if node.handlers:
+            self._handled -= 1
+        for block in (node.handlers, node.orelse, node.finalbody):
+            for child in block:
+                self.visit(child)
+
+    visit_TryStar = visit_Try
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        # The body runs when called, outside any try around the definition
+        handled, self._handled = self._handled, 0
+        self.generic_visit(node)
+        self._handled = handled
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+    visit_Lambda = visit_FunctionDef
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        if self._is_http_client(node.value):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    self._http_clients.add(target.id)
+        self.generic_visit(node)
+
+    def visit_Expr(self, node: ast.Expr) -> None:
+        value = node.value
+        if isinstance(value, ast.Name) and value.id == "print":
+            self._add("print_statement", node)
+        self.generic_visit(node)
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        value = node.value
+        if isinstance(value, str) and ("localhost" in value or "127.0.0.1" in value):
+            self._add("localhost", node)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        func = node.func
+        name = _call_name(func)
+        if name is not None:
+            if name == "print" and isinstance(func, ast.Name):
+                if self._is_print_statement(node):
+                    self._add("print_statement", node)
+                else:
+                    self._add("print_function", node)
+            if name in _COMPONENT_TRAVERSAL_FUNCS:
+                self._add(f"traversal:{name}", node)
+            if not self._handled:
+                if name in _ERROR_HANDLING_FUNCS:
+                    self._add(f"unhandled:{name}", node)
+                if name in _HTTP_FUNCTIONS or (
+                    name in _HTTP_CLIENT_METHODS
+                    and isinstance(func, ast.Attribute)
+                    and self._is_http_client(func.value)
+                ):
+                    self._add("http", node)
+        self.generic_visit(node)
+
+    def _is_http_client(self, node: ast.expr) -> bool:
+        if isinstance(node, ast.Name):
+            return node.id in self._http_clients
+        return isinstance(node, ast.Call) and _call_name(node.func) == "httpClient"
+
+    _dispatch: dict[type, Callable[[_PatternVisitor, Any], None]] = {
+        ast.Try: visit_Try,
+        ast.FunctionDef: visit_FunctionDef,
+        ast.AsyncFunctionDef: visit_FunctionDef,
+        ast.Lambda: visit_FunctionDef,
+        ast.Assign: visit_Assign,
+        ast.Expr: visit_Expr,
+        ast.Constant: visit_Constant,
+        ast.Call: visit_Call,
+        ast.Name: _leaf,
+        ast.Load: _leaf,
+        ast.Store: _leaf,
+        ast.Del: _leaf,
+    }
+    # try/except* is new in Python 3.11
+    if hasattr(ast, "TryStar"):
+        _dispatch[ast.TryStar] = visit_Try
+
+
+_PATTERN_TEXT_RE = re.compile(
+    r"""
+    (?P<localhost>localhost|127\.0\.0\.1)
+    | (?<![.\w])print\b(?:(?P<print_function>\s*\()|(?P<print_statement>[ \t]+))
+    | \b(?P<call>\w+)\s*\(
+    """,
+    re.VERBOSE,
+)
+
+
+def _scan_patterns(script: str) -> dict[str, int]:
+    """Text-only version of :class:`_PatternVisitor` for unparsable scripts.
+
+    Strings and comments are not told apart, and a ``try``/``except``
+    anywhere in the script counts as handling every call.
+    """
+    handled = "try:" in script and "except" in script
+    found: dict[str, int] = {}
+    for match in _PATTERN_TEXT_RE.finditer(script):
+        kind = match.lastgroup
+        if kind == "call":
+            name = match.group("call")
+            keys = []
+            if name in _COMPONENT_TRAVERSAL_FUNCS:
+                keys.append(f"traversal:{name}")
+            if not handled and name in _ERROR_HANDLING_FUNCS:
+                keys.append(f"unhandled:{name}")
+            if not handled and (name in _HTTP_FUNCTIONS or name == "httpClient"):
+                keys.append("http")
+        else:
+            keys = [kind]
+        for key in keys:
+            if key not in found:
+                found[key] = script.count("\n", 0, match.start()) + 1
+    return found
+
+
+def _at_script_line(message: str, line: int) -> str:
+    """Name a finding's line within its script, as library call checks do."""
+    return f"{message} (script line {line})"
 
 
 class JythonValidator:
-    """Validates inline Jython scripts from Ignition projects."""
+    """Validates inline Jython scripts from Ignition projects.
+
+    Results are memoized by script text (see :class:`ResultMemo`);
+    *memo_size* bounds the number of distinct scripts kept, and 0 disables
+    the memo.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, memo_size: int = DEFAULT_MEMO_SIZE) -> None:
         self.issues: list[JythonIssue] = []
+        self.memo: ResultMemo[tuple[str, bool, bool, bool], tuple[JythonIssue, ...]] = (
+            ResultMemo(memo_size)
+        )
 
     def validate_script(
-        self, script_content: str, context: str = "script", standalone: bool = False
+        self,
+        script_content: str,
+        context: str = "script",
+        standalone: bool = False,
+        embedded: bool = False,
     ) -> list[LintIssue]:
         """Validate a script and return normalized lint issues.
 
         When *standalone* is True the script has already been dedented for
         editing (e.g. by ignition-lsp) — indentation checks are skipped and
-        syntax checking avoids a redundant ``textwrap.dedent``.
+        syntax checking avoids a redundant ``textwrap.dedent``.  When
+        *embedded* is True the script sits inside a view or tag file: lines
+        within it are named in the messages and no issue carries a line,
+        so the caller can place each issue at the script in its file.
         """
         self.issues = []
 
         if not script_content or not script_content.strip():
             return []
 
+        key = self._memo_key(script_content, context, standalone)
+        self.issues = list(
+            self.memo.lookup(
+                key, lambda: self._analyze(script_content, context, standalone)
+            )
+        )
+        return self._lint_issues(self.issues, context, embedded)
+
+    def validate_many(
+        self,
+        scripts: Iterable[tuple[str, str]],
+        standalone: bool = False,
+        jobs: int = 1,
+        embedded: bool = False,
+    ) -> list[list[LintIssue]]:
+        """Validate a batch of ``(script_content, context)`` pairs.
+
+        Returns one issue list per pair, in input order, matching what
+        :meth:`validate_script` returns for it.  Identical scripts are
+        analyzed once, the Python 2 rewrites run over all new scripts in a
+        single pass, and with *jobs* > 1 a large batch of new scripts is
+        analyzed in a process pool.
+        """
+        batch = [
+            (content, context, self._memo_key(content, context, standalone))
+            for content, context in scripts
+        ]
+
+        pending: dict[tuple[str, bool, bool, bool], str] = {}
+        for content, context, key in batch:
+            if content and content.strip() and key not in self.memo:
+                pending.setdefault(key, context)
+
+        analyzed: dict[tuple[str, bool, bool, bool], tuple[JythonIssue, ...]] = {}
+        if pending:
+            sources = _preprocess_py2_many(
+                [
+                    self._syntax_source(key[0], context, standalone)
+                    for key, context in pending.items()
+                ]
+            )
+            work = [
+                (key[0], context, standalone, prepared)
+                for (key, context), prepared in zip(
+                    pending.items(), sources, strict=True
+                )
+            ]
+            if jobs > 1 and len(work) >= _MIN_POOL_BATCH:
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    results = list(
+                        pool.map(
+                            _analyze_batch_item,
+                            work,
+                            chunksize=max(1, len(work) // (jobs * 4)),
+                        )
+                    )
+            else:
+                results = [self._analyze(*item) for item in work]
+            analyzed = dict(zip(pending, results, strict=True))
+
+        grouped: list[list[LintIssue]] = []
+        for content, context, key in batch:
+            if not content or not content.strip():
+                grouped.append([])
+                continue
+            if key in analyzed:
+                result = analyzed[key]
+                issues = self.memo.lookup(key, lambda result=result: result)
+            else:
+                # Memoized before the batch; analyze again if evicted since.
+                issues = self.memo.lookup(
+                    key,
+                    partial(self._analyze, content, context, standalone),
+                )
+            grouped.append(self._lint_issues(issues, context, embedded))
+        self.issues = []
+        return grouped
+
+    @staticmethod
+    def _memo_key(
+        script_content: str, context: str, standalone: bool
+    ) -> tuple[str, bool, bool, bool]:
+        # The checks only depend on whether the context is a transform or a
+        # standalone .py file; key on those so every call site shares entries.
+        return (
+            script_content,
+            standalone,
+            "transform[" in context,
+            context.endswith(".py") or ".py]" in context,
+        )
+
+    @staticmethod
+    def _lint_issues(
+        issues: Iterable[JythonIssue], context: str, embedded: bool = False
+    ) -> list[LintIssue]:
+        return [
+            LintIssue(
+                severity=issue.severity,
+                code=issue.code,
+                message=_at_script_line(issue.message, issue.line_number)
+                if embedded and issue.line_number is not None
+                else issue.message,
+                file_path="<inline>",
+                component_path=context,
+                line_number=None if embedded else issue.line_number,
+                column=None if embedded else issue.column,
+                suggestion=issue.suggestion,
+            )
+            for issue in issues
+        ]
+
+    def _analyze(
+        self,
+        script_content: str,
+        context: str,
+        standalone: bool,
+        prepared: str | None = None,
+    ) -> tuple[JythonIssue, ...]:
+        self.issues = []
         self._check_indentation(script_content, context, standalone=standalone)
-        tree = self._check_syntax(script_content, context, standalone=standalone)
+        tree = self._check_syntax(
+            script_content, context, standalone=standalone, prepared=prepared
+        )
         if tree is not None:
             self._check_duplicate_definitions(tree, context)
-        self._check_ignition_patterns(script_content, context)
+        self._check_ignition_patterns(tree, script_content, context)
         self._check_java_imports(script_content, context)
-
-        lint_issues: list[LintIssue] = []
-        for issue in self.issues:
-            lint_issues.append(
-                LintIssue(
-                    severity=issue.severity,
-                    code=issue.code,
-                    message=issue.message,
-                    file_path="<inline>",
-                    component_path=context,
-                    line_number=issue.line_number,
-                    suggestion=issue.suggestion,
-                )
-            )
-        return lint_issues
+        return tuple(self.issues)
 
     def _check_indentation(
         self, script: str, context: str, standalone: bool = False
     ) -> None:
+        """Check the indentation of a script embedded in a view or tag file.
+
+        Only embedded scripts are checked, and their callers place issues
+        at the script in its file, so lines within the script are named in
+        the messages rather than set as the issue's line.
+        """
         # Skip indentation heuristics for standalone .py files. Python's own
         # compiler (in _check_syntax) catches real errors; our custom checks
         # are only useful for embedded scripts in JSON event handlers.
@@ -198,49 +661,32 @@ class JythonValidator:
         if standalone:
             return
 
-        lines = script.split("\n")
-        mixed_lines = []
-        tab_lines = []
-        space_lines = []
-        non_indented = []
-        inconsistent_levels = []
-
+        non_indented: list[int] = []
+        mixed_lines: list[tuple[int, int]] = []
+        inconsistent_levels: list[tuple[int, int, int, int]] = []
+        has_tab_lines = has_space_lines = False
         previous_indent = 0
-        in_triple_quote = False
-
-        for index, line in enumerate(lines, 1):
-            if not line.strip():
-                continue
-
-            # Track triple-quoted string state; skip content lines inside them
-            was_in_triple = in_triple_quote
-            for tq in ('"""', "'''"):
-                count = line.count(tq)
-                if count % 2 == 1:
-                    in_triple_quote = not in_triple_quote
-                    break
-            if was_in_triple:
-                continue
-
-            tabs = len(line) - len(line.lstrip("\t"))
-            line_after_tabs = line.lstrip("\t")
-            spaces_after_tabs = len(line_after_tabs) - len(line_after_tabs.lstrip(" "))
-            total_spaces = len(line) - len(line.lstrip(" "))
 
+        for index, line, width in _logical_line_starts(script):
             if not line.startswith("\t") and not line.startswith("    "):
                 non_indented.append(index)
 
-            if "\t" in line[: tabs + spaces_after_tabs]:
-                if spaces_after_tabs > 0:
-                    mixed_lines.append(index)
-                else:
-                    tab_lines.append((index, tabs))
-            elif total_spaces > 0:
-                space_lines.append((index, total_spaces))
+            tabs = line.count("\t", 0, width)
+            spaces = width - tabs
+            if tabs and spaces:
+                # Column of the first character that breaks the line's style
+                switch = line.find(" " if line[0] == "\t" else "\t", 0, width)
+                mixed_lines.append((index, switch + 1))
+            elif tabs:
+                has_tab_lines = True
+            elif spaces:
+                has_space_lines = True
 
-            current_indent = tabs + (spaces_after_tabs // 4)
+            current_indent = tabs + spaces // 4
             if current_indent > previous_indent + 1:
-                inconsistent_levels.append((index, current_indent, previous_indent))
+                inconsistent_levels.append(
+                    (index, width + 1, current_indent, previous_indent)
+                )
             previous_indent = current_indent
 
         if non_indented:
@@ -249,25 +695,25 @@ class JythonValidator:
                     severity=LintSeverity.ERROR,
                     code="JYTHON_INDENTATION_REQUIRED",
                     message=(
-                        f"Lines {non_indented[:5]} have no indentation - Ignition requires at least one tab or 4 spaces"
+                        f"Script lines {non_indented[:5]} have no indentation - Ignition requires at least one tab or 4 spaces"
                     ),
                     suggestion="Indent each line with a tab (recommended) or 4 spaces.",
-                    line_number=non_indented[0],
                 )
             )
 
-        for line_num in mixed_lines[:3]:
+        for line_num, column in mixed_lines[:3]:
             self.issues.append(
                 JythonIssue(
                     severity=LintSeverity.WARNING,
                     code="JYTHON_MIXED_INDENTATION",
-                    message=f"Mixed tabs and spaces on line {line_num}",
+                    message=(
+                        f"Mixed tabs and spaces on script line {line_num}, column {column}"
+                    ),
                     suggestion="Use consistent tabs for indentation (Ignition standard).",
-                    line_number=line_num,
                 )
             )
 
-        if space_lines and tab_lines:
+        if has_space_lines and has_tab_lines:
             self.issues.append(
                 JythonIssue(
                     severity=LintSeverity.INFO,
@@ -277,37 +723,52 @@ class JythonValidator:
                 )
             )
 
-        for line_num, current, previous in inconsistent_levels:
+        for line_num, column, current, previous in inconsistent_levels:
             self.issues.append(
                 JythonIssue(
                     severity=LintSeverity.ERROR,
                     code="JYTHON_INDENTATION_JUMP",
-                    message=f"Indentation jumps from {previous} to {current} levels on line {line_num}.",
+                    message=(
+                        f"Indentation jumps from {previous} to {current} levels "
+                        f"on script line {line_num}, column {column}."
+                    ),
                     suggestion="Increase indentation by one level per logical block.",
-                    line_number=line_num,
                 )
             )
 
-    def _check_syntax(
-        self, script: str, context: str, standalone: bool = False
-    ) -> ast.Module | None:
+    @staticmethod
+    def _syntax_source(script: str, context: str, standalone: bool = False) -> str:
+        """Return *script* laid out for ``ast.parse``, before Python 2 rewrites."""
         # Script transforms are stored with leading tab indentation inside an
         # implicit function body.  When triple-quoted strings break
         # textwrap.dedent() common-prefix detection, ast.parse() fails.
         # Wrap transforms in a def so the indentation is valid Python.
-        is_transform = "transform[" in context
-        if is_transform:
+        if "transform[" in context:
             # Standalone transforms are already dedented — re-indent so the
             # body is valid inside the wrapper function.
             body = textwrap.indent(script, "    ") if standalone else script
-            prepared = f"def _transform(self, value, quality, timestamp):\n{body}"
-            prepared = _preprocess_py2(prepared)
-        elif standalone:
+            return f"def _transform(self, value, quality, timestamp):\n{body}"
+        if standalone:
             # Already dedented — parse directly
-            prepared = _preprocess_py2(script)
-        else:
-            # Ignition stores inline scripts with leading indentation; dedent before parsing
-            prepared = _preprocess_py2(textwrap.dedent(script))
+            return script
+        # Ignition stores inline scripts with leading indentation; dedent before parsing
+        return textwrap.dedent(script)
+
+    def _check_syntax(
+        self,
+        script: str,
+        context: str,
+        standalone: bool = False,
+        prepared: str | None = None,
+    ) -> ast.Module | None:
+        """Parse *script*, reporting syntax errors.
+
+        *prepared* is the already rewritten parse source, when the caller
+        preprocessed a batch of scripts together.
+        """
+        is_transform = "transform[" in context
+        if prepared is None:
+            prepared = _preprocess_py2(self._syntax_source(script, context, standalone))
 
         line_offset = -1 if is_transform else 0
         try:
@@ -319,7 +780,7 @@ class JythonValidator:
                     severity=LintSeverity.ERROR,
                     code="JYTHON_SYNTAX_ERROR",
                     message=f"Python syntax error: {exc.msg}",
-                    suggestion=f"Fix syntax near line {reported_line}.",
+                    suggestion=f"Fix syntax near script line {reported_line}.",
                     line_number=reported_line,
                 )
             )
@@ -397,69 +858,102 @@ class JythonValidator:
 
         _check_scope(tree.body, "")
 
-    def _check_ignition_patterns(self, script: str, context: str) -> None:
-        if "localhost" in script or "127.0.0.1" in script:
+    def _check_ignition_patterns(
+        self, tree: ast.Module | None, script: str, context: str
+    ) -> None:
+        """Report Ignition best-practice findings from one walk of *tree*.
+
+        Each rule is reported once per script, and its first occurrence is
+        named in the message: issues without a line are placed at the
+        script in its view or tag file, so the script's own line would be
+        mistaken for a file line.  Scripts that do not parse fall back to
+        :func:`_scan_patterns`.
+        """
+        if tree is None:
+            found = _scan_patterns(script)
+        else:
+            visitor = _PatternVisitor(script, -1 if "transform[" in context else 0)
+            visitor.visit(tree)
+            found = visitor.found
+
+        if "localhost" in found:
             self.issues.append(
                 JythonIssue(
                     severity=LintSeverity.WARNING,
                     code="JYTHON_HARDCODED_LOCALHOST",
-                    message="Hardcoded localhost reference detected.",
+                    message=_at_script_line(
+                        "Hardcoded localhost reference detected.", found["localhost"]
+                    ),
                     suggestion="Use a configurable gateway URL.",
                 )
             )
 
-        # Flag print statement syntax (print x) — should use print() function
-        if re.search(r"\bprint\s+[^(]", script):
+        if "print_statement" in found:
             self.issues.append(
                 JythonIssue(
                     severity=LintSeverity.WARNING,
                     code="JYTHON_PRINT_STATEMENT",
-                    message="Print statement found - use print() function for Jython compatibility.",
+                    message=_at_script_line(
+                        "Print statement found - use print() function for Jython compatibility.",
+                        found["print_statement"],
+                    ),
                     suggestion="Change 'print x' to 'print(x)'",
                 )
             )
 
         # Suggest system.perspective.print() over bare print() in Perspective scripts
-        if re.search(r"(?<![.\w])print\s*\(", script):
+        if "print_function" in found:
             self.issues.append(
                 JythonIssue(
                     severity=LintSeverity.INFO,
                     code="JYTHON_PREFER_PERSPECTIVE_PRINT",
-                    message="Consider using system.perspective.print() for Perspective logging.",
+                    message=_at_script_line(
+                        "Consider using system.perspective.print() for Perspective logging.",
+                        found["print_function"],
+                    ),
                     suggestion="Replace print() with system.perspective.print() for gateway log visibility",
                 )
             )
 
-        if ("httpClient" in script or "httpPost" in script or "httpGet" in script) and (
-            "try:" not in script or "except" not in script
-        ):
+        if "http" in found:
             self.issues.append(
                 JythonIssue(
                     severity=LintSeverity.WARNING,
                     code="JYTHON_HTTP_WITHOUT_EXCEPTION_HANDLING",
-                    message="HTTP calls should be wrapped in try/except blocks.",
+                    message=_at_script_line(
+                        "HTTP calls should be wrapped in try/except blocks.",
+                        found["http"],
+                    ),
                     suggestion="Add error handling around network calls.",
                 )
             )
 
-        for func in ["getChild", "getSibling", "sendMessage", "closePopup"]:
-            if func in script and "try:" not in script:
+        for func in _ERROR_HANDLING_FUNCS:
+            key = f"unhandled:{func}"
+            if key in found:
                 self.issues.append(
                     JythonIssue(
                         severity=LintSeverity.INFO,
                         code="JYTHON_RECOMMEND_ERROR_HANDLING",
-                        message=f"Consider wrapping {func} usage in error handling.",
+                        message=_at_script_line(
+                            f"Consider wrapping {func} usage in error handling.",
+                            found[key],
+                        ),
                     )
                 )
 
         # Flag fragile component tree traversal
-        for func in ["getSibling", "getParent", "getChild", "getComponent"]:
-            if re.search(rf"\b{func}\s*\(", script):
+        for func in _COMPONENT_TRAVERSAL_FUNCS:
+            key = f"traversal:{func}"
+            if key in found:
                 self.issues.append(
                     JythonIssue(
                         severity=LintSeverity.WARNING,
                         code="JYTHON_BAD_COMPONENT_REF",
-                        message=f"Component tree traversal '{func}()' is fragile and breaks on refactoring",
+                        message=_at_script_line(
+                            f"Component tree traversal '{func}()' is fragile and breaks on refactoring",
+                            found[key],
+                        ),
                         suggestion="Use view custom properties or message handlers instead",
                     )
                 )
@@ -571,3 +1065,10 @@ class JythonValidator:
     def _looks_like_java_package(pkg: str) -> bool:
         """Heuristic: does this look like a Java/Ignition package name?"""
         return pkg.startswith(("java.", "javax.", "com.inductiveautomation."))
+
+
+def _analyze_batch_item(
+    item: tuple[str, str, bool, str],
+) -> tuple[JythonIssue, ...]:
+    """Process-pool entry point for :meth:`JythonValidator.validate_many`."""
+    return JythonValidator(memo_size=0)._analyze(*item)
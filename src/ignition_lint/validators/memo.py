@@ -0,0 +1,89 @@
+"""Bounded memo of validator results keyed by source text.
+
+Projects repeat the same expressions and scripts across templated views,
+so validators memoize the location-independent part of each result and
+re-stamp file and component locations per call site.  Each process keeps
+its own memo; nothing is shared between worker processes, so per-call
+stats are collected with :meth:`ResultMemo.take_stats` and summed by the
+caller.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_MEMO_SIZE = 4096
+
+
+@dataclass(slots=True)
+class MemoStats:
+    """Hit and miss counts of a :class:`ResultMemo`."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def add(self, other: MemoStats) -> None:
+        self.hits += other.hits
+        self.misses += other.misses
+
+
+class ResultMemo(Generic[K, V]):
+    """Least-recently-used map holding at most *capacity* results.
+
+    A capacity of 0 disables memoization; lookups then always compute and
+    are not counted.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_MEMO_SIZE):
+        self.capacity = capacity
+        self.stats = MemoStats()
+        self._entries: OrderedDict[K, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def lookup(self, key: K, compute: Callable[[], V]) -> V:
+        """Return the memoized result for *key*, computing it on a miss."""
+        if self.capacity <= 0:
+            return compute()
+        entries = self._entries
+        try:
+            value = entries[key]
+        except KeyError:
+            pass
+        else:
+            entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+        self.stats.misses += 1
+        value = compute()
+        entries[key] = value
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+        return value
+
+    def take_stats(self) -> MemoStats:
+        """Return the stats gathered since the last call and reset them."""
+        stats, self.stats = self.stats, MemoStats()
+        return stats
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,237 @@
+"""Compiled, shared JSON-schema validators.
+
+``jsonschema.validate`` re-checks the schema against its meta-schema and
+builds a fresh validator on every call.  :class:`SchemaValidator` does
+that work once per schema file and is shared by every linter that loads
+the same path.
+
+For schemas whose top level is a ``oneOf`` over component kinds, each
+branch is also indexed by the values it accepts for a discriminator
+property (``type`` for Perspective components).  Instances whose
+discriminator selects exactly one branch are checked against that branch
+alone; only failures fall back to the full schema, so reported errors are
+identical to ``jsonschema.validate``.  Schemas that instead select by an
+``allOf`` of ``if``/``then`` conditions on the discriminator (the tag
+schema's ``tagType``) are indexed the same way: an instance is checked
+against the ``then`` its value selects, without evaluating the other
+conditions.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    from jsonschema.exceptions import ValidationError, best_match
+    from jsonschema.validators import validator_for
+
+    JSONSCHEMA_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    ValidationError = None  # type: ignore[assignment,misc]
+    best_match = None  # type: ignore[assignment]
+    validator_for = None  # type: ignore[assignment]
+    JSONSCHEMA_AVAILABLE = False
+
+# Sentinel for "this branch accepts any discriminator value"
+_ANY = None
+# Top-level keys that $refs in a narrowed copy of the root still rely on
+_SCHEMA_CONTEXT = frozenset({"$schema", "$id", "definitions", "$defs"})
+
+
+class SchemaValidator:
+    """A schema compiled once, with an optional per-discriminator fast path."""
+
+    def __init__(self, schema: dict, discriminator: str | None = "type"):
+        if not JSONSCHEMA_AVAILABLE:
+            raise RuntimeError("The 'jsonschema' package is required")
+
+        validator_cls = validator_for(schema)
+        validator_cls.check_schema(schema)
+        self.schema = schema
+        self.discriminator = discriminator
+        self._validator_cls = validator_cls
+        self._validator = validator_cls(schema)
+        self._branch_validators: dict[Any, Any] = {}
+        self.fast_path_hits = 0
+        if discriminator:
+            self._branch_validators = self._index_branches(discriminator)
+
+    # ------------------------------------------------------------------
+    # Branch indexing
+    # ------------------------------------------------------------------
+
+    def _resolve(self, node: Any, seen: frozenset[str] = frozenset()) -> Any:
+        ref = node.get("$ref") if isinstance(node, dict) else None
+        if not isinstance(ref, str) or not ref.startswith("#/") or ref in seen:
+            return node
+        target: Any = self.schema
+        for part in ref[2:].split("/"):
+            if not isinstance(target, dict) or part not in target:
+                return node
+            target = target[part]
+        return self._resolve(target, seen | {ref})
+
+    def _accepted_values(
+        self, node: Any, key: str, seen: frozenset[int] = frozenset()
+    ) -> frozenset | None:
+        """Values of *key* the subschema can accept, or ``_ANY`` if unbounded.
+
+        Only ``const``/``enum`` on the property (reached through ``$ref``
+        and ``allOf``) narrow the set; anything else is treated as
+        unbounded, which simply disables the fast path for that branch.
+        """
+        node = self._resolve(node)
+        if not isinstance(node, dict) or id(node) in seen:
+            return _ANY
+        seen = seen | {id(node)}
+
+        accepted: frozenset | None = _ANY
+        prop = node.get("properties", {}).get(key)
+        if isinstance(prop, dict):
+            accepted = _narrow(accepted, self._property_values(prop))
+        for sub in node.get("allOf", []):
+            accepted = _narrow(accepted, self._accepted_values(sub, key, seen))
+        return accepted
+
+    def _property_values(self, prop: Any) -> frozenset | None:
+        prop = self._resolve(prop)
+        if not isinstance(prop, dict):
+            return _ANY
+        if "const" in prop:
+            return _hashable_set([prop["const"]])
+        if isinstance(prop.get("enum"), list):
+            return _hashable_set(prop["enum"])
+        return _ANY
+
+    def _index_branches(self, key: str) -> dict[Any, Any]:
+        branches = self.schema.get("oneOf")
+        if not isinstance(branches, list) or not branches:
+            return self._index_conditions(key)
+
+        owners: dict[Any, list[int]] = {}
+        for index, branch in enumerate(branches):
+            values = self._accepted_values(branch, key)
+            if values is _ANY:
+                # An open branch competes with every value; no fast path
+                return {}
+            for value in values:
+                owners.setdefault(value, []).append(index)
+
+        compiled: dict[int, Any] = {}
+        dispatch: dict[Any, Any] = {}
+        for value, indexes in owners.items():
+            if len(indexes) != 1:
+                continue
+            index = indexes[0]
+            if index not in compiled:
+                narrowed = dict(self.schema)
+                narrowed["oneOf"] = [branches[index]]
+                compiled[index] = self._validator_cls(narrowed)
+            dispatch[value] = compiled[index]
+        return dispatch
+
+    def _condition_value(self, condition: Any, key: str) -> str | None:
+        """The *key* value an ``{"if": ..., "then": ...}`` entry tests for.
+
+        Only ``if`` schemas that require *key* and constrain nothing but
+        its ``const`` qualify; for anything else the result is ``_ANY``.
+        """
+        if not isinstance(condition, dict) or set(condition) != {"if", "then"}:
+            return _ANY
+        test = self._resolve(condition["if"])
+        if not isinstance(test, dict) or set(test) - {"properties", "required"}:
+            return _ANY
+        prop = test.get("properties")
+        if not isinstance(prop, dict) or set(prop) != {key}:
+            return _ANY
+        if key not in test.get("required", []):
+            return _ANY
+        value = self._resolve(prop[key])
+        if not isinstance(value, dict) or set(value) != {"const"}:
+            return _ANY
+        return value["const"] if isinstance(value["const"], str) else _ANY
+
+    def _index_conditions(self, key: str) -> dict[Any, Any]:
+        root = self._resolve(self.schema)
+        conditions = root.get("allOf") if isinstance(root, dict) else None
+        if not isinstance(conditions, list) or not conditions:
+            return {}
+
+        selected: dict[str, list[Any]] = {}
+        for condition in conditions:
+            value = self._condition_value(condition, key)
+            if value is _ANY:
+                return {}
+            selected.setdefault(value, []).append(self._resolve(condition["then"]))
+
+        # Other conditions' ``if`` fails for these values, so only the
+        # selected ``then`` schemas apply alongside the rest of the root
+        base = {k: v for k, v in self.schema.items() if k in _SCHEMA_CONTEXT}
+        base.update((k, v) for k, v in root.items() if k != "allOf")
+        return {
+            value: self._validator_cls({**base, "allOf": thens})
+            for value, thens in selected.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+
+    def first_error(self, instance: Any) -> ValidationError | None:
+        """Return the error ``jsonschema.validate`` would raise, or None."""
+        if self._branch_validators and isinstance(instance, dict):
+            value = instance.get(self.discriminator)
+            # Strings only: JSON equality differs from Python's for 1/True
+            branch = (
+                self._branch_validators.get(value) if isinstance(value, str) else None
+            )
+            if branch is not None and branch.is_valid(instance):
+                self.fast_path_hits += 1
+                return None
+        return best_match(self._validator.iter_errors(instance))
+
+    def validate(self, instance: Any) -> None:
+        """Raise :class:`jsonschema.ValidationError` if *instance* is invalid."""
+        error = self.first_error(instance)
+        if error is not None:
+            raise error
+
+
+def _narrow(current: frozenset | None, other: frozenset | None) -> frozenset | None:
+    if current is _ANY:
+        return other
+    if other is _ANY:
+        return current
+    return current & other
+
+
+def _hashable_set(values: list) -> frozenset | None:
+    try:
+        return frozenset(values)
+    except TypeError:
+        return _ANY
+
+
+_VALIDATORS: dict[tuple[str, str | None], SchemaValidator] = {}
+
+
+def get_schema_validator(
+    schema_path: str | Path,
+    schema: dict | None = None,
+    discriminator: str | None = "type",
+) -> SchemaValidator:
+    """Return the shared compiled validator for *schema_path*.
+
+    *schema* may be passed when the caller has already loaded the file.
+    """
+    key = (str(Path(schema_path).resolve()), discriminator)
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        if schema is None:
+            with open(schema_path) as f:
+                schema = json.load(f)
+        validator = SchemaValidator(schema, discriminator)
+        _VALIDATORS[key] = validator
+    return validator
@@ -0,0 +1,187 @@
+"""Tests for the content-hash incremental lint cache."""
+
+import json
+
+from ignition_lint.cache import LintCache
+from ignition_lint.cli import lint_scripts, lint_target_directory
+from ignition_lint.reporting import LintIssue, LintSeverity
+
+
+def _issue(file_path, code="TEST_CODE"):
+    return LintIssue(
+        severity=LintSeverity.WARNING,
+        code=code,
+        message="message",
+        file_path=file_path,
+        component_path="root.root",
+        metadata={"key": "value"},
+    )
+
+
+def test_miss_then_hit_restamps_file_path(tmp_path):
+    first = tmp_path / "a.json"
+    second = tmp_path / "b.json"
+    first.write_text("{}")
+    second.write_text("{}")
+
+    cache = LintCache(tmp_path / "cache", options={"check": "test"})
+    assert cache.get(first) is None
+    cache.put(first, [_issue(str(first))])
+
+    # Identical content shares the entry but reports its own path
+    cached = cache.get(second)
+    assert cached == [_issue(str(second))]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_content_change_invalidates(tmp_path):
+    target = tmp_path / "a.json"
+    target.write_text("{}")
+    cache = LintCache(tmp_path / "cache", options={"check": "test"})
+    cache.get(target)
+    cache.put(target, [])
+    assert cache.get(target) == []
+
+    target.write_text('{"changed": true}')
+    assert cache.get(target) is None
+
+
+def test_option_or_dependency_change_invalidates(tmp_path):
+    target = tmp_path / "a.json"
+    target.write_text("{}")
+    schema = tmp_path / "schema.json"
+    schema.write_text("{}")
+
+    cache = LintCache(tmp_path / "cache", {"check": "test"}, dependencies=[schema])
+    cache.get(target)
+    cache.put(target, [])
+
+    other_options = LintCache(tmp_path / "cache", {"check": "other"}, [schema])
+    assert other_options.get(target) is None
+
+    schema.write_text('{"type": "object"}')
+    new_schema = LintCache(tmp_path / "cache", {"check": "test"}, [schema])
+    assert new_schema.get(target) is None
+
+
+def test_prune_evicts_to_size_limit(tmp_path):
+    cache = LintCache(tmp_path / "cache", {"check": "test"}, max_bytes=0)
+    for i in range(3):
+        target = tmp_path / f"{i}.json"
+        target.write_text(str(i))
+        cache.get(target)
+        cache.put(target, [_issue(str(target))])
+
+    assert cache.prune() == 3
+    assert not list((tmp_path / "cache").rglob("*.json"))
+
+
+def _write_view(root):
+    view_dir = root / "views" / "Main"
+    view_dir.mkdir(parents=True)
+    view = {
+        "custom": {"unused": 1},
+        "root": {"type": "ia.container.flex", "meta": {"name": "root"}},
+    }
+    (view_dir / "view.json").write_text(json.dumps(view, indent=2))
+    script_dir = root / "scripts" / "lib"
+    script_dir.mkdir(parents=True)
+    (script_dir / "code.py").write_text("def run(x):\n    print x\n")
+
+
+def test_cached_run_matches_uncached(tmp_path):
+    _write_view(tmp_path)
+    cache_dir = tmp_path / ".ignition-lint-cache"
+
+    def lint(**kwargs):
+        return lint_target_directory(
+            tmp_path,
+            "robust",
+            None,
+            {"perspective", "scripts"},
+            "PascalCase",
+            "camelCase",
+            None,
+            None,
+            False,
+            **kwargs,
+        )
+
+    uncached = lint()
+    cold = lint(cache_dir=cache_dir)
+    warm = lint(cache_dir=cache_dir)
+
+    assert uncached.issues
+    assert cold.issues == uncached.issues
+    assert warm.issues == uncached.issues
+    assert (cold.cache_hits, cold.cache_misses) == (0, 2)
+    assert (warm.cache_hits, warm.cache_misses) == (2, 0)
+
+
+def test_script_cache_tracks_edits(tmp_path):
+    _write_view(tmp_path)
+    cache_dir = tmp_path / "cache"
+    scripts = tmp_path / "scripts"
+
+    lint_scripts(scripts, verbose=False, cache_dir=cache_dir)
+    (scripts / "lib" / "code.py").write_text("def run(x):\n    return x\n")
+    edited = lint_scripts(scripts, verbose=False, cache_dir=cache_dir)
+
+    assert edited.cache_misses == 1
+    assert edited.issues == lint_scripts(scripts, verbose=False).issues
+
+
+def test_unreadable_entry_is_relinted(tmp_path):
+    _write_view(tmp_path)
+    cache_dir = tmp_path / "cache"
+    scripts = tmp_path / "scripts"
+    lint_scripts(scripts, verbose=False, cache_dir=cache_dir)
+
+    (entry,) = cache_dir.rglob("*.json")
+    entry.write_text("not json")
+    relinted = lint_scripts(scripts, verbose=False, cache_dir=cache_dir)
+
+    assert (relinted.cache_hits, relinted.cache_misses) == (0, 1)
+    assert relinted.issues == lint_scripts(scripts, verbose=False).issues
+
+
+def test_duplicate_content_files_keep_their_own_results(tmp_path):
+    views = tmp_path / "views"
+    plain = {"root": {"type": "ia.container.flex", "meta": {"name": "root"}}}
+    broken = {
+        "propConfig": {
+            "custom.value": {"onChange": {"script": "\tif value >\n\t\tpass"}}
+        },
+        "root": {"type": "ia.container.flex", "meta": {"name": "root"}},
+    }
+    for name, view in (("A", plain), ("B", plain), ("C", broken)):
+        (views / name).mkdir(parents=True)
+        (views / name / "view.json").write_text(json.dumps(view, indent=2))
+    cache_dir = tmp_path / "cache"
+
+    def lint(**kwargs):
+        return lint_target_directory(
+            tmp_path,
+            "robust",
+            None,
+            {"perspective"},
+            "PascalCase",
+            "camelCase",
+            None,
+            None,
+            False,
+            **kwargs,
+        )
+
+    uncached = lint()
+    assert any(
+        issue.code.startswith("JYTHON") and issue.file_path.endswith("C/view.json")
+        for issue in uncached.issues
+    )
+    cold = lint(cache_dir=cache_dir)
+    warm = lint(cache_dir=cache_dir)
+
+    assert cold.issues == uncached.issues
+    assert warm.issues == uncached.issues
+    assert (cold.cache_hits, cold.cache_misses) == (0, 3)
+    assert (warm.cache_hits, warm.cache_misses) == (3, 0)
@@ -1,5 +1,8 @@
-from ignition_lint.cli import determine_checks
+import json
+
+from ignition_lint.cli import determine_checks, lint_tags
 from ignition_lint.json_linter import JsonLinter
+from ignition_lint.perspective import find_view_files
 
 
 def test_determine_checks_profile_defaults():
@@ -7,7 +10,39 @@ def test_determine_checks_profile_defaults():
         "perspective",
         "naming",
         "scripts",
+        "tags",
+    }
+
+
+def test_lint_tags_directory(tmp_path):
+    export = {
+        "name": "",
+        "tagType": "Provider",
+        "tags": [{"name": "Speed", "tagType": "AtomicTag", "valueSource": "memory"}],
     }
+    (tmp_path / "exports").mkdir()
+    (tmp_path / "exports" / "plant.json").write_text(json.dumps(export, indent=2))
+    (tmp_path / "exports" / "broken.json").write_text("{")
+
+    report = lint_tags([tmp_path / "exports"])
+    by_code = {issue.code: issue for issue in report.issues}
+    assert set(by_code) == {"INVALID_JSON", "MISSING_DATA_TYPE"}
+    assert by_code["MISSING_DATA_TYPE"].component_path == "/tags[0]/Speed"
+    assert by_code["MISSING_DATA_TYPE"].line_number == 5
+
+
+def test_find_view_files_prefers_perspective_views(tmp_path):
+    views = tmp_path / "com.inductiveautomation.perspective" / "views"
+    for name in ("B", "A"):
+        (views / name).mkdir(parents=True)
+        (views / name / "view.json").write_text("{}")
+    (tmp_path / "view.json").write_text("{}")
+
+    assert find_view_files(tmp_path) == [
+        str(views / "A" / "view.json"),
+        str(views / "B" / "view.json"),
+    ]
+    assert find_view_files(tmp_path / "missing") == []
 
 
 def test_determine_checks_naming_only():
@@ -0,0 +1,74 @@
+"""Tests for the Ignition expression lexer and parser."""
+
+from ignition_lint.validators.expression_parser import (
+    Binary,
+    Call,
+    ExpressionVisitor,
+    Index,
+    Member,
+    Name,
+    Number,
+    PropertyRef,
+    Sequence,
+    String,
+    parse_expression,
+)
+
+
+class _Collector(ExpressionVisitor):
+    def __init__(self):
+        self.calls = []
+
+    def visit_Call(self, node):
+        self.calls.append((node.name, len(node.args)))
+        self.generic_visit(node)
+
+
+def test_builds_tree_with_precedence():
+    parsed = parse_expression("if({view.custom.x} > 0 && 1 + 2 * 3, 'a', \"b\")")
+    call = parsed.root
+    assert isinstance(call, Call) and call.name == "if"
+    cond, yes, no = call.args
+    assert isinstance(cond, Binary) and cond.op == "&&"
+    assert isinstance(cond.left.left, PropertyRef)
+    assert cond.left.left.path == "view.custom.x"
+    assert cond.right.op == "+" and cond.right.right.op == "*"
+    assert (yes, no) == (String("a", 37), String("b", 42))
+
+
+def test_postfix_and_word_operators():
+    root = parse_expression("{x}[1].name like 'a%' // trailing comment").root
+    assert isinstance(root, Binary) and root.op == "like"
+    member = root.left
+    assert isinstance(member, Member) and member.name == "name"
+    assert isinstance(member.target, Index)
+    assert member.target.index == Number("1", 4)
+
+
+def test_brackets_inside_references_and_strings_are_opaque():
+    parsed = parse_expression("toStr({[default]Pump (1)/Speed}) + ')'")
+    assert not parsed.unclosed_parens and not parsed.extra_parens
+    assert parsed.root.left.args == [PropertyRef("[default]Pump (1)/Speed", 6)]
+
+
+def test_records_syntax_problems():
+    parsed = parse_expression("f(g(1), h(2 {a}}) 'x")
+    assert parsed.unclosed_parens == [1]
+    assert parsed.extra_braces == [15]
+    assert parsed.unclosed_string == (18, "'")
+    assert [t.start for t in parsed.adjacent] == [12, 18]
+
+
+def test_adjacent_values_are_kept_in_the_tree():
+    parsed = parse_expression("toStr(1) now()")
+    assert isinstance(parsed.root, Sequence)
+    collector = _Collector()
+    collector.visit(parsed.root)
+    assert collector.calls == [("toStr", 1), ("now", 0)]
+    assert parsed.root.items[1].callee == Name("now", 9)
+
+
+def test_deep_nesting_does_not_raise():
+    parsed = parse_expression("(" * 2000 + "1" + ")" * 2000)
+    assert parsed.root is None
+    assert not parsed.unclosed_parens and not parsed.extra_parens
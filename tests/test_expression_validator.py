@@ -520,3 +520,81 @@ class TestAdjacentExpressions:
             expr, "test", "file.json", "root", "ia.display.label"
         )
         assert "EXPR_ADJACENT_EXPRESSIONS" not in _codes(issues)
+
+
+class TestTokenizedChecks:
+    def test_string_contents_are_not_code(self, validator):
+        issues = validator.validate_expression(
+            "concat('now() {root.custom.x} foo(', \"it's\")",
+            "test",
+            "file.json",
+            "root",
+            "ia.display.label",
+        )
+        assert issues == []
+
+    def test_like_operator_and_comment_ok(self, validator):
+        issues = validator.validate_expression(
+            "{view.custom.x} like 'a%' // match prefix",
+            "test",
+            "file.json",
+            "root",
+            "ia.display.label",
+        )
+        assert issues == []
+
+    def test_unclosed_paren_column_points_at_unclosed_paren(self, validator):
+        issues = validator.validate_expression(
+            "if(toStr(1) = '1', now(5000), 0", "test", "file.json", "root", "x"
+        )
+        issue = next(i for i in issues if i.code == "EXPR_UNMATCHED_PAREN")
+        assert issue.column == 3
+        assert "1 unclosed" in issue.message
+
+    def test_unclosed_double_quote(self, validator):
+        issues = validator.validate_expression(
+            'toStr("abc)', "test", "file.json", "root", "ia.display.label"
+        )
+        issue = next(i for i in issues if i.code == "EXPR_UNMATCHED_QUOTE")
+        assert issue.column == 7
+        assert "double quote" in issue.suggestion
+
+    def test_guard_in_separate_if_branch_not_flagged(self, validator):
+        """The guard and the index must be operands of the same && / ||."""
+        expr = (
+            "if(len({view.params.steps}) > 1, {view.params.steps[1].a}, 0) "
+            "&& {view.custom.enabled}"
+        )
+        issues = validator.validate_expression(
+            expr, "test", "file.json", "root", "ia.display.label"
+        )
+        assert "EXPR_NO_SHORT_CIRCUIT" not in _codes(issues)
+
+
+class TestMemo:
+    def test_repeated_expression_restamped_per_call(self, validator):
+        first = validator.validate_expression("now()", "a", "one.json", "root.a", "t1")
+        second = validator.validate_expression("now()", "b", "two.json", "root.b", "t2")
+        assert validator.memo.stats.hits == 1
+        assert (second[0].file_path, second[0].component_path) == (
+            "two.json",
+            "root.b",
+        )
+        assert second[0].component_type == "t2"
+        # Fresh issues, so callers may locate or mutate them independently
+        assert first[0] is not second[0]
+        assert first[0].message == second[0].message
+
+    def test_capacity_evicts_least_recently_used(self):
+        validator = ExpressionValidator(memo_size=2)
+        for expression in ("now()", "now(1)", "now()", "now(2)", "now()"):
+            validator.validate_expression(expression, "", "f", "c", "t")
+        assert len(validator.memo) == 2
+        assert (validator.memo.stats.hits, validator.memo.stats.misses) == (2, 3)
+
+    def test_memo_disabled(self):
+        validator = ExpressionValidator(memo_size=0)
+        for _ in range(2):
+            issues = validator.validate_expression("now()", "", "f", "c", "t")
+            assert _codes(issues) == {"EXPR_NOW_DEFAULT_POLLING"}
+        assert validator.memo.stats.lookups == 0
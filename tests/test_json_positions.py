@@ -0,0 +1,241 @@
+"""Tests for the position-tracking JSON loader and issue location."""
+
+import json
+
+import pytest
+
+from ignition_lint.json_positions import load_json_with_positions
+from ignition_lint.perspective import IgnitionPerspectiveLinter
+from ignition_lint.scripts.symbols import CALL_CODES, ScriptLibrary
+from ignition_lint.tags import IgnitionTagLinter
+
+VIEW = {
+    "custom": {"title": "Hello", "unused": 1},
+    "params": {"itemId": 0},
+    "propConfig": {"params.itemId": {"paramDirection": "input"}},
+    "root": {
+        "type": "ia.container.flex",
+        "meta": {"name": "root"},
+        "props": {"direction": "column"},
+        "children": [
+            {
+                "type": "ia.display.label",
+                "meta": {"name": "Label"},
+                "position": {"basis": "auto"},
+                "props": {"text": "a"},
+            },
+            {
+                "type": "ia.display.label",
+                "meta": {"name": "Label"},
+                "position": {"basis": "auto"},
+                "propConfig": {
+                    "props.text": {
+                        "binding": {
+                            "type": "property",
+                            "config": {"path": "view.custom.missing"},
+                        }
+                    }
+                },
+            },
+        ],
+    },
+}
+
+
+def _nth(text, needle, index=0):
+    """Offset of the (0-based) index-th occurrence of *needle* in *text*."""
+    offset = -1
+    for _ in range(index + 1):
+        offset = text.index(needle, offset + 1)
+    return offset
+
+
+def _position(text, offset):
+    """1-based (line, column) of *offset* in *text*."""
+    line = text.count("\n", 0, offset) + 1
+    return line, offset - (text.rfind("\n", 0, offset) + 1) + 1
+
+
+def _line_of(text, needle, occurrence=1):
+    return _position(text, _nth(text, needle, occurrence - 1))
+
+
+class TestLoader:
+    def test_matches_json_loads(self):
+        text = json.dumps(VIEW, indent=2)
+        data, _ = load_json_with_positions(text)
+        assert data == json.loads(text)
+
+    def test_scalars_and_escapes(self):
+        text = '{"a\\"b": [1, -2.5e3, true, false, null, "x\\u00e9"], "": {}}'
+        data, positions = load_json_with_positions(text)
+        assert data == json.loads(text)
+        assert positions.line_col(positions.offset(('a"b',))) == (1, 2)
+
+    @pytest.mark.parametrize("text", ['{"a": 1,}', "[1 2]", '{"a" 1}', "", "{} x"])
+    def test_malformed_raises_json_decode_error(self, text):
+        with pytest.raises(json.JSONDecodeError):
+            load_json_with_positions(text)
+
+    def test_records_keys_and_containers(self):
+        text = json.dumps(VIEW, indent=2)
+        _, positions = load_json_with_positions(text)
+        assert positions.line_col(positions.offset(("root",))) == _line_of(
+            text, '"root": {'
+        )
+        second = ("root", "children", 1)
+        assert positions.offset(second) == positions.containers[second]
+        assert positions.line_col(positions.offset((*second, "meta", "name"))) == (
+            _line_of(text, '"name": "Label"', occurrence=2)
+        )
+
+    def test_resolve_keys_containing_dots(self):
+        text = json.dumps(VIEW, indent=2)
+        _, positions = load_json_with_positions(text)
+        base = ("root", "children", 1)
+        path, complete = positions.resolve(base, "propConfig.props.text.binding")
+        assert complete
+        assert path == (*base, "propConfig", "props.text", "binding")
+
+        path, complete = positions.resolve(base, "propConfig.props.nope")
+        assert not complete
+        assert path == (*base, "propConfig")
+
+
+class TestIssueLocation:
+    def test_perspective_issues_located_exactly(self, tmp_path):
+        text = json.dumps(VIEW, indent=2)
+        view = tmp_path / "view.json"
+        view.write_text(text)
+
+        linter = IgnitionPerspectiveLinter()
+        linter.lint_file(str(view))
+        by_code = {issue.code: issue for issue in linter.issues}
+
+        generic = [i for i in linter.issues if i.code == "GENERIC_COMPONENT_NAME"]
+        assert [i.component_path for i in generic] == [
+            "root.root.children[0]",
+            "root.root.children[1]",
+        ]
+        # Repeated names resolve to their own component object
+        for index, issue in enumerate(generic):
+            brace = text.rfind("{", 0, _nth(text, '"type": "ia.display.label"', index))
+            assert (issue.line_number, issue.column) == _position(text, brace)
+
+        unused = by_code["UNUSED_CUSTOM_PROPERTY"]
+        assert (unused.line_number, unused.column) == _line_of(text, '"unused"')
+
+        binding = by_code["BINDING_VIEW_PROP_NOT_FOUND"]
+        assert (binding.line_number, binding.column) == _line_of(text, '"props.text"')
+
+    def test_view_event_script_issues_located_at_their_script(self, tmp_path):
+        view = {
+            **VIEW,
+            "root": {
+                **VIEW["root"],
+                "events": {
+                    "dom": {
+                        "onClick": {
+                            "type": "script",
+                            "config": {"script": "\tx = 1\n\tif x\n\t\tpass"},
+                        }
+                    }
+                },
+            },
+        }
+        text = json.dumps(view, indent=2)
+        path = tmp_path / "view.json"
+        path.write_text(text)
+
+        linter = IgnitionPerspectiveLinter()
+        linter.lint_file(str(path))
+        (issue,) = [i for i in linter.issues if i.code == "JYTHON_SYNTAX_ERROR"]
+        # The file line of the handler; the script's own line is in the message
+        assert issue.line_number == _line_of(text, '"onClick"')[0]
+        assert "(script line 2)" in issue.message
+
+    def test_tag_issues_use_search_key(self, tmp_path):
+        tags = {
+            "name": "Root",
+            "tagType": "Folder",
+            "tags": [
+                {"name": "A", "tagType": "AtomicTag", "valueSource": "opc"},
+                {"name": "A", "tagType": "AtomicTag", "valueSource": "opc"},
+            ],
+        }
+        text = json.dumps(tags, indent=2)
+        path = tmp_path / "tags.json"
+        path.write_text(text)
+
+        linter = IgnitionTagLinter()
+        linter.lint_file(str(path))
+        opc = [i for i in linter.issues if i.code == "OPC_MISSING_CONFIG"]
+        assert [(i.line_number, i.column) for i in opc] == [
+            _line_of(text, '"valueSource"', occurrence=1),
+            _line_of(text, '"valueSource"', occurrence=2),
+        ]
+
+    def test_tag_event_script_calls_located_at_their_script(self, tmp_path):
+        library_root = tmp_path / "script-python"
+        (library_root / "util").mkdir(parents=True)
+        (library_root / "util" / "code.py").write_text("def log(msg):\n    pass\n")
+        tags = {
+            "name": "Root",
+            "tagType": "Folder",
+            "tags": [
+                {
+                    "name": "A",
+                    "tagType": "AtomicTag",
+                    "dataType": "Int4",
+                    "valueSource": "memory",
+                    "eventScripts": [
+                        {"eventid": "valueChanged", "script": "\tutil.log()"},
+                        {"eventid": "qualityChanged", "script": "\tutil.missing()"},
+                    ],
+                }
+            ],
+        }
+        text = json.dumps(tags, indent=2)
+        path = tmp_path / "tags.json"
+        path.write_text(text)
+
+        linter = IgnitionTagLinter(script_library=ScriptLibrary.load(library_root))
+        linter.lint_file(str(path))
+        calls = [i for i in linter.issues if i.code in CALL_CODES]
+        assert [(i.code, i.line_number) for i in calls] == [
+            ("SCRIPT_CALL_ARITY", _line_of(text, '"eventid": "valueChanged"')[0] - 1),
+            (
+                "UNRESOLVED_SCRIPT_CALL",
+                _line_of(text, '"eventid": "qualityChanged"')[0] - 1,
+            ),
+        ]
+
+    def test_script_pattern_issues_located_at_their_script(self, tmp_path):
+        tags = {
+            "name": "Root",
+            "tagType": "Folder",
+            "tags": [
+                {
+                    "name": "A",
+                    "tagType": "AtomicTag",
+                    "dataType": "Int4",
+                    "valueSource": "memory",
+                    "eventScripts": [
+                        {
+                            "eventid": "valueChanged",
+                            "script": "\tx = 1\n\turl = 'http://localhost'",
+                        }
+                    ],
+                }
+            ],
+        }
+        text = json.dumps(tags, indent=2)
+        path = tmp_path / "tags.json"
+        path.write_text(text)
+
+        linter = IgnitionTagLinter()
+        linter.lint_file(str(path))
+        (issue,) = [i for i in linter.issues if i.code == "JYTHON_HARDCODED_LOCALHOST"]
+        # The file line of the script; the script's own line is in the message
+        assert issue.line_number == _line_of(text, '"eventid": "valueChanged"')[0] - 1
+        assert issue.message.endswith("(script line 2)")
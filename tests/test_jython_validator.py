@@ -144,6 +144,42 @@ class TestTripleQuotedStrings:
         codes = {i.code for i in issues}
         assert "JYTHON_INDENTATION_REQUIRED" not in codes
 
+    def test_triple_quote_inside_other_string(self):
+        """A triple quote inside a regular string does not open a block."""
+        script = "\tx = \"'''\"\nbad_line = 1\n"
+        issues = validate(script)
+        required = [i for i in issues if i.code == "JYTHON_INDENTATION_REQUIRED"]
+        assert [i.message.split(" have")[0] for i in required] == ["Script lines [2]"]
+
+
+class TestIndentationContinuations:
+    """Only lines that start a statement are checked for indentation."""
+
+    def test_bracket_and_backslash_continuations(self):
+        script = (
+            "\tresult = system.tag.readBlocking([\n"
+            "'[default]A',\n"
+            "  '[default]B'])\n"
+            "\ttotal = 1 + \\\n"
+            "2\n"
+            "# comment at column 0\n"
+            "\treturn total"
+        )
+        codes = {i.code for i in validate(script)}
+        assert "JYTHON_INDENTATION_REQUIRED" not in codes
+        assert "JYTHON_INCONSISTENT_INDENTATION_STYLE" not in codes
+
+    def test_indentation_columns(self):
+        script = "\tif x:\n\t    y = 1\n\t\t\t\tz = 2"
+        issues = {i.code: i for i in validate(script)}
+        # Named in the message; the caller places the issue at the script
+        mixed = issues["JYTHON_MIXED_INDENTATION"]
+        assert mixed.line_number is None
+        assert mixed.message.endswith("on script line 2, column 2")
+        jump = issues["JYTHON_INDENTATION_JUMP"]
+        assert jump.line_number is None
+        assert jump.message.endswith("on script line 3, column 5.")
+
 
 def validate_with_context(script: str, context: str):
     validator = JythonValidator()
@@ -225,6 +261,68 @@ class TestTransformSyntax:
         assert "JYTHON_SYNTAX_ERROR" not in codes
 
 
+class TestIgnitionPatterns:
+    """Pattern rules look at the parsed script, not substrings of its text."""
+
+    def test_localhost_in_comment_not_flagged(self):
+        issues = validate("\t# was http://localhost:8088\n\tx = 1")
+        assert "JYTHON_HARDCODED_LOCALHOST" not in {i.code for i in issues}
+
+    def test_localhost_string_reports_its_line(self):
+        issues = validate("\tx = 1\n\turl = 'http://127.0.0.1/api'")
+        (issue,) = [i for i in issues if i.code == "JYTHON_HARDCODED_LOCALHOST"]
+        # Placed at the script by the caller; the script line is in the message
+        assert issue.line_number is None
+        assert issue.message.endswith("(script line 2)")
+
+    def test_http_inside_try_not_flagged(self):
+        script = (
+            "\tclient = system.net.httpClient()\n"
+            "\ttry:\n"
+            "\t\tresponse = client.get(url)\n"
+            "\texcept Exception:\n"
+            "\t\tpass"
+        )
+        codes = {i.code for i in validate(script)}
+        assert "JYTHON_HTTP_WITHOUT_EXCEPTION_HANDLING" not in codes
+
+    def test_http_outside_try_flagged_when_try_elsewhere(self):
+        script = (
+            "\ttry:\n"
+            "\t\tx = 1\n"
+            "\texcept Exception:\n"
+            "\t\tpass\n"
+            "\tresponse = system.net.httpGet(url)"
+        )
+        (issue,) = [
+            i
+            for i in validate(script)
+            if i.code == "JYTHON_HTTP_WITHOUT_EXCEPTION_HANDLING"
+        ]
+        assert issue.message.endswith("(script line 5)")
+
+    def test_function_defined_in_try_is_not_handled(self):
+        script = (
+            "\ttry:\n"
+            "\t\tdef send():\n"
+            "\t\t\tsystem.perspective.sendMessage('m')\n"
+            "\texcept Exception:\n"
+            "\t\tpass"
+        )
+        codes = {i.code for i in validate(script)}
+        assert "JYTHON_RECOMMEND_ERROR_HANDLING" in codes
+
+    def test_print_in_string_not_flagged(self):
+        issues = validate("\tlogger.info('print the report')")
+        assert "JYTHON_PRINT_STATEMENT" not in {i.code for i in issues}
+
+    def test_unparsable_script_falls_back_to_text(self):
+        issues = validate("\tif x\n\t\turl = 'http://localhost'")
+        codes = {i.code for i in issues}
+        assert "JYTHON_SYNTAX_ERROR" in codes
+        assert "JYTHON_HARDCODED_LOCALHOST" in codes
+
+
 class TestDuplicateDefinitions:
     """Duplicate function/class definitions at the same scope are flagged."""
 
@@ -293,3 +391,61 @@ class TestDuplicateDefinitions:
         dupes = [i for i in issues if i.code == "JYTHON_DUPLICATE_DEFINITION"]
         assert len(dupes) == 1
         assert "silently overwrites" in dupes[0].suggestion
+
+
+class TestMemo:
+    def test_memo_keyed_by_script_and_context_kind(self):
+        validator = JythonValidator()
+        script = "\tprint 'x'"
+        event = validator.validate_script(script, context="event.onClick[0]")
+        again = validator.validate_script(script, context="event.onFocus[0]")
+        assert validator.memo.stats.hits == 1
+        assert event
+        assert [i.component_path for i in again] == ["event.onFocus[0]"] * len(event)
+
+        # Transforms are parsed inside a wrapper function: a separate entry
+        validator.validate_script("\treturn value", context="transform[0]")
+        validator.validate_script("\treturn value", context="event.onClick[0]")
+        assert validator.memo.stats.misses == 3
+
+
+class TestValidateMany:
+    SCRIPTS = [
+        ("\tprint 'x'", "event.onClick[0]"),
+        ("", "event.onClick[1]"),
+        ("\treturn value", "transform[0]"),
+        ("\tprint >>log, 'x'\n\texcept Foo, e:", "onChange(text)"),
+        ("\tprint 'x'", "event.onFocus[0]"),
+        ("\tdef f():\n\t\tpass\n\tdef f():\n\t\tpass", "event.onClick[0]"),
+    ]
+
+    @staticmethod
+    def _summary(results):
+        return [
+            [(i.code, i.line_number, i.component_path) for i in issues]
+            for issues in results
+        ]
+
+    def test_matches_validate_script(self):
+        single = JythonValidator(memo_size=0)
+        expected = [single.validate_script(s, context=c) for s, c in self.SCRIPTS]
+
+        validator = JythonValidator()
+        results = validator.validate_many(self.SCRIPTS)
+        assert self._summary(results) == self._summary(expected)
+        # The repeated print script is analyzed once
+        assert (validator.memo.stats.misses, validator.memo.stats.hits) == (4, 1)
+
+    def test_uses_earlier_memo_entries(self):
+        validator = JythonValidator()
+        validator.validate_script("\tprint 'x'", context="event.onClick[0]")
+        validator.validate_many(self.SCRIPTS[:1])
+        assert validator.memo.stats.hits == 1
+
+    def test_nul_in_script_falls_back_to_per_script_preprocessing(self):
+        scripts = [("\tprint 'a\0'", "event.onClick[0]"), ("\tprint b", "script")]
+        single = JythonValidator(memo_size=0)
+        expected = [single.validate_script(s, context=c) for s, c in scripts]
+        assert self._summary(JythonValidator().validate_many(scripts)) == (
+            self._summary(expected)
+        )
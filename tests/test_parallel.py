@@ -0,0 +1,92 @@
+"""Tests for process-pool linting (--jobs)."""
+
+import json
+
+from ignition_lint.cli import lint_scripts, lint_target_directory
+from ignition_lint.parallel import resolve_jobs
+
+
+def _write_project(root):
+    for i in range(6):
+        view_dir = root / "views" / f"View{i}"
+        view_dir.mkdir(parents=True)
+        view = {
+            "custom": {"unused": i},
+            "params": {"itemId": 0},
+            "root": {
+                "type": "ia.container.flex",
+                "meta": {"name": "root"},
+                "children": [
+                    {
+                        "type": "ia.display.label",
+                        "meta": {"name": "Label"},
+                        "propConfig": {
+                            "props.text": {
+                                "binding": {
+                                    "type": "expr",
+                                    "config": {"expression": "now()"},
+                                }
+                            }
+                        },
+                    }
+                ],
+            },
+        }
+        (view_dir / "view.json").write_text(json.dumps(view, indent=2))
+
+    for i in range(4):
+        script_dir = root / "scripts" / f"lib{i}"
+        script_dir.mkdir(parents=True)
+        (script_dir / "code.py").write_text(
+            "def run(x):\n    print x\n    return xrange(x)\n"
+        )
+
+
+def _lint(root, jobs):
+    return lint_target_directory(
+        root,
+        "robust",
+        None,
+        {"perspective", "scripts"},
+        "PascalCase",
+        "camelCase",
+        None,
+        None,
+        False,
+        jobs=jobs,
+    )
+
+
+def test_resolve_jobs():
+    assert resolve_jobs(None) == 1
+    assert resolve_jobs(3) == 3
+    assert resolve_jobs(0) >= 1
+
+
+def test_parallel_matches_serial(tmp_path):
+    _write_project(tmp_path)
+    serial = _lint(tmp_path, jobs=1)
+    parallel = _lint(tmp_path, jobs=3)
+
+    assert serial.issues
+    assert parallel.issues == serial.issues
+    assert parallel.summary == serial.summary
+
+
+def test_parallel_scripts_matches_serial(tmp_path):
+    _write_project(tmp_path)
+    serial = lint_scripts(tmp_path / "scripts", verbose=False)
+    parallel = lint_scripts(tmp_path / "scripts", verbose=False, jobs=2)
+
+    assert serial.issues
+    assert parallel.issues == serial.issues
+
+
+def test_memo_stats_collected_from_workers(tmp_path):
+    _write_project(tmp_path)
+    for jobs in (1, 3):
+        report = _lint(tmp_path, jobs=jobs)
+        stats = report.memo_stats["expression"]
+        # The same now() expression in every view; each process misses once
+        assert stats.lookups == 6
+        assert 1 <= stats.misses <= jobs
@@ -159,6 +159,51 @@ class TestUnusedProperties:
 
         assert all(i.severity == LintSeverity.INFO for i in param_issues)
 
+    def test_prefix_reference_does_not_count(self):
+        view = {
+            "custom": {"foo": "", "foobar": ""},
+            "params": {},
+            "root": {
+                "type": "ia.container.flex",
+                "meta": {"name": "Root"},
+                "children": [],
+                "events": {
+                    "dom": {
+                        "onClick": {
+                            "type": "script",
+                            "config": {"script": "\tx = self.view.custom.foobar"},
+                        }
+                    }
+                },
+            },
+        }
+        issues = _lint_view(view)
+        unused = [i for i in issues if i.code == "UNUSED_CUSTOM_PROPERTY"]
+        assert [i.component_path for i in unused] == ["custom.foo"]
+
+    def test_subscript_and_component_key_references(self):
+        view = {
+            "custom": {"my prop": "", "shadowed": ""},
+            "params": {},
+            "root": {
+                "type": "ia.container.flex",
+                "meta": {"name": "Root"},
+                "children": [],
+                # A component's own custom.shadowed is not the view's
+                "propConfig": {
+                    "custom.shadowed": {
+                        "binding": {
+                            "type": "expr",
+                            "config": {"expression": "{view.custom['my prop']}"},
+                        }
+                    }
+                },
+            },
+        }
+        issues = _lint_view(view)
+        unused = [i for i in issues if i.code == "UNUSED_CUSTOM_PROPERTY"]
+        assert [i.component_path for i in unused] == ["custom.shadowed"]
+
 
 class TestUnknownPropValidation:
     def test_unknown_prop_flagged(self):
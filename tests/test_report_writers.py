@@ -0,0 +1,145 @@
+"""Tests for the streaming CLI report writers."""
+
+import io
+import json
+
+import pytest
+
+from ignition_lint.report_writers import (
+    JsonLinesReportWriter,
+    JsonReportWriter,
+    ReportWriter,
+    SarifReportWriter,
+    TextReportWriter,
+)
+from ignition_lint.reporting import (
+    LintIssue,
+    LintReport,
+    LintSeverity,
+    format_report_text,
+    issue_to_dict,
+)
+from ignition_lint.suppression import build_suppression_config
+
+ISSUES = [
+    LintIssue(
+        LintSeverity.ERROR,
+        "JYTHON_SYNTAX_ERROR",
+        "Syntax error",
+        "views/Main/view.json",
+        component_path="root.events.onClick",
+        line_number=12,
+        suggestion="Fix it",
+    ),
+    LintIssue(
+        LintSeverity.STYLE,
+        "LONG_LINE",
+        "Line too long",
+        "scripts/lib/code.py",
+        metadata={"length": "130"},
+    ),
+]
+
+
+def _stream(writer_class, issues, **report_fields):
+    stream = io.StringIO()
+    writer = writer_class(stream)
+    report = LintReport(sink=writer.write, **report_fields)
+    report.extend(issues)
+    writer.close(report)
+    return report, stream.getvalue()
+
+
+def test_writer_must_write_issues():
+    class Silent(ReportWriter):
+        pass
+
+    with pytest.raises(TypeError):
+        Silent(io.StringIO())
+
+
+def test_sink_receives_issues_instead_of_storing_them():
+    received = []
+    suppression = build_suppression_config(ignore_codes="LONG_LINE")
+    report = LintReport(suppression=suppression, sink=received.append)
+    report.extend(ISSUES)
+    assert received == ISSUES[:1]
+    assert not report.issues
+    assert report.summary == {"error": 1}
+    assert report.suppressed_count == 1
+    assert report.has_failures(LintSeverity.ERROR)
+
+
+def test_json_matches_whole_document_dump():
+    for issues in (ISSUES, []):
+        report, output = _stream(JsonReportWriter, issues, cache_hits=2, cache_misses=1)
+        expected = {
+            "issues": [issue_to_dict(issue) for issue in issues],
+            "summary": report.summary,
+            "cache": {"hits": 2, "misses": 1},
+        }
+        assert output == json.dumps(expected, indent=2) + "\n"
+
+
+def test_json_lines_end_with_totals():
+    report, output = _stream(JsonLinesReportWriter, ISSUES)
+    *records, totals = [json.loads(line) for line in output.splitlines()]
+    assert records == [issue_to_dict(issue) for issue in ISSUES]
+    assert totals == {"summary": {"error": 1, "style": 1}}
+
+
+def test_text_writes_issues_then_totals():
+    report, output = _stream(TextReportWriter, ISSUES)
+    buffered = LintReport()
+    buffered.extend(ISSUES)
+    # Same lines as the buffered report, with the severity totals moved last
+    assert sorted(output.splitlines()) == sorted(
+        format_report_text(buffered).splitlines()
+    )
+    assert output.index("[LONG_LINE]") < output.index("Issues by severity")
+    assert "   length: 130" in output
+
+    _report, empty = _stream(TextReportWriter, [])
+    assert empty == format_report_text(LintReport()) + "\n"
+
+
+def test_sarif_interns_rules_and_artifacts(tmp_path):
+    view = str(tmp_path / "views" / "Main Page" / "view.json")
+    issues = [
+        LintIssue(LintSeverity.WARNING, "UNKNOWN_PROP", "a", view, "root", None, 4, 9),
+        LintIssue(LintSeverity.INFO, "NO_COMPONENTS", "b", "/elsewhere/view.json"),
+        LintIssue(LintSeverity.ERROR, "UNKNOWN_PROP", "c", view, suggestion="Fix"),
+    ]
+    stream = io.StringIO()
+    writer = SarifReportWriter(stream, source_root=tmp_path)
+    report = LintReport(sink=writer.write)
+    report.extend(issues)
+    writer.close(report)
+
+    log = json.loads(stream.getvalue())
+    assert log["version"] == "2.1.0"
+    (run,) = log["runs"]
+    rules = run["tool"]["driver"]["rules"]
+    assert [rule["id"] for rule in rules] == ["UNKNOWN_PROP", "NO_COMPONENTS"]
+    assert all("shortDescription" not in rule for rule in rules)
+    assert [a["location"]["uri"] for a in run["artifacts"]] == [
+        "views/Main%20Page/view.json",
+        "file:///elsewhere/view.json",
+    ]
+    first, second, third = run["results"]
+    assert (first["ruleIndex"], second["ruleIndex"], third["ruleIndex"]) == (0, 1, 0)
+    # Each result has its own issue's level, whatever the rule's default
+    assert [r["level"] for r in (first, second, third)] == ["warning", "note", "error"]
+    assert rules[0]["defaultConfiguration"]["level"] == "warning"
+    location = first["locations"][0]
+    assert location["physicalLocation"]["artifactLocation"]["index"] == 0
+    assert location["physicalLocation"]["region"] == {"startLine": 4, "startColumn": 9}
+    assert location["logicalLocations"][0]["fullyQualifiedName"] == "root"
+    assert "region" not in third["locations"][0]["physicalLocation"]
+    assert third["properties"] == {"suggestion": "Fix"}
+
+
+def test_sarif_without_results_is_valid_json():
+    _report, output = _stream(SarifReportWriter, [])
+    (run,) = json.loads(output)["runs"]
+    assert run["results"] == [] and run["tool"]["driver"]["rules"] == []
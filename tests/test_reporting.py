@@ -0,0 +1,77 @@
+"""Tests for the compact issue table behind LintReport."""
+
+import pickle
+
+import pytest
+
+from ignition_lint.reporting import (
+    NO_METADATA,
+    IssueTable,
+    LintIssue,
+    LintReport,
+    LintSeverity,
+)
+
+
+def _issue(line, **overrides):
+    fields = {
+        "severity": LintSeverity.WARNING,
+        "code": "UNKNOWN_PROP",
+        "message": "Unknown prop 'textt'",
+        "file_path": "views/Main/view.json",
+        "component_path": "root.children[0]",
+        "component_type": "ia.display.label",
+        "line_number": line,
+        "suggestion": "Check the prop name",
+    }
+    fields.update(overrides)
+    return LintIssue(**fields)
+
+
+def test_round_trips_issues():
+    issues = [
+        _issue(3, column=7),
+        _issue(None, severity=LintSeverity.ERROR, suggestion=None),
+        _issue(9, metadata={"tag_name": "Motor"}),
+    ]
+    table = IssueTable(issues)
+    assert len(table) == 3
+    assert list(table) == issues
+    assert table == issues
+    assert table[-1].metadata == {"tag_name": "Motor"}
+    assert table[1:] == issues[1:]
+    with pytest.raises(IndexError):
+        table[3]
+
+
+def test_strings_are_stored_once():
+    table = IssueTable(_issue(line) for line in range(1, 1001))
+    first, last = table[0], table[999]
+    assert first.message is last.message
+    assert first.file_path is last.file_path
+    assert first.metadata is NO_METADATA
+
+
+def test_rows_are_copies():
+    table = IssueTable([_issue(1)])
+    table[0].line_number = 5
+    assert table[0].line_number == 1
+
+
+def test_no_metadata_is_shared_and_read_only():
+    assert LintIssue(LintSeverity.INFO, "X", "m", "f").metadata is NO_METADATA
+    assert pickle.loads(pickle.dumps(NO_METADATA)) is NO_METADATA
+    with pytest.raises(TypeError):
+        NO_METADATA["key"] = "value"
+    # Python 3.10 dataclasses reject dict instances as field defaults
+    assert not isinstance(NO_METADATA, dict)
+    assert NO_METADATA == {} and dict(NO_METADATA) == {}
+
+
+def test_report_failures_from_summary():
+    report = LintReport()
+    report.extend([_issue(1, severity=LintSeverity.INFO)])
+    assert not report.has_failures(LintSeverity.WARNING)
+    report.add_issue(_issue(2, severity=LintSeverity.ERROR))
+    assert report.has_failures(LintSeverity.WARNING)
+    assert report.summary == {"info": 1, "error": 1}
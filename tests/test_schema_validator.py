@@ -0,0 +1,87 @@
+"""Tests for the compiled, shared schema validator."""
+
+import json
+
+import pytest
+from jsonschema import ValidationError, validate
+
+from ignition_lint.schemas import SCHEMA_FILES, schema_path_for, tag_schema_path_for
+from ignition_lint.validators.schema import SchemaValidator, get_schema_validator
+
+COMPONENTS = [
+    {"type": "ia.container.flex", "props": {"direction": "row"}},
+    {"type": "ia.container.flex", "props": {"direction": "diagonal"}},
+    {"type": "ia.display.label", "props": {"text": "Hello"}},
+    {"type": "ia.display.label", "props": {"textStyle": {"fontSize": 12}}},
+    {"type": "ia.display.table", "props": {"data": []}},
+    {"type": "ia.input.button", "props": {"text": 3}},
+    {"type": "ia.chart.pie"},
+    {"type": "ia.unknown.widget"},
+    {"type": "custom.widget"},
+    {"type": 1},
+    {"meta": {"name": "NoType"}},
+    "not-an-object",
+]
+
+
+def _expected_message(instance, schema):
+    try:
+        validate(instance=instance, schema=schema)
+    except ValidationError as e:
+        return e.message, list(e.absolute_path)
+    return None
+
+
+@pytest.mark.parametrize("mode", sorted(SCHEMA_FILES))
+def test_matches_jsonschema_validate(mode):
+    path = schema_path_for(mode)
+    schema = json.loads(path.read_text())
+    validator = SchemaValidator(schema)
+
+    for component in COMPONENTS:
+        error = validator.first_error(component)
+        actual = (error.message, list(error.absolute_path)) if error else None
+        assert actual == _expected_message(component, schema), component
+
+
+def test_fast_path_only_for_unambiguous_types():
+    schema = json.loads(schema_path_for("strict").read_text())
+    validator = SchemaValidator(schema)
+
+    # labelComponent and displayComponents both accept labels
+    assert "ia.display.label" not in validator._branch_validators
+    assert "ia.display.table" in validator._branch_validators
+
+    assert validator.first_error({"type": "ia.display.table"}) is None
+    assert validator.fast_path_hits == 1
+
+
+def test_shared_per_schema_path():
+    path = schema_path_for("robust")
+    assert get_schema_validator(path) is get_schema_validator(str(path))
+
+
+def test_tag_schema_matches_jsonschema_validate():
+    path = tag_schema_path_for("robust")
+    schema = json.loads(path.read_text())
+    validator = get_schema_validator(path, schema, discriminator="tagType")
+    tags = [
+        {"name": "T", "tagType": "AtomicTag", "dataType": "Int4"},
+        {"name": "T", "tagType": "AtomicTag", "dataType": "Nope"},
+        {"name": "F", "tagType": "Folder", "tags": [{"tagType": "Bogus"}]},
+        {"name": "X"},
+    ]
+    for tag in tags:
+        error = validator.first_error(tag)
+        actual = (error.message, list(error.absolute_path)) if error else None
+        assert actual == _expected_message(tag, schema), tag
+
+
+def test_tag_schema_dispatches_on_tag_type():
+    path = tag_schema_path_for("robust")
+    schema = json.loads(path.read_text())
+    validator = SchemaValidator(schema, discriminator="tagType")
+
+    assert {"AtomicTag", "UdtInstance", "Folder"} <= set(validator._branch_validators)
+    assert validator.first_error({"name": "T", "tagType": "Folder"}) is None
+    assert validator.fast_path_hits == 1
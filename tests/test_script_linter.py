@@ -0,0 +1,78 @@
+"""Tests for the standalone script-python linter."""
+
+import textwrap
+
+from ignition_lint.scripts.linter import IgnitionScriptLinter, ScriptContext
+
+
+def _lint(tmp_path, content: str) -> IgnitionScriptLinter:
+    f = tmp_path / "code.py"
+    f.write_text(textwrap.dedent(content))
+    linter = IgnitionScriptLinter()
+    linter._lint_file(f)
+    return linter
+
+
+def _codes(linter):
+    return [(i.code, i.line_number) for i in linter.issues]
+
+
+def test_jython2_syntax_is_parsed(tmp_path):
+    linter = _lint(
+        tmp_path,
+        """\
+        def handler(event):
+            try:
+                print event
+            except Exception, e:
+                raise ValueError, "bad"
+        """,
+    )
+    assert _codes(linter) == [
+        ("JYTHON_PRINT_STATEMENT", 3),
+        ("MISSING_DOCSTRING", 1),
+    ]
+
+
+def test_syntax_error_quotes_original_line(tmp_path):
+    linter = _lint(tmp_path, "print x\nif x\n")
+    error = next(i for i in linter.issues if i.code == "SYNTAX_ERROR")
+    assert error.line_number == 2
+    assert error.suggestion == "Fix syntax error: if x"
+
+
+def test_line_rules_in_one_scan(tmp_path):
+    linter = _lint(
+        tmp_path,
+        f"""\
+        from java.util import Date
+        system = None
+        for k, v in d.iteritems(): print (debug) + xrange(2)
+        global counter
+        url = "localhost:8088/{"x" * 120}"
+        system.util.xrange(system.foo.bar(system.tag.readBlocking))
+        """,
+    )
+    assert _codes(linter) == [
+        ("JYTHON_XRANGE_USAGE", 3),
+        ("JYTHON_DEPRECATED_ITERITEMS", 3),
+        ("JYTHON_XRANGE_USAGE", 6),
+        ("IGNITION_SYSTEM_OVERRIDE", 2),
+        ("IGNITION_DEBUG_PRINT", 3),
+        ("IGNITION_HARDCODED_GATEWAY", 5),
+        ("IGNITION_UNKNOWN_SYSTEM_CALL", None),
+        ("LONG_LINE", 5),
+        ("GLOBAL_VARIABLE_USAGE", 4),
+        ("JAVA_INTEGRATION_DETECTED", None),
+    ]
+    unknown = next(i for i in linter.issues if i.code == "IGNITION_UNKNOWN_SYSTEM_CALL")
+    assert unknown.message == "Unknown system function call: system.foo.bar"
+
+
+def test_context_scan():
+    context = ScriptContext.analyze(
+        "code.py", "x = system.a.system.b\nprint x\nprint\nfoo()"
+    )
+    assert list(context.system_calls) == ["system.a.system.b"]
+    assert context.rule_lines == {"JYTHON_PRINT_STATEMENT": [2]}
+    assert context.tree is not None
@@ -0,0 +1,227 @@
+"""Tests for the script-python library index and call checks."""
+
+import ast
+import json
+import textwrap
+
+from ignition_lint.cli import lint_perspective, lint_scripts, lint_tags
+from ignition_lint.scripts.symbols import (
+    LibraryCall,
+    ScriptLibrary,
+    collect_library_calls,
+    collect_module_symbols,
+)
+
+UTIL_DB = """\
+def query(sql, params=None, *rest):
+    return sql
+
+class Cache(object):
+    def __init__(self, size):
+        self.size = size
+
+if True:
+    def later(a):
+        pass
+
+TIMEOUT = 5
+"""
+
+APP = """\
+import util.db as database
+
+def run(event):
+    util.db.query()
+    database.query("x", 1, 2, 3)
+    util.db.missing(1)
+    util.db.Cache(1, 2)
+    project.util.db.later(1)
+    shared.util.nowhere.thing()
+    util.db(1)
+    local = util
+    system.tag.readBlocking([])
+    other.call()
+"""
+
+
+def _write_library(root):
+    library = root / "ignition" / "script-python"
+    for module, source in (("util/db", UTIL_DB), ("app", APP)):
+        folder = library / module
+        folder.mkdir(parents=True)
+        (folder / "code.py").write_text(source)
+    return library
+
+
+def _call_issues(report):
+    codes = {"UNRESOLVED_SCRIPT_CALL", "SCRIPT_CALL_ARITY"}
+    return sorted(
+        (i.code, i.line_number, i.message) for i in report.issues if i.code in codes
+    )
+
+
+EXPECTED = [
+    (
+        "SCRIPT_CALL_ARITY",
+        4,
+        "Function 'util.db.query' is missing required argument(s) 'sql'",
+    ),
+    (
+        "SCRIPT_CALL_ARITY",
+        7,
+        "Class 'util.db.Cache' takes at most 1 positional argument(s) (2 given)",
+    ),
+    ("UNRESOLVED_SCRIPT_CALL", 6, "Script module 'util.db' has no attribute 'missing'"),
+    ("UNRESOLVED_SCRIPT_CALL", 9, "Script module 'util.nowhere' does not exist"),
+    (
+        "UNRESOLVED_SCRIPT_CALL",
+        10,
+        "'util.db' is a script package or module, not a function",
+    ),
+]
+
+
+def test_module_symbols():
+    symbols = collect_module_symbols(ast.parse(UTIL_DB))
+    query = symbols.functions["query"]
+    assert (query.params, query.required, query.varargs) == (
+        ("sql", "params"),
+        1,
+        True,
+    )
+    assert symbols.classes["Cache"].params == ("size",)
+    assert symbols.defines("later") and symbols.defines("TIMEOUT")
+    assert not symbols.open
+
+
+def test_calls_skip_locally_bound_roots():
+    tree = ast.parse(
+        textwrap.dedent(
+            """\
+            def f(util):
+                util.db.query(1)
+            from util import db
+            db.query(k=1, *args)
+            """
+        )
+    )
+    calls = collect_library_calls(tree)
+    assert [(c.target, c.positional, c.keywords, c.unpacked) for c in calls] == [
+        ("util.db.query", 0, ("k",), True)
+    ]
+    assert LibraryCall.from_json(json.loads(json.dumps(calls[0].to_json()))) == calls[0]
+
+
+def test_library_script_calls(tmp_path):
+    library = _write_library(tmp_path)
+    report = lint_scripts(library, verbose=False)
+    assert _call_issues(report) == EXPECTED
+
+
+def test_library_calls_served_from_cache(tmp_path):
+    library = _write_library(tmp_path)
+    cache_dir = tmp_path / "cache"
+    first = lint_scripts(library, False, jobs=2, cache_dir=cache_dir)
+    second = lint_scripts(library, False, cache_dir=cache_dir)
+    assert second.cache_misses == 0
+    assert _call_issues(first) == _call_issues(second) == EXPECTED
+
+
+def test_module_cached_from_a_non_module_copy(tmp_path):
+    library = _write_library(tmp_path)
+    # Same content as util/db, cached last, in a file that is not a module
+    (library / "zz").mkdir()
+    (library / "zz" / "scratch.py").write_text(UTIL_DB)
+    cache_dir = tmp_path / "cache"
+    for _ in range(2):
+        report = lint_scripts(library, False, cache_dir=cache_dir)
+        assert _call_issues(report) == EXPECTED
+    assert report.cache_misses == 0
+
+
+def test_library_update_and_remove(tmp_path):
+    root = _write_library(tmp_path)
+    library = ScriptLibrary.load(root)
+    call = LibraryCall("util.db.added", 0, (), False, 1, 0)
+    assert library.check(call)[0] == "UNRESOLVED_SCRIPT_CALL"
+
+    db = root / "util" / "db" / "code.py"
+    db.write_text(UTIL_DB + "\ndef added():\n    pass\n")
+    library.update(db)
+    assert library.check(call) is None
+
+    # With util/db gone, util is no longer a library package to check.
+    library.remove(db)
+    assert "util" not in library.packages
+    assert library.check(call) is None
+
+
+def test_view_script_calls(tmp_path):
+    _write_library(tmp_path)
+    views = tmp_path / "com.inductiveautomation.perspective" / "views"
+    folder = views / "Main"
+    folder.mkdir(parents=True)
+    view = {
+        "root": {
+            "type": "ia.container.flex",
+            "meta": {"name": "root"},
+            "children": [
+                {
+                    "type": "ia.input.button",
+                    "meta": {"name": "Save"},
+                    "events": {
+                        "component": {
+                            "onActionPerformed": {
+                                "type": "script",
+                                "config": {
+                                    "script": "\tx = 1\n\tutil.db.later(x, self)"
+                                },
+                            }
+                        }
+                    },
+                }
+            ],
+        }
+    }
+    (folder / "view.json").write_text(json.dumps(view, indent=2))
+
+    report = lint_perspective(views, "robust", None, verbose=False)
+    (issue,) = [i for i in report.issues if i.code == "SCRIPT_CALL_ARITY"]
+    assert issue.message == (
+        "Function 'util.db.later' takes at most 1 positional argument(s) (2 given)"
+        " (script line 2)"
+    )
+    assert issue.component_path == (
+        "root.root.children[0].events.component.onActionPerformed"
+    )
+    assert issue.line_number is not None
+
+
+def test_tag_script_calls_track_the_library(tmp_path):
+    library = _write_library(tmp_path)
+    tags = {
+        "name": "Plant",
+        "tagType": "Folder",
+        "tags": [
+            {
+                "name": "A",
+                "tagType": "AtomicTag",
+                "eventScripts": [
+                    {"eventid": "valueChanged", "script": "\tutil.db.later()"}
+                ],
+            }
+        ],
+    }
+    (tmp_path / "tags.json").write_text(json.dumps(tags))
+    cache_dir = tmp_path / "cache"
+
+    def lint():
+        report = lint_tags(
+            [tmp_path / "tags.json"], cache_dir=cache_dir, library_root=library
+        )
+        return [i.code for i in report.issues if i.code.startswith("SCRIPT_CALL")]
+
+    assert lint() == lint() == ["SCRIPT_CALL_ARITY"]
+    db = library / "util" / "db" / "code.py"
+    db.write_text(UTIL_DB.replace("def later(a):", "def later():"))
+    assert lint() == []
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import json
 import textwrap
 
+from ignition_lint.cli import lint_scripts, lint_tags, lint_target_directory
+from ignition_lint.perspective.linter import RULE_CODES, IgnitionPerspectiveLinter
 from ignition_lint.reporting import LintIssue, LintReport, LintSeverity
 from ignition_lint.scripts.linter import IgnitionScriptLinter
 from ignition_lint.suppression import (
@@ -150,6 +153,32 @@ class TestLintIgnoreFile:
         assert config.should_suppress("NAMING_COMPONENT", str(ref)) is True
         assert config.should_suppress("OTHER", str(ref)) is False
 
+    def test_rule_patterns_grouped_by_code(self, tmp_path):
+        ignore = tmp_path / ".ignition-lintignore"
+        ignore.write_text(
+            "views/A/**:NAMING_COMPONENT\n"
+            "views/B/**:NAMING_COMPONENT,LONG_LINE\n"
+            "!views/B/**:LONG_LINE\n"
+        )
+        config = build_suppression_config(project_root=tmp_path, ignore_file=ignore)
+
+        a = config.for_path(str(tmp_path / "views" / "A" / "view.json"))
+        b = config.for_path(str(tmp_path / "views" / "B" / "view.json"))
+        assert a.codes == {"NAMING_COMPONENT"} and not a.blanket
+        # A lone exclusion line does not undo the other line for its code
+        assert b.codes == {"NAMING_COMPONENT", "LONG_LINE"}
+
+    def test_path_outcome_memoized(self, tmp_path):
+        ignore = tmp_path / ".ignition-lintignore"
+        ignore.write_text("generated/**\n")
+        config = build_suppression_config(project_root=tmp_path, ignore_file=ignore)
+
+        path = str(tmp_path / "generated" / "a.py")
+        first = config.for_path(path)
+        assert first.blanket and first.suppresses("ANYTHING")
+        assert config.for_path(path) is first
+        assert not config.for_path(str(tmp_path / "other.py")).suppresses("X")
+
 
 # ---------------------------------------------------------------------------
 # Mechanism 3: Inline suppression (scripts only)
@@ -250,3 +279,114 @@ class TestInlineSuppression:
         linter._lint_file(f)
         docstring_issues = [i for i in linter.issues if i.code == "MISSING_DOCSTRING"]
         assert len(docstring_issues) >= 1
+
+
+# ---------------------------------------------------------------------------
+# Early suppression: ignored files are not read, ignored checks are not run
+# ---------------------------------------------------------------------------
+
+
+_VIEW = {
+    "custom": {"unused": 1},
+    "root": {"type": "ia.container.flex", "meta": {"name": "root"}},
+}
+
+
+def _view(root, name, view):
+    folder = root / "views" / name
+    folder.mkdir(parents=True)
+    (folder / "view.json").write_text(json.dumps(view))
+    return folder / "view.json"
+
+
+class TestEarlySuppression:
+    def test_ignored_views_are_not_read(self, tmp_path):
+        (tmp_path / ".ignition-lintignore").write_text("views/Vendor/**\n")
+        vendor = tmp_path / "views" / "Vendor" / "Broken"
+        vendor.mkdir(parents=True)
+        (vendor / "view.json").write_text("{ not json")
+        _view(tmp_path, "Main", _VIEW)
+
+        suppression = build_suppression_config(project_root=tmp_path)
+        report = lint_target_directory(
+            tmp_path,
+            "robust",
+            None,
+            {"perspective"},
+            "PascalCase",
+            "camelCase",
+            None,
+            None,
+            False,
+            report=LintReport(suppression=suppression),
+        )
+        codes = {issue.code for issue in report.issues}
+        assert "INVALID_JSON" not in codes
+        assert "UNUSED_CUSTOM_PROPERTY" in codes
+        # Nothing was reported for the vendored view, so nothing was filtered
+        assert report.suppressed_count == 0
+        # Orphan checks need every view's embeds
+        assert "ORPHAN_VIEW" not in codes
+
+    def test_checks_for_ignored_codes_are_not_run(self, tmp_path, monkeypatch):
+        view = _view(tmp_path, "Main", _VIEW)
+        linter = IgnitionPerspectiveLinter(
+            ignore_codes=RULE_CODES["schema"] | RULE_CODES["unused_properties"]
+        )
+        assert linter.skipped_rules == {"schema", "unused_properties"}
+
+        def fail(*args, **kwargs):
+            raise AssertionError("skipped check was run")
+
+        monkeypatch.setattr(linter, "validate_component_schema", fail)
+        monkeypatch.setattr(linter, "_check_unused_properties", fail)
+        assert linter.lint_file(str(view)) is True
+        assert linter.issues == []
+
+    def test_ignored_library_modules_still_resolve_calls(self, tmp_path):
+        library = tmp_path / "ignition" / "script-python"
+        (library / "vendor" / "api").mkdir(parents=True)
+        (library / "vendor" / "api" / "code.py").write_text("def fetch(url):\n  pass\n")
+        (library / "app").mkdir()
+        (library / "app" / "code.py").write_text(
+            "def run():\n    vendor.api.fetch('x')\n    vendor.api.gone()\n"
+        )
+        (tmp_path / ".ignition-lintignore").write_text(
+            "ignition/script-python/vendor/**\n"
+        )
+
+        suppression = build_suppression_config(project_root=tmp_path)
+        report = lint_scripts(
+            library, verbose=False, report=LintReport(suppression=suppression)
+        )
+        calls = [i.message for i in report.issues if i.code == "UNRESOLVED_SCRIPT_CALL"]
+        assert calls == ["Script module 'vendor.api' has no attribute 'gone'"]
+
+    def test_ignored_tag_exports_still_define_udts(self, tmp_path):
+        types = {
+            "name": "_types_",
+            "tagType": "Folder",
+            "tags": [
+                {"name": "Motor", "tagType": "UdtType"},
+                {"name": "Pump", "tagType": "UdtType", "typeId": "Gone"},
+            ],
+        }
+        plant = {
+            "name": "Plant",
+            "tagType": "Folder",
+            "tags": [
+                {"name": "M1", "tagType": "UdtInstance", "typeId": "Motor"},
+                {"name": "X1", "tagType": "UdtInstance", "typeId": "Missing"},
+            ],
+        }
+        (tmp_path / "vendor").mkdir()
+        (tmp_path / "vendor" / "types.json").write_text(json.dumps(types))
+        (tmp_path / "plant.json").write_text(json.dumps(plant))
+        (tmp_path / ".ignition-lintignore").write_text("vendor/**\n")
+
+        suppression = build_suppression_config(project_root=tmp_path)
+        report = lint_tags([tmp_path], report=LintReport(suppression=suppression))
+        unknown = [i for i in report.issues if i.code == "UDT_UNKNOWN_TYPE"]
+        assert [i.component_path for i in unknown] == ["Plant/tags[1]/X1"]
+        # The ignored export's own issues are dropped, not filtered
+        assert report.suppressed_count == 0
@@ -301,6 +301,56 @@ class TestEventScriptValidation:
         script_issues = [i for i in issues if "JYTHON" in i.code or "SYNTAX" in i.code]
         assert script_issues == []
 
+    @staticmethod
+    def _shared_script_folder(count):
+        script = {"valueChanged": {"eventScript": "\tprint 'changed'"}}
+        return {
+            "name": "Motors",
+            "tagType": "Folder",
+            "tags": [
+                {
+                    "name": f"M{i}",
+                    "tagType": "AtomicTag",
+                    "dataType": "Int4",
+                    "valueSource": "memory",
+                    "eventScripts": script,
+                }
+                for i in range(count)
+            ],
+        }
+
+    def test_shared_script_linted_once(self, monkeypatch, tmp_path):
+        linter = IgnitionTagLinter()
+        calls = []
+        validate = linter.jython_validator.validate_script
+
+        def counting(script, **kwargs):
+            calls.append(script)
+            return validate(script, **kwargs)
+
+        monkeypatch.setattr(linter.jython_validator, "validate_script", counting)
+        path = tmp_path / "tags.json"
+        path.write_text(json.dumps(self._shared_script_folder(3)))
+        linter.lint_file(str(path))
+
+        assert len(calls) == 1
+        printed = _issues_with_code(linter.issues, "JYTHON_PRINT_STATEMENT")
+        assert [i.component_path for i in printed] == [
+            f"Motors/tags[{i}]/M{i}.valueChanged" for i in range(3)
+        ]
+        assert len({id(i) for i in printed}) == 3
+
+    def test_shared_script_rollup(self, tmp_path):
+        linter = IgnitionTagLinter(rollup_event_scripts=True)
+        path = tmp_path / "tags.json"
+        path.write_text(json.dumps(self._shared_script_folder(3)))
+        linter.lint_file(str(path))
+
+        (printed,) = _issues_with_code(linter.issues, "JYTHON_PRINT_STATEMENT")
+        assert printed.component_path == "Motors/tags[0]/M0.valueChanged"
+        assert printed.message.endswith("(3 occurrences)")
+        assert printed.metadata["occurrences"] == "3"
+
 
 # ---------------------------------------------------------------------------
 # TestNestedTags
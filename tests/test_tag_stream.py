@@ -0,0 +1,114 @@
+"""Tests for TagStream, the incremental tag export reader."""
+
+import io
+import json
+
+import pytest
+
+from ignition_lint.tags import IgnitionTagLinter
+from ignition_lint.tags.stream import CHILDREN, NODE, TagStream
+
+EXPORT = {
+    "name": "",
+    "tagType": "Provider",
+    "tags": [
+        {
+            "name": "Line1",
+            "tagType": "Folder",
+            "tags": [
+                {"name": "Speed", "tagType": "AtomicTag", "valueSource": "opc"},
+                "not a tag",
+                {
+                    "name": "Motor",
+                    "tagType": "UdtInstance",
+                    "tags": [
+                        {"name": "Amps", "tagType": "AtomicTag", "valueSource": "expr"}
+                    ],
+                },
+            ],
+        },
+        {"name": "Count", "tagType": "AtomicTag", "value": -0.0, "enabled": True},
+    ],
+}
+
+
+def _events(text, chunk_size=3):
+    return [
+        (event, tag.pointer, tag.value)
+        for event, tag in TagStream(io.StringIO(text), chunk_size)
+    ]
+
+
+def test_children_are_walked_not_loaded():
+    events = _events(json.dumps(EXPORT, indent=2))
+    assert [(event, pointer) for event, pointer, _ in events] == [
+        (CHILDREN, ()),
+        (CHILDREN, ("tags", 0)),
+        (NODE, ("tags", 0, "tags", 0)),
+        (NODE, ("tags", 0, "tags", 1)),
+        (CHILDREN, ("tags", 0, "tags", 2)),
+        (NODE, ("tags", 0, "tags", 2, "tags", 0)),
+        (NODE, ("tags", 0, "tags", 2)),
+        (NODE, ("tags", 0)),
+        (NODE, ("tags", 1)),
+        (NODE, ()),
+    ]
+    assert events[-1][2] == {"name": "", "tagType": "Provider"}
+    assert events[3][2] == "not a tag"
+    assert events[-2][2]["value"] == -0.0
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64])
+def test_chunk_size_does_not_change_values(chunk_size):
+    text = json.dumps(EXPORT, indent="\t")
+    assert _events(text, chunk_size) == _events(text, 1 << 20)
+
+
+def test_top_level_array_and_positions():
+    text = '[\n  {"name": "A",\n   "tagType": "AtomicTag"}\n]'
+    ((event, tag),) = list(TagStream(io.StringIO(text), 4))
+    assert (event, tag.pointer) == (NODE, (0,))
+    assert tag.positions.position(()) == (2, 3)
+    assert tag.positions.position(("tagType",)) == (3, 4)
+
+
+@pytest.mark.parametrize(
+    "text", ['{"name": "A", "tags": [{"name": 1} {}]}', '{"a": [1, 2', "[{}] x"]
+)
+def test_errors_match_json_module(text):
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(text)
+    with pytest.raises(json.JSONDecodeError) as raised:
+        _events(text, 2)
+    assert (raised.value.msg, raised.value.lineno, raised.value.colno) == (
+        expected.value.msg,
+        expected.value.lineno,
+        expected.value.colno,
+    )
+
+
+def test_deep_nesting_does_not_recurse(tmp_path):
+    depth = 1500
+    text = '{"name": "F", "tagType": "Folder", "tags": [' * depth + "]}" * depth
+    path = tmp_path / "deep.json"
+    path.write_text(text)
+    linter = IgnitionTagLinter()
+    assert linter.lint_file(str(path))
+    assert linter.tag_stats["total_tags"] == depth
+
+
+def test_parent_issues_precede_children(tmp_path):
+    path = tmp_path / "tags.json"
+    path.write_text(json.dumps(EXPORT, indent=2))
+    linter = IgnitionTagLinter()
+    assert not linter.lint_file(str(path))
+    paths = [issue.component_path for issue in linter.issues]
+    assert paths.index("/tags[0]/Line1/tags[2]/Motor") < paths.index(
+        "/tags[0]/Line1/tags[2]/Motor/tags[0]/Amps"
+    )
+    # Children of a UdtInstance inherit dataType from the definition
+    assert not [
+        issue
+        for issue in linter.issues
+        if issue.code == "MISSING_DATA_TYPE" and "Amps" in issue.component_path
+    ]
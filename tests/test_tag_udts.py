@@ -0,0 +1,295 @@
+"""Tests for resolving UDT instances against their definitions."""
+
+import json
+
+from ignition_lint.cli import lint_tags
+from ignition_lint.tags import IgnitionTagLinter
+from ignition_lint.tags.udt import TagUdts, UdtIndex, check_tag_udts, type_key
+
+UDT_CODES = {"UDT_UNKNOWN_TYPE", "UDT_UNKNOWN_MEMBER", "UDT_PARAMETER_MISMATCH"}
+
+TYPES = {
+    "name": "_types_",
+    "tagType": "Folder",
+    "tags": [
+        {
+            "name": "Motor",
+            "tagType": "UdtType",
+            "parameters": {"Speed": {"dataType": "Integer", "value": 0}},
+            "tags": [
+                {"name": "Amps", "tagType": "AtomicTag", "dataType": "Float4"},
+                {
+                    "name": "Status",
+                    "tagType": "Folder",
+                    "tags": [
+                        {
+                            "name": "Running",
+                            "tagType": "AtomicTag",
+                            "dataType": "Boolean",
+                        }
+                    ],
+                },
+            ],
+        },
+        {
+            "name": "Pumps",
+            "tagType": "Folder",
+            "tags": [
+                {
+                    "name": "Pump",
+                    "tagType": "UdtType",
+                    "typeId": "Motor",
+                    "parameters": {"Flow": {"dataType": "Float4", "value": 0}},
+                    "tags": [
+                        {"name": "Flow", "tagType": "AtomicTag", "dataType": "Float4"}
+                    ],
+                }
+            ],
+        },
+        {
+            "name": "Line",
+            "tagType": "UdtType",
+            "tags": [{"name": "M1", "tagType": "UdtInstance", "typeId": "Motor"}],
+        },
+    ],
+}
+
+
+def _instance(name, type_id, **extra):
+    return {"name": name, "tagType": "UdtInstance", "typeId": type_id, **extra}
+
+
+def _export(*tags, types=TYPES):
+    return {"name": "", "tagType": "Provider", "tags": [types, *tags]}
+
+
+def _udt_issues(tmp_path, *exports):
+    for i, export in enumerate(exports):
+        (tmp_path / f"export{i}.json").write_text(json.dumps(export, indent=2))
+    report = lint_tags([tmp_path])
+    return [issue for issue in report.issues if issue.code in UDT_CODES]
+
+
+def test_matching_instances_have_no_issues(tmp_path):
+    export = _export(
+        _instance(
+            "Motor1",
+            "Motor",
+            parameters={"Speed": {"dataType": "Integer", "value": 5}},
+            tags=[
+                {"name": "Amps", "tagType": "AtomicTag", "value": 3},
+                {
+                    "name": "Status",
+                    "tagType": "Folder",
+                    "tags": [{"name": "Running", "tagType": "AtomicTag"}],
+                },
+            ],
+        ),
+        # Members and parameters inherited from the parent type
+        _instance(
+            "Pump1",
+            "Pumps/Pump",
+            parameters={"Speed": {"value": 1}, "Flow": {"value": 2}},
+            tags=[{"name": "Amps", "tagType": "AtomicTag"}],
+        ),
+        _instance("Motor2", "[default]_types_/Motor"),
+        _instance(
+            "Line1",
+            "Line",
+            tags=[
+                {
+                    "name": "M1",
+                    "tagType": "UdtInstance",
+                    "tags": [{"name": "Amps", "tagType": "AtomicTag"}],
+                }
+            ],
+        ),
+    )
+    assert _udt_issues(tmp_path, export) == []
+
+
+def test_unknown_type(tmp_path):
+    (issue,) = _udt_issues(tmp_path, _export(_instance("M", "Missing")))
+    assert issue.code == "UDT_UNKNOWN_TYPE"
+    assert issue.component_path == "/tags[1]/M"
+    assert "'Missing'" in issue.message
+    # Located at the instance's typeId
+    lines = (tmp_path / "export0.json").read_text().splitlines()
+    assert '"typeId": "Missing"' in lines[issue.line_number - 1]
+
+
+def test_unknown_members(tmp_path):
+    export = _export(
+        _instance(
+            "Motor1",
+            "Motor",
+            tags=[
+                {"name": "Volts", "tagType": "AtomicTag"},
+                {
+                    "name": "Status",
+                    "tagType": "Folder",
+                    "tags": [{"name": "Stopped", "tagType": "AtomicTag"}],
+                },
+            ],
+        ),
+        _instance(
+            "Line1",
+            "Line",
+            tags=[
+                {
+                    "name": "M1",
+                    "tagType": "UdtInstance",
+                    "tags": [{"name": "Flow", "tagType": "AtomicTag"}],
+                }
+            ],
+        ),
+    )
+    issues = _udt_issues(tmp_path, export)
+    assert [(i.code, i.component_path) for i in issues] == [
+        ("UDT_UNKNOWN_MEMBER", "/tags[1]/Motor1/tags[0]/Volts"),
+        ("UDT_UNKNOWN_MEMBER", "/tags[1]/Motor1/tags[1]/Status/tags[0]/Stopped"),
+        ("UDT_UNKNOWN_MEMBER", "/tags[2]/Line1/tags[0]/M1/tags[0]/Flow"),
+    ]
+    assert all(issue.line_number for issue in issues)
+
+
+def test_parameter_mismatches(tmp_path):
+    export = _export(
+        _instance(
+            "Motor1",
+            "Motor",
+            parameters={
+                "Speed": {"dataType": "String", "value": "fast"},
+                "Spd": {"dataType": "Integer", "value": 1},
+            },
+        )
+    )
+    issues = _udt_issues(tmp_path, export)
+    assert {i.code for i in issues} == {"UDT_PARAMETER_MISMATCH"}
+    messages = sorted(i.message for i in issues)
+    assert "'Spd' is not declared by UDT 'Motor'" in messages[0]
+    assert "'Speed' is String but UDT 'Motor' declares it as Integer" in messages[1]
+
+
+def test_unknown_parent_type(tmp_path):
+    types = {
+        "name": "_types_",
+        "tagType": "Folder",
+        "tags": [{"name": "Orphan", "tagType": "UdtType", "typeId": "Gone"}],
+    }
+    (issue,) = _udt_issues(tmp_path, _export(_instance("O1", "Orphan"), types=types))
+    assert issue.code == "UDT_UNKNOWN_TYPE"
+    assert issue.component_type == "UdtType"
+    assert "'Orphan' extends 'Gone'" in issue.message
+
+
+def test_definitions_from_other_files_and_cache(tmp_path):
+    exports = tmp_path / "exports"
+    exports.mkdir()
+    (exports / "types.json").write_text(json.dumps(TYPES))
+    instances = {
+        "name": "Plant",
+        "tagType": "Folder",
+        "tags": [_instance("Motor1", "Motor"), _instance("Bad", "Nope")],
+    }
+    (exports / "plant.json").write_text(json.dumps(instances))
+
+    cache_dir = tmp_path / "cache"
+    for _ in range(2):
+        report = lint_tags([exports], cache_dir=cache_dir)
+        codes = [i.code for i in report.issues if i.code in UDT_CODES]
+        assert codes == ["UDT_UNKNOWN_TYPE"]
+    assert report.cache_hits == 2
+
+
+def test_file_per_tag_definition(tmp_path):
+    types = tmp_path / "tags" / "_types_" / "Valves"
+    types.mkdir(parents=True)
+    definition = {
+        "tagType": "UdtType",
+        "tags": [{"name": "Open", "tagType": "AtomicTag", "dataType": "Boolean"}],
+    }
+    (types / "Valve.json").write_text(json.dumps(definition))
+    valve = _instance(
+        "V1", "Valves/Valve", tags=[{"name": "Shut", "tagType": "AtomicTag"}]
+    )
+    (tmp_path / "tags" / "V1.json").write_text(json.dumps(valve))
+
+    report = lint_tags([tmp_path / "tags"])
+    codes = [i.code for i in report.issues if i.code in UDT_CODES]
+    assert codes == ["UDT_UNKNOWN_MEMBER"]
+
+
+def test_identical_definition_files_keep_their_paths(tmp_path):
+    definition = {
+        "tagType": "UdtType",
+        "tags": [{"name": "Open", "tagType": "AtomicTag"}],
+    }
+    for folder in ("Valves", "Gates"):
+        types = tmp_path / "tags" / "_types_" / folder
+        types.mkdir(parents=True)
+        (types / "Valve.json").write_text(json.dumps(definition))
+    plant = {
+        "name": "Plant",
+        "tagType": "Folder",
+        "tags": [_instance("V1", "Valves/Valve"), _instance("G1", "Gates/Valve")],
+    }
+    (tmp_path / "tags" / "plant.json").write_text(json.dumps(plant))
+
+    cache_dir = tmp_path / "cache"
+    for _ in range(2):
+        report = lint_tags([tmp_path / "tags"], cache_dir=cache_dir)
+        assert [i for i in report.issues if i.code in UDT_CODES] == []
+    assert report.cache_misses == 0
+
+
+def test_instances_without_definitions_are_not_resolved(tmp_path):
+    export = {"name": "Plant", "tagType": "Folder", "tags": [_instance("M", "Motor")]}
+    assert _udt_issues(tmp_path, export) == []
+
+
+def test_lint_file_only_summarizes(tmp_path):
+    linter = IgnitionTagLinter()
+    path = tmp_path / "export.json"
+    path.write_text(json.dumps(_export(_instance("M", "Missing"))))
+    linter.lint_file(str(path))
+    assert not any(issue.code in UDT_CODES for issue in linter.issues)
+    # Resolution happens across files, from the summaries
+    (issue,) = check_tag_udts(linter.udt_summaries)
+    assert issue.code == "UDT_UNKNOWN_TYPE"
+
+
+def test_summary_round_trip(tmp_path):
+    linter = IgnitionTagLinter()
+    path = tmp_path / "export.json"
+    path.write_text(json.dumps(_export(_instance("M", "Motor"))))
+    linter.lint_file(str(path))
+    data = linter.udt_summaries[str(path)]
+    summary = TagUdts.from_json(json.loads(json.dumps(data)))
+    assert summary.to_json() == data
+    assert [d.path for d in summary.definitions] == ["Motor", "Pumps/Pump", "Line"]
+    assert summary.types_folder
+
+
+def test_inheritance_cycle_is_not_followed():
+    summary = TagUdts.from_json(
+        [
+            [
+                ["A", "B", {}, {}, "A", 1, 1, True],
+                ["B", "A", {}, {}, "B", 2, 1, True],
+            ],
+            [],
+            True,
+        ]
+    )
+    index = UdtIndex()
+    for definition in summary.definitions:
+        index.add(definition)
+    assert index.members("A") is None
+    assert index.resolve("A") is not None
+
+
+def test_type_key():
+    assert type_key("[default]_types_/Pumps/Pump") == "Pumps/Pump"
+    assert type_key("_types_/Motor") == "Motor"
+    assert type_key("Motor") == "Motor"
@@ -0,0 +1,138 @@
+"""Tests for the single-pass Perspective view traversal."""
+
+from ignition_lint.perspective.traversal import (
+    FunctionRule,
+    NodeKind,
+    Rule,
+    ViewTraversal,
+)
+
+VIEW = {
+    "custom": {"title": "Hello"},
+    "propConfig": {
+        "custom.title": {"onChange": {"script": "\tpass"}},
+    },
+    "root": {
+        "type": "ia.container.flex",
+        "meta": {"name": "root"},
+        "children": [
+            {
+                "type": "ia.display.label",
+                "meta": {"name": "Title"},
+                "propConfig": {
+                    "props.text": {
+                        "binding": {
+                            "type": "expr",
+                            "config": {"expression": "{view.custom.title}"},
+                            "transforms": [
+                                {"type": "script", "code": "\treturn value"},
+                                {"type": "expression", "expression": "{value}"},
+                            ],
+                        }
+                    }
+                },
+                "events": {
+                    "dom": {"onClick": {"type": "script", "config": {"script": "\tx"}}}
+                },
+            },
+            {"type": "ia.input.button", "meta": {"name": "Go"}},
+        ],
+    },
+}
+
+
+class _Recorder(Rule):
+    kinds = frozenset(NodeKind)
+
+    def __init__(self):
+        self.nodes = []
+        self.finished = False
+
+    def visit(self, node):
+        self.nodes.append(node)
+
+    def finish(self):
+        self.finished = True
+
+
+def _walk(component_type=None):
+    recorder = _Recorder()
+    traversal = ViewTraversal([recorder], component_type=component_type)
+    traversal.walk(VIEW)
+    traversal.finish()
+    return traversal, recorder
+
+
+def test_each_component_visited_once_in_preorder():
+    traversal, recorder = _walk()
+    components = [n.scope for n in recorder.nodes if n.kind is NodeKind.COMPONENT]
+
+    assert traversal.component_count == 3
+    assert [s.path for s in components] == [
+        "root.root",
+        "root.root.children[0]",
+        "root.root.children[1]",
+    ]
+    assert [s.resolution_path for s in components] == [
+        "root",
+        "root/Title",
+        "root/Go",
+    ]
+    assert recorder.finished
+
+
+def test_scripts_and_expressions_carry_origin():
+    _, recorder = _walk()
+    scripts = [
+        (n.scope.path, n.origin, n.prop_name, n.index, n.member)
+        for n in recorder.nodes
+        if n.kind is NodeKind.SCRIPT
+    ]
+    expressions = [
+        (n.origin, n.index, n.value)
+        for n in recorder.nodes
+        if n.kind is NodeKind.EXPRESSION
+    ]
+
+    assert scripts == [
+        ("view", "onChange", "custom.title", None, ""),
+        ("root.root.children[0]", "transform", "props.text", 0, ""),
+        ("root.root.children[0]", "event", "", 0, "dom.onClick"),
+    ]
+    assert expressions == [
+        ("expr", None, "{view.custom.title}"),
+        ("transform", 1, "{value}"),
+    ]
+
+
+def test_strings_cover_whole_view():
+    _, recorder = _walk()
+    strings = [s for n in recorder.nodes if n.kind is NodeKind.STRING for s in n.value]
+    assert "Hello" in strings
+    assert "{view.custom.title}" in strings
+    assert "Go" in strings
+
+
+def test_component_filter_marks_selection_only():
+    traversal, recorder = _walk(component_type="ia.input")
+    selected = {
+        n.scope.path: n.scope.linted
+        for n in recorder.nodes
+        if n.kind is NodeKind.COMPONENT
+    }
+
+    # Filtering never skips nodes; rules decide based on selection
+    assert traversal.component_count == 3
+    assert selected == {
+        "root.root": False,
+        "root.root.children[0]": False,
+        "root.root.children[1]": True,
+    }
+
+
+def test_rules_only_receive_declared_kinds():
+    seen = []
+    traversal = ViewTraversal([FunctionRule({NodeKind.BINDING}, seen.append)])
+    traversal.walk(VIEW)
+    assert [n.kind for n in seen] == [NodeKind.BINDING]
+    assert seen[0].prop_name == "props.text"
@@ -0,0 +1,159 @@
+"""Tests for the project-wide cross-view reference graph."""
+
+import json
+
+from ignition_lint.cli import lint_perspective, lint_perspective_files
+from ignition_lint.perspective import IgnitionPerspectiveLinter
+from ignition_lint.perspective.view_graph import ViewRefs
+
+
+def _flex(*children, **extra):
+    return {
+        "type": "ia.container.flex",
+        "meta": {"name": "root"},
+        "children": list(children),
+        **extra,
+    }
+
+
+def _write_view(views, view_path, view):
+    folder = views / view_path
+    folder.mkdir(parents=True)
+    (folder / "view.json").write_text(json.dumps(view, indent=2))
+
+
+def _write_project(root):
+    perspective = root / "com.inductiveautomation.perspective"
+    views = perspective / "views"
+    main = {
+        "root": _flex(
+            {
+                "type": "ia.display.view",
+                "meta": {"name": "ChildEmbed"},
+                "props": {"path": "Shared/Child", "params": {"a": 1}},
+            },
+            {
+                "type": "ia.display.view",
+                "meta": {"name": "Broken"},
+                "props": {"path": "Shared/Missing"},
+            },
+            {
+                "type": "ia.input.button",
+                "meta": {"name": "OpenDetail"},
+                "events": {
+                    "component": {
+                        "onActionPerformed": {
+                            "type": "popup",
+                            "config": {
+                                "type": "open",
+                                "viewPath": "Popups/Detail",
+                                "viewParams": {"id": 1},
+                            },
+                        }
+                    }
+                },
+            },
+        )
+    }
+    child = {
+        "params": {"a": 0, "b": 0, "out": 0},
+        "propConfig": {
+            "params.a": {"paramDirection": "input"},
+            "params.b": {"paramDirection": "input"},
+            "params.out": {"paramDirection": "output"},
+        },
+        "root": _flex(),
+    }
+    _write_view(views, "Main", main)
+    _write_view(views, "Shared/Child", child)
+    _write_view(views, "Popups/Detail", {"params": {"id": 0}, "root": _flex()})
+    _write_view(views, "Orphan", {"root": _flex()})
+
+    page_config = perspective / "page-config"
+    page_config.mkdir()
+    (page_config / "config.json").write_text(
+        json.dumps({"pages": {"/": {"viewPath": "Main"}}})
+    )
+    return views
+
+
+def _graph_issues(report):
+    codes = {"EMBEDDED_VIEW_NOT_FOUND", "VIEW_PARAM_NEVER_SET", "ORPHAN_VIEW"}
+    return sorted(
+        (i.code, i.file_path.split("views/")[1], i.component_path)
+        for i in report.issues
+        if i.code in codes
+    )
+
+
+EXPECTED = [
+    ("EMBEDDED_VIEW_NOT_FOUND", "Main/view.json", "root.root.children[1]"),
+    ("ORPHAN_VIEW", "Orphan/view.json", "view"),
+    ("VIEW_PARAM_NEVER_SET", "Shared/Child/view.json", "params.b"),
+]
+
+
+def test_project_graph_issues(tmp_path):
+    views = _write_project(tmp_path)
+    report = lint_perspective(views, "robust", None, verbose=False)
+    assert _graph_issues(report) == EXPECTED
+
+    missing = next(i for i in report.issues if i.code == "EMBEDDED_VIEW_NOT_FOUND")
+    text = (views / "Main" / "view.json").read_text()
+    brace = text.rfind("{", 0, text.rfind('"type"', 0, text.index('"Broken"')))
+    assert missing.line_number == text[:brace].count("\n") + 1
+
+
+def test_graph_is_served_from_cache_and_workers(tmp_path):
+    views = _write_project(tmp_path)
+    cache_dir = tmp_path / "cache"
+    first = lint_perspective(views, "robust", None, False, jobs=2, cache_dir=cache_dir)
+    second = lint_perspective(views, "robust", None, False, cache_dir=cache_dir)
+
+    assert (second.cache_hits, second.cache_misses) == (4, 0)
+    assert _graph_issues(first) == _graph_issues(second) == EXPECTED
+
+
+def test_partial_scan_only_checks_embed_targets(tmp_path):
+    views = _write_project(tmp_path)
+    report = lint_perspective_files(
+        [views / "Main" / "view.json", views / "Orphan" / "view.json"],
+        "robust",
+        None,
+        scanned_root=views / "Main",
+    )
+    assert _graph_issues(report) == EXPECTED[:1]
+
+
+def test_no_orphans_without_page_config(tmp_path):
+    views = _write_project(tmp_path)
+    (views.parent / "page-config" / "config.json").unlink()
+    report = lint_perspective(views, "robust", None, verbose=False)
+    assert _graph_issues(report) == [EXPECTED[0], EXPECTED[2]]
+
+
+def test_bound_params_are_not_reported(tmp_path):
+    views = _write_project(tmp_path)
+    main_path = views / "Main" / "view.json"
+    main = json.loads(main_path.read_text())
+    main["root"]["children"][0]["propConfig"] = {
+        "props.params": {"binding": {"type": "expr", "config": {"expression": "1"}}}
+    }
+    main_path.write_text(json.dumps(main))
+
+    report = lint_perspective(views, "robust", None, verbose=False)
+    assert "VIEW_PARAM_NEVER_SET" not in {i.code for i in report.issues}
+
+
+def test_view_refs_json_round_trip(tmp_path):
+    views = _write_project(tmp_path)
+    linter = IgnitionPerspectiveLinter()
+    main = str(views / "Main" / "view.json")
+    linter.lint_file(main)
+    refs = linter.view_refs[main]
+    assert [(e.target, e.kind, e.params) for e in refs.embeds] == [
+        ("Shared/Child", "view", frozenset({"a"})),
+        ("Shared/Missing", "view", frozenset()),
+        ("Popups/Detail", "popup", frozenset({"id"})),
+    ]
+    assert ViewRefs.from_json(json.loads(json.dumps(refs.to_json()))) == refs
@@ -160,3 +160,43 @@ def test_convenience_properties():
     model = build_view_model(view_data, "test/view.json")
     assert len(model.all_expression_text) == 1
     assert len(model.all_script_text) == 1
+
+
+def test_nodes_carry_component_context():
+    view_data = {
+        "custom": {},
+        "root": {
+            "type": "ia.container.flex",
+            "meta": {"name": "root"},
+            "children": [
+                {
+                    "type": "ia.input.button",
+                    "meta": {"name": "Submit"},
+                    "events": {
+                        "component": {
+                            "onActionPerformed": {
+                                "type": "script",
+                                "config": {"script": "\tpass"},
+                            }
+                        }
+                    },
+                }
+            ],
+        },
+    }
+    model = build_view_model(view_data, "test/view.json")
+    script = model.scripts[0]
+    assert script.component_path == "root.root.children[0]"
+    assert script.component_type == "ia.input.button"
+    assert script.event == "component.onActionPerformed"
+    assert script.index == 0
+    assert model.name_tree == {"Submit": {"_type": "ia.input.button", "_children": {}}}
+
+
+def test_property_name_sets_are_memoized():
+    model = build_view_model(
+        {"custom": {"a": 1}, "params": {"b": 2}, "root": {}}, "test/view.json"
+    )
+    assert model.custom_property_names is model.custom_property_names
+    assert model.param_property_names == frozenset({"b"})
+    assert not hasattr(model, "__dict__")